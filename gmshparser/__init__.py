@@ -6,18 +6,28 @@ from .api import (
     ElementCollection,
     Entity,
     EntityCollection,
+    GhostElement,
     Node,
     NodeCollection,
+    Partition,
+    Partitioning,
     PeriodicLink,
     PeriodicLinkCollection,
     PhysicalGroup,
     PhysicalGroupCollection,
     Version,
+    View,
+    ViewCollection,
+    ViewStep,
+    ViewStepInfo,
     read,
+    read_partition,
+    read_partitioned,
 )
 from .api import (
     Mesh as ModernMesh,
 )
+from .cache import CacheInfo, DiskCache, MeshCache
 from .element_types import ElementFamily, ElementType, ElementTypeInfo
 from .errors import (
     GmshError,
@@ -33,46 +43,72 @@ from .errors import (
     UnsupportedBinaryFormatError,
     UnsupportedVersionError,
 )
+from .lazy import LazyMesh, read_lazy
 from .main_parser import MainParser
 from .mesh import Mesh
+from .parsing import open_source
+from .probe import MeshProbe, probe
+from .section_index import SectionIndex
+from .streaming import ElementBlock, NodeBlock, iter_element_blocks, iter_node_blocks
 from .version_manager import MshFormatVersion, VersionManager
 
 __all__ = [
+    "CacheInfo",
+    "DiskCache",
     "Element",
+    "ElementBlock",
     "ElementCollection",
     "ElementFamily",
     "ElementType",
     "ElementTypeInfo",
     "Entity",
     "EntityCollection",
+    "GhostElement",
     "GmshError",
     "InvalidElementConnectivityError",
     "InvalidElementError",
     "InvalidMeshError",
     "InvalidNodeError",
     "InvalidSectionError",
+    "LazyMesh",
     "MainParser",
     "Mesh",
+    "MeshCache",
+    "MeshProbe",
     "ModernMesh",
     "MshFormatVersion",
     "Node",
+    "NodeBlock",
     "NodeCollection",
     "ParseError",
     "ParsingContext",
+    "Partition",
+    "Partitioning",
     "PeriodicLink",
     "PeriodicLinkCollection",
     "PhysicalGroup",
     "PhysicalGroupCollection",
+    "SectionIndex",
     "UnexpectedEndOfFileError",
     "UnknownElementTypeError",
     "UnsupportedBinaryFormatError",
     "UnsupportedVersionError",
     "Version",
     "VersionManager",
+    "View",
+    "ViewCollection",
+    "ViewStep",
+    "ViewStepInfo",
     "api",
     "helpers",
+    "iter_element_blocks",
+    "iter_node_blocks",
     "parse",
+    "probe",
     "read",
+    "read_lazy",
+    "read_partition",
+    "read_partitioned",
 ]
 
 __version__ = _distribution_version("gmshparser")
@@ -89,6 +125,6 @@ def parse(filename: str) -> Mesh:
     mesh = Mesh()
     mesh.set_name(filename)
     parser = MainParser()
-    with open(filename, encoding="utf-8") as io:
+    with open_source(filename) as io:
         parser.parse(mesh, io)
     return mesh
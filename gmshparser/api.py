@@ -1,13 +1,33 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterable, Iterator
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import (
+    Buffer,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from dataclasses import dataclass, field
-from typing import Protocol, TextIO, cast
+from io import BytesIO
+from itertools import islice
+from typing import TYPE_CHECKING, BinaryIO, Protocol, Self, TextIO, cast
 
+from .cache import DiskCache, cache_options, open_cache
+from .columnar import RowView
+from .data_parser import DATA_SECTIONS
 from .element_types import ElementFamily, ElementType, ElementTypeInfo
 from .main_parser import MainParser
 from .mesh import Mesh as LegacyMesh
+from .parsing import open_source
+from .sink import DataBuffer, Validation
+
+if TYPE_CHECKING:
+    from .columnar import ElementTable, NodeTable
 
 __all__ = [
     "Element",
@@ -18,18 +38,26 @@ __all__ = [
     "Entity",
     "EntityCollection",
     "EntityKey",
+    "GhostElement",
     "Mesh",
     "Node",
     "NodeCollection",
     "PeriodicLink",
     "PeriodicLinkCollection",
     "PeriodicLinkKey",
+    "Partition",
+    "Partitioning",
     "PhysicalGroup",
     "PhysicalGroupCollection",
     "PhysicalGroupKey",
     "Version",
+    "View",
+    "ViewCollection",
+    "ViewStep",
+    "ViewStepInfo",
     "parse",
     "read",
+    "read_partition",
 ]
 
 
@@ -57,17 +85,104 @@ class _Tagged(Protocol):
     def tag(self) -> int: ...
 
 
-class _TaggedCollection[T: _Tagged]:
-    """Immutable values that iterate naturally and index by Gmsh tag."""
+class _TaggedCollection[T: _Tagged](ABC):
+    """Immutable values that iterate naturally and index by Gmsh tag.
+
+    Queries go through secondary indexes that group the item positions by one
+    field, such as the owning entity. Each index is built on its first query
+    and each subset on its first lookup, so repeated queries cost O(result).
+    """
+
+    __slots__ = ("_items", "_by_tag", "_indexes")
 
-    __slots__ = ("_items", "_by_tag")
+    _items: Sequence[T]
+    _by_tag: Mapping[int, T]
+    _indexes: dict[str, dict[Hashable, array[int] | Self]] | None
 
     def __init__(self, items: Iterable[T]):
         self._items = tuple(items)
         self._by_tag = {item.tag: item for item in self._items}
+        self._indexes = None
         if len(self._by_tag) != len(self._items):
             raise ValueError("Tags must be unique within a mesh collection")
 
+    @classmethod
+    def _wrap(cls, items: Sequence[T], by_tag: Mapping[int, T]) -> Self:
+        collection = cls.__new__(cls)
+        collection._items = items
+        collection._by_tag = by_tag
+        collection._indexes = None
+        return collection
+
+    @classmethod
+    def _from_rows(cls, rows: RowView[T]) -> Self:
+        """Wrap table rows whose values are created on access."""
+        return cls._wrap(rows, rows.tag_map())
+
+    @abstractmethod
+    def _index_keys(self, name: str) -> Iterable[tuple[Hashable, ...]]:
+        """Return the keys of the field *name* for each item, in order."""
+
+    def _index(self, name: str) -> dict[Hashable, array[int] | Self]:
+        """Return the item positions grouped by the field *name*, built once."""
+        indexes = self._indexes
+        if indexes is None:
+            indexes = self._indexes = {}
+        index = indexes.get(name)
+        if index is None:
+            index = {}
+            for position, keys in enumerate(self._index_keys(name)):
+                for key in keys:
+                    positions = index.get(key)
+                    if positions is None:
+                        positions = index[key] = array("q")
+                    cast("array[int]", positions).append(position)
+            # Concurrent first queries may both build the index; either is kept.
+            indexes[name] = index
+        return index
+
+    def _indexed(self, name: str, key: Hashable) -> Self:
+        """Return the items whose field *name* has *key*."""
+        index = self._index(name)
+        subset = index.get(key)
+        if subset is None:
+            return self._take(())
+        if not isinstance(subset, _TaggedCollection):
+            subset = index[key] = self._take(subset)
+        return subset
+
+    def _query(self, filters: Sequence[tuple[str, Hashable]]) -> Self:
+        """Return the items matching every ``(field, key)`` filter.
+
+        The narrowest indexed subset is refined by the other filters through
+        its own indexes.
+        """
+        if not filters:
+            return self
+        subsets = [self._indexed(name, key) for name, key in filters]
+        narrowest = min(
+            range(len(filters)), key=lambda position: len(subsets[position])
+        )
+        result = subsets[narrowest]
+        for position, (name, key) in enumerate(filters):
+            if position != narrowest and result:
+                result = result._indexed(name, key)
+        return result
+
+    def _take(self, positions: Sequence[int]) -> Self:
+        items = self._items
+        if isinstance(items, RowView):
+            rows = items.rows
+            return self._from_rows(
+                RowView(
+                    items.table,
+                    array("q", map(rows.__getitem__, positions)),
+                    items.materialize,
+                )
+            )
+        subset = tuple(map(items.__getitem__, positions))
+        return self._wrap(subset, {item.tag: item for item in subset})
+
     def __iter__(self) -> Iterator[T]:
         return iter(self._items)
 
@@ -89,7 +204,7 @@ class _TaggedCollection[T: _Tagged]:
         return type(self) is type(other) and self._items == other._items
 
     def __hash__(self) -> int:
-        return hash(self._items)
+        return hash(tuple(self._items))
 
     def get(self, tag: int, default: T | None = None) -> T | None:
         """Return the item with *tag*, or *default* when absent."""
@@ -244,15 +359,12 @@ class NodeCollection(_TaggedCollection[Node]):
         """Return nodes matching the supplied metadata."""
         if entity is not None:
             dimension, entity_tag = entity
-
-        return NodeCollection(
-            node
-            for node in self
-            if (dimension is None or node.dimension == dimension)
-            and (entity_tag is None or node.entity_tag == entity_tag)
-            and (parametric is None or node.is_parametric is parametric)
-            and (physical_tag is None or physical_tag in node.physical_tags)
-        )
+        filters = _entity_filters(dimension, entity_tag)
+        if parametric is not None:
+            filters.append(("parametric", parametric))
+        if physical_tag is not None:
+            filters.append(("physical", physical_tag))
+        return self._query(filters)
 
     def by_entity(self, dimension: int, tag: int) -> NodeCollection:
         """Return nodes owned by one elementary entity."""
@@ -263,6 +375,23 @@ class NodeCollection(_TaggedCollection[Node]):
         """Cartesian coordinates in collection order."""
         return tuple(node.coordinates for node in self)
 
+    def _index_keys(self, name: str) -> Iterable[tuple[Hashable, ...]]:
+        items = self._items
+        if isinstance(items, RowView):
+            table = cast("NodeTable", items.table)
+            return table.index_keys(name, items.rows)
+        if name == "dimension":
+            return ((node.dimension,) for node in items)
+        if name == "entity":
+            return ((node.entity_key,) for node in items)
+        if name == "entity_tag":
+            return ((node.entity_tag,) for node in items)
+        if name == "parametric":
+            return ((node.is_parametric,) for node in items)
+        if name == "physical":
+            return (node.physical_tags for node in items)
+        raise ValueError(f"Unknown node field {name!r}")
+
 
 class ElementCollection(_TaggedCollection[Element]):
     """All elements in a mesh, entity, physical group, or filtered selection."""
@@ -279,16 +408,12 @@ class ElementCollection(_TaggedCollection[Element]):
         """Return elements matching the supplied metadata."""
         if entity is not None:
             dimension, entity_tag = entity
-        wanted_type = None if element_type is None else ElementType(element_type)
-
-        return ElementCollection(
-            element
-            for element in self
-            if (wanted_type is None or element.element_type is wanted_type)
-            and (dimension is None or element.dimension == dimension)
-            and (entity_tag is None or element.entity_tag == entity_tag)
-            and (physical_tag is None or physical_tag in element.physical_tags)
-        )
+        filters = _entity_filters(dimension, entity_tag)
+        if element_type is not None:
+            filters.append(("type", int(ElementType(element_type))))
+        if physical_tag is not None:
+            filters.append(("physical", physical_tag))
+        return self._query(filters)
 
     def by_type(self, element_type: ElementType | int) -> ElementCollection:
         """Return elements with one Gmsh element type."""
@@ -301,18 +426,62 @@ class ElementCollection(_TaggedCollection[Element]):
     @property
     def types(self) -> frozenset[ElementType]:
         """Element types present in the collection."""
-        return frozenset(element.element_type for element in self)
+        return frozenset(map(ElementType, cast("Iterable[int]", self._index("type"))))
+
+    def _index_keys(self, name: str) -> Iterable[tuple[Hashable, ...]]:
+        items = self._items
+        if isinstance(items, RowView):
+            table = cast("ElementTable", items.table)
+            return table.index_keys(name, items.rows)
+        if name == "type":
+            return ((int(element.element_type),) for element in items)
+        if name == "dimension":
+            return ((element.dimension,) for element in items)
+        if name == "entity":
+            return ((element.entity_key,) for element in items)
+        if name == "entity_tag":
+            return ((element.entity_tag,) for element in items)
+        if name == "physical":
+            return (element.physical_tags for element in items)
+        raise ValueError(f"Unknown element field {name!r}")
+
+
+def _mesh_order_key(tags: Sequence[int]) -> Callable[[int], int]:
+    """Return a sort key that orders a subset of *tags* as in *tags*.
+
+    Ascending tags, the common case, sort by value without a position map.
+    """
+    if all(map(int.__lt__, tags, islice(tags, 1, None))):
+        return int
+    return {tag: position for position, tag in enumerate(tags)}.__getitem__
+
+
+def _entity_filters(
+    dimension: int | None, entity_tag: int | None
+) -> list[tuple[str, Hashable]]:
+    """Return the index filter of an entity query on nodes or elements."""
+    if entity_tag is None:
+        return [] if dimension is None else [("dimension", dimension)]
+    if dimension is None:
+        return [("entity_tag", entity_tag)]
+    return [("entity", (dimension, entity_tag))]
 
 
 @dataclass(frozen=True, slots=True)
 class Entity:
-    """A unified Gmsh entity containing both nodes and elements."""
+    """A unified Gmsh entity containing both nodes and elements.
+
+    Entities of a partitioned mesh record the model entity they were split
+    from as ``parent`` and the partitions that share them as ``partitions``.
+    """
 
     dimension: int
     tag: int
     nodes: NodeCollection
     elements: ElementCollection
     physical_tags: tuple[int, ...] = ()
+    parent: EntityKey | None = None
+    partitions: tuple[int, ...] = ()
 
     @property
     def key(self) -> EntityKey:
@@ -590,6 +759,251 @@ class PhysicalGroupCollection:
         return tuple(group.name for group in self if group.name is not None)
 
 
+@dataclass(frozen=True, slots=True)
+class ViewStepInfo:
+    """The tags of one post-processing view step, without its values.
+
+    ``section`` is ``"$NodeData"``, ``"$ElementData"``, or
+    ``"$ElementNodeData"``.
+    """
+
+    section: str
+    string_tags: tuple[str, ...]
+    real_tags: tuple[float, ...]
+    integer_tags: tuple[int, ...]
+
+    @property
+    def name(self) -> str:
+        """View name from the first string tag, or ``""``."""
+        return self.string_tags[0] if self.string_tags else ""
+
+    @property
+    def time(self) -> float:
+        """Time value from the first real tag, or ``0.0``."""
+        return self.real_tags[0] if self.real_tags else 0.0
+
+    @property
+    def time_step(self) -> int:
+        """Time-step index from the first integer tag."""
+        return self.integer_tags[0]
+
+    @property
+    def components(self) -> int:
+        """Number of values per node or element node."""
+        return self.integer_tags[1]
+
+    @property
+    def partition(self) -> int | None:
+        """Partition index from the fourth integer tag, if present."""
+        return self.integer_tags[3] if len(self.integer_tags) > 3 else None
+
+    @property
+    def count(self) -> int:
+        """Number of nodes or elements with values, from the third integer tag."""
+        return self.integer_tags[2]
+
+
+@dataclass(frozen=True, slots=True)
+class ViewStep(ViewStepInfo):
+    """One time step of a post-processing view, read from one data section.
+
+    ``tags`` holds node tags for ``$NodeData`` and element tags otherwise.
+    ``values`` holds ``components`` values per tag; for ``$ElementNodeData``,
+    each element holds ``node_count * components`` values, with its node count
+    in ``node_counts``.
+    """
+
+    data: DataBuffer
+
+    @property
+    def tags(self) -> array[int]:
+        """Node or element tags in file order."""
+        return self.data.tags
+
+    @property
+    def values(self) -> array[float]:
+        """All values in file order as one flat array."""
+        return self.data.values
+
+    @property
+    def node_counts(self) -> array[int] | None:
+        """Nodes per element of ``$ElementNodeData`` records."""
+        return self.data.node_counts
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[tuple[int, tuple[float, ...]]]:
+        return iter(self.data)
+
+
+class View:
+    """The time steps of one named post-processing view in file order.
+
+    Steps are either held in memory or, when *load* is given, described by
+    their :class:`ViewStepInfo` and parsed by ``load(index)`` only when
+    :meth:`step` asks for them. Step tags, times, and counts never require
+    loading.
+    """
+
+    __slots__ = ("name", "section", "_steps", "_load")
+
+    def __init__(
+        self,
+        name: str,
+        steps: Iterable[ViewStepInfo],
+        load: Callable[[int], ViewStep] | None = None,
+    ):
+        self._steps = tuple(steps)
+        sections = {step.section for step in self._steps}
+        if len(sections) != 1:
+            raise ValueError(f"View {name!r} must come from one kind of data section")
+        if load is None and not all(isinstance(s, ViewStep) for s in self._steps):
+            raise TypeError(f"View {name!r} needs a loader for steps without values")
+        self.name = name
+        self.section = sections.pop()
+        self._load = load
+
+    def __iter__(self) -> Iterator[ViewStep]:
+        return (self.step(index) for index in range(len(self._steps)))
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        return f"View({self.name!r}, section={self.section!r}, steps={len(self)})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, View)
+            and self.name == other.name
+            and tuple(self) == tuple(other)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, len(self._steps)))
+
+    def step(self, index: int) -> ViewStep:
+        """Return the step at *index* in file order; ``-1`` is the last step."""
+        step = self._steps[index]
+        if isinstance(step, ViewStep):
+            return step
+        assert self._load is not None
+        return self._load(index % len(self._steps))
+
+    def step_info(self, index: int) -> ViewStepInfo:
+        """Return the tags of the step at *index* without loading its values."""
+        return self._steps[index]
+
+    @property
+    def time_steps(self) -> tuple[int, ...]:
+        """Time-step indices in file order."""
+        return tuple(step.time_step for step in self._steps)
+
+    @property
+    def times(self) -> tuple[float, ...]:
+        """Time values in file order."""
+        return tuple(step.time for step in self._steps)
+
+
+class ViewCollection:
+    """Post-processing views keyed by name."""
+
+    __slots__ = ("_items", "_by_name")
+
+    def __init__(self, items: Iterable[View]):
+        self._items = tuple(items)
+        self._by_name = {view.name: view for view in self._items}
+        if len(self._by_name) != len(self._items):
+            raise ValueError("View names must be unique")
+
+    @classmethod
+    def from_steps(cls, steps: Iterable[ViewStep]) -> ViewCollection:
+        """Group data-section steps into views by name, in first-seen order."""
+        grouped: dict[str, list[ViewStep]] = {}
+        for step in steps:
+            grouped.setdefault(step.name, []).append(step)
+        return cls(View(name, values) for name, values in grouped.items())
+
+    def __iter__(self) -> Iterator[View]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, name: str) -> View:
+        return self._by_name[name]
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, str):
+            return value in self._by_name
+        return value in self._items
+
+    def __repr__(self) -> str:
+        return f"ViewCollection({list(self._items)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ViewCollection) and self._items == other._items
+
+    def __hash__(self) -> int:
+        return hash(self._items)
+
+    def get(self, name: str, default: View | None = None) -> View | None:
+        """Return a view by name."""
+        return self._by_name.get(name, default)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """View names in file order."""
+        return tuple(self._by_name)
+
+
+@dataclass(frozen=True, slots=True)
+class GhostElement:
+    """An element that partitions other than its owner hold as a ghost."""
+
+    tag: int
+    partition: int
+    ghost_partitions: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Partitioning:
+    """Partition metadata from ``$PartitionedEntities`` and ``$GhostElements``.
+
+    Partitions are numbered from 1 to ``count``. ``ghost_entities`` pairs the
+    tag of each ghost entity with its partition.
+    """
+
+    count: int
+    ghost_entities: tuple[tuple[int, int], ...] = ()
+    ghost_elements: tuple[GhostElement, ...] = ()
+
+    @classmethod
+    def from_records(
+        cls,
+        count: int,
+        ghost_entities: Mapping[int, int],
+        ghost_elements: Iterable[tuple[int, int, tuple[int, ...]]],
+    ) -> Partitioning | None:
+        """Build partition metadata from sink records; ``None`` if unpartitioned."""
+        if not count:
+            return None
+        return cls(
+            count,
+            tuple(ghost_entities.items()),
+            tuple(GhostElement(*record) for record in ghost_elements),
+        )
+
+    def ghosts(self, partition: int) -> tuple[GhostElement, ...]:
+        """Return the ghost elements that *partition* holds."""
+        return tuple(
+            ghost
+            for ghost in self.ghost_elements
+            if partition in ghost.ghost_partitions
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class Mesh:
     """A read-only, Pythonic representation of a parsed Gmsh mesh."""
@@ -605,6 +1019,8 @@ class Mesh:
     periodic_links: PeriodicLinkCollection = field(
         default_factory=lambda: PeriodicLinkCollection(())
     )
+    views: ViewCollection = field(default_factory=lambda: ViewCollection(()))
+    partitioning: Partitioning | None = None
 
     @classmethod
     def from_legacy(cls, mesh: LegacyMesh) -> Mesh:
@@ -697,6 +1113,7 @@ class Mesh:
                     if physical_tag not in physical_tags:
                         physical_tags.append(physical_tag)
 
+            parent, partitions = mesh.get_entity_partitions(*key) or (None, ())
             entity_values.append(
                 Entity(
                     dimension=dimension,
@@ -704,6 +1121,8 @@ class Mesh:
                     nodes=NodeCollection(nodes_by_entity.get(key, ())),
                     elements=entity_elements,
                     physical_tags=tuple(physical_tags),
+                    parent=parent,
+                    partitions=partitions,
                 )
             )
 
@@ -719,6 +1138,7 @@ class Mesh:
                 physical_keys.setdefault((element.dimension, physical_tag), None)
 
         physical_group_values: list[PhysicalGroup] = []
+        order = _mesh_order_key(nodes.tags) if physical_keys else int
         for dimension, physical_tag in physical_keys:
             group_entities = entities.where(
                 dimension=dimension,
@@ -740,7 +1160,7 @@ class Mesh:
                     entities=group_entities,
                     elements=group_elements,
                     nodes=NodeCollection(
-                        node for node in nodes if node.tag in node_tags
+                        map(nodes.__getitem__, sorted(node_tags, key=order))
                     ),
                 )
             )
@@ -778,12 +1198,30 @@ class Mesh:
             entities=entities,
             physical_groups=physical_groups,
             periodic_links=periodic_links,
+            views=ViewCollection.from_steps(
+                ViewStep(*record) for record in mesh.get_data_steps()
+            ),
+            partitioning=Partitioning.from_records(
+                mesh.get_number_of_partitions(),
+                mesh.get_ghost_entities(),
+                mesh.get_ghost_elements(),
+            ),
         )
 
     def entity(self, dimension: int, tag: int) -> Entity:
         """Return one elementary entity without constructing a tuple key."""
         return self.entities[(dimension, tag)]
 
+    def partition(self, index: int) -> Partition:
+        """Extract one partition of a partitioned mesh with local numbering.
+
+        Raises :class:`ValueError` when the mesh is not partitioned or has no
+        partition *index*. See :class:`Partition`.
+        """
+        from .partitions import extract_partition
+
+        return extract_partition(self, index)
+
     def physical_group(
         self,
         name_or_tag: str | int,
@@ -864,45 +1302,317 @@ class Mesh:
             f"Mesh(name={self.name!r}, version={version!r}, "
             f"nodes={len(self.nodes)}, elements={len(self.elements)}, "
             f"physical_groups={len(self.physical_groups)}, "
-            f"periodic_links={len(self.periodic_links)})"
+            f"periodic_links={len(self.periodic_links)}, "
+            f"views={len(self.views)})"
         )
 
     __str__ = __repr__
 
 
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """One partition of a partitioned mesh, renumbered from 1.
+
+    ``mesh`` holds the partitioned entities that list the partition, their
+    elements, and the nodes they use. Its nodes and elements are renumbered
+    ``1..n`` in file order, and its views are dropped. ``ghost_elements`` is the
+    ghost layer declared by ``$GhostElements``: its elements continue the local
+    element numbering and use mesh nodes or ``ghost_nodes``, which continue the
+    local node numbering. ``node_tags[i]`` and ``element_tags[i]`` are the
+    original tags of local tag ``i + 1``.
+    """
+
+    index: int
+    mesh: Mesh
+    ghost_nodes: NodeCollection
+    ghost_elements: ElementCollection
+    node_tags: tuple[int, ...]
+    element_tags: tuple[int, ...]
+
+    def global_node_tag(self, tag: int) -> int:
+        """Return the original tag of local node *tag*."""
+        if tag < 1:
+            raise IndexError(f"Local node tags start at 1, got {tag}")
+        return self.node_tags[tag - 1]
+
+    def global_element_tag(self, tag: int) -> int:
+        """Return the original tag of local element *tag*."""
+        if tag < 1:
+            raise IndexError(f"Local element tags start at 1, got {tag}")
+        return self.element_tags[tag - 1]
+
+
 def read(
-    source: str | os.PathLike[str] | TextIO,
+    source: str | os.PathLike[str] | TextIO | BinaryIO | Buffer,
     *,
     name: str | None = None,
+    sections: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    workers: int | None = None,
+    entities: Iterable[EntityKey] | None = None,
+    physical_groups: Iterable[str | PhysicalGroupKey] | None = None,
+    validate: Validation = "full",
+    cache_dir: str | os.PathLike[str] | DiskCache | None = None,
+    columnar: bool = False,
 ) -> Mesh:
-    """Read a path or text stream into the modern API.
+    """Read a path, stream, or in-memory buffer into the modern API.
 
     Top-level :func:`gmshparser.parse` intentionally retains the mutable
     compatibility API. Within :mod:`gmshparser.api`, :func:`parse` is an alias
     for this modern reader.
+
+    Binary MSH files are detected from the ``$MeshFormat`` header of a path.
+    Streams containing binary MSH data must be opened in binary mode. Paths
+    compressed with gzip, bzip2, or xz are decompressed while they are read.
+    ``bytes``, ``bytearray``, and ``memoryview`` sources hold the file
+    content. Paths, binary streams, and buffers are read as bytes: numeric
+    records are converted without decoding them to text.
+
+    ``sections`` limits parsing to the named sections, such as
+    ``{"$Nodes"}``, and ``exclude`` skips the named sections. Skipped sections
+    are consumed without being tokenized and are absent from the result.
+    ``$MeshFormat`` is always read, and ``$Elements`` and ``$Periodic``
+    require ``$Nodes``. The ``$NodeData``, ``$ElementData``, and
+    ``$ElementNodeData`` sections of :attr:`Mesh.views` are read only when
+    ``sections`` names them.
+
+    With ``workers`` greater than one, the ``$Nodes`` and ``$Elements``
+    sections of an MSH 4 file path are split at entity-block and record
+    boundaries and parsed in that many processes. The result and the errors
+    are those of a serial read. Streams, other versions, and reads filtered by
+    entity are read serially.
+
+    ``entities`` and ``physical_groups`` keep only the elements of the given
+    ``(dimension, tag)`` entities and of the entities in the given physical
+    groups, named or given as ``(dimension, tag)``. Nodes are kept for those
+    entities and the entities bounding them, and for the selected elements'
+    nodes on lower-dimensional entities, such as embedded points, whose
+    bounding box meets that of a selected entity. In MSH 4 files, the other
+    entity blocks are skipped by counting their lines without tokenizing them.
+    MSH 1 and 2 files have no entity blocks: they are parsed whole, their
+    elements are filtered afterwards, and all nodes are kept.
+
+    ``validate="basic"`` skips the per-record value checks of the section
+    parsers, such as entity bounding boxes, duplicate entity tags, and
+    duplicate periodic slave nodes. ``validate="none"`` also skips the builder
+    checks that the mesh can be built without: the coordinate count of node
+    records, and with ``columnar=True`` the duplicate node and element tag
+    scans. Malformed records, wrong counts, and unknown node references are
+    reported at every level, and so are duplicate tags in the default backend,
+    whose collections map tags to values. Use the lower levels only for files
+    that were validated before.
+
+    With ``cache_dir``, a path read is stored there as a snapshot of its
+    arrays and metadata, keyed by the resolved path and the read options.
+    Later reads of the unchanged file copy the snapshot arrays out of a memory
+    map and rebuild the mesh without parsing. The arrays are copied rather than
+    viewed in place because the builders take ``array.array`` buffers and copy
+    them again into the mesh, so views would save one short-lived copy at most.
+    ``cache_dir`` may be a :class:`DiskCache` to bound the size of the
+    directory.
+
+    With ``columnar=True``, nodes and elements are stored in typed arrays, see
+    :mod:`gmshparser.columnar`, and :class:`Node` and :class:`Element` values
+    are created each time they are accessed. The mesh compares equal to the
+    default one and needs a fraction of its memory, while iterating it is
+    slower.
     """
-    if hasattr(source, "read"):
-        stream = cast(TextIO, source)
-        mesh_name = name or str(getattr(stream, "name", "<stream>"))
-        return _read_stream(stream, mesh_name)
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if validate not in _VALIDATION_LEVELS:
+        raise ValueError(f"validate must be one of {', '.join(_VALIDATION_LEVELS)}")
+    if cache_dir is not None:
+        from .modern_builder import ModernMeshBuilder
+
+        path = _cached_path(source)
+        cache = open_cache(cache_dir)
+        sections = None if sections is None else tuple(sections)
+        exclude = None if exclude is None else tuple(exclude)
+        entities = None if entities is None else tuple(entities)
+        if physical_groups is not None:
+            physical_groups = tuple(physical_groups)
+        options = cache_options(
+            sections=sections,
+            exclude=exclude,
+            entities=entities,
+            physical_groups=physical_groups,
+            validate=validate,
+        )
+        snapshot = cache.load(path, options)
+        if snapshot is not None:
+            builder = ModernMeshBuilder(name or path)
+            builder.set_validation("none")
+            snapshot.replay(builder)
+            return builder.build(columnar=columnar)
+        before = os.stat(path)
+        parsed = read(
+            path,
+            name=name,
+            sections=sections,
+            exclude=exclude,
+            workers=workers,
+            entities=entities,
+            physical_groups=physical_groups,
+            validate=validate,
+            columnar=columnar,
+        )
+        cache.store(path, options, parsed, before)
+        return parsed
+
+    parser = MainParser(sections=sections, exclude=exclude, line_tracking="lazy")
+    for dependent in ("$Elements", "$Periodic"):
+        if parser.selects(dependent) and not parser.selects("$Nodes"):
+            raise ValueError(f"Reading {dependent} requires $Nodes to be read")
+    selection = None
+    if entities is not None or physical_groups is not None:
+        selection = tuple(entities or ()), tuple(physical_groups or ())
+
+    serial = (
+        selection is not None or hasattr(source, "read") or isinstance(source, Buffer)
+    )
+    if workers is not None and workers > 1 and not serial:
+        from .parallel import read_parallel
 
-    path = os.fspath(source)
-    with open(path, encoding="utf-8") as stream:
-        return _read_stream(stream, name or path)
+        path = os.fspath(cast("str | os.PathLike[str]", source))
+        mesh = read_parallel(
+            path, name or path, parser, workers, validate, columnar=columnar
+        )
+        if mesh is not None:
+            return mesh
+
+    return _read_source(
+        source, name, parser, selection, validation=validate, columnar=columnar
+    )
+
+
+def read_partition(
+    source: str | os.PathLike[str] | TextIO | BinaryIO | Buffer,
+    partition: int,
+    *,
+    name: str | None = None,
+) -> Partition:
+    """Read one partition of a partitioned MSH 4 file with local numbering.
+
+    Only the entity blocks of *partition* and of the partitions that share a
+    partitioned entity with it, which hold its ghost elements, are parsed.
+    The blocks of other partitions are skipped without tokenizing them, as in
+    a read filtered by ``entities``, and data sections are not read. The
+    result equals ``read(source).partition(partition)``.
+    """
+    parser = MainParser(exclude=DATA_SECTIONS, line_tracking="lazy")
+    return _read_source(source, name, parser, partition=partition).partition(partition)
+
+
+def read_partitioned(
+    source: str | os.PathLike[str] | Iterable[str | os.PathLike[str]],
+    *,
+    name: str | None = None,
+    workers: int | None = None,
+) -> Mesh:
+    """Read the per-partition files of a split mesh into one mesh.
+
+    *source* is a glob pattern such as ``"mesh_*.msh"``, matching the
+    ``mesh_1.msh`` to ``mesh_N.msh`` files Gmsh writes with
+    ``PartitionSplitMeshFiles``, or the files themselves. They are parsed
+    concurrently in up to *workers* processes, and nodes and elements shared
+    by several files are kept once. Tags are then validated as in a
+    single-file read. Data sections are not read.
+    """
+    from .modern_builder import ModernMeshBuilder
+    from .partitions import merge_partition_files, partition_paths
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    paths = partition_paths(source)
+    if name is None:
+        name = os.fspath(source) if isinstance(source, str | os.PathLike) else paths[0]
+    builder = ModernMeshBuilder(name)
+    merge_partition_files(paths, builder, workers=workers)
+    return builder.build()
 
 
 def parse(
-    source: str | os.PathLike[str] | TextIO,
+    source: str | os.PathLike[str] | TextIO | BinaryIO | Buffer,
     *,
     name: str | None = None,
+    sections: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    workers: int | None = None,
+    entities: Iterable[EntityKey] | None = None,
+    physical_groups: Iterable[str | PhysicalGroupKey] | None = None,
+    validate: Validation = "full",
+    cache_dir: str | os.PathLike[str] | DiskCache | None = None,
+    columnar: bool = False,
 ) -> Mesh:
     """Parse into the modern model inside the explicit ``gmshparser.api`` namespace."""
-    return read(source, name=name)
+    return read(
+        source,
+        name=name,
+        sections=sections,
+        exclude=exclude,
+        workers=workers,
+        entities=entities,
+        physical_groups=physical_groups,
+        validate=validate,
+        cache_dir=cache_dir,
+        columnar=columnar,
+    )
+
+
+type _Selection = tuple[tuple[EntityKey, ...], tuple[str | PhysicalGroupKey, ...]]
+
+_VALIDATION_LEVELS: tuple[Validation, ...] = ("full", "basic", "none")
+
 
+def _cached_path(source: str | os.PathLike[str] | TextIO | BinaryIO | Buffer) -> str:
+    if hasattr(source, "read") or isinstance(source, Buffer):
+        raise ValueError("cache_dir requires a file path source")
+    return os.fspath(source)
 
-def _read_stream(stream: TextIO, name: str) -> Mesh:
+
+def _read_source(
+    source: str | os.PathLike[str] | TextIO | BinaryIO | Buffer,
+    name: str | None,
+    parser: MainParser,
+    selection: _Selection | None = None,
+    partition: int | None = None,
+    *,
+    validation: Validation = "full",
+    columnar: bool = False,
+) -> Mesh:
+    if not hasattr(source, "read") and isinstance(source, Buffer):
+        stream = cast(TextIO, BytesIO(source))
+        mesh_name = name or "<bytes>"
+    elif hasattr(source, "read"):
+        stream = cast(TextIO, source)
+        mesh_name = name or str(getattr(stream, "name", "<stream>"))
+    else:
+        path = os.fspath(cast("str | os.PathLike[str]", source))
+        with open_source(path) as stream:
+            return _read_stream(
+                stream, name or path, parser, selection, partition, validation, columnar
+            )
+    return _read_stream(
+        stream, mesh_name, parser, selection, partition, validation, columnar
+    )
+
+
+def _read_stream(
+    stream: TextIO,
+    name: str,
+    parser: MainParser,
+    selection: _Selection | None = None,
+    partition: int | None = None,
+    validation: Validation = "full",
+    columnar: bool = False,
+) -> Mesh:
     from .modern_builder import ModernMeshBuilder
 
     builder = ModernMeshBuilder(name)
-    MainParser().parse(builder, stream)
-    return builder.build()
+    builder.set_validation(validation)
+    if selection is not None:
+        builder.select_entities(*selection)
+    if partition is not None:
+        builder.select_partition(partition)
+    parser.parse(builder, stream)
+    return builder.build(columnar=columnar)
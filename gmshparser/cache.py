@@ -0,0 +1,675 @@
+"""Caches of parsed meshes, reused while their source file is unchanged.
+
+:class:`DiskCache` stores columnar snapshots that later processes rebuild
+meshes from, and :class:`MeshCache` keeps built meshes in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from itertools import groupby
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from .columnar import RowView
+from .sink import DataBuffer, ElementBuffer, NodeBuffer, RawElement
+
+if TYPE_CHECKING:
+    from .api import Element, Mesh, Node
+    from .columnar import ElementTable
+    from .sink import EntityKey, MeshSink, PhysicalGroupKey, Validation
+
+__all__ = ["CacheInfo", "DiskCache", "MeshCache", "Snapshot"]
+
+_MAGIC = b"GMSHPARSER-SNAPSHOT-1\n"
+_ALIGNMENT = 8
+_SUFFIX = ".snapshot"
+# A source modified this close to its snapshot may have changed again within
+# the resolution of its modification time, so its content is hashed instead.
+_RACY_NS = 2_000_000_000
+_HASH_CHUNK = 1 << 20
+# Approximate CPython footprint of the modern mesh objects, measured with
+# tracemalloc: a Node with its coordinate tuple and collection entries, an
+# Element without its node references, and one physical-group member.
+_NODE_BYTES = 330
+_ELEMENT_BYTES = 230
+_REFERENCE_BYTES = 8
+_MEMBER_BYTES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """Columnar copy of a modern mesh: JSON-ready metadata and typed arrays.
+
+    Node and element blocks, periodic node pairs, and view data are stored as
+    arrays referenced by index from ``metadata``. :meth:`replay` passes them
+    to any :class:`~gmshparser.sink.MeshSink` as whole typed buffers, so no
+    section parser runs.
+    """
+
+    metadata: Mapping[str, Any]
+    arrays: tuple[array[Any], ...]
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh) -> Snapshot:
+        """Collect the blocks and metadata from which *mesh* can be rebuilt."""
+        arrays: list[array[Any]] = []
+
+        def store(values: array[Any]) -> int:
+            arrays.append(values)
+            return len(arrays) - 1
+
+        # Nodes carry the physical tags declared by their entity, which also
+        # collects the tags of its elements.
+        declared = {
+            entity.key: next(iter(entity.nodes), entity).physical_tags
+            for entity in mesh.entities
+        }
+
+        nodes = []
+        for (key, parametric), node_group in groupby(mesh.nodes, key=_node_key):
+            block_nodes = list(node_group)
+            coordinates = array("d")
+            for node in block_nodes:
+                coordinates.extend(node.coordinates)
+                coordinates.extend(node.parametric_coordinates)
+            tags = store(array("q", [node.tag for node in block_nodes]))
+            nodes.append([*key, parametric, tags, store(coordinates)])
+
+        elements = []
+        for (key, type_id), element_group in groupby(mesh.elements, key=_element_key):
+            block = list(element_group)
+            values = array("q")
+            for element in block:
+                values.append(element.tag)
+                values.extend(node.tag for node in element.nodes)
+            node_counts = None
+            if len({len(element.nodes) for element in block}) != 1:
+                node_counts = store(array("q", [len(e.nodes) for e in block]))
+            physical = None
+            if any(element.physical_tags != declared[key] for element in block):
+                physical = [list(element.physical_tags) for element in block]
+            elements.append(
+                [*key, type_id, len(block), store(values), node_counts, physical]
+            )
+
+        periodic_links = []
+        for link in mesh.periodic_links:
+            pairs = array("q", [tag for pair in link.node_pairs for tag in pair])
+            periodic_links.append(
+                [
+                    link.dimension,
+                    link.entity_tag,
+                    link.master_entity_tag,
+                    list(link.affine_transform),
+                    store(pairs),
+                ]
+            )
+
+        views = []
+        for view in mesh.views:
+            for step in view:
+                data = step.data
+                views.append(
+                    [
+                        step.section,
+                        list(step.string_tags),
+                        list(step.real_tags),
+                        list(step.integer_tags),
+                        data.width,
+                        store(data.tags),
+                        store(data.values),
+                        None if data.node_counts is None else store(data.node_counts),
+                    ]
+                )
+
+        partitioning = mesh.partitioning
+        metadata = {
+            "version": None if mesh.version is None else float(mesh.version),
+            "is_ascii": mesh.is_ascii,
+            "data_size": mesh.data_size,
+            "physical_names": [
+                [group.dimension, group.tag, group.name]
+                for group in mesh.physical_groups
+                if group.name is not None
+            ],
+            "entities": [
+                [*entity.key, list(declared[entity.key]), entity.parent]
+                + [list(entity.partitions)]
+                for entity in mesh.entities
+            ],
+            "partitioning": None
+            if partitioning is None
+            else [
+                partitioning.count,
+                [list(ghost) for ghost in partitioning.ghost_entities],
+                [
+                    [ghost.tag, ghost.partition, list(ghost.ghost_partitions)]
+                    for ghost in partitioning.ghost_elements
+                ],
+            ],
+            "nodes": nodes,
+            "elements": elements,
+            "periodic_links": periodic_links,
+            "views": views,
+        }
+        return cls(metadata, tuple(arrays))
+
+    def replay(self, target: MeshSink) -> None:
+        """Pass the snapshot to *target* in the order the section parsers do."""
+        metadata, arrays = self.metadata, self.arrays
+        if metadata["version"] is not None:
+            target.set_version(metadata["version"])
+        target.set_ascii(metadata["is_ascii"])
+        target.set_precision(metadata["data_size"])
+        for dimension, tag, name in metadata["physical_names"]:
+            target.set_physical_name(dimension, tag, name)
+
+        partitioning = metadata["partitioning"]
+        if partitioning is not None:
+            target.set_number_of_partitions(partitioning[0])
+            for tag, partition in partitioning[1]:
+                target.add_ghost_entity(tag, partition)
+        for dimension, tag, physical_tags, parent, partitions in metadata["entities"]:
+            target.set_entity_physical_tags(dimension, tag, physical_tags)
+            if parent is not None:
+                parent_dimension, parent_tag = parent
+                target.set_entity_partitions(
+                    dimension, tag, parent_dimension, parent_tag, partitions
+                )
+
+        nodes, elements = metadata["nodes"], metadata["elements"]
+        target.set_number_of_nodes(sum(len(arrays[block[3]]) for block in nodes))
+        target.set_number_of_elements(sum(block[3] for block in elements))
+        for dimension, tag, parametric, tags, coordinates in nodes:
+            target.add_node_block(
+                dimension,
+                tag,
+                parametric,
+                NodeBuffer(arrays[tags], arrays[coordinates], 3 + parametric),
+            )
+        for dimension, tag, type_id, count, values, node_counts, physical in elements:
+            target.add_element_block(
+                dimension,
+                tag,
+                type_id,
+                _element_records(
+                    arrays[values],
+                    count,
+                    None if node_counts is None else arrays[node_counts],
+                    physical,
+                ),
+            )
+
+        for dimension, tag, master, transform, pairs in metadata["periodic_links"]:
+            values = arrays[pairs]
+            target.add_periodic_link(
+                dimension,
+                tag,
+                master,
+                transform,
+                zip(values[::2], values[1::2], strict=True),
+            )
+        for section, strings, reals, integers, width, *data in metadata["views"]:
+            tags, values, node_counts = data
+            target.add_data_step(
+                section,
+                tuple(strings),
+                tuple(reals),
+                tuple(integers),
+                DataBuffer(
+                    arrays[tags],
+                    arrays[values],
+                    width,
+                    None if node_counts is None else arrays[node_counts],
+                ),
+            )
+        if partitioning is not None:
+            for tag, partition, ghost_partitions in partitioning[2]:
+                target.add_ghost_element(tag, partition, ghost_partitions)
+
+
+class DiskCache:
+    """Directory of mesh snapshots keyed by source path and read options.
+
+    Each snapshot records the size, modification time, and BLAKE2 digest of
+    its source. A snapshot is reused while the size and modification time
+    match; when they do not, or the source was modified within two seconds
+    of the snapshot, the digest decides. Stale and unreadable snapshots are
+    deleted, and once the directory holds more than *max_bytes* of
+    snapshots, the least recently used ones are removed.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_bytes: int = 1 << 30,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+
+    def load(
+        self,
+        path: str | os.PathLike[str],
+        options: Mapping[str, Any],
+    ) -> Snapshot | None:
+        """Return the snapshot of *path* read with *options*, if still valid."""
+        source = os.path.realpath(path)
+        snapshot_path = self._snapshot_path(source, options)
+        try:
+            with open(snapshot_path, "rb") as file:
+                header, snapshot = _read_snapshot(file)
+            current = _is_current(source, header)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, LookupError, TypeError):
+            current = False
+        if not current:
+            _remove(snapshot_path)
+            return None
+        os.utime(snapshot_path)
+        return snapshot
+
+    def store(
+        self,
+        path: str | os.PathLike[str],
+        options: Mapping[str, Any],
+        mesh: Mesh,
+        before: os.stat_result,
+    ) -> None:
+        """Write the snapshot of *mesh*, parsed from *path* after stat *before*.
+
+        Nothing is written if the source changed while it was parsed.
+        """
+        source = os.path.realpath(path)
+        digest = _digest(source)
+        after = os.stat(source)
+        if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+            return
+        header = {
+            "byteorder": sys.byteorder,
+            "size": after.st_size,
+            "mtime_ns": after.st_mtime_ns,
+            "digest": digest,
+            "written_ns": time.time_ns(),
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            suffix=".tmp", prefix=".", dir=self.directory
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                _write_snapshot(file, header, Snapshot.from_mesh(mesh))
+            os.replace(temporary, self._snapshot_path(source, options))
+        except BaseException:
+            _remove(temporary)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        """Delete every snapshot in the directory."""
+        for entry in self._entries():
+            _remove(entry.path)
+
+    def _snapshot_path(self, source: str, options: Mapping[str, Any]) -> str:
+        key = json.dumps([source, options], sort_keys=True)
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + _SUFFIX)
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry for entry in entries if entry.name.endswith(_SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self) -> None:
+        usage: dict[str, tuple[int, int]] = {}
+        for entry in self._entries():
+            try:
+                status = entry.stat()
+            except FileNotFoundError:
+                continue
+            usage[entry.path] = status.st_mtime_ns, status.st_size
+        total = sum(size for _, size in usage.values())
+        for path in sorted(usage, key=usage.__getitem__):
+            if total <= self.max_bytes:
+                break
+            total -= usage[path][1]
+            _remove(path)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    """Statistics of a :class:`MeshCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+type _MeshKey = tuple[str, str]
+
+
+class MeshCache:
+    """Thread-safe least-recently-used cache of built meshes, bounded in bytes.
+
+    :meth:`read` returns the cached :class:`~gmshparser.api.Mesh` of a path
+    while its resolved path, size, and modification time are unchanged.
+    Meshes are immutable, so one instance is shared by every caller. Once the
+    estimated footprint of the cached meshes exceeds *max_bytes*, the least
+    recently used ones are dropped; a mesh larger than *max_bytes* is
+    returned without being cached.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 30) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pending: dict[_MeshKey, threading.Lock] = {}
+        self._entries: OrderedDict[_MeshKey, tuple[int, int, Mesh, int]] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def read(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        name: str | None = None,
+        sections: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        workers: int | None = None,
+        entities: Iterable[EntityKey] | None = None,
+        physical_groups: Iterable[str | PhysicalGroupKey] | None = None,
+        validate: Validation = "full",
+        cache_dir: str | os.PathLike[str] | DiskCache | None = None,
+        columnar: bool = False,
+    ) -> Mesh:
+        """Return :func:`gmshparser.read` of *path*, reusing a cached mesh.
+
+        Meshes are cached per path, *name*, selection options, and *columnar*.
+        Concurrent calls that miss on the same key wait for one read instead of
+        parsing the file once each.
+        """
+        from .api import read
+
+        if hasattr(path, "read"):
+            raise ValueError("MeshCache requires a file path source")
+        source = os.path.realpath(path)
+        sections = None if sections is None else tuple(sections)
+        exclude = None if exclude is None else tuple(exclude)
+        entities = None if entities is None else tuple(entities)
+        if physical_groups is not None:
+            physical_groups = tuple(physical_groups)
+        options = cache_options(
+            sections=sections,
+            exclude=exclude,
+            entities=entities,
+            physical_groups=physical_groups,
+            validate=validate,
+        )
+        key = source, json.dumps([name, options, columnar], sort_keys=True)
+
+        mesh = self._lookup(key, source)
+        if mesh is not None:
+            return mesh
+        with self._lock:
+            pending = self._pending.setdefault(key, threading.Lock())
+        with pending:
+            try:
+                mesh = self._lookup(key, source, count=False)
+                if mesh is not None:
+                    return mesh
+                before = os.stat(source)
+                mesh = read(
+                    path,
+                    name=name,
+                    sections=sections,
+                    exclude=exclude,
+                    workers=workers,
+                    entities=entities,
+                    physical_groups=physical_groups,
+                    validate=validate,
+                    cache_dir=cache_dir,
+                    columnar=columnar,
+                )
+                self._insert(key, before, mesh)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+        return mesh
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit, miss, and eviction counts and the cache size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._current_bytes,
+                self.max_bytes,
+            )
+
+    def cache_clear(self) -> None:
+        """Drop every cached mesh and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key: _MeshKey, source: str, count: bool = True) -> Mesh | None:
+        status = os.stat(source)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                size, mtime_ns, mesh, footprint = entry
+                if (size, mtime_ns) == (status.st_size, status.st_mtime_ns):
+                    self._entries.move_to_end(key)
+                    self._hits += count
+                    return mesh
+                del self._entries[key]
+                self._current_bytes -= footprint
+            self._misses += count
+            return None
+
+    def _insert(self, key: _MeshKey, before: os.stat_result, mesh: Mesh) -> None:
+        after = os.stat(key[0])
+        if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+            return
+        footprint = estimate_size(mesh)
+        if footprint > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[3]
+            self._entries[key] = after.st_size, after.st_mtime_ns, mesh, footprint
+            self._current_bytes += footprint
+            while self._current_bytes > self.max_bytes:
+                *_, evicted = self._entries.popitem(last=False)[1]
+                self._current_bytes -= evicted
+                self._evictions += 1
+
+
+def estimate_size(mesh: Mesh) -> int:
+    """Return the approximate number of bytes *mesh* occupies in memory."""
+    elements = mesh.elements._items
+    if isinstance(elements, RowView):
+        # Columnar meshes hold their values in the tables and row arrays.
+        table = cast("ElementTable", elements.table)
+        size = table.nbytes + table.nodes.nbytes
+        size += _REFERENCE_BYTES * sum(
+            len(group.nodes) + len(group.elements) for group in mesh.physical_groups
+        )
+    else:
+        size = _NODE_BYTES * len(mesh.nodes) + _ELEMENT_BYTES * len(mesh.elements)
+        size += _REFERENCE_BYTES * sum(len(element.nodes) for element in elements)
+        size += _MEMBER_BYTES * sum(
+            len(group.nodes) + len(group.elements) for group in mesh.physical_groups
+        )
+    for view in mesh.views:
+        for step in view:
+            data = step.data
+            size += data.tags.itemsize * len(data.tags)
+            size += data.values.itemsize * len(data.values)
+    return size
+
+
+def open_cache(cache_dir: str | os.PathLike[str] | DiskCache) -> DiskCache:
+    """Return *cache_dir* as a :class:`DiskCache` with the default size bound."""
+    return cache_dir if isinstance(cache_dir, DiskCache) else DiskCache(cache_dir)
+
+
+def cache_options(
+    *,
+    sections: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    entities: Iterable[EntityKey] | None = None,
+    physical_groups: Iterable[str | PhysicalGroupKey] | None = None,
+    validate: Validation = "full",
+) -> dict[str, Any]:
+    """Return the options of a :func:`gmshparser.read` call as a snapshot key."""
+    return {
+        "sections": _canonical(sections),
+        "exclude": _canonical(exclude),
+        "entities": _canonical(entities),
+        "physical_groups": _canonical(physical_groups),
+        "validate": validate,
+    }
+
+
+def _canonical(values: Iterable[Any] | None) -> list[Any] | None:
+    if values is None:
+        return None
+    return sorted(
+        (list(value) if isinstance(value, tuple) else value for value in values),
+        key=repr,
+    )
+
+
+def _node_key(node: Node) -> tuple[EntityKey, int]:
+    return node.entity_key, len(node.parametric_coordinates)
+
+
+def _element_key(element: Element) -> tuple[EntityKey, int]:
+    return element.entity_key, element.type_id
+
+
+def _element_records(
+    values: array[int],
+    count: int,
+    node_counts: array[int] | None,
+    physical: list[list[int]] | None,
+) -> ElementBuffer | list[RawElement]:
+    if node_counts is None and physical is None and count:
+        return ElementBuffer(values, len(values) // count)
+    widths = node_counts or [len(values) // max(count, 1) - 1] * count
+    records: list[RawElement] = []
+    start = 0
+    for index, width in enumerate(widths):
+        end = start + 1 + width
+        physical_tags = () if physical is None else tuple(physical[index])
+        records.append((values[start], list(values[start + 1 : end]), physical_tags))
+        start = end
+    return records
+
+
+def _write_snapshot(
+    file: IO[bytes],
+    header: dict[str, Any],
+    snapshot: Snapshot,
+) -> None:
+    layout = []
+    offset = 0
+    for values in snapshot.arrays:
+        layout.append([values.typecode, offset, len(values)])
+        offset += _padded(len(values) * values.itemsize)
+    encoded = json.dumps(
+        {**header, "metadata": snapshot.metadata, "arrays": layout}
+    ).encode()
+    prefix = _MAGIC + len(encoded).to_bytes(8, "little") + encoded
+    file.write(prefix.ljust(_padded(len(prefix)), b"\0"))
+    for values in snapshot.arrays:
+        data = values.tobytes()
+        file.write(data.ljust(_padded(len(data)), b"\0"))
+
+
+def _read_snapshot(file: IO[bytes]) -> tuple[dict[str, Any], Snapshot]:
+    """Read a snapshot into new arrays.
+
+    The file is mapped read-only so that each array is copied once, straight
+    from the mapping; the returned arrays do not refer to the file.
+    """
+    with (
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+        if view[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a mesh snapshot")
+        start = len(_MAGIC) + 8
+        length = int.from_bytes(view[len(_MAGIC) : start], "little")
+        header = json.loads(bytes(view[start : start + length]))
+        start = _padded(start + length)
+        arrays = []
+        for typecode, offset, count in header.pop("arrays"):
+            values = array(typecode)
+            begin = start + offset
+            end = begin + count * values.itemsize
+            if end > len(view):
+                raise ValueError("Truncated mesh snapshot")
+            values.frombytes(view[begin:end])
+            arrays.append(values)
+    return header, Snapshot(header.pop("metadata"), tuple(arrays))
+
+
+def _padded(size: int) -> int:
+    return size + -size % _ALIGNMENT
+
+
+def _is_current(source: str, header: Mapping[str, Any]) -> bool:
+    if header["byteorder"] != sys.byteorder:
+        return False
+    status = os.stat(source)
+    if status.st_size != header["size"]:
+        return False
+    if (
+        status.st_mtime_ns == header["mtime_ns"]
+        and status.st_mtime_ns + _RACY_NS < header["written_ns"]
+    ):
+        return True
+    return bool(_digest(source) == header["digest"])
+
+
+def _digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,416 @@
+"""Column-oriented node and element storage behind the modern collections.
+
+A :class:`NodeTable` or :class:`ElementTable` holds one row per node or
+element in flat typed arrays. Collections read with ``columnar=True`` wrap a
+:class:`RowView` of table rows and create :class:`~gmshparser.api.Node` and
+:class:`~gmshparser.api.Element` values only when they are accessed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, overload
+
+from . import api
+from .element_types import ElementType
+from .sink import NodeBuffer
+
+if TYPE_CHECKING:
+    from .api import Element, Node
+    from .sink import EntityKey, RawNode
+
+__all__ = ["ElementTable", "NodeTable", "RowView"]
+
+# Row indices of a collection, ascending so that they follow mesh order.
+type Rows = range | array[int]
+
+
+class _Table:
+    """Rows with unique integer tags, looked up without a per-row dictionary."""
+
+    __slots__ = ("tags", "_order", "_sorted")
+
+    def __init__(self) -> None:
+        self.tags = array("q")
+        self._order: array[int] | None = None
+        self._sorted: bool | None = None
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def row(self, tag: int) -> int:
+        """Return the row of *tag*, or raise :class:`KeyError`."""
+        tags = self.tags
+        if self._sorted is None:
+            self._index()
+        if self._sorted:
+            # Gmsh usually numbers consecutively, so try the direct offset first.
+            row = tag - tags[0] if tags else 0
+            if not 0 <= row < len(tags) or tags[row] != tag:
+                row = bisect_left(tags, tag)
+        else:
+            assert self._order is not None
+            position = bisect_left(self._order, tag, key=tags.__getitem__)
+            row = self._order[position] if position < len(self._order) else -1
+        if row < 0 or row >= len(tags) or tags[row] != tag:
+            raise KeyError(tag)
+        return row
+
+    def has(self, tag: int) -> bool:
+        """Whether a row has *tag*."""
+        try:
+            self.row(tag)
+        except KeyError:
+            return False
+        return True
+
+    def first_repeated(self) -> int | None:
+        """Return the first repeated tag in sort order, or ``None``."""
+        self._index()
+        if self._sorted:
+            return None
+        assert self._order is not None
+        tags = self.tags
+        for previous, current in pairwise(self._order):
+            if tags[previous] == tags[current]:
+                return tags[current]
+        return None
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the typed columns."""
+        return sum(
+            column.itemsize * len(column)
+            for column in self._columns()
+            if column is not None
+        )
+
+    def _columns(self) -> tuple[array[Any] | None, ...]:
+        return self.tags, self._order
+
+    def _index(self) -> None:
+        tags = self.tags
+        self._sorted = all(map(int.__lt__, tags, tags[1:]))
+        if not self._sorted:
+            self._order = array("q", sorted(range(len(tags)), key=tags.__getitem__))
+
+
+class NodeTable(_Table):
+    """Node tags, coordinates, and owning entities in flat typed arrays.
+
+    ``coordinates`` holds ``(x, y, z)`` per row. Parametric coordinates are
+    stored only once a node has them: the values of each row end at its
+    ``parametric_offsets`` entry in ``parametric``.
+    """
+
+    __slots__ = (
+        "coordinates",
+        "dimensions",
+        "entity_tags",
+        "parametric",
+        "parametric_offsets",
+        "physical_tags",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.coordinates = array("d")
+        self.dimensions = array("b")
+        self.entity_tags = array("q")
+        self.parametric = array("d")
+        self.parametric_offsets: array[int] | None = None
+        self.physical_tags: dict[EntityKey, tuple[int, ...]] = {}
+
+    def add_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        nodes: Sequence[RawNode],
+    ) -> range:
+        """Append one node block and return its rows."""
+        start = len(self.tags)
+        if isinstance(nodes, NodeBuffer) and nodes.width == 3:
+            self.tags.extend(nodes.tags)
+            self.coordinates.extend(nodes.coordinates)
+            if self.parametric_offsets is not None:
+                self.parametric_offsets.extend(
+                    array("q", [len(self.parametric)]) * len(nodes)
+                )
+        else:
+            for tag, coordinates in nodes:
+                self.tags.append(tag)
+                self.coordinates.extend(coordinates[:3])
+                if len(coordinates) > 3 and self.parametric_offsets is None:
+                    self.parametric_offsets = array("q", [0]) * (len(self.tags) - 1)
+                if self.parametric_offsets is not None:
+                    self.parametric.extend(coordinates[3:])
+                    self.parametric_offsets.append(len(self.parametric))
+        count = len(self.tags) - start
+        self.dimensions.extend(array("b", [dimension]) * count)
+        self.entity_tags.extend(array("q", [entity_tag]) * count)
+        self._sorted = None
+        return range(start, start + count)
+
+    def _columns(self) -> tuple[array[Any] | None, ...]:
+        return (
+            *super()._columns(),
+            self.coordinates,
+            self.dimensions,
+            self.entity_tags,
+            self.parametric,
+            self.parametric_offsets,
+        )
+
+    def node(self, row: int) -> Node:
+        """Create the :class:`~gmshparser.api.Node` of *row*."""
+        coordinates = self.coordinates
+        start = 3 * row
+        offsets = self.parametric_offsets
+        dimension = self.dimensions[row]
+        entity_tag = self.entity_tags[row]
+        return api.Node(
+            tag=self.tags[row],
+            coordinates=(
+                coordinates[start],
+                coordinates[start + 1],
+                coordinates[start + 2],
+            ),
+            dimension=dimension,
+            entity_tag=entity_tag,
+            parametric_coordinates=()
+            if offsets is None
+            else tuple(self.parametric[offsets[row - 1] if row else 0 : offsets[row]]),
+            physical_tags=self.physical_tags.get((dimension, entity_tag), ()),
+        )
+
+    def view(self, rows: Rows) -> RowView[Node]:
+        """Return the nodes of *rows*, created on access."""
+        return RowView(self, rows, self.node)
+
+    def index_keys(self, field: str, rows: Rows) -> Iterator[tuple[Hashable, ...]]:
+        """Yield the keys of *field* for each of *rows*, read from the columns.
+
+        The fields are those of :meth:`gmshparser.api.NodeCollection.where`.
+        """
+        dimensions, entity_tags = self.dimensions, self.entity_tags
+        if field == "dimension":
+            return ((dimensions[row],) for row in rows)
+        if field == "entity":
+            return (((dimensions[row], entity_tags[row]),) for row in rows)
+        if field == "entity_tag":
+            return ((entity_tags[row],) for row in rows)
+        if field == "parametric":
+            offsets = self.parametric_offsets
+            if offsets is None:
+                return ((False,) for _ in rows)
+            return ((offsets[row] > (offsets[row - 1] if row else 0),) for row in rows)
+        if field == "physical":
+            physical_tags = self.physical_tags
+            return (
+                physical_tags.get((dimensions[row], entity_tags[row]), ())
+                for row in rows
+            )
+        raise ValueError(f"Unknown node field {field!r}")
+
+
+class ElementTable(_Table):
+    """Element tags, types, owning entities, and connectivity in typed arrays.
+
+    ``connectivity`` holds node rows of :attr:`nodes`, with ``offsets[row]``
+    to ``offsets[row + 1]`` delimiting each element. ``physical_ids`` indexes
+    the distinct physical-tag tuples in ``physical_values``.
+    """
+
+    __slots__ = (
+        "connectivity",
+        "dimensions",
+        "entity_tags",
+        "nodes",
+        "offsets",
+        "physical_ids",
+        "physical_values",
+        "type_ids",
+        "_physical_index",
+    )
+
+    def __init__(self, nodes: NodeTable) -> None:
+        super().__init__()
+        self.nodes = nodes
+        self.type_ids = array("i")
+        self.dimensions = array("b")
+        self.entity_tags = array("q")
+        self.offsets = array("q", [0])
+        self.connectivity = array("q")
+        self.physical_ids = array("i")
+        self.physical_values: list[tuple[int, ...]] = []
+        self._physical_index: dict[tuple[int, ...], int] = {}
+
+    def add(
+        self,
+        tag: int,
+        type_id: int,
+        dimension: int,
+        entity_tag: int,
+        node_rows: Sequence[int],
+        physical_tags: tuple[int, ...],
+    ) -> int:
+        """Append one element and return the id of its physical tags."""
+        physical_id = self._physical_index.get(physical_tags)
+        if physical_id is None:
+            physical_id = self._physical_index[physical_tags] = len(
+                self.physical_values
+            )
+            self.physical_values.append(physical_tags)
+        self.tags.append(tag)
+        self.type_ids.append(type_id)
+        self.dimensions.append(dimension)
+        self.entity_tags.append(entity_tag)
+        self.connectivity.extend(node_rows)
+        self.offsets.append(len(self.connectivity))
+        self.physical_ids.append(physical_id)
+        self._sorted = None
+        return physical_id
+
+    def _columns(self) -> tuple[array[Any] | None, ...]:
+        return (
+            *super()._columns(),
+            self.type_ids,
+            self.dimensions,
+            self.entity_tags,
+            self.offsets,
+            self.connectivity,
+            self.physical_ids,
+        )
+
+    def node_rows(self, row: int) -> array[int]:
+        """Return the node rows of the element in *row*."""
+        return self.connectivity[self.offsets[row] : self.offsets[row + 1]]
+
+    def element(self, row: int) -> Element:
+        """Create the :class:`~gmshparser.api.Element` of *row*."""
+        node = self.nodes.node
+        return api.Element(
+            tag=self.tags[row],
+            element_type=ElementType(self.type_ids[row]),
+            nodes=tuple(map(node, self.node_rows(row))),
+            dimension=self.dimensions[row],
+            entity_tag=self.entity_tags[row],
+            physical_tags=self.physical_values[self.physical_ids[row]],
+        )
+
+    def view(self, rows: Rows) -> RowView[Element]:
+        """Return the elements of *rows*, created on access."""
+        return RowView(self, rows, self.element)
+
+    def index_keys(self, field: str, rows: Rows) -> Iterator[tuple[Hashable, ...]]:
+        """Yield the keys of *field* for each of *rows*, read from the columns.
+
+        The fields are those of :meth:`gmshparser.api.ElementCollection.where`.
+        """
+        dimensions, entity_tags = self.dimensions, self.entity_tags
+        if field == "type":
+            type_ids = self.type_ids
+            return ((type_ids[row],) for row in rows)
+        if field == "dimension":
+            return ((dimensions[row],) for row in rows)
+        if field == "entity":
+            return (((dimensions[row], entity_tags[row]),) for row in rows)
+        if field == "entity_tag":
+            return ((entity_tags[row],) for row in rows)
+        if field == "physical":
+            physical_ids, physical_values = self.physical_ids, self.physical_values
+            return (physical_values[physical_ids[row]] for row in rows)
+        raise ValueError(f"Unknown element field {field!r}")
+
+
+class RowView[T](Sequence[T]):
+    """Values of ascending table rows, created by *materialize* on access."""
+
+    __slots__ = ("materialize", "rows", "table")
+
+    def __init__(
+        self,
+        table: _Table,
+        rows: Rows,
+        materialize: Callable[[int], T],
+    ) -> None:
+        self.table = table
+        self.rows = rows
+        self.materialize = materialize
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self.materialize, self.rows)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return list(map(self.materialize, self.rows[index]))
+        return self.materialize(self.rows[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RowView) and other.table is self.table:
+            return len(self.rows) == len(other.rows) and all(
+                map(int.__eq__, self.rows, other.rows)
+            )
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(map(_equal, self, other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def tag_map(self) -> RowTagMap[T]:
+        """Return the values of the view keyed by tag."""
+        return RowTagMap(self)
+
+
+class RowTagMap[T](Mapping[int, T]):
+    """Read-only mapping from the tags of a :class:`RowView` to its values."""
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: RowView[T]) -> None:
+        self._view = view
+
+    def __getitem__(self, tag: int) -> T:
+        view = self._view
+        row = view.table.row(tag)
+        rows = view.rows
+        if isinstance(rows, array):
+            position = bisect_left(rows, row)
+            if position == len(rows) or rows[position] != row:
+                raise KeyError(tag)
+        elif row not in rows:
+            raise KeyError(tag)
+        return view.materialize(row)
+
+    def __iter__(self) -> Iterator[int]:
+        return map(self._view.table.tags.__getitem__, self._view.rows)
+
+    def __len__(self) -> int:
+        return len(self._view.rows)
+
+
+def _equal(left: Any, right: Any) -> bool:
+    return bool(left == right)
+
+
+def merge_rows(parts: Sequence[range]) -> Rows:
+    """Join ascending row ranges, keeping a single range as it is."""
+    if len(parts) == 1:
+        return parts[0]
+    merged = array("q")
+    for part in parts:
+        merged.extend(part)
+    return merged
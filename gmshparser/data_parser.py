@@ -0,0 +1,251 @@
+from array import array
+from collections.abc import Callable, Sequence
+from functools import partial
+from itertools import chain
+from typing import TextIO
+
+from .abstract_parser import AbstractParser
+from .errors import InvalidSectionError
+from .mesh import Mesh
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_record_lines,
+    read_required_line,
+    replay_lines,
+)
+from .sink import DataBuffer
+
+# Value lines are converted in bounded batches, as in the MSH 4.1 node parser.
+_BATCH_LINES = 1 << 16
+
+DATA_SECTIONS = ("$NodeData", "$ElementData", "$ElementNodeData")
+
+
+class NodeDataParser(AbstractParser):
+    """Parse one ``$NodeData`` view step from MSH 2.x and 4.x files."""
+
+    @staticmethod
+    def get_section_name() -> str:
+        return "$NodeData"
+
+    @staticmethod
+    def parse(mesh: Mesh, io: TextIO) -> None:
+        parse_data_section(mesh, io, "$NodeData")
+
+
+class ElementDataParser(AbstractParser):
+    """Parse one ``$ElementData`` view step from MSH 2.x and 4.x files."""
+
+    @staticmethod
+    def get_section_name() -> str:
+        return "$ElementData"
+
+    @staticmethod
+    def parse(mesh: Mesh, io: TextIO) -> None:
+        parse_data_section(mesh, io, "$ElementData")
+
+
+class ElementNodeDataParser(AbstractParser):
+    """Parse one ``$ElementNodeData`` view step from MSH 2.x and 4.x files."""
+
+    @staticmethod
+    def get_section_name() -> str:
+        return "$ElementNodeData"
+
+    @staticmethod
+    def parse(mesh: Mesh, io: TextIO) -> None:
+        parse_data_section(mesh, io, "$ElementNodeData")
+
+
+def parse_data_section(mesh: Mesh, io: TextIO, section: str) -> None:
+    """Parse the tags and records of a post-processing data *section*.
+
+    Records are decoded in bulk into a :class:`~gmshparser.sink.DataBuffer`
+    and passed to ``add_data_step`` together with the tags.
+    """
+    string_tags, real_tags, integer_tags = read_data_tags(io, section)
+    components, count = integer_tags[1], integer_tags[2]
+    per_node = section == "$ElementNodeData"
+    if mesh.get_ascii():
+        data = _read_records(io, count, components, per_node)
+    else:
+        data = _read_binary_records(binary_source(io), count, components, per_node)
+    mesh.add_data_step(section, string_tags, real_tags, integer_tags, data)
+
+    marker = "$End" + section[1:]
+    if mesh.get_ascii():
+        expect_end_marker(io, marker)
+    else:
+        expect_binary_end_marker(binary_source(io), marker)
+
+
+def read_data_tags(
+    io: TextIO,
+    section: str,
+) -> tuple[tuple[str, ...], tuple[float, ...], tuple[int, ...]]:
+    """Read the string, real, and integer tags that open a data *section*.
+
+    The tags are text in both ASCII and binary files. The integer tags must
+    hold at least the time step, the number of components, and the number of
+    records.
+    """
+    string_tags = tuple(map(_unquote, _read_tags(io, section, "string", str)))
+    real_tags = tuple(_read_tags(io, section, "real", float))
+    integer_tags = tuple(_read_tags(io, section, "integer", int))
+    if len(integer_tags) < 3:
+        raise InvalidSectionError(
+            f"{section} requires at least three integer tags, got {len(integer_tags)}"
+        )
+    if integer_tags[1] < 1:
+        raise InvalidSectionError(f"{section} must have at least one component")
+    if integer_tags[2] < 0:
+        raise InvalidSectionError(f"{section} record count cannot be negative")
+    return string_tags, real_tags, integer_tags
+
+
+def _read_tags[T](
+    io: TextIO,
+    section: str,
+    kind: str,
+    convert: Callable[[str], T],
+) -> list[T]:
+    line = read_required_line(io, f"the {section} {kind} tag count")
+    try:
+        count = int(line)
+    except ValueError as error:
+        raise InvalidSectionError(
+            f"{section} {kind} tag count must be an integer"
+        ) from error
+    if count < 0:
+        raise InvalidSectionError(f"{section} {kind} tag count cannot be negative")
+
+    tags: list[T] = []
+    for _ in range(count):
+        line = read_required_line(io, f"a {section} {kind} tag").strip()
+        try:
+            tags.append(convert(line))
+        except ValueError as error:
+            raise InvalidSectionError(
+                f"{section} {kind} tags must be {kind} values"
+            ) from error
+    return tags
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _read_records(
+    io: TextIO,
+    count: int,
+    components: int,
+    per_node: bool,
+) -> DataBuffer:
+    """Read ASCII data records in batches into flat tag and value arrays."""
+    tags = array("q")
+    values = array("d")
+    node_counts = array("q") if per_node else None
+    width = 1 + components
+    while len(tags) < count:
+        expected = min(_BATCH_LINES, count - len(tags))
+        lines = read_record_lines(io, expected)
+        if not per_node and len(lines) == expected:
+            rows: list[Sequence[str | bytes]] = [line.split() for line in lines]
+            if set(map(len, rows)) == {width}:
+                fields = list(chain.from_iterable(rows))
+                try:
+                    batch_tags = array("q", map(int, fields[::width]))
+                    del fields[::width]
+                    values.extend(array("d", map(float, fields)))
+                    tags.extend(batch_tags)
+                    continue
+                except (OverflowError, ValueError):
+                    pass
+        parse = partial(
+            _parse_record_lines,
+            count=expected,
+            components=components,
+            per_node=per_node,
+        )
+        for tag, node_count, record in replay_lines(io, lines, parse):
+            tags.append(tag)
+            values.extend(record)
+            if node_counts is not None:
+                node_counts.append(node_count)
+    return DataBuffer(tags, values, components, node_counts)
+
+
+def _parse_record_lines(
+    io: TextIO,
+    count: int,
+    components: int,
+    per_node: bool,
+) -> list[tuple[int, int, Sequence[float]]]:
+    records: list[tuple[int, int, Sequence[float]]] = []
+    for _ in range(count):
+        fields = read_required_line(io, "a data record").split()
+        header = 2 if per_node else 1
+        if len(fields) < header:
+            raise InvalidSectionError(
+                "Element-node data records must start with a tag and a node count"
+                if per_node
+                else "Data records must start with a tag"
+            )
+        try:
+            tag = int(fields[0])
+            node_count = int(fields[1]) if per_node else 1
+            record = [float(value) for value in fields[header:]]
+        except ValueError as error:
+            raise InvalidSectionError(
+                "Data record tags and values must be numeric"
+            ) from error
+        if node_count <= 0:
+            raise InvalidSectionError(
+                f"Data record {tag} must have a positive node count"
+            )
+        if len(record) != node_count * components:
+            raise InvalidSectionError(
+                f"Data record {tag} requires {node_count * components} values, "
+                f"got {len(record)}"
+            )
+        records.append((tag, node_count, record))
+    return records
+
+
+def _read_binary_records(
+    source: SourceBinaryIO,
+    count: int,
+    components: int,
+    per_node: bool,
+) -> DataBuffer:
+    """Read binary records of an ``int`` tag followed by ``double`` values."""
+    tags = array("q")
+    values = array("d")
+    if not per_node:
+        for tag, *record in source.unpack_records(
+            f"i{components}d", count, "binary data records"
+        ):
+            tags.append(tag)
+            values.extend(record)
+        return DataBuffer(tags, values, components)
+
+    node_counts = array("q")
+    for _ in range(count):
+        tag, node_count = source.unpack("ii", "a binary element-node data header")
+        if node_count <= 0:
+            raise InvalidSectionError(
+                f"Data record {tag} must have a positive node count"
+            )
+        tags.append(tag)
+        node_counts.append(node_count)
+        values.extend(
+            source.read_array(
+                "d", node_count * components, "binary element-node data values"
+            )
+        )
+    return DataBuffer(tags, values, components, node_counts)
@@ -1,3 +1,7 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from functools import partial
+from itertools import chain
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
@@ -9,7 +13,20 @@ from .element_types import (
 from .errors import InvalidElementError
 from .helpers import parse_ints
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_record_lines,
+    read_required_line,
+    replay_lines,
+    skip_record_lines,
+)
+from .sink import ElementBuffer, ParsedElementBlock, RawElement
+
+# Element lines are decoded in bounded batches, as in the nodes parser.
+_BATCH_LINES = 1 << 16
 
 
 class ElementsParser(AbstractParser):
@@ -21,96 +38,210 @@ class ElementsParser(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
-        line = read_required_line(io, "$Elements header")
-        if line.startswith("$Elements"):
-            line = read_required_line(io, "$Elements header")
+        for block in iter_blocks(mesh, io):
+            mesh.add_element_block(*block)
 
-        try:
-            metadata = [int(value) for value in line.strip().split()]
-        except ValueError as error:
-            raise InvalidElementError(
-                "$Elements header must contain integers"
-            ) from error
 
-        is_v40 = mesh.get_version_major() == 4 and mesh.get_version_minor() == 0
-        expected_header_fields = 2 if is_v40 else 4
-        if len(metadata) != expected_header_fields:
+def iter_blocks(mesh: Mesh, io: TextIO) -> Iterator[ParsedElementBlock]:
+    """Yield ``$Elements`` entity blocks one at a time as they are parsed.
+
+    Blocks are yielded as the arguments of
+    :meth:`~gmshparser.mesh.Mesh.add_element_block`, as in
+    :func:`gmshparser.nodes_parser.iter_blocks`.
+    """
+    if not mesh.get_ascii():
+        yield from _iter_binary_blocks(mesh, binary_source(io))
+        return
+
+    line = read_required_line(io, "$Elements header")
+    if line.startswith("$Elements"):
+        line = read_required_line(io, "$Elements header")
+
+    try:
+        metadata = [int(value) for value in line.strip().split()]
+    except ValueError as error:
+        raise InvalidElementError("$Elements header must contain integers") from error
+
+    is_v40 = mesh.get_version_major() == 4 and mesh.get_version_minor() == 0
+    expected_header_fields = 2 if is_v40 else 4
+    if len(metadata) != expected_header_fields:
+        raise InvalidElementError(
+            f"$Elements header for MSH {'4.0' if is_v40 else '4.1'} must "
+            f"contain {expected_header_fields} integers"
+        )
+
+    if is_v40:
+        number_of_entities, number_of_elements = metadata
+        min_tag = max_tag = 0
+    else:
+        number_of_entities, number_of_elements, min_tag, max_tag = metadata
+
+    if number_of_entities < 0 or number_of_elements < 0:
+        raise InvalidElementError("$Elements counts cannot be negative")
+
+    mesh.set_number_of_element_entities(number_of_entities)
+    mesh.set_number_of_elements(number_of_elements)
+    mesh.set_min_element_tag(min_tag)
+    mesh.set_max_element_tag(max_tag)
+
+    parsed_elements = 0
+    tag_extremes: list[int] = []
+    for _ in range(number_of_entities):
+        block_metadata = parse_ints(io)
+        if len(block_metadata) != 4:
             raise InvalidElementError(
-                f"$Elements header for MSH {'4.0' if is_v40 else '4.1'} must "
-                f"contain {expected_header_fields} integers"
+                "An $Elements block header must contain four integers"
             )
 
         if is_v40:
-            number_of_entities, number_of_elements = metadata
-            min_tag = max_tag = 0
+            entity_tag, dimension, type_id, block_count = block_metadata
         else:
-            number_of_entities, number_of_elements, min_tag, max_tag = metadata
-
-        if number_of_entities < 0 or number_of_elements < 0:
-            raise InvalidElementError("$Elements counts cannot be negative")
-
-        mesh.set_number_of_element_entities(number_of_entities)
-        mesh.set_number_of_elements(number_of_elements)
-        mesh.set_min_element_tag(min_tag)
-        mesh.set_max_element_tag(max_tag)
-
-        parsed_elements = 0
-        parsed_tags: list[int] = []
-        for _ in range(number_of_entities):
-            block_metadata = parse_ints(io)
-            if len(block_metadata) != 4:
-                raise InvalidElementError(
-                    "An $Elements block header must contain four integers"
-                )
-
-            if is_v40:
-                entity_tag, dimension, type_id, block_count = block_metadata
-            else:
-                dimension, entity_tag, type_id, block_count = block_metadata
-
-            if dimension not in {0, 1, 2, 3}:
-                raise InvalidElementError(
-                    f"Element entity {entity_tag} has invalid dimension {dimension}"
-                )
-            if block_count < 0:
-                raise InvalidElementError("Element block counts cannot be negative")
-
-            element_type = ElementType(type_id)
-            if element_type.is_known:
-                validate_element_dimension(element_type, dimension)
-
-            records: list[tuple[int, list[int], tuple[int, ...]]] = []
-            for _ in range(block_count):
-                element_info = parse_ints(io)
-                if not element_info:
-                    raise InvalidElementError("An element record cannot be empty")
-                element_tag = element_info[0]
-                node_tags = element_info[1:]
-                if element_type.is_known:
-                    validate_element_connectivity(
-                        element_type,
-                        node_tags,
-                        element_tag=element_tag,
-                    )
-                records.append((element_tag, node_tags, ()))
-                parsed_tags.append(element_tag)
-
-            parsed_elements += block_count
-            mesh.add_element_block(
-                dimension,
-                entity_tag,
-                int(element_type),
-                records,
-            )
+            dimension, entity_tag, type_id, block_count = block_metadata
 
-        if parsed_elements != number_of_elements:
+        if dimension not in {0, 1, 2, 3}:
             raise InvalidElementError(
-                f"$Elements declares {number_of_elements} elements, "
-                f"parsed {parsed_elements}"
+                f"Element entity {entity_tag} has invalid dimension {dimension}"
             )
+        if block_count < 0:
+            raise InvalidElementError("Element block counts cannot be negative")
 
-        if is_v40:
-            mesh.set_min_element_tag(min(parsed_tags, default=0))
-            mesh.set_max_element_tag(max(parsed_tags, default=0))
+        element_type = ElementType(type_id)
+        if element_type.is_known:
+            validate_element_dimension(element_type, dimension)
+
+        parsed_elements += block_count
+        if not mesh.selects_entity_block("$Elements", dimension, entity_tag):
+            skip_record_lines(io, block_count, "a skipped element record")
+            continue
+
+        records: Sequence[RawElement]
+        if element_type.is_known:
+            records = _read_element_block(io, element_type, block_count)
+        else:
+            records = _parse_element_lines(io, block_count, element_type)
+        if is_v40 and records:
+            block_tags = [record[0] for record in records]
+            tag_extremes += min(block_tags), max(block_tags)
+
+        yield dimension, entity_tag, int(element_type), records
+
+    if parsed_elements != number_of_elements:
+        raise InvalidElementError(
+            f"$Elements declares {number_of_elements} elements, "
+            f"parsed {parsed_elements}"
+        )
+
+    if is_v40:
+        mesh.set_min_element_tag(min(tag_extremes, default=0))
+        mesh.set_max_element_tag(max(tag_extremes, default=0))
+
+    expect_end_marker(io, "$EndElements")
+
+
+def _read_element_block(
+    io: TextIO,
+    element_type: ElementType,
+    count: int,
+) -> ElementBuffer:
+    """Decode a block of known element type in batches of fixed-width records.
+
+    All records in a block share one element type, so the record width is
+    checked once per batch and the batch is converted with one ``int`` pass
+    into a flat array of ``count * width`` values.
+    """
+    node_count = element_type.node_count
+    assert node_count is not None
+    width = 1 + node_count
+    values = array("q")
+    while len(values) < count * width:
+        expected = min(_BATCH_LINES, count - len(values) // width)
+        lines = read_record_lines(io, expected)
+        rows: list[Sequence[str | bytes]] = [line.split() for line in lines]
+        if len(rows) == expected and set(map(len, rows)) == {width}:
+            try:
+                values.extend(array("q", map(int, chain.from_iterable(rows))))
+                continue
+            except (OverflowError, ValueError):
+                pass
+        records = replay_lines(
+            io,
+            lines,
+            partial(_parse_element_lines, count=expected, element_type=element_type),
+        )
+        try:
+            values.extend(
+                chain.from_iterable((tag, *nodes) for tag, nodes, _ in records)
+            )
+        except OverflowError as error:
+            raise InvalidElementError(
+                "Element and node tags must fit in 64-bit integers"
+            ) from error
+    return ElementBuffer(values, width)
+
+
+def _parse_element_lines(
+    io: TextIO,
+    count: int,
+    element_type: ElementType,
+) -> list[RawElement]:
+    records: list[RawElement] = []
+    for _ in range(count):
+        element_info = parse_ints(io)
+        if not element_info:
+            raise InvalidElementError("An element record cannot be empty")
+        element_tag = element_info[0]
+        node_tags = element_info[1:]
+        if element_type.is_known:
+            validate_element_connectivity(
+                element_type,
+                node_tags,
+                element_tag=element_tag,
+            )
+        records.append((element_tag, node_tags, ()))
+    return records
+
+
+def _iter_binary_blocks(
+    mesh: Mesh,
+    source: SourceBinaryIO,
+) -> Iterator[ParsedElementBlock]:
+    """Read MSH 4.1 binary element blocks as one connectivity array per block."""
+    number_of_entities, number_of_elements, min_tag, max_tag = source.unpack(
+        "NNNN", "the binary $Elements header"
+    )
+    mesh.set_number_of_element_entities(number_of_entities)
+    mesh.set_number_of_elements(number_of_elements)
+    mesh.set_min_element_tag(min_tag)
+    mesh.set_max_element_tag(max_tag)
+
+    parsed_elements = 0
+    for _ in range(number_of_entities):
+        dimension, entity_tag, type_id, block_count = source.unpack(
+            "iiiN", "a binary element block header"
+        )
+        if dimension not in {0, 1, 2, 3}:
+            raise InvalidElementError(
+                f"Element entity {entity_tag} has invalid dimension {dimension}"
+            )
 
-        expect_end_marker(io, "$EndElements")
+        # Binary records carry no width, so the element type must be registered.
+        element_type = validate_element_dimension(type_id, dimension)
+        node_count = element_type.node_count
+        assert node_count is not None
+        width = 1 + node_count
+        parsed_elements += block_count
+        if not mesh.selects_entity_block("$Elements", dimension, entity_tag):
+            size = block_count * width * source.data_size
+            source.skip_bytes(size, "skipped binary element records")
+            continue
+        values = source.read_array("N", block_count * width, "binary element records")
+        records = ElementBuffer(values, width)
+        yield dimension, entity_tag, int(element_type), records
+
+    if parsed_elements != number_of_elements:
+        raise InvalidElementError(
+            f"$Elements declares {number_of_elements} elements, "
+            f"parsed {parsed_elements}"
+        )
+
+    expect_binary_end_marker(source, "$EndElements")
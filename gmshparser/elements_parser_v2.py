@@ -1,12 +1,29 @@
 """Parser for the MSH 2.x ``$Elements`` section."""
 
+from collections.abc import Iterator
+from itertools import batched, groupby
+from operator import itemgetter
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
-from .element_types import validate_element_connectivity
+from .element_types import require_element_type, validate_element_connectivity
 from .errors import InvalidElementError
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_required_line,
+)
+from .sink import ParsedElementBlock, RawElement
+
+type ElementRecord = tuple[int, int, list[int], list[int]]
+type BlockKey = tuple[int, int, int]
+
+# Streamed element runs and binary element groups are split into chunks of this
+# many records.
+_BATCH_RECORDS = 1 << 16
 
 
 class ElementsParserV2(AbstractParser):
@@ -18,80 +35,21 @@ class ElementsParserV2(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
-        line = read_required_line(io, "$Elements element count")
-        if line.startswith("$Elements"):
-            line = read_required_line(io, "$Elements element count")
-
-        try:
-            number_of_elements = int(line.strip())
-        except ValueError as error:
-            raise InvalidElementError(
-                "$Elements element count must be an integer"
-            ) from error
-        if number_of_elements < 0:
-            raise InvalidElementError("$Elements element count cannot be negative")
-
-        mesh.set_number_of_elements(number_of_elements)
-        element_groups: dict[
-            tuple[int, int, int],
-            list[tuple[int, list[int], tuple[int, ...]]],
-        ] = {}
+        element_groups: dict[BlockKey, list[RawElement]] = {}
         physical_tags_by_entity: dict[tuple[int, int], list[int]] = {}
         min_tag: int | None = None
         max_tag: int | None = None
 
-        for _ in range(number_of_elements):
-            record = read_required_line(io, "an MSH 2 element record")
-            try:
-                fields = [int(value) for value in record.strip().split()]
-            except ValueError as error:
-                raise InvalidElementError(
-                    "MSH 2 element records must contain integers"
-                ) from error
-            if len(fields) < 3:
-                raise InvalidElementError(
-                    "An MSH 2 element record must contain at least three fields"
-                )
-
-            element_tag = fields[0]
-            element_type_id = fields[1]
-            number_of_tags = fields[2]
-            if number_of_tags < 0:
-                raise InvalidElementError("Element tag counts cannot be negative")
-
-            tags_start = 3
-            tags_end = tags_start + number_of_tags
-            if len(fields) < tags_end:
-                raise InvalidElementError(
-                    f"Element {element_tag} declares {number_of_tags} tags, "
-                    f"but the record contains {max(0, len(fields) - tags_start)}"
-                )
-
-            tags = fields[tags_start:tags_end]
-            node_tags = fields[tags_end:]
-            element_type = validate_element_connectivity(
-                element_type_id,
-                node_tags,
-                element_tag=element_tag,
-            )
-            dimension = element_type.dimension
-            assert dimension is not None
-
-            physical_tag = tags[0] if tags and tags[0] > 0 else 0
-            physical_tags = (physical_tag,) if physical_tag else ()
-            entity_tag = tags[1] if len(tags) > 1 else 1
-            entity_key = dimension, entity_tag
-            if physical_tag:
-                entity_tags = physical_tags_by_entity.setdefault(entity_key, [])
-                if physical_tag not in entity_tags:
-                    entity_tags.append(physical_tag)
+        for block_key, record in _iter_block_records(mesh, io):
+            element_tag, _, physical_tags = record
+            if physical_tags:
+                entity_tags = physical_tags_by_entity.setdefault(block_key[:2], [])
+                if physical_tags[0] not in entity_tags:
+                    entity_tags.append(physical_tags[0])
 
             min_tag = element_tag if min_tag is None else min(min_tag, element_tag)
             max_tag = element_tag if max_tag is None else max(max_tag, element_tag)
-            block_key = (dimension, entity_tag, int(element_type))
-            element_groups.setdefault(block_key, []).append(
-                (element_tag, node_tags, physical_tags)
-            )
+            element_groups.setdefault(block_key, []).append(record)
 
         if min_tag is not None and max_tag is not None:
             mesh.set_min_element_tag(min_tag)
@@ -110,4 +68,136 @@ class ElementsParserV2(AbstractParser):
         for (dimension, entity_tag, type_id), block_elements in element_groups.items():
             mesh.add_element_block(dimension, entity_tag, type_id, block_elements)
 
+
+def iter_blocks(mesh: Mesh, io: TextIO) -> Iterator[ParsedElementBlock]:
+    """Yield runs of consecutive MSH 2 elements that share entity and type.
+
+    MSH 2 interleaves entities freely, so one entity may be yielded in several
+    runs. :meth:`ElementsParserV2.parse` merges them into one block per entity
+    and type instead.
+    """
+    for (dimension, entity_tag, type_id), run in groupby(
+        _iter_block_records(mesh, io), key=itemgetter(0)
+    ):
+        for batch in batched(run, _BATCH_RECORDS):
+            yield dimension, entity_tag, type_id, [record for _, record in batch]
+
+
+def _iter_block_records(
+    mesh: Mesh,
+    io: TextIO,
+) -> Iterator[tuple[BlockKey, RawElement]]:
+    """Yield validated records keyed by ``(dimension, entity, type)``."""
+    line = read_required_line(io, "$Elements element count")
+    if line.startswith("$Elements"):
+        line = read_required_line(io, "$Elements element count")
+
+    try:
+        number_of_elements = int(line.strip())
+    except ValueError as error:
+        raise InvalidElementError(
+            "$Elements element count must be an integer"
+        ) from error
+    if number_of_elements < 0:
+        raise InvalidElementError("$Elements element count cannot be negative")
+
+    mesh.set_number_of_elements(number_of_elements)
+    if mesh.get_ascii():
+        element_records = _read_ascii_records(io, number_of_elements)
+    else:
+        element_records = _read_binary_records(binary_source(io), number_of_elements)
+
+    for element_tag, element_type_id, tags, node_tags in element_records:
+        element_type = validate_element_connectivity(
+            element_type_id,
+            node_tags,
+            element_tag=element_tag,
+        )
+        dimension = element_type.dimension
+        assert dimension is not None
+
+        physical_tag = tags[0] if tags and tags[0] > 0 else 0
+        physical_tags = (physical_tag,) if physical_tag else ()
+        entity_tag = tags[1] if len(tags) > 1 else 1
+        yield (
+            (dimension, entity_tag, int(element_type)),
+            (element_tag, node_tags, physical_tags),
+        )
+
+    if mesh.get_ascii():
         expect_end_marker(io, "$EndElements")
+    else:
+        expect_binary_end_marker(binary_source(io), "$EndElements")
+
+
+def _read_ascii_records(io: TextIO, number_of_elements: int) -> Iterator[ElementRecord]:
+    """Yield ``(tag, type, tags, node_tags)`` from one text line per element."""
+    for _ in range(number_of_elements):
+        record = read_required_line(io, "an MSH 2 element record")
+        try:
+            fields = [int(value) for value in record.strip().split()]
+        except ValueError as error:
+            raise InvalidElementError(
+                "MSH 2 element records must contain integers"
+            ) from error
+        if len(fields) < 3:
+            raise InvalidElementError(
+                "An MSH 2 element record must contain at least three fields"
+            )
+
+        element_tag = fields[0]
+        number_of_tags = fields[2]
+        if number_of_tags < 0:
+            raise InvalidElementError("Element tag counts cannot be negative")
+
+        tags_start = 3
+        tags_end = tags_start + number_of_tags
+        if len(fields) < tags_end:
+            raise InvalidElementError(
+                f"Element {element_tag} declares {number_of_tags} tags, "
+                f"but the record contains {max(0, len(fields) - tags_start)}"
+            )
+        yield element_tag, fields[1], fields[tags_start:tags_end], fields[tags_end:]
+
+
+def _read_binary_records(
+    source: SourceBinaryIO,
+    number_of_elements: int,
+) -> Iterator[ElementRecord]:
+    """Yield binary records, bulk-reading each ``(type, count, ntags)`` group.
+
+    Binary MSH 2 element groups share one header, so every record in a group has
+    the same width and the group is read as ``int`` arrays of up to 65,536
+    records.
+    """
+    remaining = number_of_elements
+    while remaining > 0:
+        element_type_id, count, number_of_tags = source.unpack(
+            "iii", "a binary MSH 2 element header"
+        )
+        if count <= 0 or count > remaining:
+            raise InvalidElementError(
+                f"Binary element header declares {count} elements, but "
+                f"{remaining} remain in $Elements"
+            )
+        if number_of_tags < 0:
+            raise InvalidElementError("Element tag counts cannot be negative")
+
+        # Binary records carry no width, so the element type must be registered.
+        node_count = require_element_type(element_type_id).node_count
+        assert node_count is not None
+        tags_end = 1 + number_of_tags
+        for first in range(0, count, _BATCH_RECORDS):
+            values = source.read_array(
+                "i",
+                min(_BATCH_RECORDS, count - first) * (tags_end + node_count),
+                "binary MSH 2 element records",
+            )
+            for row in batched(values.tolist(), tags_end + node_count):
+                yield (
+                    row[0],
+                    element_type_id,
+                    list(row[1:tags_end]),
+                    list(row[tags_end:]),
+                )
+        remaining -= count
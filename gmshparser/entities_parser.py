@@ -1,10 +1,18 @@
+from collections.abc import Callable, Iterable, Sequence
 from math import isfinite
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
 from .errors import InvalidSectionError
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    get_validation,
+    read_required_line,
+)
 
 
 class EntitiesParser(AbstractParser):
@@ -16,6 +24,10 @@ class EntitiesParser(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
+        if not mesh.get_ascii():
+            _parse_binary(mesh, binary_source(io))
+            return
+
         line = read_required_line(io, "$Entities header")
         if line.startswith("$Entities"):
             line = read_required_line(io, "$Entities header")
@@ -34,7 +46,9 @@ class EntitiesParser(AbstractParser):
             raise InvalidSectionError("$Entities counts cannot be negative")
 
         is_v40 = mesh.get_version_major() == 4 and mesh.get_version_minor() == 0
+        checked = get_validation(mesh) == "full"
         seen_entity_tags: list[set[int]] = [set() for _ in counts]
+        set_bounds = entity_bounds_setter(mesh)
 
         for dimension, count in enumerate(counts):
             geometry_count = 6 if is_v40 or dimension > 0 else 3
@@ -62,26 +76,10 @@ class EntitiesParser(AbstractParser):
                         "values must be numbers"
                     ) from error
 
-                if tag <= 0:
-                    raise InvalidSectionError("Entity tags must be positive")
-                if tag in seen_entity_tags[dimension]:
-                    raise InvalidSectionError(
-                        f"Duplicate dimension-{dimension} entity tag {tag}"
-                    )
-                if any(not isfinite(value) for value in geometry):
-                    raise InvalidSectionError(
-                        f"Entity {tag} contains non-finite geometry values"
+                if checked:
+                    _validate_geometry(
+                        dimension, tag, geometry, seen_entity_tags[dimension]
                     )
-                if geometry_count == 6:
-                    minimum = geometry[:3]
-                    maximum = geometry[3:]
-                    if any(
-                        lower > upper
-                        for lower, upper in zip(minimum, maximum, strict=True)
-                    ):
-                        raise InvalidSectionError(
-                            f"Entity {tag} has an inverted bounding box"
-                        )
                 if number_of_physical_tags < 0:
                     raise InvalidSectionError(
                         "Entity physical-group counts cannot be negative"
@@ -104,10 +102,8 @@ class EntitiesParser(AbstractParser):
                     raise InvalidSectionError(
                         "Entity physical-group tags must be integers"
                     ) from error
-                if any(physical_tag <= 0 for physical_tag in physical_tags):
-                    raise InvalidSectionError(
-                        "Entity physical-group tags must be positive integers"
-                    )
+                if checked:
+                    _validate_physical_tags(physical_tags)
 
                 if dimension == 0:
                     if len(parts) != physical_stop:
@@ -146,12 +142,99 @@ class EntitiesParser(AbstractParser):
                         raise InvalidSectionError(
                             "Entity boundary tags must be integers"
                         ) from error
-                    if any(boundary_tag == 0 for boundary_tag in boundary_tags):
-                        raise InvalidSectionError(
-                            "Entity boundary tags must be non-zero signed integers"
-                        )
+                    if checked:
+                        _validate_boundary_tags(boundary_tags)
+                    mesh.set_entity_boundary(dimension, tag, boundary_tags)
 
                 seen_entity_tags[dimension].add(tag)
                 mesh.set_entity_physical_tags(dimension, tag, physical_tags)
+                if set_bounds is not None:
+                    set_bounds(dimension, tag, geometry)
 
         expect_end_marker(io, "$EndEntities")
+
+
+def _validate_geometry(
+    dimension: int,
+    tag: int,
+    geometry: tuple[float, ...],
+    seen_tags: set[int],
+) -> None:
+    if tag <= 0:
+        raise InvalidSectionError("Entity tags must be positive")
+    if tag in seen_tags:
+        raise InvalidSectionError(f"Duplicate dimension-{dimension} entity tag {tag}")
+    if any(not isfinite(value) for value in geometry):
+        raise InvalidSectionError(f"Entity {tag} contains non-finite geometry values")
+    if len(geometry) == 6:
+        minimum = geometry[:3]
+        maximum = geometry[3:]
+        if any(lower > upper for lower, upper in zip(minimum, maximum, strict=True)):
+            raise InvalidSectionError(f"Entity {tag} has an inverted bounding box")
+
+
+def _validate_physical_tags(physical_tags: Iterable[int]) -> None:
+    if any(physical_tag <= 0 for physical_tag in physical_tags):
+        raise InvalidSectionError(
+            "Entity physical-group tags must be positive integers"
+        )
+
+
+def _validate_boundary_tags(boundary_tags: Iterable[int]) -> None:
+    if any(boundary_tag == 0 for boundary_tag in boundary_tags):
+        raise InvalidSectionError(
+            "Entity boundary tags must be non-zero signed integers"
+        )
+
+
+def _parse_binary(mesh: Mesh, source: SourceBinaryIO) -> None:
+    """Read MSH 4.1 binary entity records."""
+    counts = source.unpack("NNNN", "the binary $Entities header")
+    checked = get_validation(mesh) == "full"
+    seen_entity_tags: list[set[int]] = [set() for _ in counts]
+    set_bounds = entity_bounds_setter(mesh)
+
+    for dimension, count in enumerate(counts):
+        geometry_count = 3 if dimension == 0 else 6
+        for _ in range(count):
+            tag, *geometry = source.unpack(
+                f"i{geometry_count}d", "a binary entity record"
+            )
+            if checked:
+                _validate_geometry(
+                    dimension, tag, tuple(geometry), seen_entity_tags[dimension]
+                )
+
+            (number_of_physical_tags,) = source.unpack(
+                "N", "a binary entity physical-group count"
+            )
+            physical_tags = tuple(
+                source.read_array(
+                    "i", number_of_physical_tags, "binary entity physical tags"
+                )
+            )
+            if checked:
+                _validate_physical_tags(physical_tags)
+
+            if dimension > 0:
+                (boundary_count,) = source.unpack("N", "a binary entity boundary count")
+                boundary_tags = source.read_array(
+                    "i", boundary_count, "binary boundary tags"
+                )
+                if checked:
+                    _validate_boundary_tags(boundary_tags)
+                mesh.set_entity_boundary(dimension, tag, boundary_tags)
+
+            seen_entity_tags[dimension].add(tag)
+            mesh.set_entity_physical_tags(dimension, tag, physical_tags)
+            if set_bounds is not None:
+                set_bounds(dimension, tag, geometry)
+
+    expect_binary_end_marker(source, "$EndEntities")
+
+
+def entity_bounds_setter(
+    mesh: Mesh,
+) -> Callable[[int, int, Sequence[float]], None] | None:
+    """Return the optional bounding-box callback of *mesh*, used by selective reads."""
+    return getattr(mesh, "set_entity_bounding_box", None)
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from functools import partial
+from io import StringIO, TextIOWrapper
+from types import TracebackType
+from typing import TYPE_CHECKING, BinaryIO, TextIO, cast
+
+from .data_parser import DATA_SECTIONS, read_data_tags
+from .errors import InvalidSectionError, UnexpectedEndOfFileError
+from .main_parser import (
+    DATA_PARSERS,
+    ParserClass,
+    ParserTarget,
+    dispatch_table,
+    get_default_parsers,
+    parse_section,
+)
+from .mesh_format_parser import MeshFormatParser
+from .modern_builder import ModernMeshBuilder
+from .parsing import SourceBinaryIO, SourceTextIO, contextualize_error
+from .section_index import SectionIndex, SectionSpan
+from .sink import MeshSinkBase
+
+if TYPE_CHECKING:
+    from .api import (
+        ElementCollection,
+        Mesh,
+        NodeCollection,
+        PeriodicLinkCollection,
+        PhysicalGroupKey,
+        Version,
+        ViewCollection,
+        ViewStep,
+        ViewStepInfo,
+    )
+
+__all__ = ["LazyMesh", "read_lazy"]
+
+# Data section tags are read from a prefix of the section that grows as needed.
+_STEP_HEADER_BYTES = 1 << 12
+
+
+class LazyMesh:
+    """Handle to an MSH file whose sections are parsed on first access.
+
+    Sections are located through a :class:`~gmshparser.section_index.SectionIndex`
+    and each one is parsed at most once, the first time a property needs it.
+    Reading :attr:`physical_names` therefore parses only ``$MeshFormat`` and
+    ``$PhysicalNames``, and :attr:`nodes` never tokenizes ``$Elements``. The
+    handle keeps the file memory-mapped until :meth:`close` is called or its
+    ``with`` block exits.
+
+    :attr:`views` reads only the tags of each post-processing data section.
+    A step is parsed when :meth:`~gmshparser.api.View.step` requests it, and
+    the last *step_cache* steps are kept in a least-recently-used cache.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        name: str | None = None,
+        step_cache: int = 8,
+    ) -> None:
+        if step_cache < 0:
+            raise ValueError("step_cache cannot be negative")
+        self.index = SectionIndex(path)
+        self.name = name or self.index.path
+        self._builder = ModernMeshBuilder(self.name)
+        self._parsers: dict[str, ParserClass] | None = None
+        self._loaded: set[str] = set()
+        self._byte_order: str | None = None
+        self._data_size = 8
+        self._mesh: Mesh | None = None
+        self._views: ViewCollection | None = None
+        self._step_cache_size = step_cache
+        self._step_cache: OrderedDict[int, ViewStep] = OrderedDict()
+
+    def close(self) -> None:
+        """Release the memory-mapped file."""
+        self.index.close()
+
+    def __enter__(self) -> LazyMesh:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        loaded = sorted(self._loaded)
+        return f"LazyMesh(name={self.name!r}, loaded_sections={loaded!r})"
+
+    @property
+    def loaded_sections(self) -> frozenset[str]:
+        """Names of the sections parsed so far."""
+        return frozenset(self._loaded)
+
+    @property
+    def version(self) -> Version:
+        from .api import Version
+
+        self._section_parsers()
+        major = self._builder.get_version_major()
+        minor = self._builder.get_version_minor()
+        assert major is not None and minor is not None
+        return Version(major, minor)
+
+    @property
+    def is_ascii(self) -> bool:
+        self._section_parsers()
+        return self._builder.get_ascii()
+
+    @property
+    def physical_names(self) -> dict[PhysicalGroupKey, str]:
+        """Physical names keyed by ``(dimension, tag)``."""
+        self.load("$PhysicalNames")
+        return self._builder.get_physical_names()
+
+    @property
+    def nodes(self) -> NodeCollection:
+        """Nodes with physical tags inherited from ``$Entities`` when present."""
+        self.load("$Entities", "$PartitionedEntities", self._nodes_section())
+        return self._build().nodes
+
+    @property
+    def elements(self) -> ElementCollection:
+        self.load(
+            "$Entities",
+            "$PartitionedEntities",
+            self._nodes_section(),
+            self._elements_section(),
+        )
+        return self._build().elements
+
+    @property
+    def periodic_links(self) -> PeriodicLinkCollection:
+        self.load(self._nodes_section(), "$Periodic")
+        return self._build().periodic_links
+
+    @property
+    def views(self) -> ViewCollection:
+        """Post-processing views indexed by the tags of their data sections.
+
+        Building the index reads the tags of every ``$NodeData``,
+        ``$ElementData``, and ``$ElementNodeData`` section but none of their
+        values; ``views[name].step(k)`` seeks to one section and parses it.
+        """
+        from .api import View, ViewCollection
+
+        if self._views is None:
+            parsers = self._section_parsers()
+            spans = [span for span in self.index if span.name in DATA_SECTIONS]
+            grouped: dict[str, list[tuple[ViewStepInfo, SectionSpan]]] = {}
+            for span in spans:
+                if span.name in parsers:
+                    info = self._step_info(span)
+                    grouped.setdefault(info.name, []).append((info, span))
+            self._views = ViewCollection(
+                View(
+                    name,
+                    [info for info, _ in steps],
+                    partial(self._load_step, tuple(span for _, span in steps)),
+                )
+                for name, steps in grouped.items()
+            )
+        return self._views
+
+    def load(self, *sections: str) -> None:
+        """Parse the named sections now unless they are already loaded.
+
+        Sections missing from the file, and sections without a parser for the
+        file's MSH version, are skipped.
+        """
+        parsers = self._section_parsers()
+        for section in sections:
+            if section in self._loaded:
+                continue
+            parser = parsers.get(section)
+            if parser is not None:
+                # Data sections repeat once per view step.
+                for span in self.index.find_all(section):
+                    self._parse(parser, span)
+                    self._mesh = None
+            self._loaded.add(section)
+
+    def read(self) -> Mesh:
+        """Parse every remaining section and return the complete modern mesh."""
+        self.load(*self._section_parsers())
+        return self._build()
+
+    def _nodes_section(self) -> str:
+        self._section_parsers()
+        return "$NOD" if self._builder.get_version_major() == 1 else "$Nodes"
+
+    def _elements_section(self) -> str:
+        self._section_parsers()
+        return "$ELM" if self._builder.get_version_major() == 1 else "$Elements"
+
+    def _section_parsers(self) -> dict[str, ParserClass]:
+        if self._parsers is not None:
+            return self._parsers
+
+        span = self.index.get("$MeshFormat")
+        if span is not None:
+            self._parse(MeshFormatParser, span)
+        elif "$NOD" in self.index:
+            self._builder.set_version(1.0)
+        else:
+            raise InvalidSectionError(
+                "Could not detect a supported MSH format", filename=self.name
+            )
+        self._loaded.add("$MeshFormat")
+        parsers = get_default_parsers(self._builder)
+        if self._builder.get_version_major() != 1:
+            parsers = [*parsers, *DATA_PARSERS]
+        self._parsers = dispatch_table(parsers)
+        return self._parsers
+
+    def _step_info(self, span: SectionSpan) -> ViewStepInfo:
+        from .api import ViewStepInfo
+
+        size = _STEP_HEADER_BYTES
+        while True:
+            stop = min(span.end_offset, span.body_offset + size)
+            data = self.index.read_range(span.body_offset, stop)
+            source = SourceTextIO(StringIO(data.decode("utf-8", errors="replace")))
+            source.context = source.context.copy(
+                filename=self.name, line_number=span.line_number, section=span.name
+            )
+            try:
+                tags = read_data_tags(cast(TextIO, source), span.name)
+            except Exception as error:
+                if (
+                    isinstance(error, UnexpectedEndOfFileError)
+                    and stop < span.end_offset
+                ):
+                    size *= 16
+                    continue
+                contextual = contextualize_error(error, source.locate())
+                if contextual is error:
+                    raise
+                raise contextual from error
+            return ViewStepInfo(span.name, *tags)
+
+    def _load_step(self, spans: tuple[SectionSpan, ...], index: int) -> ViewStep:
+        from .api import ViewStep
+
+        span = spans[index]
+        step = self._step_cache.pop(span.offset, None)
+        if step is None:
+            target = MeshSinkBase(self.name)
+            target.set_ascii(self.is_ascii)
+            self._parse(self._section_parsers()[span.name], span, target)
+            step = ViewStep(*target.get_data_steps()[0])
+        if self._step_cache_size:
+            self._step_cache[span.offset] = step
+            if len(self._step_cache) > self._step_cache_size:
+                self._step_cache.popitem(last=False)
+        return step
+
+    def _parse(
+        self,
+        parser: ParserClass,
+        span: SectionSpan,
+        target: ParserTarget | None = None,
+    ) -> None:
+        with open(self.index.path, "rb") as stream:
+            stream.seek(span.body_offset)
+            source: SourceTextIO
+            if self.index.is_binary:
+                source = SourceBinaryIO(
+                    cast(BinaryIO, stream), self.name, line_tracking="lazy"
+                )
+                source.byte_order = self._byte_order or source.byte_order
+                source.data_size = self._data_size
+            else:
+                source = SourceTextIO(
+                    TextIOWrapper(stream, encoding="utf-8"),
+                    self.name,
+                    line_tracking="lazy",
+                )
+            source.context.line_number = span.line_number
+            parse_section(parser, target or self._builder, source, span.name)
+            if isinstance(source, SourceBinaryIO) and parser is MeshFormatParser:
+                self._byte_order = source.byte_order
+                self._data_size = source.data_size
+
+    def _build(self) -> Mesh:
+        if self._mesh is None:
+            self._mesh = self._builder.build()
+        return self._mesh
+
+
+def read_lazy(
+    path: str | os.PathLike[str],
+    *,
+    name: str | None = None,
+    step_cache: int = 8,
+) -> LazyMesh:
+    """Open an MSH file for section-by-section parsing on first access.
+
+    Use the returned handle as a context manager to release the memory-mapped
+    file deterministically::
+
+        with gmshparser.read_lazy("volume.msh") as mesh:
+            names = mesh.physical_names
+
+    Up to *step_cache* parsed steps of :attr:`LazyMesh.views` are cached.
+    """
+    return LazyMesh(path, name=name, step_cache=step_cache)
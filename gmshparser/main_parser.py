@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Protocol, TextIO, cast
 
 from .abstract_parser import AbstractParser
+from .data_parser import ElementDataParser, ElementNodeDataParser, NodeDataParser
 from .elements_parser import ElementsParser
 from .elements_parser_v1 import ElementsParserV1
 from .elements_parser_v2 import ElementsParserV2
@@ -13,9 +15,11 @@ from .mesh_format_parser import MeshFormatParser
 from .nodes_parser import NodesParser
 from .nodes_parser_v1 import NodesParserV1
 from .nodes_parser_v2 import NodesParserV2
-from .parsing import SourceTextIO, contextualize_error
+from .parsing import LineTracking, SourceTextIO, contextualize_error, track_source
+from .partitions_parser import GhostElementsParser, PartitionedEntitiesParser
 from .periodic_parser import PeriodicParser
 from .physical_names_parser import PhysicalNamesParser
+from .section_index import end_marker
 
 type ParserClass = type[AbstractParser]
 
@@ -36,9 +40,11 @@ DEFAULT_PARSERS_V4: list[ParserClass] = [
     MeshFormatParser,
     PhysicalNamesParser,
     EntitiesParser,
+    PartitionedEntitiesParser,
     NodesParser,
     ElementsParser,
     PeriodicParser,
+    GhostElementsParser,
 ]
 
 DEFAULT_PARSERS_V2: list[ParserClass] = [
@@ -54,24 +60,73 @@ DEFAULT_PARSERS_V1: list[ParserClass] = [
     ElementsParserV1,
 ]
 
+# Post-processing data can dwarf the mesh, so it is parsed only on request.
+DATA_PARSERS: list[ParserClass] = [
+    NodeDataParser,
+    ElementDataParser,
+    ElementNodeDataParser,
+]
+
+# MSH 1 names its node and element sections differently; selections accept both.
+_SECTION_ALIASES = {
+    "$NOD": "$Nodes",
+    "$Nodes": "$NOD",
+    "$ELM": "$Elements",
+    "$Elements": "$ELM",
+}
+
 
 class MainParser:
     """Route MSH sections to version-specific parsers with source context."""
 
-    def __init__(self, parsers: list[ParserClass] | None = None) -> None:
+    def __init__(
+        self,
+        parsers: list[ParserClass] | None = None,
+        *,
+        sections: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        line_tracking: LineTracking = "eager",
+    ) -> None:
         self.parsers = parsers
+        self.line_tracking: LineTracking = line_tracking
         self.version_detected = False
+        self.sections = None if sections is None else _with_aliases(sections)
+        self.exclude = _with_aliases(exclude or ())
+        self._data_parsers = [
+            parser
+            for parser in DATA_PARSERS
+            if self.sections is not None and parser.get_section_name() in self.sections
+        ]
+
+    def selects(self, section: str) -> bool:
+        """Return whether *section* is parsed rather than skipped.
+
+        ``$MeshFormat`` is always parsed because it selects the parser set.
+        """
+        if section == "$MeshFormat":
+            return True
+        if section in self.exclude:
+            return False
+        return self.sections is None or section in self.sections
 
     def parse(self, mesh: ParserTarget, io: TextIO) -> None:
         """Parse an MSH stream and populate *mesh*.
 
         All section failures are exposed as structured ``ParseError`` subclasses
         carrying the source name, current section, line number, and line text.
+        Sections are dispatched by header through a table built from the
+        parser set. Sections without a parser, such as
+        ``$InterpolationScheme``, and sections deselected through ``sections``
+        or ``exclude`` are consumed by searching for their end marker without
+        tokenizing their contents. ``$NodeData``, ``$ElementData``, and
+        ``$ElementNodeData`` are parsed only when ``sections`` names them. With
+        ``line_tracking="lazy"``, line numbers are only recounted from the last
+        section start when an error is reported.
         """
         self.version_detected = False
         filename = mesh.get_name() or str(getattr(io, "name", "<stream>"))
-        source = io if isinstance(io, SourceTextIO) else SourceTextIO(io, filename)
-        context = source.context
+        source = track_source(io, filename, line_tracking=self.line_tracking)
+        dispatch = dispatch_table([*(self.parsers or ()), *self._data_parsers])
 
         for raw_line in source:
             line = raw_line.strip()
@@ -83,22 +138,28 @@ class MainParser:
                 self.version_detected = True
                 if self.parsers is None:
                     self.parsers = DEFAULT_PARSERS_V1
-                self._parse_section(NodesParserV1, mesh, source, line)
+                    dispatch = dispatch_table([*self.parsers, *self._data_parsers])
+                if self.selects(line):
+                    parse_section(NodesParserV1, mesh, source, line)
+                else:
+                    skip_section(source, line)
                 continue
 
             if line == "$MeshFormat" and not self.version_detected:
-                self._parse_section(MeshFormatParser, mesh, source, line)
+                parse_section(MeshFormatParser, mesh, source, line)
                 self.version_detected = True
                 if self.parsers is None:
-                    self.parsers = self._get_parsers_for_version(mesh)
+                    self.parsers = get_default_parsers(mesh)
+                    dispatch = dispatch_table([*self.parsers, *self._data_parsers])
                 continue
 
-            if self.parsers:
-                for parser in self.parsers:
-                    if parser.get_section_name() == line:
-                        self._parse_section(parser, mesh, source, line)
-                        break
+            parser = dispatch.get(line)
+            if parser is not None and self.selects(line):
+                parse_section(parser, mesh, source, line)
+            elif is_section_header(line):
+                skip_section(source, line)
 
+        context = source.locate()
         context.section = None
         if not self.version_detected:
             raise InvalidSectionError(
@@ -108,38 +169,69 @@ class MainParser:
                 line=context.line,
             )
 
-    @staticmethod
-    def _parse_section(
-        parser: ParserClass,
-        mesh: ParserTarget,
-        source: SourceTextIO,
-        section: str,
-    ) -> None:
-        context = source.context
-        context.section = section
-        try:
-            parser.parse(cast(Mesh, mesh), cast(TextIO, source))
-        except Exception as error:
-            contextual = contextualize_error(error, context)
-            if contextual is error:
-                raise
-            raise contextual from error
-        finally:
-            context.section = None
-
-    def _get_parsers_for_version(self, mesh: ParserTarget) -> list[ParserClass]:
-        """Return the parser set for the detected major MSH version."""
-        version = mesh.get_version()
-        if version is None:
-            raise InvalidSectionError(
-                "Cannot determine parsers because the version was not detected"
-            )
 
-        major = mesh.get_version_major()
-        if major == 1:
-            return DEFAULT_PARSERS_V1
-        if major == 2:
-            return DEFAULT_PARSERS_V2
-        if major == 4:
-            return DEFAULT_PARSERS_V4
-        raise InvalidSectionError(f"Unsupported MSH format version: {version}")
+def _with_aliases(sections: Iterable[str]) -> frozenset[str]:
+    names = frozenset(sections)
+    return names | {
+        _SECTION_ALIASES[name] for name in names if name in _SECTION_ALIASES
+    }
+
+
+def dispatch_table(parsers: Iterable[ParserClass]) -> dict[str, ParserClass]:
+    """Map section headers to parsers; the first parser of a section wins."""
+    table: dict[str, ParserClass] = {}
+    for parser in parsers:
+        table.setdefault(parser.get_section_name(), parser)
+    return table
+
+
+def is_section_header(line: str) -> bool:
+    return line.startswith("$") and not line.startswith(("$End", "$END"))
+
+
+def parse_section(
+    parser: ParserClass,
+    mesh: ParserTarget,
+    source: SourceTextIO,
+    section: str,
+) -> None:
+    """Run *parser* on a source positioned after the *section* header line."""
+    context = source.locate()
+    context.section = section
+    try:
+        parser.parse(cast(Mesh, mesh), cast(TextIO, source))
+    except Exception as error:
+        contextual = contextualize_error(error, source.locate())
+        if contextual is error:
+            raise
+        raise contextual from error
+    finally:
+        context.section = None
+
+
+def skip_section(source: SourceTextIO, section: str) -> None:
+    """Consume *section* through its end marker without parsing it."""
+    context = source.context
+    context.section = section
+    try:
+        source.skip_section(end_marker(section))
+    finally:
+        context.section = None
+
+
+def get_default_parsers(mesh: ParserTarget) -> list[ParserClass]:
+    """Return the default parser set for the detected major MSH version."""
+    version = mesh.get_version()
+    if version is None:
+        raise InvalidSectionError(
+            "Cannot determine parsers because the version was not detected"
+        )
+
+    major = mesh.get_version_major()
+    if major == 1:
+        return DEFAULT_PARSERS_V1
+    if major == 2:
+        return DEFAULT_PARSERS_V2
+    if major == 4:
+        return DEFAULT_PARSERS_V4
+    raise InvalidSectionError(f"Unsupported MSH format version: {version}")
@@ -5,6 +5,13 @@ from gmshparser.element import Element
 from gmshparser.element_entity import ElementEntity
 from gmshparser.node import Node
 from gmshparser.node_entity import NodeEntity
+from gmshparser.sink import (
+    DataBuffer,
+    DataStepRecord,
+    EntityPartitionValue,
+    GhostElementRecord,
+    Validation,
+)
 
 type EntityKey = tuple[int, int]
 type ElementEntityKey = tuple[int, int, int]
@@ -31,6 +38,7 @@ class Mesh:
         self.version_minor_: int | None = None
         self.ascii_ = True
         self.precision_ = 8
+        self.validation_: Validation = "full"
         self.number_of_node_entities_ = 0
         self.number_of_nodes_ = 0
         self.min_node_tag_ = 0
@@ -44,7 +52,13 @@ class Mesh:
         self.physical_names_: dict[EntityKey, str] = {}
         self.entity_physical_tags_: dict[EntityKey, tuple[int, ...]] = {}
         self.element_physical_tags_: dict[int, tuple[int, ...]] = {}
+        self.entity_boundaries_: dict[EntityKey, tuple[int, ...]] = {}
         self.periodic_links_: dict[EntityKey, PeriodicLinkValue] = {}
+        self.data_steps_: list[DataStepRecord] = []
+        self.number_of_partitions_ = 0
+        self.ghost_entities_: dict[int, int] = {}
+        self.entity_partitions_: dict[EntityKey, EntityPartitionValue] = {}
+        self.ghost_elements_: list[GhostElementRecord] = []
 
     def set_name(self, name: str) -> None:
         """Set the name of the mesh."""
@@ -90,6 +104,14 @@ class Mesh:
         """Get the MSH data-size field."""
         return self.precision_
 
+    def set_validation(self, validation: Validation) -> None:
+        """Set how thoroughly parsers check records: full, basic, or none."""
+        self.validation_ = validation
+
+    def get_validation(self) -> Validation:
+        """Get the validation level used by the section parsers."""
+        return self.validation_
+
     def set_number_of_node_entities(self, number_of_node_entities: int) -> None:
         """Set the number of node entities."""
         self.number_of_node_entities_ = number_of_node_entities
@@ -338,6 +360,31 @@ class Mesh:
         """Return physical tags carried directly by one element."""
         return self.element_physical_tags_.get(element_tag, ())
 
+    def set_entity_boundary(
+        self,
+        dimension: int,
+        tag: int,
+        boundary_tags: Iterable[int],
+    ) -> None:
+        """Store the bounding entity tags of one MSH 4 entity, without signs."""
+        self.entity_boundaries_[(dimension, tag)] = tuple(
+            abs(int(boundary)) for boundary in boundary_tags
+        )
+
+    def get_entity_boundary(self, dimension: int, tag: int) -> tuple[int, ...]:
+        """Return the tags of the dimension ``dimension - 1`` bounding entities."""
+        return self.entity_boundaries_.get((dimension, tag), ())
+
+    def selects_entity_block(
+        self,
+        section: str,
+        dimension: int,
+        entity_tag: int,
+    ) -> bool:
+        """Return ``True``: the compatibility model keeps every entity block."""
+        del section, dimension, entity_tag
+        return True
+
     def has_periodic_link(self, dimension: int, entity_tag: int) -> bool:
         """Return whether a periodic relation exists for one slave entity."""
         return (dimension, entity_tag) in self.periodic_links_
@@ -379,6 +426,78 @@ class Mesh:
             ) in self.periodic_links_.items()
         )
 
+    def add_data_step(
+        self,
+        section: str,
+        string_tags: tuple[str, ...],
+        real_tags: tuple[float, ...],
+        integer_tags: tuple[int, ...],
+        data: DataBuffer,
+    ) -> None:
+        """Add the records of one post-processing data section."""
+        self.data_steps_.append((section, string_tags, real_tags, integer_tags, data))
+
+    def get_data_steps(self) -> tuple[DataStepRecord, ...]:
+        """Return post-processing data sections in file order."""
+        return tuple(self.data_steps_)
+
+    def set_number_of_partitions(self, value: int) -> None:
+        """Set the number of partitions declared by ``$PartitionedEntities``."""
+        self.number_of_partitions_ = value
+
+    def get_number_of_partitions(self) -> int:
+        """Get the number of partitions; zero for an unpartitioned mesh."""
+        return self.number_of_partitions_
+
+    def add_ghost_entity(self, tag: int, partition: int) -> None:
+        """Add a ghost entity and the partition it belongs to."""
+        self.ghost_entities_[int(tag)] = int(partition)
+
+    def get_ghost_entities(self) -> dict[int, int]:
+        """Return the partition of each ghost entity tag."""
+        return dict(self.ghost_entities_)
+
+    def set_entity_partitions(
+        self,
+        dimension: int,
+        tag: int,
+        parent_dimension: int,
+        parent_tag: int,
+        partitions: Iterable[int],
+    ) -> None:
+        """Store the model entity and partitions of one partitioned entity."""
+        self.entity_partitions_[(int(dimension), int(tag))] = (
+            (int(parent_dimension), int(parent_tag)),
+            tuple(int(partition) for partition in partitions),
+        )
+
+    def get_entity_partitions(
+        self,
+        dimension: int,
+        tag: int,
+    ) -> EntityPartitionValue | None:
+        """Return ``(parent_key, partitions)`` of a partitioned entity."""
+        return self.entity_partitions_.get((dimension, tag))
+
+    def add_ghost_element(
+        self,
+        element_tag: int,
+        partition: int,
+        ghost_partitions: Iterable[int],
+    ) -> None:
+        """Add one ``$GhostElements`` record."""
+        self.ghost_elements_.append(
+            (
+                int(element_tag),
+                int(partition),
+                tuple(int(ghost) for ghost in ghost_partitions),
+            )
+        )
+
+    def get_ghost_elements(self) -> tuple[GhostElementRecord, ...]:
+        """Return ``(element_tag, partition, ghost_partitions)`` records."""
+        return tuple(self.ghost_elements_)
+
     @staticmethod
     def _normalize_tags(tags: Iterable[int]) -> tuple[int, ...]:
         normalized: list[int] = []
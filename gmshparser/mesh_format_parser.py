@@ -7,8 +7,19 @@ from .errors import (
     UnsupportedVersionError,
 )
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
-from .version_manager import VersionManager
+from .parsing import (
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_required_line,
+)
+from .version_manager import MshFormatVersion, VersionManager
+
+# MSH 2.2 declares the width of its doubles, MSH 4.1 the width of ``size_t``.
+BINARY_DATA_SIZES = {
+    MshFormatVersion.MSH_2_2: frozenset({8}),
+    MshFormatVersion.MSH_4_1: frozenset({4, 8}),
+}
 
 
 class MeshFormatParser(AbstractParser):
@@ -44,14 +55,39 @@ class MeshFormatParser(AbstractParser):
             raise InvalidSectionError(
                 f"Unsupported $MeshFormat file type {file_type}; expected 0 or 1"
             )
-        if file_type == 1:
-            raise UnsupportedBinaryFormatError(
-                "Binary MSH files are not supported; provide an ASCII MSH file"
-            )
         if data_size <= 0:
             raise InvalidSectionError("$MeshFormat data size must be positive")
 
         mesh.set_version(version_enum.version_number)
-        mesh.set_ascii(True)
+        mesh.set_ascii(file_type == 0)
         mesh.set_precision(data_size)
-        expect_end_marker(io, "$EndMeshFormat")
+        if file_type == 0:
+            expect_end_marker(io, "$EndMeshFormat")
+            return
+
+        source = binary_source(io)
+        data_sizes = BINARY_DATA_SIZES.get(version_enum)
+        if data_sizes is None:
+            supported = ", ".join(str(version) for version in BINARY_DATA_SIZES)
+            raise UnsupportedBinaryFormatError(
+                f"Binary MSH {version_enum} files are not supported; binary input "
+                f"is read for MSH {supported}"
+            )
+        if data_size not in data_sizes:
+            expected = " or ".join(str(size) for size in sorted(data_sizes))
+            raise UnsupportedBinaryFormatError(
+                f"Binary MSH {version_enum} data size {data_size} is not "
+                f"supported; expected {expected}"
+            )
+
+        byte_order_mark = source.read_bytes(4, "the binary byte-order mark")
+        if byte_order_mark == b"\x01\x00\x00\x00":
+            source.byte_order = "<"
+        elif byte_order_mark == b"\x00\x00\x00\x01":
+            source.byte_order = ">"
+        else:
+            raise InvalidSectionError(
+                "Binary $MeshFormat byte-order mark must encode the integer 1"
+            )
+        source.data_size = data_size
+        expect_binary_end_marker(source, "$EndMeshFormat")
@@ -1,143 +1,68 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from array import array
+from collections.abc import Container, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, cast
 
 from .element_types import ElementType
 from .errors import InvalidMeshError
+from .sink import (
+    ElementBuffer,
+    EntityKey,
+    MeshSinkBase,
+    NodeBuffer,
+    NodePair,
+    ParsedElementBlock,
+    ParsedNodeBlock,
+    PeriodicLinkRecord,
+    PeriodicLinkValue,
+    PhysicalGroupKey,
+    RawElement,
+    RawNode,
+)
 
 if TYPE_CHECKING:
-    from .api import Mesh
+    from .api import (
+        Element,
+        ElementCollection,
+        EntityCollection,
+        Mesh,
+        Node,
+        NodeCollection,
+        PeriodicLinkCollection,
+        PhysicalGroupCollection,
+    )
+    from .columnar import NodeTable, RowView
     from .element_entity import ElementEntity
     from .node_entity import NodeEntity
 
-
-type EntityKey = tuple[int, int]
-type PhysicalGroupKey = tuple[int, int]
-type RawNode = tuple[int, tuple[float, ...]]
-type RawNodeBlock = tuple[int, int, list[RawNode]]
-type RawElement = tuple[int, list[int], tuple[int, ...]]
-type RawElementBlock = tuple[int, int, int, list[RawElement]]
-type NodePair = tuple[int, int]
-type PeriodicLinkValue = tuple[int, tuple[float, ...], tuple[NodePair, ...]]
-type PeriodicLinkRecord = tuple[
-    int,
-    int,
-    int,
-    tuple[float, ...],
-    tuple[NodePair, ...],
+__all__ = [
+    "EntityKey",
+    "ModernMeshBuilder",
+    "NodePair",
+    "ParsedElementBlock",
+    "ParsedNodeBlock",
+    "PeriodicLinkRecord",
+    "PeriodicLinkValue",
+    "PhysicalGroupKey",
+    "RawElement",
+    "RawNode",
 ]
 
+type RawNodeBlock = tuple[int, int, Sequence[RawNode]]
+type RawElementBlock = tuple[int, int, int, Sequence[RawElement]]
+# Selected entities and the entities whose nodes they use, as resolved by
+# MeshSinkBase._resolve_selection.
+type _Selection = tuple[frozenset[EntityKey], frozenset[EntityKey] | None]
+
 
-class ModernMeshBuilder:
+class ModernMeshBuilder(MeshSinkBase):
     """Parser target that builds the immutable API without a legacy mesh."""
 
     def __init__(self, name: str = "New Mesh") -> None:
-        self._name = name
-        self._version: float | None = None
-        self._version_major: int | None = None
-        self._version_minor: int | None = None
-        self._ascii = True
-        self._precision = 8
-
-        self._number_of_node_entities = 0
-        self._number_of_nodes = 0
-        self._min_node_tag = 0
-        self._max_node_tag = 0
-        self._number_of_element_entities = 0
-        self._number_of_elements = 0
-        self._min_element_tag = 0
-        self._max_element_tag = 0
-
+        super().__init__(name)
         self._raw_node_blocks: list[RawNodeBlock] = []
         self._raw_element_blocks: list[RawElementBlock] = []
-        self._physical_names: dict[PhysicalGroupKey, str] = {}
-        self._entity_physical_tags: dict[EntityKey, tuple[int, ...]] = {}
-        self._element_physical_tags: dict[int, tuple[int, ...]] = {}
-        self._periodic_links: dict[
-            EntityKey, tuple[int, tuple[float, ...], tuple[tuple[int, int], ...]]
-        ] = {}
-
-    def set_name(self, name: str) -> None:
-        self._name = name
-
-    def get_name(self) -> str:
-        return self._name
-
-    def set_version(self, version: float) -> None:
-        self._version = version
-        major = int(version)
-        self._version_major = major
-        self._version_minor = int(round((version - major) * 10))
-
-    def get_version(self) -> float | None:
-        return self._version
-
-    def get_version_major(self) -> int | None:
-        return self._version_major
-
-    def get_version_minor(self) -> int | None:
-        return self._version_minor
-
-    def set_ascii(self, is_ascii: bool) -> None:
-        self._ascii = is_ascii
-
-    def get_ascii(self) -> bool:
-        return self._ascii
-
-    def set_precision(self, precision: int) -> None:
-        self._precision = precision
-
-    def get_precision(self) -> int:
-        return self._precision
-
-    def set_number_of_node_entities(self, value: int) -> None:
-        self._number_of_node_entities = value
-
-    def get_number_of_node_entities(self) -> int:
-        return self._number_of_node_entities
-
-    def set_number_of_nodes(self, value: int) -> None:
-        self._number_of_nodes = value
-
-    def get_number_of_nodes(self) -> int:
-        return self._number_of_nodes
-
-    def set_min_node_tag(self, value: int) -> None:
-        self._min_node_tag = value
-
-    def get_min_node_tag(self) -> int:
-        return self._min_node_tag
-
-    def set_max_node_tag(self, value: int) -> None:
-        self._max_node_tag = value
-
-    def get_max_node_tag(self) -> int:
-        return self._max_node_tag
-
-    def set_number_of_element_entities(self, value: int) -> None:
-        self._number_of_element_entities = value
-
-    def get_number_of_element_entities(self) -> int:
-        return self._number_of_element_entities
-
-    def set_number_of_elements(self, value: int) -> None:
-        self._number_of_elements = value
-
-    def get_number_of_elements(self) -> int:
-        return self._number_of_elements
-
-    def set_min_element_tag(self, value: int) -> None:
-        self._min_element_tag = value
-
-    def get_min_element_tag(self) -> int:
-        return self._min_element_tag
-
-    def set_max_element_tag(self, value: int) -> None:
-        self._max_element_tag = value
-
-    def get_max_element_tag(self) -> int:
-        return self._max_element_tag
 
     def add_node_block(
         self,
@@ -146,10 +71,14 @@ class ModernMeshBuilder:
         parametric_coordinate_count: int,
         nodes: Iterable[RawNode],
     ) -> None:
-        """Store one parsed node block as compact raw records."""
+        """Store one parsed node block as compact raw records.
+
+        Typed :class:`~gmshparser.sink.NodeBuffer` blocks are kept as they are.
+        """
         del parametric_coordinate_count
-        records = nodes if isinstance(nodes, list) else list(nodes)
-        for node_tag, coordinates in records:
+        records = nodes if isinstance(nodes, list | NodeBuffer) else list(nodes)
+        checked = self._validation != "none" and not isinstance(records, NodeBuffer)
+        for node_tag, coordinates in records if checked else ():
             if len(coordinates) < 3:
                 raise InvalidMeshError(
                     f"Node {node_tag} has fewer than three coordinates"
@@ -176,7 +105,9 @@ class ModernMeshBuilder:
         elements: Iterable[RawElement],
     ) -> None:
         """Store one parsed element block without compatibility objects."""
-        records = elements if isinstance(elements, list) else list(elements)
+        records = (
+            elements if isinstance(elements, list | ElementBuffer) else list(elements)
+        )
         self._raw_element_blocks.append(
             (dimension, entity_tag, int(element_type), records)
         )
@@ -197,116 +128,50 @@ class ModernMeshBuilder:
             ],
         )
 
-    def set_physical_name(self, dimension: int, tag: int, name: str) -> None:
-        self._physical_names[(dimension, tag)] = name
-
-    def get_physical_names(self) -> dict[PhysicalGroupKey, str]:
-        return dict(self._physical_names)
-
-    def set_entity_physical_tags(
-        self,
-        dimension: int,
-        tag: int,
-        physical_tags: Iterable[int],
-    ) -> None:
-        self._entity_physical_tags[(dimension, tag)] = self._normalize_tags(
-            physical_tags
-        )
-
-    def add_entity_physical_tags(
-        self,
-        dimension: int,
-        tag: int,
-        physical_tags: Iterable[int],
-    ) -> None:
-        key = dimension, tag
-        existing = self._entity_physical_tags.get(key, ())
-        self._entity_physical_tags[key] = self._normalize_tags(
-            (*existing, *physical_tags)
-        )
-
-    def get_entity_physical_tags(
-        self,
-        dimension: int,
-        tag: int,
-    ) -> tuple[int, ...]:
-        return self._entity_physical_tags.get((dimension, tag), ())
-
-    def set_element_physical_tags(
-        self,
-        element_tag: int,
-        physical_tags: Iterable[int],
-    ) -> None:
-        self._element_physical_tags[element_tag] = self._normalize_tags(physical_tags)
-
-    def get_element_physical_tags(self, element_tag: int) -> tuple[int, ...]:
-        return self._element_physical_tags.get(element_tag, ())
-
-    def has_periodic_link(self, dimension: int, entity_tag: int) -> bool:
-        return (dimension, entity_tag) in self._periodic_links
-
-    def add_periodic_link(
-        self,
-        dimension: int,
-        entity_tag: int,
-        master_entity_tag: int,
-        affine_transform: Iterable[float],
-        node_pairs: Iterable[NodePair],
-    ) -> None:
-        key = int(dimension), int(entity_tag)
-        if key in self._periodic_links:
-            raise InvalidMeshError(f"Duplicate periodic link for entity {key}")
-        self._periodic_links[key] = (
-            int(master_entity_tag),
-            tuple(float(value) for value in affine_transform),
-            tuple((int(slave), int(master)) for slave, master in node_pairs),
-        )
+    def build(self, *, columnar: bool = False) -> Mesh:
+        """Resolve raw parser records into the immutable modern mesh model.
 
-    def get_periodic_link(
-        self,
-        dimension: int,
-        entity_tag: int,
-    ) -> PeriodicLinkValue:
-        return self._periodic_links[(dimension, entity_tag)]
-
-    def get_periodic_links(self) -> tuple[PeriodicLinkRecord, ...]:
-        return tuple(
-            (dimension, entity_tag, master_tag, affine_transform, node_pairs)
-            for (dimension, entity_tag), (
-                master_tag,
-                affine_transform,
-                node_pairs,
-            ) in self._periodic_links.items()
-        )
+        After :meth:`select_entities`, blocks outside the selection are left out
+        even when a parser delivered them, and the declared node and element
+        counts are not checked. Periodic links whose nodes were skipped are
+        dropped. A selected physical group that the mesh does not declare
+        raises :class:`ValueError`.
 
-    def build(self) -> Mesh:
-        """Resolve raw parser records into the immutable modern mesh model."""
+        With *columnar*, nodes and elements are stored in the typed arrays of a
+        :class:`~gmshparser.columnar.NodeTable` and
+        :class:`~gmshparser.columnar.ElementTable`, and the collections create
+        their values on access. The mesh compares equal to the default one.
+        """
         from .api import (
             Element,
             ElementCollection,
             Entity,
             EntityCollection,
-            Mesh,
             Node,
             NodeCollection,
-            PeriodicLink,
-            PeriodicLinkCollection,
             PhysicalGroup,
             PhysicalGroupCollection,
-            Version,
+            _mesh_order_key,
         )
 
+        selection = None
+        if self.is_selective:
+            missing = self._missing_physical_groups()
+            if missing:
+                raise ValueError(f"Unknown physical group {missing[0]!r}")
+            selection = self._resolve_selection()
+        if columnar:
+            return self._build_columnar(selection)
+
         nodes_by_entity: dict[EntityKey, list[Node]] = {}
         nodes_by_tag: dict[int, Node] = {}
         all_nodes: list[Node] = []
 
-        for dimension, entity_tag, raw_nodes in self._raw_node_blocks:
+        for dimension, entity_tag, raw_nodes in self._node_blocks(selection):
             key = dimension, entity_tag
             entity_nodes = nodes_by_entity.setdefault(key, [])
             physical_tags = self.get_entity_physical_tags(*key)
             for node_tag, coordinates in raw_nodes:
-                if node_tag in nodes_by_tag:
-                    raise InvalidMeshError(f"Duplicate node tag {node_tag}")
                 node = Node(
                     tag=node_tag,
                     coordinates=(coordinates[0], coordinates[1], coordinates[2]),
@@ -319,25 +184,27 @@ class ModernMeshBuilder:
                 entity_nodes.append(node)
                 all_nodes.append(node)
 
-        if len(all_nodes) != self._number_of_nodes:
+        # Repeated tags are found by size so the loop above stays check-free.
+        if len(nodes_by_tag) != len(all_nodes):
+            raise InvalidMeshError(f"Duplicate node tag {_first_repeated(all_nodes)}")
+        if selection is None and len(all_nodes) != self._number_of_nodes:
             raise InvalidMeshError(
                 f"Mesh declares {self._number_of_nodes} nodes, built {len(all_nodes)}"
             )
 
         nodes = NodeCollection(all_nodes)
         elements_by_entity: dict[EntityKey, list[Element]] = {}
-        element_tags: set[int] = set()
         all_elements: list[Element] = []
 
         for dimension, entity_tag, type_id, raw_elements in self._raw_element_blocks:
             key = dimension, entity_tag
+            if selection is not None and key not in selection[0]:
+                continue
             entity_element_values = elements_by_entity.setdefault(key, [])
             element_type = ElementType(type_id)
             entity_physical_tags = self.get_entity_physical_tags(*key)
 
             for element_tag, node_tags, record_physical_tags in raw_elements:
-                if element_tag in element_tags:
-                    raise InvalidMeshError(f"Duplicate element tag {element_tag}")
                 try:
                     element_nodes = tuple(nodes_by_tag[tag] for tag in node_tags)
                 except KeyError as error:
@@ -360,19 +227,26 @@ class ModernMeshBuilder:
                     entity_tag=entity_tag,
                     physical_tags=resolved_physical_tags,
                 )
-                element_tags.add(element_tag)
                 entity_element_values.append(element)
                 all_elements.append(element)
 
-        if len(all_elements) != self._number_of_elements:
+        try:
+            elements = ElementCollection(all_elements)
+        except ValueError:
+            repeated = _first_repeated(all_elements)
+            raise InvalidMeshError(f"Duplicate element tag {repeated}") from None
+        if selection is None and len(all_elements) != self._number_of_elements:
             raise InvalidMeshError(
                 f"Mesh declares {self._number_of_elements} elements, "
                 f"built {len(all_elements)}"
             )
 
-        elements = ElementCollection(all_elements)
+        declared_keys: Iterable[EntityKey] = self._entity_physical_tags
+        if selection is not None:
+            kept = selection[0] | (selection[1] or frozenset())
+            declared_keys = [key for key in declared_keys if key in kept]
         entity_keys = dict.fromkeys(
-            [*self._entity_physical_tags, *nodes_by_entity, *elements_by_entity]
+            [*declared_keys, *nodes_by_entity, *elements_by_entity]
         )
         entity_values: list[Entity] = []
 
@@ -384,6 +258,7 @@ class ModernMeshBuilder:
                 for physical_tag in element.physical_tags:
                     if physical_tag not in entity_physical_tag_values:
                         entity_physical_tag_values.append(physical_tag)
+            parent, partitions = self.get_entity_partitions(*key) or (None, ())
             entity_values.append(
                 Entity(
                     dimension=dimension,
@@ -391,6 +266,8 @@ class ModernMeshBuilder:
                     nodes=NodeCollection(nodes_by_entity.get(key, ())),
                     elements=entity_elements,
                     physical_tags=tuple(entity_physical_tag_values),
+                    parent=parent,
+                    partitions=partitions,
                 )
             )
 
@@ -419,9 +296,10 @@ class ModernMeshBuilder:
                 )
 
         physical_group_values: list[PhysicalGroup] = []
+        order = _mesh_order_key(nodes.tags) if physical_keys else int
         for dimension, physical_tag in physical_keys:
             key = dimension, physical_tag
-            group_node_tags = node_tags_by_physical.get(key, set())
+            group_node_tags = sorted(node_tags_by_physical.get(key, ()), key=order)
             physical_group_values.append(
                 PhysicalGroup(
                     dimension=dimension,
@@ -430,11 +308,220 @@ class ModernMeshBuilder:
                     entities=EntityCollection(entities_by_physical.get(key, ())),
                     elements=ElementCollection(elements_by_physical.get(key, ())),
                     nodes=NodeCollection(
-                        node for node in nodes if node.tag in group_node_tags
+                        map(nodes_by_tag.__getitem__, group_node_tags)
+                    ),
+                )
+            )
+
+        return self._mesh(
+            nodes,
+            elements,
+            entities,
+            PhysicalGroupCollection(physical_group_values),
+            self._periodic_links_of(nodes_by_tag, selection is not None),
+        )
+
+    def _node_blocks(self, selection: _Selection | None) -> Iterator[RawNodeBlock]:
+        """Yield the node blocks that a build with *selection* keeps.
+
+        Blocks of the selected entities and of their boundaries are kept whole.
+        Other blocks are pruned to the nodes that selected elements reference,
+        such as the node of a point embedded in a selected surface.
+        """
+        elements, closure = selection or (frozenset(), None)
+        if closure is None:
+            yield from self._raw_node_blocks
+            return
+        referenced: set[int] | None = None
+        for dimension, entity_tag, raw_nodes in self._raw_node_blocks:
+            if (dimension, entity_tag) in closure:
+                yield dimension, entity_tag, raw_nodes
+                continue
+            if referenced is None:
+                referenced = {
+                    node_tag
+                    for element_dimension, element_tag, _, raw_elements in (
+                        self._raw_element_blocks
+                    )
+                    if (element_dimension, element_tag) in elements
+                    for _, node_tags, _ in raw_elements
+                    for node_tag in node_tags
+                }
+            kept = [node for node in raw_nodes if node[0] in referenced]
+            if kept:
+                yield dimension, entity_tag, kept
+
+    def _build_columnar(self, selection: _Selection | None) -> Mesh:
+        """Build the mesh on node and element tables instead of objects."""
+        from .api import (
+            ElementCollection,
+            Entity,
+            EntityCollection,
+            NodeCollection,
+            PhysicalGroup,
+            PhysicalGroupCollection,
+        )
+        from .columnar import ElementTable, NodeTable, Rows, merge_rows
+
+        node_table = NodeTable()
+        node_rows_by_entity: dict[EntityKey, list[range]] = {}
+        for dimension, entity_tag, raw_nodes in self._node_blocks(selection):
+            key = dimension, entity_tag
+            node_table.physical_tags[key] = self.get_entity_physical_tags(*key)
+            rows = node_table.add_block(dimension, entity_tag, raw_nodes)
+            node_rows_by_entity.setdefault(key, []).append(rows)
+
+        checked = self._validation != "none"
+        repeated = node_table.first_repeated() if checked else None
+        if repeated is not None:
+            raise InvalidMeshError(f"Duplicate node tag {repeated}")
+        if selection is None and len(node_table) != self._number_of_nodes:
+            raise InvalidMeshError(
+                f"Mesh declares {self._number_of_nodes} nodes, built {len(node_table)}"
+            )
+
+        element_table = ElementTable(node_table)
+        element_rows_by_entity: dict[EntityKey, list[range]] = {}
+        physical_ids_by_entity: dict[EntityKey, dict[int, None]] = {}
+        node_row = node_table.row
+        for dimension, entity_tag, type_id, raw_elements in self._raw_element_blocks:
+            key = dimension, entity_tag
+            if selection is not None and key not in selection[0]:
+                continue
+            entity_physical_tags = self.get_entity_physical_tags(*key)
+            entity_physical_ids = physical_ids_by_entity.setdefault(key, {})
+            start = len(element_table)
+            for element_tag, node_tags, record_physical_tags in raw_elements:
+                try:
+                    node_rows = [node_row(tag) for tag in node_tags]
+                except KeyError as error:
+                    missing_tag = int(error.args[0])
+                    raise InvalidMeshError(
+                        f"Element {element_tag} references unknown node {missing_tag}"
+                    ) from error
+                resolved_physical_tags = (
+                    tuple(record_physical_tags)
+                    or self.get_element_physical_tags(element_tag)
+                    or entity_physical_tags
+                )
+                physical_id = element_table.add(
+                    element_tag,
+                    type_id,
+                    dimension,
+                    entity_tag,
+                    node_rows,
+                    resolved_physical_tags,
+                )
+                entity_physical_ids[physical_id] = None
+            element_rows_by_entity.setdefault(key, []).append(
+                range(start, len(element_table))
+            )
+
+        repeated = element_table.first_repeated() if checked else None
+        if repeated is not None:
+            raise InvalidMeshError(f"Duplicate element tag {repeated}")
+        if selection is None and len(element_table) != self._number_of_elements:
+            raise InvalidMeshError(
+                f"Mesh declares {self._number_of_elements} elements, "
+                f"built {len(element_table)}"
+            )
+
+        declared_keys: Iterable[EntityKey] = self._entity_physical_tags
+        if selection is not None:
+            kept = selection[0] | (selection[1] or frozenset())
+            declared_keys = [key for key in declared_keys if key in kept]
+        entity_keys = dict.fromkeys(
+            [*declared_keys, *node_rows_by_entity, *element_rows_by_entity]
+        )
+        physical_values = element_table.physical_values
+        entity_values: list[Entity] = []
+        for key in entity_keys:
+            physical_tags = dict.fromkeys(self.get_entity_physical_tags(*key))
+            for physical_id in physical_ids_by_entity.get(key, ()):
+                physical_tags.update(dict.fromkeys(physical_values[physical_id]))
+            parent, partitions = self.get_entity_partitions(*key) or (None, ())
+            entity_values.append(
+                Entity(
+                    dimension=key[0],
+                    tag=key[1],
+                    nodes=NodeCollection._from_rows(
+                        node_table.view(
+                            merge_rows(node_rows_by_entity.get(key, [range(0)]))
+                        )
+                    ),
+                    elements=ElementCollection._from_rows(
+                        element_table.view(
+                            merge_rows(element_rows_by_entity.get(key, [range(0)]))
+                        )
+                    ),
+                    physical_tags=tuple(physical_tags),
+                    parent=parent,
+                    partitions=partitions,
+                )
+            )
+
+        entities = EntityCollection(entity_values)
+        physical_keys = dict.fromkeys(self._physical_names)
+        entities_by_physical: dict[PhysicalGroupKey, list[Entity]] = {}
+        element_rows_by_physical: dict[PhysicalGroupKey, array[int]] = {}
+        node_rows_by_physical: dict[PhysicalGroupKey, set[int]] = {}
+
+        for entity in entities:
+            for physical_tag in entity.physical_tags:
+                key = entity.dimension, physical_tag
+                physical_keys.setdefault(key, None)
+                entities_by_physical.setdefault(key, []).append(entity)
+                node_rows_by_physical.setdefault(key, set()).update(
+                    cast("RowView[Node]", entity.nodes._items).rows
+                )
+
+        dimensions, physical_ids = element_table.dimensions, element_table.physical_ids
+        for row in range(len(element_table)):
+            for physical_tag in physical_values[physical_ids[row]]:
+                key = dimensions[row], physical_tag
+                physical_keys.setdefault(key, None)
+                element_rows_by_physical.setdefault(key, array("q")).append(row)
+                node_rows_by_physical.setdefault(key, set()).update(
+                    element_table.node_rows(row)
+                )
+
+        physical_group_values: list[PhysicalGroup] = []
+        for key in physical_keys:
+            group_node_rows: Rows = array(
+                "q", sorted(node_rows_by_physical.get(key, ()))
+            )
+            physical_group_values.append(
+                PhysicalGroup(
+                    dimension=key[0],
+                    tag=key[1],
+                    name=self._physical_names.get(key),
+                    entities=EntityCollection(entities_by_physical.get(key, ())),
+                    elements=ElementCollection._from_rows(
+                        element_table.view(element_rows_by_physical.get(key, range(0)))
                     ),
+                    nodes=NodeCollection._from_rows(node_table.view(group_node_rows)),
                 )
             )
 
+        return self._mesh(
+            NodeCollection._from_rows(node_table.view(range(len(node_table)))),
+            ElementCollection._from_rows(element_table.view(range(len(element_table)))),
+            entities,
+            PhysicalGroupCollection(physical_group_values),
+            self._periodic_links_of(_TagRows(node_table), selection is not None),
+        )
+
+    def _periodic_links_of(
+        self,
+        nodes: Container[int],
+        selective: bool,
+    ) -> PeriodicLinkCollection:
+        """Resolve periodic links whose node pairs must all be in *nodes*.
+
+        Links with nodes outside a selective read are dropped.
+        """
+        from .api import PeriodicLink, PeriodicLinkCollection
+
         periodic_link_values: list[PeriodicLink] = []
         for (
             dimension,
@@ -443,13 +530,17 @@ class ModernMeshBuilder:
             affine_transform,
             node_pairs,
         ) in self.get_periodic_links():
+            if selective and not all(
+                slave in nodes and master in nodes for slave, master in node_pairs
+            ):
+                continue
             for slave_tag, master_tag in node_pairs:
-                if slave_tag not in nodes_by_tag:
+                if slave_tag not in nodes:
                     raise InvalidMeshError(
                         f"Periodic entity ({dimension}, {entity_tag}) references "
                         f"unknown slave node {slave_tag}"
                     )
-                if master_tag not in nodes_by_tag:
+                if master_tag not in nodes:
                     raise InvalidMeshError(
                         f"Periodic entity ({dimension}, {entity_tag}) references "
                         f"unknown master node {master_tag}"
@@ -463,6 +554,17 @@ class ModernMeshBuilder:
                     node_pairs=node_pairs,
                 )
             )
+        return PeriodicLinkCollection(periodic_link_values)
+
+    def _mesh(
+        self,
+        nodes: NodeCollection,
+        elements: ElementCollection,
+        entities: EntityCollection,
+        physical_groups: PhysicalGroupCollection,
+        periodic_links: PeriodicLinkCollection,
+    ) -> Mesh:
+        from .api import Mesh, Partitioning, Version, ViewCollection, ViewStep
 
         version = (
             None
@@ -477,15 +579,36 @@ class ModernMeshBuilder:
             nodes=nodes,
             elements=elements,
             entities=entities,
-            physical_groups=PhysicalGroupCollection(physical_group_values),
-            periodic_links=PeriodicLinkCollection(periodic_link_values),
+            physical_groups=physical_groups,
+            periodic_links=periodic_links,
+            views=ViewCollection.from_steps(
+                ViewStep(*record) for record in self.get_data_steps()
+            ),
+            partitioning=Partitioning.from_records(
+                self._number_of_partitions,
+                self._ghost_entities,
+                self._ghost_elements,
+            ),
         )
 
-    @staticmethod
-    def _normalize_tags(tags: Iterable[int]) -> tuple[int, ...]:
-        normalized: list[int] = []
-        for tag in tags:
-            value = int(tag)
-            if value > 0 and value not in normalized:
-                normalized.append(value)
-        return tuple(normalized)
+
+class _TagRows:
+    """Node tags of a table as a container, for periodic link checks."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: NodeTable) -> None:
+        self._table = table
+
+    def __contains__(self, tag: object) -> bool:
+        return isinstance(tag, int) and self._table.has(tag)
+
+
+def _first_repeated(values: Iterable[Node | Element]) -> int:
+    """Return the first tag that repeats in *values*, which must have one."""
+    seen: set[int] = set()
+    for value in values:
+        if value.tag in seen:
+            return value.tag
+        seen.add(value.tag)
+    raise AssertionError("No repeated tag")
@@ -1,10 +1,28 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from functools import partial
+from itertools import chain
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
 from .errors import InvalidNodeError
 from .helpers import parse_floats, parse_ints
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_record_lines,
+    read_required_line,
+    replay_lines,
+    skip_record_lines,
+)
+from .sink import NodeBuffer, ParsedNodeBlock, RawNode
+
+# Node lines are converted in bounded batches so a 20M-node block never holds
+# all of its source text in memory at once.
+_BATCH_LINES = 1 << 16
 
 
 class NodesParser(AbstractParser):
@@ -16,124 +34,263 @@ class NodesParser(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
+        for block in iter_blocks(mesh, io):
+            mesh.add_node_block(*block)
+
+
+def iter_blocks(mesh: Mesh, io: TextIO) -> Iterator[ParsedNodeBlock]:
+    """Yield ``$Nodes`` entity blocks one at a time as they are parsed.
+
+    Section metadata is stored on *mesh*, but the blocks are not; each one is
+    yielded as the arguments of :meth:`~gmshparser.mesh.Mesh.add_node_block`.
+    The section counts and end marker are checked once the last block has been
+    consumed.
+    """
+    if not mesh.get_ascii():
+        yield from _iter_binary_blocks(mesh, binary_source(io))
+        return
+
+    line = read_required_line(io, "$Nodes header")
+    if line.startswith("$Nodes"):
         line = read_required_line(io, "$Nodes header")
-        if line.startswith("$Nodes"):
-            line = read_required_line(io, "$Nodes header")
 
-        try:
-            metadata = [int(value) for value in line.strip().split()]
-        except ValueError as error:
-            raise InvalidNodeError("$Nodes header must contain integers") from error
+    try:
+        metadata = [int(value) for value in line.strip().split()]
+    except ValueError as error:
+        raise InvalidNodeError("$Nodes header must contain integers") from error
+
+    is_v40 = mesh.get_version_major() == 4 and mesh.get_version_minor() == 0
+    expected_header_fields = 2 if is_v40 else 4
+    if len(metadata) != expected_header_fields:
+        raise InvalidNodeError(
+            f"$Nodes header for MSH {'4.0' if is_v40 else '4.1'} must contain "
+            f"{expected_header_fields} integers"
+        )
+
+    if is_v40:
+        number_of_entities, number_of_nodes = metadata
+        min_tag = max_tag = 0
+    else:
+        number_of_entities, number_of_nodes, min_tag, max_tag = metadata
 
-        is_v40 = mesh.get_version_major() == 4 and mesh.get_version_minor() == 0
-        expected_header_fields = 2 if is_v40 else 4
-        if len(metadata) != expected_header_fields:
+    if number_of_entities < 0 or number_of_nodes < 0:
+        raise InvalidNodeError("$Nodes counts cannot be negative")
+
+    mesh.set_number_of_node_entities(number_of_entities)
+    mesh.set_number_of_nodes(number_of_nodes)
+    mesh.set_min_node_tag(min_tag)
+    mesh.set_max_node_tag(max_tag)
+
+    parsed_nodes = 0
+    # Only block extremes are kept, so memory stays bounded while streaming.
+    tag_extremes: list[int] = []
+    for _ in range(number_of_entities):
+        entity_metadata = parse_ints(io)
+        if len(entity_metadata) != 4:
             raise InvalidNodeError(
-                f"$Nodes header for MSH {'4.0' if is_v40 else '4.1'} must contain "
-                f"{expected_header_fields} integers"
+                "A $Nodes entity block header must contain four integers"
             )
 
         if is_v40:
-            number_of_entities, number_of_nodes = metadata
-            min_tag = max_tag = 0
+            entity_tag, dimension, parametric, entity_node_count = entity_metadata
         else:
-            number_of_entities, number_of_nodes, min_tag, max_tag = metadata
-
-        if number_of_entities < 0 or number_of_nodes < 0:
-            raise InvalidNodeError("$Nodes counts cannot be negative")
-
-        mesh.set_number_of_node_entities(number_of_entities)
-        mesh.set_number_of_nodes(number_of_nodes)
-        mesh.set_min_node_tag(min_tag)
-        mesh.set_max_node_tag(max_tag)
-
-        parsed_nodes = 0
-        parsed_tags: list[int] = []
-        for _ in range(number_of_entities):
-            entity_metadata = parse_ints(io)
-            if len(entity_metadata) != 4:
-                raise InvalidNodeError(
-                    "A $Nodes entity block header must contain four integers"
-                )
+            dimension, entity_tag, parametric, entity_node_count = entity_metadata
 
-            if is_v40:
-                entity_tag, dimension, parametric, entity_node_count = entity_metadata
-            else:
-                dimension, entity_tag, parametric, entity_node_count = entity_metadata
+        expected_coordinates = _coordinate_count(
+            dimension, entity_tag, parametric, entity_node_count
+        )
+        parsed_nodes += entity_node_count
+        if not mesh.selects_entity_block("$Nodes", dimension, entity_tag):
+            # MSH 4.1 lists the tags and the coordinates of a block separately.
+            lines = entity_node_count if is_v40 else 2 * entity_node_count
+            skip_record_lines(io, lines, "a skipped node record")
+            continue
 
-            if dimension not in {0, 1, 2, 3}:
-                raise InvalidNodeError(
-                    f"Node entity {entity_tag} has invalid dimension {dimension}"
-                )
-            if parametric not in {0, 1}:
-                raise InvalidNodeError(
-                    f"Node entity {entity_tag} has invalid parametric flag {parametric}"
+        records: Sequence[RawNode] = []
+
+        if is_v40:
+            v40_records: list[RawNode] = []
+            for _ in range(entity_node_count):
+                record = read_required_line(io, "an MSH 4.0 node record")
+                fields = record.strip().split()
+                expected_fields = 1 + expected_coordinates
+                if len(fields) != expected_fields:
+                    raise InvalidNodeError(
+                        f"An MSH 4.0 node record requires {expected_fields} values, "
+                        f"got {len(fields)}"
+                    )
+                try:
+                    tag = int(fields[0])
+                    coordinates = tuple(float(value) for value in fields[1:])
+                except ValueError as error:
+                    raise InvalidNodeError(
+                        "MSH 4.0 node tags and coordinates must be numeric"
+                    ) from error
+                v40_records.append((tag, coordinates))
+            if v40_records:
+                block_tags = [tag for tag, _ in v40_records]
+                tag_extremes += min(block_tags), max(block_tags)
+            records = v40_records
+        else:
+            node_tags = _read_node_tags(io, entity_node_count)
+            values = _read_node_coordinates(io, node_tags, expected_coordinates)
+            records = NodeBuffer(node_tags, values, expected_coordinates)
+
+        yield dimension, entity_tag, dimension if parametric else 0, records
+
+    if parsed_nodes != number_of_nodes:
+        raise InvalidNodeError(
+            f"$Nodes declares {number_of_nodes} nodes, parsed {parsed_nodes}"
+        )
+
+    if is_v40:
+        mesh.set_min_node_tag(min(tag_extremes, default=0))
+        mesh.set_max_node_tag(max(tag_extremes, default=0))
+
+    expect_end_marker(io, "$EndNodes")
+
+
+def _read_node_tags(io: TextIO, count: int) -> array[int]:
+    """Read MSH 4.1 node tag lines in batches, one ``int`` conversion per batch."""
+    tags = array("q")
+    while len(tags) < count:
+        expected = min(_BATCH_LINES, count - len(tags))
+        lines = read_record_lines(io, expected)
+        batch: Sequence[int] = []
+        if len(lines) == expected:
+            try:
+                batch = array("q", map(int, lines))
+            except (OverflowError, ValueError):
+                pass
+        if len(batch) != expected:
+            batch = replay_lines(io, lines, partial(_parse_tag_lines, count=expected))
+        try:
+            tags.extend(batch)
+        except OverflowError as error:
+            raise InvalidNodeError("Node tags must fit in 64-bit integers") from error
+    return tags
+
+
+def _read_node_coordinates(
+    io: TextIO,
+    tags: array[int],
+    width: int,
+) -> array[float]:
+    """Read MSH 4.1 coordinate lines in batches into one flat array."""
+    coordinates = array("d")
+    count = len(tags)
+    while len(coordinates) < count * width:
+        first = len(coordinates) // width
+        expected = min(_BATCH_LINES, count - first)
+        lines = read_record_lines(io, expected)
+        rows: list[Sequence[str | bytes]] = [line.split() for line in lines]
+        if len(rows) == expected and set(map(len, rows)) == {width}:
+            try:
+                coordinates.extend(array("d", map(float, chain.from_iterable(rows))))
+                continue
+            except ValueError:
+                pass
+        coordinates.extend(
+            chain.from_iterable(
+                replay_lines(
+                    io,
+                    lines,
+                    partial(
+                        _parse_coordinate_lines,
+                        tags=tags[first : first + expected],
+                        width=width,
+                    ),
                 )
-            if entity_node_count < 0:
-                raise InvalidNodeError("Node entity counts cannot be negative")
-
-            expected_coordinates = 3 + (dimension if parametric else 0)
-            records: list[tuple[int, tuple[float, ...]]] = []
-
-            if is_v40:
-                for _ in range(entity_node_count):
-                    record = read_required_line(io, "an MSH 4.0 node record")
-                    fields = record.strip().split()
-                    expected_fields = 1 + expected_coordinates
-                    if len(fields) != expected_fields:
-                        raise InvalidNodeError(
-                            f"An MSH 4.0 node record requires {expected_fields} values, "
-                            f"got {len(fields)}"
-                        )
-                    try:
-                        tag = int(fields[0])
-                        coordinates = tuple(float(value) for value in fields[1:])
-                    except ValueError as error:
-                        raise InvalidNodeError(
-                            "MSH 4.0 node tags and coordinates must be numeric"
-                        ) from error
-                    records.append((tag, coordinates))
-                    parsed_tags.append(tag)
-            else:
-                node_tags: list[int] = []
-                for _ in range(entity_node_count):
-                    tag_line = read_required_line(io, "a node tag")
-                    fields = tag_line.strip().split()
-                    if len(fields) != 1:
-                        raise InvalidNodeError(
-                            "Each MSH 4.1 node tag must be on its own line"
-                        )
-                    try:
-                        tag = int(fields[0])
-                    except ValueError as error:
-                        raise InvalidNodeError("Node tags must be integers") from error
-                    node_tags.append(tag)
-                    parsed_tags.append(tag)
-
-                for tag in node_tags:
-                    coordinate_values = parse_floats(io)
-                    if len(coordinate_values) != expected_coordinates:
-                        raise InvalidNodeError(
-                            f"Node {tag} requires {expected_coordinates} coordinate values, "
-                            f"got {len(coordinate_values)}"
-                        )
-                    records.append((tag, tuple(coordinate_values)))
-
-            parsed_nodes += entity_node_count
-            mesh.add_node_block(
-                dimension,
-                entity_tag,
-                dimension if parametric else 0,
-                records,
             )
+        )
+    return coordinates
+
+
+def _parse_tag_lines(io: TextIO, count: int) -> list[int]:
+    tags: list[int] = []
+    for _ in range(count):
+        tag_line = read_required_line(io, "a node tag")
+        fields = tag_line.strip().split()
+        if len(fields) != 1:
+            raise InvalidNodeError("Each MSH 4.1 node tag must be on its own line")
+        try:
+            tags.append(int(fields[0]))
+        except ValueError as error:
+            raise InvalidNodeError("Node tags must be integers") from error
+    return tags
+
 
-        if parsed_nodes != number_of_nodes:
+def _parse_coordinate_lines(
+    io: TextIO,
+    tags: Sequence[int],
+    width: int,
+) -> list[tuple[float, ...]]:
+    coordinates: list[tuple[float, ...]] = []
+    for tag in tags:
+        coordinate_values = parse_floats(io)
+        if len(coordinate_values) != width:
             raise InvalidNodeError(
-                f"$Nodes declares {number_of_nodes} nodes, parsed {parsed_nodes}"
+                f"Node {tag} requires {width} coordinate values, "
+                f"got {len(coordinate_values)}"
             )
+        coordinates.append(tuple(coordinate_values))
+    return coordinates
 
-        if is_v40:
-            mesh.set_min_node_tag(min(parsed_tags, default=0))
-            mesh.set_max_node_tag(max(parsed_tags, default=0))
 
-        expect_end_marker(io, "$EndNodes")
+def _coordinate_count(
+    dimension: int,
+    entity_tag: int,
+    parametric: int,
+    entity_node_count: int,
+) -> int:
+    """Validate a node entity block header and return its coordinate width."""
+    if dimension not in {0, 1, 2, 3}:
+        raise InvalidNodeError(
+            f"Node entity {entity_tag} has invalid dimension {dimension}"
+        )
+    if parametric not in {0, 1}:
+        raise InvalidNodeError(
+            f"Node entity {entity_tag} has invalid parametric flag {parametric}"
+        )
+    if entity_node_count < 0:
+        raise InvalidNodeError("Node entity counts cannot be negative")
+    return 3 + (dimension if parametric else 0)
+
+
+def _iter_binary_blocks(
+    mesh: Mesh,
+    source: SourceBinaryIO,
+) -> Iterator[ParsedNodeBlock]:
+    """Read MSH 4.1 binary node blocks as contiguous tag and coordinate arrays."""
+    number_of_entities, number_of_nodes, min_tag, max_tag = source.unpack(
+        "NNNN", "the binary $Nodes header"
+    )
+    mesh.set_number_of_node_entities(number_of_entities)
+    mesh.set_number_of_nodes(number_of_nodes)
+    mesh.set_min_node_tag(min_tag)
+    mesh.set_max_node_tag(max_tag)
+
+    parsed_nodes = 0
+    for _ in range(number_of_entities):
+        dimension, entity_tag, parametric, entity_node_count = source.unpack(
+            "iiiN", "a binary node entity block header"
+        )
+        width = _coordinate_count(dimension, entity_tag, parametric, entity_node_count)
+        parsed_nodes += entity_node_count
+        if not mesh.selects_entity_block("$Nodes", dimension, entity_tag):
+            size = entity_node_count * (source.data_size + 8 * width)
+            source.skip_bytes(size, "skipped binary node records")
+            continue
+        tags = source.read_array("N", entity_node_count, "binary node tags")
+        coordinates = source.read_array(
+            "d", entity_node_count * width, "binary node coordinates"
+        )
+        records = NodeBuffer(tags, coordinates, width)
+        yield dimension, entity_tag, dimension if parametric else 0, records
+
+    if parsed_nodes != number_of_nodes:
+        raise InvalidNodeError(
+            f"$Nodes declares {number_of_nodes} nodes, parsed {parsed_nodes}"
+        )
+
+    expect_binary_end_marker(source, "$EndNodes")
@@ -1,11 +1,25 @@
 """Parser for the MSH 2.x ``$Nodes`` section."""
 
+from collections.abc import Iterable, Iterator
+from itertools import batched, chain
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
 from .errors import InvalidNodeError
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    read_required_line,
+)
+from .sink import ParsedNodeBlock
+
+type NodeRecord = tuple[int, tuple[float, ...]]
+
+# MSH 2 has no entity blocks; streamed nodes are yielded in chunks of this size.
+_BATCH_RECORDS = 1 << 16
 
 
 class NodesParserV2(AbstractParser):
@@ -17,44 +31,68 @@ class NodesParserV2(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
+        blocks = list(iter_blocks(mesh, io))
+        records = list(chain.from_iterable(block[3] for block in blocks))
+        if records:
+            tags = [node_tag for node_tag, _ in records]
+            mesh.set_min_node_tag(min(tags))
+            mesh.set_max_node_tag(max(tags))
+        mesh.set_number_of_node_entities(1)
+        mesh.add_node_block(3, 1, 0, records)
+
+
+def iter_blocks(mesh: Mesh, io: TextIO) -> Iterator[ParsedNodeBlock]:
+    """Yield the flat MSH 2 node list in chunks attributed to entity ``(3, 1)``."""
+    line = read_required_line(io, "$Nodes node count")
+    if line.startswith("$Nodes"):
         line = read_required_line(io, "$Nodes node count")
-        if line.startswith("$Nodes"):
-            line = read_required_line(io, "$Nodes node count")
 
+    try:
+        number_of_nodes = int(line.strip())
+    except ValueError as error:
+        raise InvalidNodeError("$Nodes node count must be an integer") from error
+    if number_of_nodes < 0:
+        raise InvalidNodeError("$Nodes node count cannot be negative")
+
+    mesh.set_number_of_nodes(number_of_nodes)
+    records: Iterable[NodeRecord]
+    if mesh.get_ascii():
+        records = _read_ascii_records(io, number_of_nodes)
+    else:
+        records = _read_binary_records(binary_source(io), number_of_nodes)
+
+    for batch in batched(records, _BATCH_RECORDS):
+        yield 3, 1, 0, list(batch)
+
+    if mesh.get_ascii():
+        expect_end_marker(io, "$EndNodes")
+    else:
+        expect_binary_end_marker(binary_source(io), "$EndNodes")
+
+
+def _read_ascii_records(io: TextIO, number_of_nodes: int) -> Iterator[NodeRecord]:
+    for _ in range(number_of_nodes):
+        node_line = read_required_line(io, "an MSH 2 node record")
+        fields = node_line.strip().split()
+        if len(fields) != 4:
+            raise InvalidNodeError("An MSH 2 node record must contain tag, x, y, and z")
         try:
-            number_of_nodes = int(line.strip())
+            node_tag = int(fields[0])
+            coordinates = tuple(float(value) for value in fields[1:])
         except ValueError as error:
-            raise InvalidNodeError("$Nodes node count must be an integer") from error
-        if number_of_nodes < 0:
-            raise InvalidNodeError("$Nodes node count cannot be negative")
-
-        mesh.set_number_of_nodes(number_of_nodes)
-        records: list[tuple[int, tuple[float, ...]]] = []
-        min_tag: int | None = None
-        max_tag: int | None = None
-
-        for _ in range(number_of_nodes):
-            node_line = read_required_line(io, "an MSH 2 node record")
-            fields = node_line.strip().split()
-            if len(fields) != 4:
-                raise InvalidNodeError(
-                    "An MSH 2 node record must contain tag, x, y, and z"
-                )
-            try:
-                node_tag = int(fields[0])
-                coordinates = tuple(float(value) for value in fields[1:])
-            except ValueError as error:
-                raise InvalidNodeError(
-                    "MSH 2 node tags and coordinates must be numeric"
-                ) from error
-
-            min_tag = node_tag if min_tag is None else min(min_tag, node_tag)
-            max_tag = node_tag if max_tag is None else max(max_tag, node_tag)
-            records.append((node_tag, coordinates))
-
-        if min_tag is not None and max_tag is not None:
-            mesh.set_min_node_tag(min_tag)
-            mesh.set_max_node_tag(max_tag)
-        mesh.set_number_of_node_entities(1)
-        mesh.add_node_block(3, 1, 0, records)
-        expect_end_marker(io, "$EndNodes")
+            raise InvalidNodeError(
+                "MSH 2 node tags and coordinates must be numeric"
+            ) from error
+        yield node_tag, coordinates
+
+
+def _read_binary_records(
+    source: SourceBinaryIO, number_of_nodes: int
+) -> Iterator[NodeRecord]:
+    """Read ``int`` tag and three ``double`` coordinates per node in bulk chunks."""
+    for first in range(0, number_of_nodes, _BATCH_RECORDS):
+        count = min(_BATCH_RECORDS, number_of_nodes - first)
+        for node_tag, x, y, z in source.unpack_records(
+            "i3d", count, "binary MSH 2 node records"
+        ):
+            yield node_tag, (x, y, z)
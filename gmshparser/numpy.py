@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Any, cast
+from typing import Any, BinaryIO, TextIO, cast
 
 try:
     import numpy as np
@@ -13,10 +15,29 @@ except ModuleNotFoundError as error:  # pragma: no cover
         "NumPy support is optional; install it with 'pip install gmshparser[numpy]'"
     ) from error
 
-from .api import Element, Mesh
+from .api import Element, Mesh, View, ViewCollection, ViewStep, read
+from .cache import DiskCache, cache_options, open_cache
+from .data_parser import DATA_SECTIONS
 from .element_types import ElementType
-
-__all__ = ["CellBlock", "MeshArrays", "to_numpy"]
+from .errors import InvalidMeshError
+from .main_parser import MainParser
+from .parsing import open_source
+from .partitions import merge_partition_files, partition_paths
+from .sink import ElementBuffer, MeshSinkBase, NodeBuffer, RawElement, RawNode
+
+__all__ = [
+    "CellBlock",
+    "MeshArrays",
+    "NumpyMeshBuilder",
+    "StepArrays",
+    "ViewArrays",
+    "read_numpy",
+    "read_partitioned_numpy",
+    "to_numpy",
+]
+
+# Sections read by read_numpy; the others do not contribute to MeshArrays.
+_SECTIONS = ("$Nodes", "$Elements", *DATA_SECTIONS)
 
 
 @dataclass(frozen=True, slots=True)
@@ -52,19 +73,84 @@ class CellBlock:
         return int(self.connectivity.shape[1])
 
 
+@dataclass(frozen=True, slots=True)
+class StepArrays:
+    """NumPy arrays of one post-processing view step.
+
+    ``values`` has shape ``(len(tags), components)``. For ``$ElementNodeData``
+    it has shape ``(len(tags), nodes_per_element, components)``, which requires
+    every element of the step to have the same number of nodes.
+    """
+
+    section: str
+    time_step: int
+    time: float
+    tags: NDArray[Any]
+    values: NDArray[Any]
+
+
+class ViewArrays:
+    """The steps of one post-processing view, converted one step at a time.
+
+    Steps are copied into NumPy arrays only when :meth:`step` is called, so a
+    view with hundreds of steps is never converted as a whole.
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: View) -> None:
+        self._view = view
+
+    @property
+    def name(self) -> str:
+        """View name."""
+        return self._view.name
+
+    @property
+    def section(self) -> str:
+        """Data section the view was read from."""
+        return self._view.section
+
+    @property
+    def time_steps(self) -> NDArray[Any]:
+        """Time-step indices in file order."""
+        return np.asarray(self._view.time_steps, dtype=np.int64)
+
+    @property
+    def times(self) -> NDArray[Any]:
+        """Time values in file order."""
+        return np.asarray(self._view.times, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __iter__(self) -> Iterator[StepArrays]:
+        return (_step_arrays(step) for step in self._view)
+
+    def __repr__(self) -> str:
+        return f"ViewArrays({self.name!r}, section={self.section!r}, steps={len(self)})"
+
+    def step(self, index: int) -> StepArrays:
+        """Return detached arrays of the step at *index* in file order."""
+        return _step_arrays(self._view.step(index))
+
+
 @dataclass(frozen=True, slots=True)
 class MeshArrays:
     """Detached NumPy representation of a modern :class:`gmshparser.api.Mesh`.
 
-    Element blocks are keyed by :class:`~gmshparser.ElementType`. Arrays are
-    ordinary writable NumPy copies; changing them does not mutate the source
-    mesh.
+    Element blocks are keyed by :class:`~gmshparser.ElementType`, and
+    post-processing views by name. Arrays are ordinary writable NumPy copies;
+    changing them does not mutate the source mesh.
     """
 
     points: NDArray[Any]
     node_tags: NDArray[Any]
     node_entity_keys: NDArray[Any]
     cells: Mapping[ElementType, CellBlock]
+    views: Mapping[str, ViewArrays] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
 
     def __post_init__(self) -> None:
         if self.points.ndim != 2 or self.points.shape[1] != 3:
@@ -132,10 +218,7 @@ def to_numpy(
             "to_numpy() requires the modern mesh returned by gmshparser.read()"
         )
 
-    resolved_index_dtype = np.dtype(index_dtype)
-    if not np.issubdtype(resolved_index_dtype, np.integer):
-        raise TypeError("index_dtype must be an integer NumPy dtype")
-
+    resolved_index_dtype = _resolve_index_dtype(index_dtype)
     wanted_types = _normalize_element_types(element_types)
     nodes = tuple(mesh.nodes)
 
@@ -157,9 +240,7 @@ def to_numpy(
     for element_type, elements in grouped.items():
         widths = {len(element.nodes) for element in elements}
         if len(widths) != 1:
-            raise ValueError(
-                f"Element type {element_type.name} has inconsistent connectivity widths"
-            )
+            raise _inconsistent_widths(element_type)
         width = widths.pop()
         connectivity = np.empty((len(elements), width), dtype=resolved_index_dtype)
 
@@ -190,7 +271,341 @@ def to_numpy(
         node_tags=node_tags,
         node_entity_keys=node_entity_keys,
         cells=MappingProxyType(blocks),
+        views=_view_arrays(mesh.views),
+    )
+
+
+def read_numpy(
+    source: str | os.PathLike[str] | TextIO | BinaryIO,
+    *,
+    name: str | None = None,
+    element_types: Iterable[ElementType | int] | ElementType | int | None = None,
+    coordinate_dtype: DTypeLike = np.float64,
+    index_dtype: DTypeLike = np.int64,
+    cache_dir: str | os.PathLike[str] | DiskCache | None = None,
+) -> MeshArrays:
+    """Read a path or stream straight into NumPy arrays.
+
+    The result equals ``to_numpy(gmshparser.read(source), ...)``, but blocks
+    are appended by a :class:`NumpyMeshBuilder` instead of being built into
+    node and element objects first. Only the node, element, and
+    post-processing data sections are parsed.
+
+    With ``cache_dir``, the arrays of an unchanged path are rebuilt from the
+    snapshot that :func:`gmshparser.read` stores there. On a miss, the path is
+    read with ``cache_dir`` to store the snapshot and then converted.
+    """
+    if name is None:
+        if hasattr(source, "read"):
+            name = str(getattr(source, "name", "<stream>"))
+        else:
+            name = os.fspath(source)
+    builder = NumpyMeshBuilder(
+        name,
+        element_types=element_types,
+        coordinate_dtype=coordinate_dtype,
+        index_dtype=index_dtype,
+    )
+    if cache_dir is not None:
+        if hasattr(source, "read"):
+            raise ValueError("cache_dir requires a file path source")
+        cache = open_cache(cache_dir)
+        snapshot = cache.load(source, cache_options(sections=_SECTIONS))
+        if snapshot is None:
+            mesh = read(source, name=name, sections=_SECTIONS, cache_dir=cache)
+            return to_numpy(
+                mesh,
+                element_types=element_types,
+                coordinate_dtype=coordinate_dtype,
+                index_dtype=index_dtype,
+            )
+        builder.set_validation("none")
+        snapshot.replay(builder)
+        return builder.build()
+
+    parser = MainParser(sections=_SECTIONS, line_tracking="lazy")
+    if hasattr(source, "read"):
+        parser.parse(builder, cast(TextIO, source))
+    else:
+        with open_source(os.fspath(source)) as stream:
+            parser.parse(builder, stream)
+    return builder.build()
+
+
+def read_partitioned_numpy(
+    source: str | os.PathLike[str] | Iterable[str | os.PathLike[str]],
+    *,
+    name: str | None = None,
+    workers: int | None = None,
+    element_types: Iterable[ElementType | int] | ElementType | int | None = None,
+    coordinate_dtype: DTypeLike = np.float64,
+    index_dtype: DTypeLike = np.int64,
+) -> MeshArrays:
+    """Read the per-partition files of a split mesh straight into NumPy arrays.
+
+    The files are parsed and merged as by
+    :func:`gmshparser.read_partitioned`, but only their node and element
+    sections are read, and the blocks are appended by a
+    :class:`NumpyMeshBuilder`.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    paths = partition_paths(source)
+    if name is None:
+        name = os.fspath(source) if isinstance(source, str | os.PathLike) else paths[0]
+    builder = NumpyMeshBuilder(
+        name,
+        element_types=element_types,
+        coordinate_dtype=coordinate_dtype,
+        index_dtype=index_dtype,
     )
+    merge_partition_files(
+        paths, builder, workers=workers, sections={"$Nodes", "$Elements"}
+    )
+    return builder.build()
+
+
+class NumpyMeshBuilder(MeshSinkBase):
+    """Parser sink that appends node and element blocks to growable arrays.
+
+    Blocks passed as :class:`~gmshparser.sink.NodeBuffer` or
+    :class:`~gmshparser.sink.ElementBuffer`, as the MSH 4 parsers do, are
+    copied from their typed buffers without creating per-node Python objects.
+    Record sequences from the other parsers are converted once per block.
+    Elements of types outside *element_types* are counted but not stored.
+    """
+
+    def __init__(
+        self,
+        name: str = "New Mesh",
+        *,
+        element_types: Iterable[ElementType | int] | ElementType | int | None = None,
+        coordinate_dtype: DTypeLike = np.float64,
+        index_dtype: DTypeLike = np.int64,
+    ) -> None:
+        super().__init__(name)
+        self._wanted_types = _normalize_element_types(element_types)
+        self._index_dtype = _resolve_index_dtype(index_dtype)
+        self._points = _GrowableArray(coordinate_dtype, 3)
+        self._node_tags = _GrowableArray(np.int64, 1)
+        self._node_entity_keys = _GrowableArray(self._index_dtype, 2)
+        self._cells: dict[ElementType, _CellArrays] = {}
+        self._parsed_elements = 0
+
+    def set_number_of_nodes(self, value: int) -> None:
+        super().set_number_of_nodes(value)
+        for values in (self._points, self._node_tags, self._node_entity_keys):
+            values.reserve(values.size + value)
+
+    def add_node_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        parametric_coordinate_count: int,
+        nodes: Sequence[RawNode],
+    ) -> None:
+        """Append one node block, dropping parametric coordinates."""
+        del parametric_coordinate_count
+        if isinstance(nodes, NodeBuffer):
+            tags = _view(nodes.tags)
+            points = _view(nodes.coordinates).reshape((-1, nodes.width))[:, :3]
+        else:
+            records = list(nodes)
+            for node_tag, coordinates in records:
+                if len(coordinates) < 3:
+                    raise InvalidMeshError(
+                        f"Node {node_tag} has fewer than three coordinates"
+                    )
+            tags = np.fromiter(
+                (tag for tag, _ in records), dtype=np.int64, count=len(records)
+            )
+            points = np.asarray(
+                [coordinates[:3] for _, coordinates in records], dtype=np.float64
+            ).reshape((-1, 3))
+
+        self._node_tags.extend(tags.reshape((-1, 1)))
+        self._points.extend(points)
+        self._node_entity_keys.extend(
+            np.broadcast_to((dimension, entity_tag), (len(tags), 2))
+        )
+
+    def add_element_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        element_type: int,
+        elements: Sequence[RawElement],
+    ) -> None:
+        """Append one element block to the arrays of its element type."""
+        self._parsed_elements += len(elements)
+        resolved_type = ElementType(element_type)
+        if not elements or (
+            self._wanted_types is not None and resolved_type not in self._wanted_types
+        ):
+            return
+
+        if isinstance(elements, ElementBuffer):
+            records = _view(elements.values).reshape((-1, elements.width))
+        else:
+            widths = {len(node_tags) for _, node_tags, _ in elements}
+            if len(widths) != 1:
+                raise _inconsistent_widths(resolved_type)
+            records = np.asarray(
+                [(tag, *node_tags) for tag, node_tags, _ in elements], dtype=np.int64
+            )
+
+        cell = self._cells.get(resolved_type)
+        if cell is None:
+            cell = self._cells[resolved_type] = _CellArrays(
+                records.shape[1] - 1, self._index_dtype
+            )
+        elif cell.node_tags.width != records.shape[1] - 1:
+            raise _inconsistent_widths(resolved_type)
+        cell.element_tags.extend(records[:, :1])
+        cell.node_tags.extend(records[:, 1:])
+        cell.entity_keys.extend(
+            np.broadcast_to((dimension, entity_tag), (len(records), 2))
+        )
+
+    def build(self) -> MeshArrays:
+        """Resolve connectivity to point rows and return the collected arrays."""
+        node_tags = self._node_tags.values.ravel()
+        if len(node_tags) != self._number_of_nodes:
+            raise InvalidMeshError(
+                f"Mesh declares {self._number_of_nodes} nodes, built {len(node_tags)}"
+            )
+        if self._parsed_elements != self._number_of_elements:
+            raise InvalidMeshError(
+                f"Mesh declares {self._number_of_elements} elements, "
+                f"built {self._parsed_elements}"
+            )
+
+        order = np.argsort(node_tags, kind="stable")
+        sorted_tags = node_tags[order]
+        if self._validation != "none":
+            duplicates = sorted_tags[1:][sorted_tags[1:] == sorted_tags[:-1]]
+            if len(duplicates):
+                raise InvalidMeshError(f"Duplicate node tag {duplicates[0]}")
+            _check_unique_element_tags(self._cells.values())
+
+        blocks: dict[ElementType, CellBlock] = {}
+        for element_type, cell in self._cells.items():
+            element_tags = cell.element_tags.values.ravel()
+            connectivity = cell.node_tags.values
+            rows = np.searchsorted(sorted_tags, connectivity)
+            found = rows < len(sorted_tags)
+            found[found] = sorted_tags[rows[found]] == connectivity[found]
+            if not found.all():
+                row, column = np.argwhere(~found)[0]
+                raise InvalidMeshError(
+                    f"Element {element_tags[row]} references unknown node "
+                    f"{connectivity[row, column]}"
+                )
+            blocks[element_type] = CellBlock(
+                element_type=element_type,
+                connectivity=order[rows].astype(self._index_dtype),
+                element_tags=element_tags.astype(self._index_dtype),
+                entity_keys=cell.entity_keys.values.copy(),
+            )
+
+        return MeshArrays(
+            points=self._points.values.copy(),
+            node_tags=node_tags.astype(self._index_dtype),
+            node_entity_keys=self._node_entity_keys.values.copy(),
+            cells=MappingProxyType(blocks),
+            views=_view_arrays(
+                ViewCollection.from_steps(
+                    ViewStep(*record) for record in self.get_data_steps()
+                )
+            ),
+        )
+
+
+class _GrowableArray:
+    """Rows of a fixed width appended into a buffer that doubles as it fills."""
+
+    def __init__(self, dtype: DTypeLike, width: int) -> None:
+        self.width = width
+        self.size = 0
+        self._data = np.empty((0, width), dtype=dtype)
+
+    @property
+    def values(self) -> NDArray[Any]:
+        """View of the filled rows."""
+        return self._data[: self.size]
+
+    def reserve(self, capacity: int) -> None:
+        if capacity > len(self._data):
+            grown = np.empty((capacity, self.width), dtype=self._data.dtype)
+            grown[: self.size] = self.values
+            self._data = grown
+
+    def extend(self, rows: NDArray[Any]) -> None:
+        end = self.size + len(rows)
+        if end > len(self._data):
+            self.reserve(max(end, 2 * len(self._data)))
+        self._data[self.size : end] = rows
+        self.size = end
+
+
+class _CellArrays:
+    """Growable arrays for the elements of one type."""
+
+    def __init__(self, width: int, index_dtype: np.dtype[Any]) -> None:
+        self.element_tags = _GrowableArray(np.int64, 1)
+        self.node_tags = _GrowableArray(np.int64, width)
+        self.entity_keys = _GrowableArray(index_dtype, 2)
+
+
+def _view(values: array[Any]) -> NDArray[Any]:
+    return np.frombuffer(values, dtype=values.typecode)
+
+
+def _view_arrays(views: ViewCollection) -> Mapping[str, ViewArrays]:
+    return MappingProxyType({view.name: ViewArrays(view) for view in views})
+
+
+def _step_arrays(step: ViewStep) -> StepArrays:
+    values = _view(step.values).copy()
+    shape: tuple[int, ...] = (len(step), step.components)
+    if step.node_counts is not None:
+        counts = set(step.node_counts)
+        if len(counts) > 1:
+            raise ValueError(
+                f"View {step.name!r} step {step.time_step} mixes elements with "
+                "different node counts"
+            )
+        shape = (len(step), counts.pop() if counts else 0, step.components)
+    return StepArrays(
+        section=step.section,
+        time_step=step.time_step,
+        time=step.time,
+        tags=_view(step.tags).copy(),
+        values=values.reshape(shape),
+    )
+
+
+def _check_unique_element_tags(cells: Iterable[_CellArrays]) -> None:
+    tags = np.concatenate(
+        [cell.element_tags.values.ravel() for cell in cells] or [np.empty(0, np.int64)]
+    )
+    tags.sort()
+    duplicates = tags[1:][tags[1:] == tags[:-1]]
+    if len(duplicates):
+        raise InvalidMeshError(f"Duplicate element tag {duplicates[0]}")
+
+
+def _inconsistent_widths(element_type: ElementType) -> ValueError:
+    return ValueError(
+        f"Element type {element_type.name} has inconsistent connectivity widths"
+    )
+
+
+def _resolve_index_dtype(index_dtype: DTypeLike) -> np.dtype[Any]:
+    resolved = np.dtype(index_dtype)
+    if not np.issubdtype(resolved, np.integer):
+        raise TypeError("index_dtype must be an integer NumPy dtype")
+    return resolved
 
 
 def _normalize_element_types(
@@ -0,0 +1,414 @@
+"""Process-parallel parsing of MSH 4 ``$Nodes`` and ``$Elements`` sections."""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+from array import array
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from itertools import chain, groupby, pairwise
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO, cast
+
+from . import elements_parser, nodes_parser
+from .main_parser import MainParser
+from .modern_builder import ModernMeshBuilder
+from .parsing import SourceBinaryIO, open_source, track_source
+from .section_index import BlockSpan, SectionIndex, SectionSpan, end_marker
+from .sink import (
+    ElementBuffer,
+    NodeBuffer,
+    ParsedElementBlock,
+    ParsedNodeBlock,
+    Validation,
+)
+
+if TYPE_CHECKING:
+    from .api import Mesh
+    from .mesh import Mesh as LegacyMesh
+
+__all__ = ["read_parallel"]
+
+# Smaller chunks cost more in process round trips than they save in parsing.
+_MIN_CHUNK_RECORDS = 1 << 15
+# Several chunks per worker keep the pool busy when entity blocks are uneven.
+_CHUNKS_PER_WORKER = 4
+_SIZE_TYPECODES = {4: "I", 8: "Q"}
+_SECTIONS = ("$Nodes", "$Elements")
+
+type _Part = bytes | tuple[int, int]
+type _Block = ParsedNodeBlock | ParsedElementBlock
+
+
+@dataclass(frozen=True, slots=True)
+class _Format:
+    version: str
+    binary: bool
+    data_size: int
+    byte_order: str
+
+    @property
+    def legacy(self) -> bool:
+        return self.version == "4.0"
+
+
+@dataclass(frozen=True, slots=True)
+class _Chunk:
+    """Records of consecutive entity blocks parsed by one worker.
+
+    ``parts`` are literal bytes or ``(start, stop)`` byte ranges of the file
+    that together form a complete section. ``owners`` holds the index of the
+    source entity block of each block the section yields.
+    """
+
+    path: str
+    section: str
+    format: _Format
+    parts: tuple[_Part, ...]
+    owners: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Plan:
+    section: str
+    header: tuple[int, int, int, int]
+    chunks: tuple[_Chunk, ...]
+
+
+def read_parallel(
+    path: str | os.PathLike[str],
+    name: str,
+    parser: MainParser,
+    workers: int,
+    validation: Validation = "full",
+    *,
+    columnar: bool = False,
+) -> Mesh | None:
+    """Read an MSH 4 file with its node and element sections parsed by *workers*.
+
+    The sections are split into chunks at entity-block boundaries, and large
+    blocks at record boundaries, with the byte offsets of a
+    :class:`~gmshparser.section_index.SectionIndex`. Each worker process runs
+    the section parser's ``iter_blocks`` on its chunks, and the blocks are
+    merged in file order into one
+    :class:`~gmshparser.modern_builder.ModernMeshBuilder`, which validates tags
+    and counts as in a serial read at the same *validation* level, and builds
+    a columnar mesh with *columnar*. The other sections are parsed in this
+    process meanwhile.
+
+    Returns ``None`` for files that are not MSH 4 or whose sections cannot be
+    split, and whenever parsing fails, so that the caller reads the file
+    serially and reports the first error with its exact line. Workers use the
+    default :mod:`multiprocessing` start method, so scripts on platforms that
+    spawn workers need an ``if __name__ == "__main__":`` guard.
+    """
+    path = os.fspath(path)
+    try:
+        with SectionIndex(path) as index:
+            plans = _plan(index, parser, workers)
+    except (OSError, ValueError):
+        return None
+    if not plans:
+        return None
+
+    builder = ModernMeshBuilder(name)
+    builder.set_validation(validation)
+    remainder = MainParser(
+        sections=parser.sections,
+        exclude={*parser.exclude, *(plan.section for plan in plans)},
+        line_tracking="lazy",
+    )
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            results = [pool.map(_parse_chunk, plan.chunks) for plan in plans]
+            with open_source(path) as stream:
+                remainder.parse(builder, stream)
+            for plan, blocks in zip(plans, results, strict=True):
+                _merge(builder, plan, blocks)
+        except ValueError:
+            # Every parser error is a ValueError; the serial read reports it.
+            pool.shutdown(cancel_futures=True)
+            return None
+    return builder.build(columnar=columnar)
+
+
+def _plan(index: SectionIndex, parser: MainParser, workers: int) -> list[_Plan]:
+    version = index.version
+    if version is None or version not in {"4.0", "4.1"}:
+        return []
+    fmt = _Format(
+        version=version,
+        binary=index.is_binary,
+        data_size=index.data_size or 8,
+        byte_order=index.byte_order or "<",
+    )
+    plans: list[_Plan] = []
+    for section in _SECTIONS:
+        if not parser.selects(section):
+            continue
+        spans = index.find_all(section)
+        if len(spans) != 1:
+            return [] if spans else plans
+        plan = _plan_section(index, spans[0], fmt, workers)
+        if plan is None:
+            return []
+        plans.append(plan)
+    return plans
+
+
+def _plan_section(
+    index: SectionIndex,
+    span: SectionSpan,
+    fmt: _Format,
+    workers: int,
+) -> _Plan | None:
+    """Split one section into chunks, or return ``None`` if it is malformed."""
+    header = _section_header(index, span, fmt)
+    blocks = index.blocks(span)
+    if header is None or header[:2] != (len(blocks), sum(b.count for b in blocks)):
+        return None
+    if blocks and index.read_range(blocks[-1].stop, span.end_offset).strip():
+        return None
+
+    total = header[1]
+    size = max(_MIN_CHUNK_RECORDS, math.ceil(total / (workers * _CHUNKS_PER_WORKER)))
+    chunks: list[_Chunk] = []
+    parts: list[_Part] = []
+    owners: list[int] = []
+    filled = 0
+
+    def flush() -> None:
+        nonlocal filled
+        section_header = _encode_section_header(fmt, len(owners), filled)
+        marker = end_marker(span.name).encode()
+        closing = b"\n" + marker + b"\n" if fmt.binary else marker + b"\n"
+        chunks.append(
+            _Chunk(
+                path=index.path,
+                section=span.name,
+                format=fmt,
+                parts=(section_header, *parts, closing),
+                owners=tuple(owners),
+            )
+        )
+        parts.clear()
+        owners.clear()
+        filled = 0
+
+    for number, block in enumerate(blocks):
+        if filled >= size:
+            flush()
+        counts: list[int] = []
+        remaining, room = block.count, size - filled
+        while remaining > room:
+            counts.append(room)
+            remaining -= room
+            room = size
+        counts.append(remaining)
+        for count, piece in zip(
+            counts, _pieces(index, block, counts, fmt), strict=True
+        ):
+            if filled >= size:
+                flush()
+            parts.extend(piece)
+            owners.append(number)
+            filled += count
+    if owners:
+        flush()
+    return _Plan(section=span.name, header=header, chunks=tuple(chunks))
+
+
+def _section_header(
+    index: SectionIndex,
+    span: SectionSpan,
+    fmt: _Format,
+) -> tuple[int, int, int, int] | None:
+    """Return the ``(blocks, records, min_tag, max_tag)`` header of *span*."""
+    data = index.read_range(
+        span.body_offset, min(span.end_offset, span.body_offset + 256)
+    )
+    if fmt.binary:
+        layout = struct.Struct(fmt.byte_order + 4 * _SIZE_TYPECODES[fmt.data_size])
+        if len(data) < layout.size:
+            return None
+        blocks, records, min_tag, max_tag = layout.unpack_from(data)
+        return blocks, records, min_tag, max_tag
+    try:
+        values = [int(value) for value in data.split(b"\n", 1)[0].split()]
+    except ValueError:
+        return None
+    if len(values) != (2 if fmt.legacy else 4) or min(values[:2]) < 0:
+        return None
+    if fmt.legacy:
+        values += 0, 0
+    return values[0], values[1], values[2], values[3]
+
+
+def _encode_section_header(fmt: _Format, blocks: int, records: int) -> bytes:
+    if fmt.binary:
+        layout = fmt.byte_order + 4 * _SIZE_TYPECODES[fmt.data_size]
+        return struct.pack(layout, blocks, records, 0, 0)
+    if fmt.legacy:
+        return f"{blocks} {records}\n".encode()
+    return f"{blocks} {records} 0 0\n".encode()
+
+
+def _pieces(
+    index: SectionIndex,
+    block: BlockSpan,
+    counts: list[int],
+    fmt: _Format,
+) -> list[list[_Part]]:
+    """Return the parts of each consecutive run of *counts* records of *block*."""
+    if len(counts) == 1:
+        return [[(block.offset, block.stop)]]
+
+    nodes = block.section == "$Nodes"
+    kind = int(block.parametric) if nodes else block.element_type
+    assert kind is not None
+    headers = [_encode_block_header(fmt, block, kind, count) for count in counts]
+    if fmt.binary:
+        body = block.offset + len(headers[0])
+        record_sizes = [(block.stop - body) // block.count]
+        if nodes:
+            width = 3 + (block.dimension if block.parametric else 0)
+            record_sizes = [fmt.data_size, 8 * width]
+        columns: list[list[tuple[int, int]]] = []
+        start = body
+        for record_size in record_sizes:
+            cuts = [start + record_size * first for first in _starts(counts)]
+            columns.append(list(pairwise(cuts)))
+            start = cuts[-1]
+    else:
+        body = index.skip_lines(block.offset, 1, block.section)
+        columns = []
+        start = body
+        for _ in range(2 if nodes and not fmt.legacy else 1):
+            cuts = [start]
+            for count in counts:
+                cuts.append(index.skip_lines(cuts[-1], count, block.section))
+            columns.append(list(pairwise(cuts)))
+            start = cuts[-1]
+    return [
+        [header, *(column[number] for column in columns)]
+        for number, header in enumerate(headers)
+    ]
+
+
+def _starts(counts: Iterable[int]) -> list[int]:
+    starts = [0]
+    for count in counts:
+        starts.append(starts[-1] + count)
+    return starts
+
+
+def _encode_block_header(
+    fmt: _Format, block: BlockSpan, kind: int, count: int
+) -> bytes:
+    first, second = block.dimension, block.entity_tag
+    if fmt.legacy:
+        first, second = second, first
+    if fmt.binary:
+        layout = fmt.byte_order + "iii" + _SIZE_TYPECODES[fmt.data_size]
+        return struct.pack(layout, first, second, kind, count)
+    return f"{first} {second} {kind} {count}\n".encode()
+
+
+def _parse_chunk(chunk: _Chunk) -> list[_Block]:
+    """Parse one chunk in a worker process."""
+    with open(chunk.path, "rb") as file:
+        data = b"".join(_read_part(file, part) for part in chunk.parts)
+
+    fmt = chunk.format
+    target = ModernMeshBuilder(chunk.path)
+    target.set_version(float(fmt.version))
+    target.set_ascii(not fmt.binary)
+    source: TextIO
+    if fmt.binary:
+        binary = SourceBinaryIO(BytesIO(data), chunk.path)
+        binary.byte_order = fmt.byte_order
+        binary.data_size = fmt.data_size
+        source = cast(TextIO, binary)
+    else:
+        source = cast(TextIO, track_source(StringIO(data.decode("utf-8")), chunk.path))
+    mesh = cast("LegacyMesh", target)
+    if chunk.section == "$Nodes":
+        return list(nodes_parser.iter_blocks(mesh, source))
+    return list(elements_parser.iter_blocks(mesh, source))
+
+
+def _read_part(file: BinaryIO, part: _Part) -> bytes:
+    if isinstance(part, bytes):
+        return part
+    start, stop = part
+    file.seek(start)
+    return file.read(stop - start)
+
+
+def _merge(
+    builder: ModernMeshBuilder,
+    plan: _Plan,
+    results: Iterable[list[_Block]],
+) -> None:
+    """Store the section header and the blocks of *plan* in file order."""
+    entities, records, min_tag, max_tag = plan.header
+    nodes = plan.section == "$Nodes"
+    legacy = plan.chunks[0].format.legacy if plan.chunks else False
+    extremes: list[int] = []
+    owned = chain.from_iterable(
+        zip(chunk.owners, blocks, strict=True)
+        for chunk, blocks in zip(plan.chunks, results, strict=True)
+    )
+    for _, group in groupby(owned, key=lambda item: item[0]):
+        parts = [block for _, block in group]
+        dimension, entity_tag, kind, _ = parts[0]
+        merged = _concatenate([block[3] for block in parts])
+        if legacy and len(merged):
+            tags = _tags(merged)
+            extremes += min(tags), max(tags)
+        if nodes:
+            builder.add_node_block(dimension, entity_tag, kind, merged)
+        else:
+            builder.add_element_block(dimension, entity_tag, kind, merged)
+
+    if legacy:
+        min_tag, max_tag = min(extremes, default=0), max(extremes, default=0)
+    if nodes:
+        builder.set_number_of_node_entities(entities)
+        builder.set_number_of_nodes(records)
+        builder.set_min_node_tag(min_tag)
+        builder.set_max_node_tag(max_tag)
+    else:
+        builder.set_number_of_element_entities(entities)
+        builder.set_number_of_elements(records)
+        builder.set_min_element_tag(min_tag)
+        builder.set_max_element_tag(max_tag)
+
+
+def _concatenate(parts: list[Sequence[Any]]) -> Sequence[Any]:
+    """Join the pieces of one entity block parsed by different workers."""
+    first = parts[0]
+    if len(parts) == 1:
+        return first
+    if isinstance(first, NodeBuffer):
+        tags: array[int] = array(first.tags.typecode)
+        coordinates = array("d")
+        for part in cast(list[NodeBuffer], parts):
+            tags.extend(part.tags)
+            coordinates.extend(part.coordinates)
+        return NodeBuffer(tags, coordinates, first.width)
+    if isinstance(first, ElementBuffer):
+        values = array(first.values.typecode)
+        for element_part in cast(list[ElementBuffer], parts):
+            values.extend(element_part.values)
+        return ElementBuffer(values, first.width)
+    return list(chain.from_iterable(parts))
+
+
+def _tags(records: Sequence[Any]) -> Sequence[int]:
+    if isinstance(records, NodeBuffer | ElementBuffer):
+        return records.tags
+    return [record[0] for record in records]
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import Any, TextIO
+import bz2
+import codecs
+import gzip
+import lzma
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import (
+    BufferedIOBase,
+    BufferedReader,
+    BytesIO,
+    RawIOBase,
+    StringIO,
+    TextIOWrapper,
+)
+from itertools import chain, islice
+from typing import Any, BinaryIO, Literal, TextIO, cast
 
 from .errors import (
     InvalidElementError,
@@ -10,33 +29,209 @@ from .errors import (
     ParseError,
     ParsingContext,
     UnexpectedEndOfFileError,
+    UnsupportedBinaryFormatError,
 )
+from .sink import Validation
 
 __all__ = [
+    "LineTracking",
+    "SourceBinaryIO",
     "SourceTextIO",
+    "binary_source",
     "contextualize_error",
+    "detect_compression",
+    "expect_binary_end_marker",
     "expect_end_marker",
     "get_parsing_context",
+    "get_validation",
+    "open_source",
+    "read_lines",
+    "read_record_lines",
     "read_required_line",
+    "replay_lines",
+    "skip_record_lines",
+    "track_source",
 ]
 
+_NATIVE_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+_SIZE_TYPECODES = {4: "I", 8: "Q"}
+_SKIP_CHUNK_SIZE = 1 << 20
+_DECOMPRESSION_BUFFER_SIZE = 1 << 20
+_SKIP_BATCH_LINES = 1 << 16
+_COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+type LineTracking = Literal["eager", "lazy"]
+
+
+@dataclass(frozen=True, slots=True)
+class _Mark:
+    """Read position up to which the lazily tracked context is exact.
+
+    When the position lies in text left over by a skip, *pending* is that text
+    and *offset* the position within it; *position* is then the stream
+    position just after the left-over text.
+    """
+
+    position: int
+    pending: StringIO | None = None
+    offset: int = 0
+
 
 class SourceTextIO:
-    """Text stream proxy that records the current source line."""
+    """Text stream proxy that records the current source line.
 
-    __slots__ = ("_stream", "context")
+    With ``line_tracking="lazy"`` the proxy does no per-line bookkeeping on
+    seekable streams. It remembers the stream position up to which
+    :attr:`context` is exact, and :meth:`locate` recounts the lines read since
+    then when an error needs them. Unseekable streams are always tracked
+    eagerly.
+    """
 
-    def __init__(self, stream: TextIO, filename: str | None = None) -> None:
+    __slots__ = ("_stream", "_pending", "_mark", "context")
+
+    def __init__(
+        self,
+        stream: TextIO,
+        filename: str | None = None,
+        *,
+        line_tracking: LineTracking = "eager",
+    ) -> None:
+        if line_tracking not in ("eager", "lazy"):
+            raise ValueError(f"Unknown line tracking mode: {line_tracking!r}")
         self._stream = stream
+        self._pending: StringIO | None = None
+        self._mark = self._lazy_mark() if line_tracking == "lazy" else None
         self.context = ParsingContext(filename=filename)
 
+    @property
+    def line_tracking(self) -> LineTracking:
+        return "eager" if self._mark is None else "lazy"
+
+    def set_line_tracking(self, line_tracking: LineTracking) -> None:
+        """Switch the tracking mode from the current read position on.
+
+        Sources that cannot be tracked lazily stay eager.
+        """
+        if line_tracking not in ("eager", "lazy"):
+            raise ValueError(f"Unknown line tracking mode: {line_tracking!r}")
+        self.locate()
+        self._mark = self._lazy_mark() if line_tracking == "lazy" else None
+
+    def _lazy_mark(self) -> _Mark | None:
+        """Return a mark at the current position, or ``None`` if it cannot seek."""
+        mark = _start_mark(self._stream)
+        if mark is None or self._pending is None:
+            return mark
+        return _Mark(mark.position, self._pending, self._pending.tell())
+
+    def locate(self) -> ParsingContext:
+        """Return :attr:`context` updated to the last line read.
+
+        Under lazy tracking, the lines read since the previous call are counted
+        by rescanning the stream from the position reached then.
+        """
+        mark = self._mark
+        if mark is None:
+            return self.context
+
+        pending = self._pending
+        if pending is not None and mark.pending is pending:
+            offset = pending.tell()
+            lines, line = _count_lines([pending.getvalue()[mark.offset : offset]])
+            self._mark = _Mark(mark.position, pending, offset)
+        else:
+            position = self._stream.tell()
+            chunks = _read_between(self._stream, mark.position, position)
+            if mark.pending is not None:
+                chunks = chain([mark.pending.getvalue()[mark.offset :]], chunks)
+            lines, line = _count_lines(chunks)
+            self._mark = _Mark(position)
+
+        if lines:
+            self.context.line_number += lines
+            self.context.line = line
+        return self.context
+
     def readline(self, size: int = -1) -> str:
-        line = self._stream.readline(size)
-        if line != "":
+        if self._pending is None:
+            line = self._stream.readline(size)
+        else:
+            line = self._readline_pending(size)
+        if line != "" and self._mark is None:
             self.context.line_number += 1
             self.context.line = line.rstrip("\r\n")
         return line
 
+    def read_lines(self, count: int) -> list[str]:
+        """Read up to *count* lines in one pass and advance the line number once."""
+        lines: list[str] = []
+        if self._pending is not None:
+            lines = list(islice(iter(self._pending.readline, ""), count))
+            partial = bool(lines) and not lines[-1].endswith("\n")
+            if partial or len(lines) < count:
+                self._pending = None
+            if partial:
+                lines[-1] += self._stream.readline()
+        if len(lines) < count:
+            lines.extend(islice(iter(self._stream.readline, ""), count - len(lines)))
+        self._advance(lines)
+        return lines
+
+    def read(self, size: int = -1) -> str:
+        """Read text without line tracking, honouring text left by a skip."""
+        if self._pending is None:
+            return self._stream.read(size)
+        data = self._pending.read(size)
+        if size < 0 or len(data) < size:
+            self._pending = None
+            data += self._stream.read(-1 if size < 0 else size - len(data))
+        return data
+
+    def skip_section(self, marker: str) -> None:
+        """Consume lines up to and including *marker* without tokenizing them.
+
+        The stream is searched in large chunks for the end-marker line; line
+        numbers are advanced by counting the skipped newlines.
+        """
+        self.locate()
+        pending = "" if self._pending is None else self._pending.read()
+        rest, lines, line = _skip_to_marker(
+            pending, self._stream.read, "\n" + marker, marker
+        )
+        self._finish_skip(lines, line, marker)
+        self._pending = StringIO(rest) if rest else None
+        if self._mark is not None:
+            self._mark = _Mark(self._stream.tell(), self._pending)
+
+    def _readline_pending(self, size: int) -> str:
+        assert self._pending is not None
+        line = self._pending.readline(size)
+        if not line.endswith("\n") and (size < 0 or len(line) < size):
+            self._pending = None
+            line += self._stream.readline(-1 if size < 0 else size - len(line))
+        return line
+
+    def _advance(self, lines: list[str]) -> None:
+        if lines and self._mark is None:
+            self.context.line_number += len(lines)
+            self.context.line = lines[-1].rstrip("\r\n")
+
+    def _finish_skip(self, lines: int, line: str | None, marker: str) -> None:
+        if line is None:
+            context = self.context
+            raise UnexpectedEndOfFileError(
+                f"Unexpected end of file while searching for {marker}",
+                filename=context.filename,
+                line_number=context.line_number + lines + 1,
+                section=context.section,
+            )
+        self.context.line_number += lines
+        self.context.line = line.rstrip("\r\n")
+
     def __iter__(self) -> Iterator[str]:
         return self
 
@@ -50,12 +245,501 @@ class SourceTextIO:
         return getattr(self._stream, name)
 
 
+class SourceBinaryIO(SourceTextIO):
+    """Binary stream proxy for MSH files that contain binary section payloads.
+
+    Section headers and end markers are ASCII lines even in binary files and are
+    returned as text by :meth:`readline`. Section parsers read the payloads with
+    :meth:`unpack` and :meth:`read_array`, which honour the byte order detected
+    from the ``$MeshFormat`` check word and its ``size_t`` data size. In layouts,
+    ``N`` denotes one ``size_t`` value.
+
+    Under lazy tracking the proxy remembers the byte ranges of binary payloads
+    read since the mark, and :meth:`locate` counts the lines of the text in
+    between. Compressed streams are always tracked eagerly, because seeking
+    back in them decompresses from the start.
+    """
+
+    __slots__ = (
+        "_binary",
+        "_pending_bytes",
+        "_payloads",
+        "_payload_start",
+        "byte_order",
+        "data_size",
+    )
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        filename: str | None = None,
+        *,
+        line_tracking: LineTracking = "eager",
+    ) -> None:
+        self._binary = stream
+        self._pending_bytes: BytesIO | None = None
+        self._payloads: list[tuple[int, int]] = []
+        self._payload_start: int | None = None
+        self.byte_order = _NATIVE_BYTE_ORDER
+        self.data_size = 8
+        super().__init__(cast(TextIO, stream), filename, line_tracking=line_tracking)
+
+    def locate(self) -> ParsingContext:
+        """Return :attr:`context` updated to the last line read.
+
+        Under lazy tracking, the text read since the previous call is rescanned
+        from the stream, leaving out the binary payloads.
+        """
+        mark = self._mark
+        if mark is None:
+            return self.context
+
+        self._end_payload()
+        position = self._position()
+        lines = 0
+        line: str | None = None
+        resume = self._binary.tell()
+        try:
+            for start, stop in self._text_ranges(mark.position, position):
+                count, last = _count_lines(self._read_range(start, stop))
+                lines += count
+                line = line if last is None else last
+        finally:
+            self._binary.seek(resume)
+        self._payloads.clear()
+        self._mark = _Mark(position)
+
+        if lines:
+            self.context.line_number += lines
+            self.context.line = line
+        return self.context
+
+    def readline(self, size: int = -1) -> str:
+        if self._payload_start is not None:
+            self._end_payload()
+        if self._pending_bytes is None:
+            raw = self._binary.readline(size)
+        else:
+            raw = self._pending_bytes.readline(size)
+            if not raw.endswith(b"\n") and (size < 0 or len(raw) < size):
+                self._pending_bytes = None
+                raw += self._binary.readline(-1 if size < 0 else size - len(raw))
+        line = raw.decode("utf-8", errors="replace")
+        if line != "" and self._mark is None:
+            self.context.line_number += 1
+            self.context.line = line.rstrip("\r\n")
+        return line
+
+    def read_lines(self, count: int) -> list[str]:
+        return [
+            line.decode("utf-8", errors="replace")
+            for line in self.read_raw_lines(count)
+        ]
+
+    def read_raw_lines(self, count: int) -> list[bytes]:
+        """Read up to *count* lines as undecoded ``bytes``.
+
+        Under eager tracking only the last line is decoded, to keep
+        :attr:`context` current.
+        """
+        if self._payload_start is not None:
+            self._end_payload()
+        raw: list[bytes] = []
+        if self._pending_bytes is not None:
+            raw = list(islice(iter(self._pending_bytes.readline, b""), count))
+            partial = bool(raw) and not raw[-1].endswith(b"\n")
+            if partial or len(raw) < count:
+                self._pending_bytes = None
+            if partial:
+                raw[-1] += self._binary.readline()
+        if len(raw) < count:
+            raw.extend(islice(iter(self._binary.readline, b""), count - len(raw)))
+        if raw and self._mark is None:
+            self.context.line_number += len(raw)
+            self.context.line = raw[-1].decode("utf-8", errors="replace").rstrip("\r\n")
+        return raw
+
+    def skip_section(self, marker: str) -> None:
+        self.locate()
+        pending = b"" if self._pending_bytes is None else self._pending_bytes.read()
+        encoded = marker.encode()
+        rest, lines, line = _skip_to_marker(
+            pending, self._binary.read, b"\n" + encoded, encoded
+        )
+        text = None if line is None else line.decode("utf-8", errors="replace")
+        self._finish_skip(lines, text, marker)
+        self._pending_bytes = BytesIO(rest) if rest else None
+        if self._mark is not None:
+            self._mark = _Mark(self._position())
+
+    def read_bytes(self, size: int, description: str) -> bytes:
+        """Read exactly *size* bytes or raise an unexpected-EOF error."""
+        if self._mark is not None and self._payload_start is None:
+            self._payload_start = self._position()
+        if self._pending_bytes is None:
+            data = self._binary.read(size)
+        else:
+            data = self._pending_bytes.read(size)
+            if len(data) < size:
+                self._pending_bytes = None
+                data += self._binary.read(size - len(data))
+        if len(data) != size:
+            raise UnexpectedEndOfFileError(
+                f"Unexpected end of file while reading {description}"
+            )
+        return data
+
+    def skip_bytes(self, size: int, description: str) -> None:
+        """Consume exactly *size* bytes in bounded chunks without keeping them."""
+        while size > 0:
+            chunk = min(size, _SKIP_CHUNK_SIZE)
+            self.read_bytes(chunk, description)
+            size -= chunk
+
+    def unpack(self, layout: str, description: str) -> tuple[Any, ...]:
+        """Read one fixed-width record described by a :mod:`struct` layout."""
+        size_code = _SIZE_TYPECODES[self.data_size]
+        record = struct.Struct(self.byte_order + layout.replace("N", size_code))
+        return record.unpack(self.read_bytes(record.size, description))
+
+    def unpack_records(
+        self,
+        layout: str,
+        count: int,
+        description: str,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Read *count* consecutive fixed-width records in one bulk read."""
+        size_code = _SIZE_TYPECODES[self.data_size]
+        record = struct.Struct(self.byte_order + layout.replace("N", size_code))
+        return record.iter_unpack(self.read_bytes(count * record.size, description))
+
+    def read_array(self, typecode: str, count: int, description: str) -> array[Any]:
+        """Read *count* contiguous values into a typed :class:`array.array`."""
+        if typecode == "N":
+            typecode = _SIZE_TYPECODES[self.data_size]
+        values = array(typecode)
+        values.frombytes(self.read_bytes(count * values.itemsize, description))
+        if self.byte_order != _NATIVE_BYTE_ORDER:
+            values.byteswap()
+        return values
+
+    def _lazy_mark(self) -> _Mark | None:
+        """Return a mark at the current position, or ``None`` if it cannot seek."""
+        stream = getattr(self._binary, "raw", self._binary)
+        if isinstance(stream, gzip.GzipFile | bz2.BZ2File | lzma.LZMAFile):
+            return None
+        if _start_mark(cast(TextIO, self._binary)) is None:
+            return None
+        return _Mark(self._position())
+
+    def _position(self) -> int:
+        """Return the stream position of the next byte to be consumed."""
+        position = self._binary.tell()
+        pending = self._pending_bytes
+        if pending is not None:
+            position -= pending.getbuffer().nbytes - pending.tell()
+        return position
+
+    def _end_payload(self) -> None:
+        """Record the binary payload read since :meth:`read_bytes` opened it."""
+        if self._payload_start is not None:
+            self._payloads.append((self._payload_start, self._position()))
+            self._payload_start = None
+
+    def _text_ranges(self, start: int, stop: int) -> Iterator[tuple[int, int]]:
+        """Yield the byte ranges between *start* and *stop* outside payloads."""
+        for payload_start, payload_stop in self._payloads:
+            if payload_start > start:
+                yield start, payload_start
+            start = max(start, payload_stop)
+        if stop > start:
+            yield start, stop
+
+    def _read_range(self, start: int, stop: int) -> Iterator[str]:
+        """Yield the text between two stream positions in chunks."""
+        self._binary.seek(start)
+        decode = codecs.getincrementaldecoder("utf-8")("replace").decode
+        remaining = stop - start
+        while remaining > 0 and (
+            data := self._binary.read(min(remaining, _SKIP_CHUNK_SIZE))
+        ):
+            yield decode(data)
+            remaining -= len(data)
+
+
+def _start_mark(stream: TextIO) -> _Mark | None:
+    """Return the initial lazy-tracking mark, or ``None`` if *stream* cannot seek."""
+    try:
+        if not stream.seekable():
+            return None
+        return _Mark(stream.tell())
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _read_between(stream: TextIO, start: int, stop: int) -> Iterator[str]:
+    """Yield the text between two positions of *stream* in chunks.
+
+    The stream is left at *stop* afterwards.
+    """
+    try:
+        if isinstance(stream, StringIO):
+            stream.seek(start)
+            remaining = stop - start
+            while remaining > 0 and (chunk := stream.read(_SKIP_CHUNK_SIZE)):
+                yield chunk[:remaining]
+                remaining -= len(chunk)
+        elif _has_byte_positions(stream, start, stop):
+            stream.buffer.seek(start)
+            decode = codecs.getincrementaldecoder(stream.encoding)("replace").decode
+            remaining = stop - start
+            while remaining > 0 and (data := stream.buffer.read(_SKIP_CHUNK_SIZE)):
+                yield decode(data[:remaining])
+                remaining -= len(data)
+        else:
+            stream.seek(start)
+            while stream.tell() != stop and (line := stream.readline()):
+                yield line
+    finally:
+        stream.seek(stop)
+
+
+def _has_byte_positions(stream: TextIO, *positions: int) -> bool:
+    """Return whether *positions* of *stream* are plain byte offsets.
+
+    Text positions below 2**64 carry no decoder state; for stateless UTF-8 and
+    ASCII decoding they are the byte offsets in the underlying buffer.
+    """
+    return (
+        isinstance(stream, TextIOWrapper)
+        and codecs.lookup(stream.encoding).name in ("utf-8", "ascii")
+        and max(positions) < 1 << 64
+    )
+
+
+def _count_lines(chunks: Iterable[str]) -> tuple[int, str | None]:
+    """Return the number of lines in *chunks* and the text of the last one."""
+    lines = 0
+    last: str | None = None
+    tail = ""
+    for chunk in chunks:
+        end = chunk.rfind("\n")
+        if end < 0:
+            tail += chunk
+            continue
+        lines += chunk.count("\n")
+        start = chunk.rfind("\n", 0, end) + 1
+        last = chunk[start:end] if start else tail + chunk[:end]
+        tail = chunk[end + 1 :]
+    if tail:
+        return lines + 1, tail.rstrip("\r")
+    return lines, None if last is None else last.rstrip("\r")
+
+
+def _skip_to_marker[T: (str, bytes)](
+    pending: T,
+    read: Callable[[int], T],
+    needle: T,
+    marker: T,
+) -> tuple[T, int, T | None]:
+    """Search chunked input for the line holding exactly *marker*.
+
+    *needle* is the marker prefixed by a newline. Return the input left after
+    the marker line, the number of lines consumed including the marker line,
+    and the marker line itself, or ``None`` when the input ends first.
+    """
+    newline = needle[:1]
+    # A virtual leading newline lets the first line match the needle too.
+    buffer = newline + pending
+    virtual = 1
+    newlines = 0
+    search = 0
+    end_of_file = False
+    while True:
+        index = buffer.find(needle, search)
+        if index >= 0:
+            line_end = buffer.find(newline, index + 1)
+            if line_end >= 0 or end_of_file:
+                stop = len(buffer) if line_end < 0 else line_end + 1
+                line = buffer[index + 1 : stop]
+                if line.strip() == marker:
+                    newlines += buffer.count(newline, virtual, stop)
+                    lines = newlines if line_end >= 0 else newlines + 1
+                    return buffer[stop:], lines, line
+                search = index + 1
+                continue
+            search = index
+        elif end_of_file:
+            lines = newlines + buffer.count(newline, virtual)
+            return buffer[:0], lines, None
+        else:
+            search = max(0, len(buffer) - len(needle) + 1)
+
+        newlines += buffer.count(newline, virtual, search)
+        virtual = 1 if virtual and search == 0 else 0
+        chunk = read(_SKIP_CHUNK_SIZE)
+        end_of_file = not chunk
+        buffer = buffer[search:] + chunk
+        search = 0
+
+
+def track_source(
+    io: TextIO | BinaryIO,
+    filename: str | None = None,
+    *,
+    line_tracking: LineTracking = "eager",
+) -> SourceTextIO:
+    """Return *io* wrapped in the source proxy matching its stream type.
+
+    A source that is already tracked, such as one from :func:`open_source`, is
+    switched to *line_tracking*.
+    """
+    if isinstance(io, SourceTextIO):
+        if io.context.filename is None:
+            io.context.filename = filename
+        if io.line_tracking != line_tracking:
+            io.set_line_tracking(line_tracking)
+        return io
+    if isinstance(io, BufferedIOBase | RawIOBase):
+        return SourceBinaryIO(cast(BinaryIO, io), filename, line_tracking=line_tracking)
+    return SourceTextIO(cast(TextIO, io), filename, line_tracking=line_tracking)
+
+
+def binary_source(io: TextIO) -> SourceBinaryIO:
+    """Return *io* as a binary source or reject binary payloads on text input."""
+    if isinstance(io, SourceBinaryIO):
+        return io
+    raise UnsupportedBinaryFormatError(
+        "Binary MSH files are not supported on text streams; read the file by "
+        "path or from a binary stream"
+    )
+
+
+def detect_compression(path: str | os.PathLike[str]) -> str | None:
+    """Return ``"gzip"``, ``"bz2"``, or ``"xz"`` from the magic bytes of *path*.
+
+    Returns ``None`` for files that are not compressed.
+    """
+    with open(path, "rb") as file:
+        return _compression(file.read(6))
+
+
+def _compression(magic: bytes) -> str | None:
+    for compression, prefix in _COMPRESSION_MAGIC.items():
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+@contextmanager
+def open_source(path: str) -> Iterator[TextIO]:
+    """Open an MSH file for :class:`~gmshparser.main_parser.MainParser`.
+
+    ASCII and binary files are both opened as a :class:`SourceBinaryIO`.
+    Section headers and text records are decoded as UTF-8 line by line, while
+    bulk numeric records are converted straight from ``bytes``. Files
+    compressed with gzip, bzip2, or xz are recognized by their magic bytes and
+    decompressed while they are read, through a 1 MiB buffer.
+    """
+    with open(path, "rb") as file, _decompressed(file) as stream:
+        yield cast(TextIO, SourceBinaryIO(stream))
+
+
+@contextmanager
+def _decompressed(file: BufferedReader) -> Iterator[BinaryIO]:
+    """Yield *file* itself or a buffered decompressing reader over it."""
+    compression = _compression(file.peek(6)[:6])
+    if compression is None:
+        yield file
+        return
+    decompressor: BufferedIOBase
+    if compression == "gzip":
+        decompressor = gzip.GzipFile(fileobj=file, mode="rb")
+    elif compression == "bz2":
+        decompressor = bz2.BZ2File(file)
+    else:
+        decompressor = lzma.LZMAFile(file)
+    raw = cast(RawIOBase, decompressor)
+    with BufferedReader(raw, buffer_size=_DECOMPRESSION_BUFFER_SIZE) as stream:
+        yield stream
+
+
 def get_parsing_context(io: TextIO) -> ParsingContext | None:
     """Return parser context when *io* is a tracked source stream."""
+    if isinstance(io, SourceTextIO):
+        return io.locate()
     context = getattr(io, "context", None)
     return context if isinstance(context, ParsingContext) else None
 
 
+def get_validation(mesh: object) -> Validation:
+    """Return the validation level of a parser target, ``"full"`` if it has none."""
+    get_level: Callable[[], Validation] | None = getattr(mesh, "get_validation", None)
+    return "full" if get_level is None else get_level()
+
+
+def read_lines(io: TextIO, count: int) -> list[str]:
+    """Read up to *count* lines at once, fewer only at the end of the stream."""
+    if isinstance(io, SourceTextIO):
+        return io.read_lines(count)
+    return list(islice(iter(io.readline, ""), count))
+
+
+def read_record_lines(io: TextIO, count: int) -> list[str] | list[bytes]:
+    """Read up to *count* numeric record lines for bulk conversion.
+
+    Sources backed by a binary stream return the lines as undecoded ``bytes``.
+    ``int``, ``float``, and ``split`` accept ASCII ``bytes``, so the records of
+    ASCII payloads are converted without decoding them to text first.
+    """
+    if isinstance(io, SourceBinaryIO):
+        return io.read_raw_lines(count)
+    return read_lines(io, count)
+
+
+def skip_record_lines(io: TextIO, count: int, description: str) -> None:
+    """Consume *count* record lines without tokenizing them.
+
+    Lines are read in bounded batches through :func:`read_record_lines`, so
+    binary-backed sources do not decode them either.
+    """
+    while count > 0:
+        lines = read_record_lines(io, min(count, _SKIP_BATCH_LINES))
+        if not lines:
+            read_required_line(io, description)
+        count -= len(lines)
+
+
+def replay_lines[T](
+    io: TextIO,
+    lines: list[str] | list[bytes],
+    parse: Callable[[TextIO], T],
+) -> T:
+    """Re-parse buffered *lines* one at a time to raise a precisely located error.
+
+    Bulk conversion only reports that a batch of *lines*, just read from *io*,
+    is malformed. Replaying the batch through a per-line *parse* function
+    reproduces the error, line number, and line text of line-by-line parsing.
+    """
+    if lines and isinstance(lines[0], bytes):
+        text = b"".join(lines).decode("utf-8", errors="replace")
+    else:
+        text = "".join(cast(list[str], lines))
+    context = get_parsing_context(io)
+    if context is None:
+        return parse(StringIO(text))
+
+    replay = SourceTextIO(StringIO(text))
+    replay.context = context.copy(line_number=context.line_number - len(lines))
+    try:
+        return parse(cast(TextIO, replay))
+    except Exception as error:
+        contextual = contextualize_error(error, replay.context)
+        if contextual is error:
+            raise
+        raise contextual from error
+
+
 def read_required_line(io: TextIO, description: str) -> str:
     """Read one line or raise a contextual unexpected-EOF error."""
     line = io.readline()
@@ -85,6 +769,17 @@ def expect_end_marker(io: TextIO, marker: str) -> None:
         raise InvalidSectionError(f"Expected {marker}, got {actual!r}")
 
 
+def expect_binary_end_marker(source: SourceBinaryIO, marker: str) -> None:
+    """Consume the newline that ends a binary payload and the end marker."""
+    io = cast(TextIO, source)
+    line = read_required_line(io, marker)
+    if not line.strip():
+        line = read_required_line(io, marker)
+    actual = line.strip()
+    if actual != marker:
+        raise InvalidSectionError(f"Expected {marker}, got {actual!r}")
+
+
 def contextualize_error(
     error: Exception,
     context: ParsingContext,
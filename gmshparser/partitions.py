@@ -0,0 +1,398 @@
+"""Partitions of meshes split by the Gmsh partitioner.
+
+A partition is extracted from one mesh, and the files that Gmsh writes for
+each partition are merged back into one mesh.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from glob import glob
+from typing import TYPE_CHECKING, Any
+
+from .data_parser import DATA_SECTIONS
+from .errors import InvalidMeshError
+from .main_parser import MainParser
+from .modern_builder import ModernMeshBuilder
+from .parsing import open_source
+from .sink import (
+    ElementBuffer,
+    EntityKey,
+    MeshSink,
+    MeshSinkBase,
+    NodeBuffer,
+    PeriodicLinkValue,
+    PhysicalGroupKey,
+)
+
+if TYPE_CHECKING:
+    from .api import Element, Mesh, Node, Partition
+    from .sink import RawElement, RawNode
+
+__all__ = ["extract_partition", "merge_partition_files", "partition_paths"]
+
+# Node and element blocks are merged alike; records start with their tag.
+type _Block = tuple[int, int, int, Sequence[Any]]
+
+
+def extract_partition(mesh: Mesh, index: int) -> Partition:
+    """Return partition *index* of *mesh* with local node and element tags.
+
+    The owned part is rebuilt through a
+    :class:`~gmshparser.modern_builder.ModernMeshBuilder`, so its entities and
+    physical groups are resolved as for a file. Periodic links are kept when
+    all their nodes belong to the partition.
+    """
+    from .api import ElementCollection, NodeCollection, Partition
+
+    partitioning = mesh.partitioning
+    if partitioning is None:
+        raise ValueError(f"Mesh {mesh.name!r} is not partitioned")
+    if not 1 <= index <= partitioning.count:
+        raise ValueError(f"Partition {index} is outside 1..{partitioning.count}")
+
+    owned = [entity for entity in mesh.entities if index in entity.partitions]
+    owned_keys = {entity.key for entity in owned}
+    elements = [
+        element for element in mesh.elements if element.entity_key in owned_keys
+    ]
+    used = {node.tag for entity in owned for node in entity.nodes}
+    used.update(node.tag for element in elements for node in element.nodes)
+    nodes = [node for node in mesh.nodes if node.tag in used]
+
+    owned_mesh = _build(mesh, [entity.key for entity in owned], nodes, elements)
+
+    ghosts = [
+        element
+        for ghost in partitioning.ghosts(index)
+        if (element := mesh.elements.get(ghost.tag)) is not None
+    ]
+    ghost_used = {node.tag for element in ghosts for node in element.nodes}
+    ghost_sources = [
+        node for node in mesh.nodes if node.tag in ghost_used and node.tag not in used
+    ]
+    local = {
+        node.tag: local_node
+        for node, local_node in zip(nodes, owned_mesh.nodes, strict=True)
+    }
+    ghost_nodes: list[Node] = []
+    for number, node in enumerate(ghost_sources, len(nodes) + 1):
+        local[node.tag] = replace(node, tag=number)
+        ghost_nodes.append(local[node.tag])
+    ghost_elements = [
+        replace(
+            element,
+            tag=number,
+            nodes=tuple(local[node.tag] for node in element.nodes),
+        )
+        for number, element in enumerate(ghosts, len(elements) + 1)
+    ]
+
+    return Partition(
+        index=index,
+        mesh=owned_mesh,
+        ghost_nodes=NodeCollection(ghost_nodes),
+        ghost_elements=ElementCollection(ghost_elements),
+        node_tags=tuple(node.tag for node in (*nodes, *ghost_sources)),
+        element_tags=tuple(element.tag for element in (*elements, *ghosts)),
+    )
+
+
+def _build(
+    mesh: Mesh,
+    owned_keys: list[EntityKey],
+    nodes: list[Node],
+    elements: list[Element],
+) -> Mesh:
+    """Rebuild the owned nodes and elements of one partition from tag 1."""
+    assert mesh.partitioning is not None
+    numbers = {node.tag: number for number, node in enumerate(nodes, 1)}
+    builder = ModernMeshBuilder(mesh.name)
+    if mesh.version is not None:
+        builder.set_version(float(mesh.version))
+    builder.set_ascii(mesh.is_ascii)
+    builder.set_precision(mesh.data_size)
+    builder.set_number_of_partitions(mesh.partitioning.count)
+    for group in mesh.physical_groups:
+        if group.name is not None:
+            builder.set_physical_name(group.dimension, group.tag, group.name)
+
+    node_blocks: dict[EntityKey, list[RawNode]] = {}
+    for number, node in enumerate(nodes, 1):
+        node_blocks.setdefault(node.entity_key, []).append(
+            (number, (*node.coordinates, *node.parametric_coordinates))
+        )
+    element_blocks: dict[tuple[EntityKey, int], list[RawElement]] = {}
+    for number, element in enumerate(elements, 1):
+        element_blocks.setdefault((element.entity_key, element.type_id), []).append(
+            (
+                number,
+                [numbers[node.tag] for node in element.nodes],
+                element.physical_tags,
+            )
+        )
+
+    for key in dict.fromkeys([*owned_keys, *node_blocks]):
+        entity = mesh.entities[key]
+        builder.set_entity_physical_tags(*key, entity.physical_tags)
+        if entity.parent is not None:
+            builder.set_entity_partitions(*key, *entity.parent, entity.partitions)
+    for (dimension, tag), node_records in node_blocks.items():
+        parametric_count = len(node_records[0][1]) - 3
+        builder.add_node_block(dimension, tag, parametric_count, node_records)
+    for ((dimension, tag), type_id), element_records in element_blocks.items():
+        builder.add_element_block(dimension, tag, type_id, element_records)
+    builder.set_number_of_nodes(len(nodes))
+    builder.set_number_of_elements(len(elements))
+
+    for link in mesh.periodic_links:
+        if all(
+            slave in numbers and master in numbers for slave, master in link.node_pairs
+        ):
+            builder.add_periodic_link(
+                link.dimension,
+                link.entity_tag,
+                link.master_entity_tag,
+                link.affine_transform,
+                [
+                    (numbers[slave], numbers[master])
+                    for slave, master in link.node_pairs
+                ],
+            )
+    return builder.build()
+
+
+def partition_paths(
+    source: str | os.PathLike[str] | Iterable[str | os.PathLike[str]],
+) -> list[str]:
+    """Return the files of a split partitioned mesh in partition order.
+
+    A path or glob pattern such as ``"mesh_*.msh"`` is expanded and sorted so
+    that ``mesh_10.msh`` follows ``mesh_9.msh``. Other iterables are taken as
+    the files themselves, in the given order.
+    """
+    if isinstance(source, str | os.PathLike):
+        pattern = os.fspath(source)
+        paths = sorted(glob(pattern), key=_natural_key)
+        if not paths:
+            raise FileNotFoundError(f"No partition files match {pattern!r}")
+        return paths
+    paths = [os.fspath(path) for path in source]
+    if not paths:
+        raise ValueError("At least one partition file is required")
+    return paths
+
+
+def merge_partition_files(
+    paths: Sequence[str],
+    target: MeshSink,
+    *,
+    workers: int | None = None,
+    sections: Iterable[str] | None = None,
+) -> None:
+    """Parse the files of a split mesh concurrently and replay them into *target*.
+
+    Each file is parsed in a worker process of a
+    :class:`~concurrent.futures.ProcessPoolExecutor` with up to *workers*
+    processes, or in this process when *workers* is 1. Nodes and elements
+    that several files share, such as the nodes on partition interfaces, are
+    passed to *target* once; a shared tag whose coordinates or connectivity
+    differ between files raises :class:`~gmshparser.errors.InvalidMeshError`.
+    Data sections are not read.
+    """
+    selected = None if sections is None else tuple(sections)
+    jobs = [(path, selected) for path in paths]
+    if workers == 1 or len(jobs) == 1:
+        files = [_read_file(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            files = list(pool.map(_read_file, jobs))
+
+    first = files[0]
+    version = first.get_version()
+    if version is not None:
+        target.set_version(version)
+    target.set_ascii(first.get_ascii())
+    target.set_precision(first.get_precision())
+    counts = {file.get_number_of_partitions() for file in files}
+    if len(counts) > 1:
+        raise InvalidMeshError(
+            f"Partition files declare different partition counts {sorted(counts)}"
+        )
+    target.set_number_of_partitions(counts.pop())
+
+    _merge_metadata(target, files)
+    nodes = list(_unique_blocks(files, "node_blocks", "Node"))
+    elements = list(_unique_blocks(files, "element_blocks", "Element"))
+    target.set_number_of_nodes(sum(len(block[3]) for block in nodes))
+    target.set_number_of_elements(sum(len(block[3]) for block in elements))
+    for dimension, tag, parametric, node_records in nodes:
+        target.add_node_block(dimension, tag, parametric, node_records)
+    for dimension, tag, type_id, element_records in elements:
+        target.add_element_block(dimension, tag, type_id, element_records)
+
+    ghosts: dict[int, tuple[int, list[int]]] = {}
+    for file in files:
+        for element_tag, partition, ghost_partitions in file.get_ghost_elements():
+            owner, merged = ghosts.setdefault(element_tag, (partition, []))
+            if owner != partition:
+                raise _conflict(file, f"Ghost element {element_tag} has another owner")
+            merged.extend(p for p in ghost_partitions if p not in merged)
+    for element_tag, (owner, merged) in ghosts.items():
+        target.add_ghost_element(element_tag, owner, merged)
+
+
+class _PartitionFile(MeshSinkBase):
+    """Sink that keeps the sections of one partition file for merging.
+
+    Blocks are stored as delivered, so typed buffers cross the process
+    boundary without being expanded into records.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.node_blocks: list[_Block] = []
+        self.element_blocks: list[_Block] = []
+
+    def add_node_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        parametric_coordinate_count: int,
+        nodes: Iterable[RawNode],
+    ) -> None:
+        records = nodes if isinstance(nodes, Sequence) else list(nodes)
+        self.node_blocks.append(
+            (dimension, entity_tag, parametric_coordinate_count, records)
+        )
+
+    def add_element_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        element_type: int,
+        elements: Iterable[RawElement],
+    ) -> None:
+        records = elements if isinstance(elements, Sequence) else list(elements)
+        self.element_blocks.append((dimension, entity_tag, int(element_type), records))
+
+    def entity_keys(self) -> list[EntityKey]:
+        """Return every entity that a section of the file declared."""
+        return list(
+            dict.fromkeys(
+                [
+                    *self._entity_physical_tags,
+                    *self._entity_boundaries,
+                    *self._entity_partitions,
+                ]
+            )
+        )
+
+    def get_entity_boundary(self, dimension: int, tag: int) -> tuple[int, ...] | None:
+        return self._entity_boundaries.get((dimension, tag))
+
+
+def _read_file(job: tuple[str, tuple[str, ...] | None]) -> _PartitionFile:
+    """Parse one partition file, in a worker process when run by a pool."""
+    path, sections = job
+    recorder = _PartitionFile(path)
+    parser = MainParser(sections=sections, exclude=DATA_SECTIONS, line_tracking="lazy")
+    with open_source(path) as stream:
+        parser.parse(recorder, stream)
+    return recorder
+
+
+def _merge_metadata(target: MeshSink, files: Sequence[_PartitionFile]) -> None:
+    """Copy the names, entities, and periodic links of all *files* to *target*."""
+    names: dict[PhysicalGroupKey, str] = {}
+    partitions: dict[EntityKey, tuple[EntityKey, list[int]]] = {}
+    ghost_entities: dict[int, int] = {}
+    periodic_links: dict[EntityKey, PeriodicLinkValue] = {}
+    for file in files:
+        for key, name in file.get_physical_names().items():
+            if names.setdefault(key, name) != name:
+                raise _conflict(file, f"Physical group {key} is named differently")
+        for key in file.entity_keys():
+            target.add_entity_physical_tags(*key, file.get_entity_physical_tags(*key))
+            boundary = file.get_entity_boundary(*key)
+            if boundary is not None:
+                target.set_entity_boundary(*key, boundary)
+            record = file.get_entity_partitions(*key)
+            if record is None:
+                continue
+            parent, merged = partitions.setdefault(key, (record[0], []))
+            if parent != record[0]:
+                raise _conflict(file, f"Partitioned entity {key} has another parent")
+            merged.extend(p for p in record[1] if p not in merged)
+        for tag, partition in file.get_ghost_entities().items():
+            if ghost_entities.setdefault(tag, partition) != partition:
+                raise _conflict(file, f"Ghost entity {tag} has another partition")
+        for dimension, tag, master, transform, pairs in file.get_periodic_links():
+            value = (master, transform, pairs)
+            if periodic_links.setdefault((dimension, tag), value) != value:
+                raise _conflict(
+                    file, f"Periodic link of entity {(dimension, tag)} differs"
+                )
+
+    for (dimension, tag), name in names.items():
+        target.set_physical_name(dimension, tag, name)
+    for key, (parent, merged) in partitions.items():
+        target.set_entity_partitions(*key, *parent, merged)
+    for tag, partition in ghost_entities.items():
+        target.add_ghost_entity(tag, partition)
+    for (dimension, tag), (master, transform, pairs) in periodic_links.items():
+        target.add_periodic_link(dimension, tag, master, transform, pairs)
+
+
+def _conflict(file: _PartitionFile, message: str) -> InvalidMeshError:
+    return InvalidMeshError(
+        f"{message} in another partition file", filename=file.get_name()
+    )
+
+
+def _unique_blocks(
+    files: Sequence[_PartitionFile],
+    attribute: str,
+    kind: str,
+) -> Iterator[_Block]:
+    """Yield the blocks of all *files* without records already yielded.
+
+    Blocks without repeated tags are yielded unchanged. A tag repeated within
+    one file is left for the builder to report as a duplicate.
+    """
+    seen: dict[int, tuple[int, Sequence[Any], int]] = {}
+    for number, file in enumerate(files):
+        blocks: list[_Block] = getattr(file, attribute)
+        for dimension, tag, kind_id, records in blocks:
+            kept: list[int] = []
+            for row, record_tag in enumerate(_tags(records)):
+                previous = seen.get(record_tag)
+                if previous is None or previous[0] == number:
+                    seen.setdefault(record_tag, (number, records, row))
+                    kept.append(row)
+                    continue
+                owner, owner_records, owner_row = previous
+                if tuple(owner_records[owner_row][1]) != tuple(records[row][1]):
+                    raise InvalidMeshError(
+                        f"{kind} {record_tag} differs between "
+                        f"{files[owner].get_name()} and {file.get_name()}",
+                        filename=file.get_name(),
+                    )
+            if len(kept) == len(records):
+                yield dimension, tag, kind_id, records
+            elif kept:
+                yield dimension, tag, kind_id, [records[row] for row in kept]
+
+
+def _tags(records: Sequence[Any]) -> Sequence[int]:
+    if isinstance(records, NodeBuffer | ElementBuffer):
+        return records.tags
+    return [record[0] for record in records]
+
+
+def _natural_key(path: str) -> list[str | int]:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
@@ -0,0 +1,274 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import TextIO
+
+from .abstract_parser import AbstractParser
+from .entities_parser import entity_bounds_setter
+from .errors import InvalidSectionError
+from .mesh import Mesh
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    get_validation,
+    read_required_line,
+)
+
+
+class PartitionedEntitiesParser(AbstractParser):
+    """Parse the partitioned entities written by the Gmsh partitioner (MSH 4)."""
+
+    @staticmethod
+    def get_section_name() -> str:
+        return "$PartitionedEntities"
+
+    @staticmethod
+    def parse(mesh: Mesh, io: TextIO) -> None:
+        if not mesh.get_ascii():
+            _parse_binary_entities(mesh, binary_source(io))
+            return
+
+        fields = _Fields(io, "$PartitionedEntities")
+        partition_count = fields.count("partition count")
+        mesh.set_number_of_partitions(partition_count)
+        for _ in range(fields.count("ghost entity count")):
+            tag, partition = fields.integers(2, "ghost entity")
+            if get_validation(mesh) == "full":
+                _validate_partitions(partition_count, (partition,))
+            mesh.add_ghost_entity(tag, partition)
+
+        counts = [fields.count("entity count") for _ in range(4)]
+        is_v40 = mesh.get_version_minor() == 0
+        set_bounds = entity_bounds_setter(mesh)
+        for dimension, count in enumerate(counts):
+            geometry_count = 6 if is_v40 or dimension > 0 else 3
+            for _ in range(count):
+                tag, parent_dimension, parent_tag = fields.integers(
+                    3, "partitioned entity"
+                )
+                partitions = fields.integers(
+                    fields.count("entity partition count"), "entity partition"
+                )
+                geometry = fields.numbers(geometry_count, "entity geometry")
+                physical_tags = fields.integers(
+                    fields.count("entity physical tag count"), "entity physical"
+                )
+                boundary_tags = (
+                    fields.integers(
+                        fields.count("entity boundary count"), "entity boundary"
+                    )
+                    if dimension > 0
+                    else []
+                )
+                _add_entity(
+                    mesh,
+                    partition_count,
+                    (dimension, tag, parent_dimension, parent_tag),
+                    partitions,
+                    physical_tags,
+                    boundary_tags,
+                )
+                if set_bounds is not None:
+                    set_bounds(dimension, tag, geometry)
+        fields.finish()
+        expect_end_marker(io, "$EndPartitionedEntities")
+
+
+class GhostElementsParser(AbstractParser):
+    """Parse the owners and ghost partitions of ``$GhostElements`` (MSH 4)."""
+
+    @staticmethod
+    def get_section_name() -> str:
+        return "$GhostElements"
+
+    @staticmethod
+    def parse(mesh: Mesh, io: TextIO) -> None:
+        if not mesh.get_ascii():
+            source = binary_source(io)
+            (count,) = source.unpack("N", "the binary $GhostElements count")
+            for _ in range(count):
+                element_tag, partition, ghost_count = source.unpack(
+                    "NiN", "a binary ghost element record"
+                )
+                ghost_partitions = source.read_array(
+                    "i", ghost_count, "binary ghost partitions"
+                )
+                _add_ghost_element(mesh, element_tag, partition, ghost_partitions)
+            expect_binary_end_marker(source, "$EndGhostElements")
+            return
+
+        fields = _Fields(io, "$GhostElements")
+        for _ in range(fields.count("ghost element count")):
+            element_tag, partition = fields.integers(2, "ghost element")
+            ghosts = fields.integers(
+                fields.count("ghost partition count"), "ghost partition"
+            )
+            _add_ghost_element(mesh, element_tag, partition, ghosts)
+        fields.finish()
+        expect_end_marker(io, "$EndGhostElements")
+
+
+class _Fields:
+    """Whitespace-separated fields of a section, read line by line as needed.
+
+    Gmsh writes each partitioned entity and ghost element on one line, but
+    the counts that precede them may share or split lines.
+    """
+
+    def __init__(self, io: TextIO, section: str) -> None:
+        self._io = io
+        self._section = section
+        self._fields: list[str] = []
+
+    def take(self, count: int, description: str) -> list[str]:
+        while len(self._fields) < count:
+            line = read_required_line(self._io, f"a {description}")
+            self._fields.extend(line.split())
+        taken = self._fields[:count]
+        del self._fields[:count]
+        return taken
+
+    def integers(self, count: int, description: str) -> list[int]:
+        return self._convert(int, count, f"{description} tags", "integers")
+
+    def numbers(self, count: int, description: str) -> list[float]:
+        return self._convert(float, count, f"{description} values", "numbers")
+
+    def count(self, description: str) -> int:
+        (value,) = self._convert(int, 1, description, "an integer")
+        if value < 0:
+            raise InvalidSectionError(
+                f"{self._section} {description} cannot be negative"
+            )
+        return value
+
+    def finish(self) -> None:
+        if self._fields:
+            raise InvalidSectionError(
+                f"{self._section} contains unexpected trailing fields"
+            )
+
+    def _convert[T](
+        self,
+        convert: Callable[[str], T],
+        count: int,
+        description: str,
+        kind: str,
+    ) -> list[T]:
+        try:
+            return [convert(value) for value in self.take(count, description)]
+        except ValueError as error:
+            raise InvalidSectionError(
+                f"{self._section} {description} must be {kind}"
+            ) from error
+
+
+def _parse_binary_entities(mesh: Mesh, source: SourceBinaryIO) -> None:
+    """Read MSH 4.1 binary partitioned entities."""
+    partition_count, ghost_count = source.unpack(
+        "NN", "the binary $PartitionedEntities header"
+    )
+    mesh.set_number_of_partitions(partition_count)
+    for tag, partition in source.unpack_records(
+        "ii", ghost_count, "binary ghost entities"
+    ):
+        if get_validation(mesh) == "full":
+            _validate_partitions(partition_count, (partition,))
+        mesh.add_ghost_entity(tag, partition)
+
+    counts = source.unpack("NNNN", "the binary partitioned entity counts")
+    set_bounds = entity_bounds_setter(mesh)
+    for dimension, count in enumerate(counts):
+        geometry_count = 3 if dimension == 0 else 6
+        for _ in range(count):
+            key = source.unpack("iii", "a binary partitioned entity")
+            (partition_tag_count,) = source.unpack("N", "a binary partition count")
+            partitions = source.read_array(
+                "i", partition_tag_count, "binary entity partitions"
+            )
+            geometry = source.read_array("d", geometry_count, "binary entity geometry")
+            (physical_count,) = source.unpack("N", "a binary physical tag count")
+            physical_tags = source.read_array(
+                "i", physical_count, "binary entity physical tags"
+            )
+            boundary_tags: list[int] = []
+            if dimension > 0:
+                (boundary_count,) = source.unpack("N", "a binary boundary count")
+                boundary_tags = source.read_array(
+                    "i", boundary_count, "binary boundary tags"
+                ).tolist()
+            _add_entity(
+                mesh,
+                partition_count,
+                (dimension, *key),
+                partitions.tolist(),
+                physical_tags.tolist(),
+                boundary_tags,
+            )
+            if set_bounds is not None:
+                set_bounds(dimension, key[0], geometry)
+
+    expect_binary_end_marker(source, "$EndPartitionedEntities")
+
+
+def _add_entity(
+    mesh: Mesh,
+    partition_count: int,
+    key: tuple[int, int, int, int],
+    partitions: Sequence[int],
+    physical_tags: Sequence[int],
+    boundary_tags: Sequence[int],
+) -> None:
+    dimension, tag, parent_dimension, parent_tag = key
+    if get_validation(mesh) == "full":
+        if tag <= 0:
+            raise InvalidSectionError("Partitioned entity tags must be positive")
+        if mesh.get_entity_partitions(dimension, tag) is not None:
+            raise InvalidSectionError(
+                f"Duplicate dimension-{dimension} partitioned entity tag {tag}"
+            )
+        if not 0 <= parent_dimension <= 3:
+            raise InvalidSectionError(
+                f"Partitioned entity {tag} has invalid parent dimension "
+                f"{parent_dimension}"
+            )
+        _validate_partitions(partition_count, partitions)
+        if any(physical_tag <= 0 for physical_tag in physical_tags):
+            raise InvalidSectionError(
+                "Entity physical-group tags must be positive integers"
+            )
+        if any(boundary_tag == 0 for boundary_tag in boundary_tags):
+            raise InvalidSectionError(
+                "Entity boundary tags must be non-zero signed integers"
+            )
+
+    mesh.set_entity_partitions(dimension, tag, parent_dimension, parent_tag, partitions)
+    mesh.set_entity_physical_tags(dimension, tag, physical_tags)
+    if dimension > 0:
+        mesh.set_entity_boundary(dimension, tag, boundary_tags)
+
+
+def _add_ghost_element(
+    mesh: Mesh,
+    element_tag: int,
+    partition: int,
+    ghost_partitions: Iterable[int],
+) -> None:
+    ghosts = list(ghost_partitions)
+    if get_validation(mesh) == "full":
+        partition_count = mesh.get_number_of_partitions()
+        if partition_count:
+            _validate_partitions(partition_count, (partition, *ghosts))
+        if partition in ghosts:
+            raise InvalidSectionError(
+                f"Ghost element {element_tag} cannot be a ghost of its own partition"
+            )
+    mesh.add_ghost_element(element_tag, partition, ghosts)
+
+
+def _validate_partitions(partition_count: int, partitions: Iterable[int]) -> None:
+    for partition in partitions:
+        if not 1 <= partition <= partition_count:
+            raise InvalidSectionError(
+                f"Partition tag {partition} is outside 1..{partition_count}"
+            )
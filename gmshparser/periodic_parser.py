@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from itertools import batched
 from typing import TextIO
 
 from .abstract_parser import AbstractParser
 from .errors import InvalidSectionError
 from .mesh import Mesh
-from .parsing import expect_end_marker, read_required_line
+from .parsing import (
+    SourceBinaryIO,
+    binary_source,
+    expect_binary_end_marker,
+    expect_end_marker,
+    get_validation,
+    read_required_line,
+)
 
 
 class PeriodicParser(AbstractParser):
@@ -17,6 +25,11 @@ class PeriodicParser(AbstractParser):
 
     @staticmethod
     def parse(mesh: Mesh, io: TextIO) -> None:
+        # MSH 2.x writes $Periodic as text even inside binary files.
+        if not mesh.get_ascii() and mesh.get_version_major() == 4:
+            _parse_binary(mesh, binary_source(io))
+            return
+
         line = read_required_line(io, "$Periodic count")
         if line.strip() == "$Periodic":
             line = read_required_line(io, "$Periodic count")
@@ -24,6 +37,7 @@ class PeriodicParser(AbstractParser):
 
         major = mesh.get_version_major()
         is_v40 = major == 4 and mesh.get_version_minor() == 0
+        checked = get_validation(mesh) == "full"
 
         for _ in range(link_count):
             relation = _parse_int_fields(
@@ -32,16 +46,8 @@ class PeriodicParser(AbstractParser):
                 expected=3,
             )
             dimension, entity_tag, master_entity_tag = relation
-            if dimension not in {0, 1, 2, 3}:
-                raise InvalidSectionError(
-                    f"Periodic entity {entity_tag} has invalid dimension {dimension}"
-                )
-            if entity_tag <= 0 or master_entity_tag <= 0:
-                raise InvalidSectionError("Periodic entity tags must be positive")
-            if mesh.has_periodic_link(dimension, entity_tag):
-                raise InvalidSectionError(
-                    f"Duplicate periodic link for entity ({dimension}, {entity_tag})"
-                )
+            if checked:
+                _validate_relation(mesh, dimension, entity_tag, master_entity_tag)
 
             next_line = read_required_line(io, "periodic affine data or node count")
             if major == 2 or is_v40:
@@ -65,13 +71,8 @@ class PeriodicParser(AbstractParser):
                     "A periodic node correspondence",
                     expected=2,
                 )
-                if slave_tag <= 0 or master_tag <= 0:
-                    raise InvalidSectionError("Periodic node tags must be positive")
-                if slave_tag in seen_slave_tags:
-                    raise InvalidSectionError(
-                        f"Duplicate periodic slave node tag {slave_tag}"
-                    )
-                seen_slave_tags.add(slave_tag)
+                if checked:
+                    _validate_node_pair(slave_tag, master_tag, seen_slave_tags)
                 node_pairs.append((slave_tag, master_tag))
 
             mesh.add_periodic_link(
@@ -85,6 +86,67 @@ class PeriodicParser(AbstractParser):
         expect_end_marker(io, "$EndPeriodic")
 
 
+def _parse_binary(mesh: Mesh, source: SourceBinaryIO) -> None:
+    """Read MSH 4.1 binary periodic links and their node correspondences."""
+    (link_count,) = source.unpack("N", "the binary $Periodic link count")
+    checked = get_validation(mesh) == "full"
+    for _ in range(link_count):
+        dimension, entity_tag, master_entity_tag = source.unpack(
+            "iii", "a binary periodic entity relation"
+        )
+        if checked:
+            _validate_relation(mesh, dimension, entity_tag, master_entity_tag)
+        (affine_count,) = source.unpack("N", "a binary periodic affine count")
+        affine_transform = source.read_array(
+            "d", affine_count, "binary periodic affine values"
+        )
+        (node_count,) = source.unpack("N", "a binary periodic node count")
+        tags = source.read_array("N", 2 * node_count, "binary periodic node pairs")
+        node_pairs = list(batched(tags.tolist(), 2))
+        seen_slave_tags: set[int] = set()
+        for slave_tag, master_tag in node_pairs if checked else ():
+            _validate_node_pair(slave_tag, master_tag, seen_slave_tags)
+        mesh.add_periodic_link(
+            dimension,
+            entity_tag,
+            master_entity_tag,
+            affine_transform,
+            node_pairs,
+        )
+
+    expect_binary_end_marker(source, "$EndPeriodic")
+
+
+def _validate_relation(
+    mesh: Mesh,
+    dimension: int,
+    entity_tag: int,
+    master_entity_tag: int,
+) -> None:
+    if dimension not in {0, 1, 2, 3}:
+        raise InvalidSectionError(
+            f"Periodic entity {entity_tag} has invalid dimension {dimension}"
+        )
+    if entity_tag <= 0 or master_entity_tag <= 0:
+        raise InvalidSectionError("Periodic entity tags must be positive")
+    if mesh.has_periodic_link(dimension, entity_tag):
+        raise InvalidSectionError(
+            f"Duplicate periodic link for entity ({dimension}, {entity_tag})"
+        )
+
+
+def _validate_node_pair(
+    slave_tag: int,
+    master_tag: int,
+    seen_slave_tags: set[int],
+) -> None:
+    if slave_tag <= 0 or master_tag <= 0:
+        raise InvalidSectionError("Periodic node tags must be positive")
+    if slave_tag in seen_slave_tags:
+        raise InvalidSectionError(f"Duplicate periodic slave node tag {slave_tag}")
+    seen_slave_tags.add(slave_tag)
+
+
 def _parse_optional_affine(io: TextIO, line: str) -> tuple[tuple[float, ...], str]:
     """Parse the optional ``Affine ...`` record used by MSH 2.x and 4.0."""
     fields = line.strip().split()
@@ -0,0 +1,151 @@
+"""Mesh metadata read from section headers without parsing record bodies."""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .errors import (
+    InvalidElementError,
+    InvalidNodeError,
+    InvalidSectionError,
+    ParseError,
+)
+from .lazy import LazyMesh
+from .section_index import SectionIndex, SectionSpan
+
+if TYPE_CHECKING:
+    from .api import PhysicalGroupKey, Version
+
+__all__ = ["MeshProbe", "probe"]
+
+_SIZE_TYPECODES = {4: "I", 8: "Q"}
+_HEADER_BYTES = 256
+_ERROR_TYPES: dict[str, type[ParseError]] = {
+    "$Nodes": InvalidNodeError,
+    "$NOD": InvalidNodeError,
+    "$Elements": InvalidElementError,
+    "$ELM": InvalidElementError,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MeshProbe:
+    """Sizes and metadata of an MSH file, read from its section headers.
+
+    Counts and tag ranges are those declared by the ``$Nodes``, ``$Elements``,
+    and ``$Entities`` headers and are ``None`` when the section is missing or
+    its header does not declare them: tag ranges exist only in MSH 4.1 and
+    entity counts only in MSH 4. ``sections`` holds the byte offsets of every
+    section in file order.
+    """
+
+    name: str
+    version: Version
+    is_ascii: bool
+    data_size: int
+    node_count: int | None
+    min_node_tag: int | None
+    max_node_tag: int | None
+    element_count: int | None
+    min_element_tag: int | None
+    max_element_tag: int | None
+    entity_counts: tuple[int, int, int, int] | None
+    physical_names: dict[PhysicalGroupKey, str]
+    sections: tuple[SectionSpan, ...]
+
+
+def probe(path: str | os.PathLike[str], *, name: str | None = None) -> MeshProbe:
+    """Read the metadata of an MSH file without parsing nodes or elements.
+
+    The file is indexed with a :class:`~gmshparser.section_index.SectionIndex`.
+    Only ``$MeshFormat``, ``$PhysicalNames``, and the first line of the
+    ``$Entities``, ``$Nodes``, and ``$Elements`` sections are read, so the
+    cost depends on the number of sections rather than on the mesh size.
+    Malformed headers raise the same error types as a full read.
+    """
+    with LazyMesh(path, name=name) as lazy:
+        index = lazy.index
+        version = lazy.version
+        names = lazy.physical_names
+        modern = version.major == 4
+        nodes_name, elements_name = "$Nodes", "$Elements"
+        if version.major == 1:
+            nodes_name, elements_name = "$NOD", "$ELM"
+
+        # MSH 4.1 headers add tag ranges to the block and record counts of 4.0.
+        fields = (4 if version.minor else 2) if modern else 1
+        nodes = _header(index, lazy.name, nodes_name, fields, modern)
+        elements = _header(index, lazy.name, elements_name, fields, modern)
+        entities = _header(index, lazy.name, "$Entities", 4, modern) if modern else None
+        return MeshProbe(
+            name=lazy.name,
+            version=version,
+            is_ascii=lazy.is_ascii,
+            data_size=index.data_size or 8,
+            node_count=_field(nodes, 1 if modern else 0),
+            min_node_tag=_field(nodes, 2),
+            max_node_tag=_field(nodes, 3),
+            element_count=_field(elements, 1 if modern else 0),
+            min_element_tag=_field(elements, 2),
+            max_element_tag=_field(elements, 3),
+            entity_counts=(
+                None
+                if entities is None
+                else (entities[0], entities[1], entities[2], entities[3])
+            ),
+            physical_names=names,
+            sections=index.sections,
+        )
+
+
+def _header(
+    index: SectionIndex,
+    name: str,
+    section: str,
+    count: int,
+    modern: bool,
+) -> tuple[int, ...] | None:
+    """Return the first *count* header values of *section*, if present.
+
+    MSH 4 binary headers are ``size_t`` values; all other headers are the
+    first text line of the section body.
+    """
+    span = index.get(section)
+    if span is None:
+        return None
+    data = index.read_range(
+        span.body_offset, min(span.end_offset, span.body_offset + _HEADER_BYTES)
+    )
+    line = data.split(b"\n", 1)[0]
+    if index.is_binary and modern:
+        assert index.data_size is not None and index.byte_order is not None
+        layout = struct.Struct(
+            index.byte_order + count * _SIZE_TYPECODES[index.data_size]
+        )
+        if len(data) >= layout.size:
+            return layout.unpack_from(data)
+    else:
+        try:
+            values = tuple(int(value) for value in line.split())
+        except ValueError:
+            values = ()
+        if len(values) == count and min(values) >= 0:
+            return values
+
+    error_type = _ERROR_TYPES.get(section, InvalidSectionError)
+    raise error_type(
+        f"{section} header must contain {count} non-negative integers",
+        filename=name,
+        line_number=span.line_number + 1,
+        section=section,
+        line=line.decode("utf-8", errors="replace").rstrip("\r"),
+    )
+
+
+def _field(values: tuple[int, ...] | None, position: int) -> int | None:
+    if values is None or position >= len(values):
+        return None
+    return values[position]
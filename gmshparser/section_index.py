@@ -0,0 +1,480 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from types import TracebackType
+
+from .element_types import require_element_type
+from .errors import (
+    InvalidSectionError,
+    ParseError,
+    ParsingContext,
+    UnexpectedEndOfFileError,
+)
+from .parsing import detect_compression
+
+__all__ = ["BlockSpan", "SectionIndex", "SectionSpan", "end_marker"]
+
+# Newlines are counted in bounded slices so the scan never copies a whole
+# multi-gigabyte section out of the memory map at once.
+_CHUNK_SIZE = 1 << 24
+_FIND_LINE_LIMIT = 4096
+_END_MARKERS = {"$NOD": "$ENDNOD", "$ELM": "$ENDELM"}
+_SIZE_TYPECODES = {4: "I", 8: "Q"}
+_MARKER_TERMINATORS = frozenset(b" \t\r\n")
+
+
+def end_marker(section: str) -> str:
+    """Return the end marker that closes *section*, e.g. ``$EndNodes``."""
+    return _END_MARKERS.get(section, "$End" + section[1:])
+
+
+@dataclass(frozen=True, slots=True)
+class SectionSpan:
+    """Location of one ``$Section`` ... ``$EndSection`` pair.
+
+    ``offset`` and ``line_number`` locate the header line and ``body_offset``
+    the first byte after it. ``end_offset`` and ``end_line_number`` locate the
+    end marker, and ``stop`` is the first byte after the end-marker line. Line
+    numbers are 1-based and count newline bytes, including any inside binary
+    payloads.
+    """
+
+    name: str
+    offset: int
+    line_number: int
+    body_offset: int
+    end_offset: int
+    end_line_number: int
+    stop: int
+
+
+@dataclass(frozen=True, slots=True)
+class BlockSpan:
+    """Location of one entity block inside an MSH 4 ``$Nodes`` or ``$Elements``.
+
+    ``offset`` is the first byte of the block header and ``stop`` the first
+    byte after the block's last record. ``element_type`` is ``None`` for node
+    blocks. ``line_number`` is ``None`` for blocks in binary files.
+    """
+
+    section: str
+    dimension: int
+    entity_tag: int
+    count: int
+    offset: int
+    stop: int
+    line_number: int | None
+    element_type: int | None = None
+    parametric: bool = False
+
+    @property
+    def entity_key(self) -> tuple[int, int]:
+        return self.dimension, self.entity_tag
+
+
+class SectionIndex:
+    """Lazily populated byte-offset index of the sections in an MSH file.
+
+    The file is memory-mapped and sections are located by searching for their
+    header and end-marker lines, so section bodies are never tokenized. The
+    index only advances as far into the file as a query requires: locating
+    ``$PhysicalNames`` near the top of a large file touches only its first
+    pages. Entity-block headers are indexed on demand by :meth:`blocks`.
+    Compressed files cannot be memory-mapped and raise
+    :class:`~gmshparser.errors.InvalidSectionError`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        compression = detect_compression(self.path)
+        if compression is not None:
+            raise InvalidSectionError(
+                f"Cannot index a {compression}-compressed file; decompress it first",
+                filename=self.path,
+            )
+        self._file = open(self.path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            self._data: mmap.mmap | bytes = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if size
+                else b""
+            )
+        except BaseException:
+            self._file.close()
+            raise
+        self._sections: list[SectionSpan] = []
+        self._blocks: dict[int, tuple[BlockSpan, ...]] = {}
+        self._position = 0
+        self._line_number = 0
+        self._complete = False
+        self._format: tuple[str, bool, int, str] | None = None
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._file.close()
+
+    def __enter__(self) -> SectionIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[SectionSpan]:
+        return iter(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __getitem__(self, name: str) -> SectionSpan:
+        span = self.get(name)
+        if span is None:
+            raise KeyError(name)
+        return span
+
+    def __repr__(self) -> str:
+        return f"SectionIndex(path={self.path!r})"
+
+    @property
+    def sections(self) -> tuple[SectionSpan, ...]:
+        """All sections in file order; scans the remainder of the file."""
+        while self._scan_next() is not None:
+            pass
+        return tuple(self._sections)
+
+    def names(self) -> tuple[str, ...]:
+        """Section names in file order, including repeated sections."""
+        return tuple(span.name for span in self.sections)
+
+    def get(self, name: str) -> SectionSpan | None:
+        """Return the first section called *name*, scanning only as far as needed."""
+        for span in self._sections:
+            if span.name == name:
+                return span
+        while (scanned := self._scan_next()) is not None:
+            if scanned.name == name:
+                return scanned
+        return None
+
+    def find_all(self, name: str) -> tuple[SectionSpan, ...]:
+        """Return every section called *name*, such as repeated ``$NodeData``."""
+        return tuple(span for span in self.sections if span.name == name)
+
+    def read(self, span: SectionSpan) -> bytes:
+        """Return the raw body bytes of *span* between its header and end marker."""
+        return bytes(self._data[span.body_offset : span.end_offset])
+
+    def read_range(self, start: int, stop: int) -> bytes:
+        """Return the raw bytes of the file between two byte offsets."""
+        return bytes(self._data[start:stop])
+
+    @property
+    def version(self) -> str | None:
+        """Version string from ``$MeshFormat``; ``None`` for legacy MSH 1 files."""
+        info = self._read_format()
+        return None if info is None else info[0]
+
+    @property
+    def is_binary(self) -> bool:
+        info = self._read_format()
+        return info is not None and info[1]
+
+    @property
+    def data_size(self) -> int | None:
+        info = self._read_format()
+        return None if info is None else info[2]
+
+    @property
+    def byte_order(self) -> str | None:
+        """:mod:`struct` byte-order prefix of a binary file, otherwise ``None``."""
+        info = self._read_format()
+        return None if info is None or not info[1] else info[3]
+
+    def blocks(self, span: SectionSpan) -> tuple[BlockSpan, ...]:
+        """Return the entity-block headers of an MSH 4 ``$Nodes``/``$Elements`` span.
+
+        Other sections and other format versions have no entity blocks and
+        yield an empty tuple. ASCII blocks are located by counting record lines;
+        binary MSH 4.1 blocks by their fixed record widths.
+        """
+        if span.name not in {"$Nodes", "$Elements"}:
+            return ()
+        cached = self._blocks.get(span.offset)
+        if cached is not None:
+            return cached
+
+        info = self._read_format()
+        if info is None or not info[0].startswith("4"):
+            blocks: tuple[BlockSpan, ...] = ()
+        elif info[1]:
+            blocks = self._binary_blocks(span, info[2], info[3])
+        else:
+            blocks = self._text_blocks(span, legacy=info[0] == "4.0")
+        self._blocks[span.offset] = blocks
+        return blocks
+
+    def _scan_next(self) -> SectionSpan | None:
+        if self._complete:
+            return None
+        data = self._data
+        position = self._position
+        if data[position : position + 1] == b"$":
+            start = position
+        else:
+            found = data.find(b"\n$", position)
+            if found < 0:
+                self._complete = True
+                return None
+            start = found + 1
+
+        header_end = data.find(b"\n", start)
+        if header_end < 0:
+            header_end = len(data)
+        header = bytes(data[start:header_end]).strip()
+        name = header.decode("utf-8", errors="replace")
+        line_number = self._line_number + self._count_lines(position, start) + 1
+
+        marker = end_marker(name)
+        end_offset = self._find_marker(marker.encode(), header_end)
+        if end_offset < 0:
+            raise UnexpectedEndOfFileError(
+                f"Unexpected end of file while searching for {marker}",
+                filename=self.path,
+                line_number=line_number,
+                section=name,
+                line=name,
+            )
+        end_line_number = line_number + self._count_lines(start, end_offset)
+        line_end = data.find(b"\n", end_offset)
+        stop = len(data) if line_end < 0 else line_end + 1
+
+        span = SectionSpan(
+            name=name,
+            offset=start,
+            line_number=line_number,
+            body_offset=min(header_end + 1, len(data)),
+            end_offset=end_offset,
+            end_line_number=end_line_number,
+            stop=stop,
+        )
+        self._sections.append(span)
+        self._position = stop
+        self._line_number = end_line_number
+        return span
+
+    def _find_marker(self, marker: bytes, start: int) -> int:
+        """Return the offset of the line holding exactly *marker* after *start*."""
+        data = self._data
+        pattern = b"\n" + marker
+        search = start
+        while (found := data.find(pattern, search)) >= 0:
+            after = found + len(pattern)
+            if after >= len(data) or data[after] in _MARKER_TERMINATORS:
+                return found + 1
+            search = after
+        return -1
+
+    def _count_lines(self, start: int, stop: int) -> int:
+        return sum(
+            self._data[offset : min(stop, offset + _CHUNK_SIZE)].count(b"\n")
+            for offset in range(start, stop, _CHUNK_SIZE)
+        )
+
+    def skip_lines(self, offset: int, count: int, section: str) -> int:
+        """Return the offset just past the next *count* newlines after *offset*.
+
+        *section* names the section in the error raised when the file ends
+        first.
+        """
+        data = self._data
+        if count <= _FIND_LINE_LIMIT:
+            for _ in range(count):
+                line_end = data.find(b"\n", offset)
+                if line_end < 0:
+                    raise self._truncated(section)
+                offset = line_end + 1
+            return offset
+
+        while count > 0:
+            chunk = data[offset : offset + _CHUNK_SIZE]
+            if not chunk:
+                raise self._truncated(section)
+            available = chunk.count(b"\n")
+            if available < count:
+                count -= available
+                offset += len(chunk)
+                continue
+            # Bisect with ranged counts so each byte is counted about twice.
+            low, high = 0, len(chunk)
+            while high - low > _FIND_LINE_LIMIT:
+                middle = (low + high) // 2
+                found = chunk.count(b"\n", low, middle)
+                if found >= count:
+                    high = middle
+                else:
+                    count -= found
+                    low = middle
+            line_end = low - 1
+            for _ in range(count):
+                line_end = chunk.index(b"\n", line_end + 1)
+            return offset + line_end + 1
+        return offset
+
+    def _truncated(self, section: str) -> UnexpectedEndOfFileError:
+        return UnexpectedEndOfFileError(
+            f"Unexpected end of file while indexing {section} entity blocks",
+            filename=self.path,
+            section=section,
+        )
+
+    def _read_line(self, offset: int, span: SectionSpan) -> tuple[list[int], int]:
+        data = self._data
+        line_end = data.find(b"\n", offset, span.end_offset)
+        if line_end < 0:
+            raise self._truncated(span.name)
+        try:
+            values = [int(value) for value in data[offset:line_end].split()]
+        except ValueError as error:
+            raise InvalidSectionError(
+                f"Malformed {span.name} header",
+                filename=self.path,
+                section=span.name,
+                line=bytes(data[offset:line_end]).decode("utf-8", errors="replace"),
+            ) from error
+        return values, line_end + 1
+
+    def _text_blocks(self, span: SectionSpan, *, legacy: bool) -> tuple[BlockSpan, ...]:
+        nodes = span.name == "$Nodes"
+        header, offset = self._read_line(span.body_offset, span)
+        line_number = span.line_number + 2
+        blocks: list[BlockSpan] = []
+        for _ in range(header[0] if header else 0):
+            fields, body = self._read_line(offset, span)
+            if len(fields) != 4:
+                raise InvalidSectionError(
+                    f"{span.name} entity block header must contain four integers",
+                    filename=self.path,
+                    line_number=line_number,
+                    section=span.name,
+                )
+            if legacy:
+                entity_tag, dimension, kind, count = fields
+            else:
+                dimension, entity_tag, kind, count = fields
+            lines = 2 * count if nodes and not legacy else count
+            stop = self.skip_lines(body, lines, span.name)
+            if stop > span.end_offset:
+                raise self._truncated(span.name)
+            blocks.append(
+                BlockSpan(
+                    section=span.name,
+                    dimension=dimension,
+                    entity_tag=entity_tag,
+                    count=count,
+                    offset=offset,
+                    stop=stop,
+                    line_number=line_number,
+                    element_type=None if nodes else kind,
+                    parametric=nodes and kind != 0,
+                )
+            )
+            line_number += 1 + lines
+            offset = stop
+        return tuple(blocks)
+
+    def _binary_blocks(
+        self,
+        span: SectionSpan,
+        data_size: int,
+        byte_order: str,
+    ) -> tuple[BlockSpan, ...]:
+        nodes = span.name == "$Nodes"
+        size_code = _SIZE_TYPECODES[data_size]
+        section_header = struct.Struct(byte_order + 4 * size_code)
+        block_header = struct.Struct(byte_order + "iii" + size_code)
+        data = self._data
+        try:
+            number_of_blocks = section_header.unpack_from(data, span.body_offset)[0]
+            offset = span.body_offset + section_header.size
+            blocks: list[BlockSpan] = []
+            for _ in range(number_of_blocks):
+                dimension, entity_tag, kind, count = block_header.unpack_from(
+                    data, offset
+                )
+                if nodes:
+                    width = 3 + (dimension if kind else 0)
+                    record_size = data_size + 8 * width
+                else:
+                    node_count = require_element_type(kind).node_count
+                    assert node_count is not None
+                    record_size = data_size * (1 + node_count)
+                stop = offset + block_header.size + count * record_size
+                if stop > span.end_offset:
+                    raise self._truncated(span.name)
+                blocks.append(
+                    BlockSpan(
+                        section=span.name,
+                        dimension=dimension,
+                        entity_tag=entity_tag,
+                        count=count,
+                        offset=offset,
+                        stop=stop,
+                        line_number=None,
+                        element_type=None if nodes else kind,
+                        parametric=nodes and kind != 0,
+                    )
+                )
+                offset = stop
+        except struct.error as error:
+            raise self._truncated(span.name) from error
+        except ParseError as error:
+            context = ParsingContext(filename=self.path, section=span.name)
+            raise error.with_context(context) from error
+        return tuple(blocks)
+
+    def _read_format(self) -> tuple[str, bool, int, str] | None:
+        if self._format is not None:
+            return self._format
+        span = self.get("$MeshFormat")
+        if span is None:
+            return None
+        data = self._data
+        line_end = data.find(b"\n", span.body_offset, span.end_offset + 1)
+        fields = bytes(data[span.body_offset : max(line_end, span.body_offset)]).split()
+        if len(fields) != 3 or line_end < 0:
+            raise InvalidSectionError(
+                "$MeshFormat header must contain version, file type, and data size",
+                filename=self.path,
+                line_number=span.line_number + 1,
+                section="$MeshFormat",
+            )
+        binary = fields[1] == b"1"
+        byte_order = "<"
+        if binary and data[line_end + 1 : line_end + 5] == b"\x00\x00\x00\x01":
+            byte_order = ">"
+        try:
+            data_size = int(fields[2])
+        except ValueError as error:
+            raise InvalidSectionError(
+                "$MeshFormat data size must be an integer",
+                filename=self.path,
+                line_number=span.line_number + 1,
+                section="$MeshFormat",
+            ) from error
+        self._format = (fields[0].decode(), binary, data_size, byte_order)
+        return self._format
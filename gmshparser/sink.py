@@ -0,0 +1,833 @@
+"""Parser sink protocol and the typed block buffers passed to sinks."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate, batched, repeat
+from typing import Literal, Protocol, overload
+
+from .errors import InvalidMeshError
+
+__all__ = [
+    "DataBuffer",
+    "ElementBuffer",
+    "MeshSink",
+    "MeshSinkBase",
+    "NodeBuffer",
+    "Validation",
+]
+
+type EntityKey = tuple[int, int]
+type PhysicalGroupKey = tuple[int, int]
+type RawNode = tuple[int, tuple[float, ...]]
+type RawElement = tuple[int, list[int], tuple[int, ...]]
+type RawDataRecord = tuple[int, tuple[float, ...]]
+# Arguments of add_node_block and add_element_block, as yielded by the
+# iter_blocks generators of the section parsers.
+type ParsedNodeBlock = tuple[int, int, int, Sequence[RawNode]]
+type ParsedElementBlock = tuple[int, int, int, Sequence[RawElement]]
+type NodePair = tuple[int, int]
+type PeriodicLinkValue = tuple[int, tuple[float, ...], tuple[NodePair, ...]]
+type PeriodicLinkRecord = tuple[
+    int,
+    int,
+    int,
+    tuple[float, ...],
+    tuple[NodePair, ...],
+]
+# Arguments of add_data_step: section name, string, real, and integer tags.
+type DataStepRecord = tuple[
+    str,
+    tuple[str, ...],
+    tuple[float, ...],
+    tuple[int, ...],
+    "DataBuffer",
+]
+# Partitioned entity parent key and partition tags.
+type EntityPartitionValue = tuple[EntityKey, tuple[int, ...]]
+# Minimum and maximum x, y, and z of an entity, as listed in $Entities.
+type EntityBounds = tuple[float, float, float, float, float, float]
+# Ghost element tag, owning partition, and partitions holding it as a ghost.
+type GhostElementRecord = tuple[int, int, tuple[int, ...]]
+# "full" runs every check, "basic" skips the per-record value checks of the
+# section parsers, and "none" also skips the builder checks that the mesh can
+# be built without: node coordinate counts and the duplicate-tag scans of the
+# columnar and NumPy builders.
+type Validation = Literal["full", "basic", "none"]
+
+_BOUNDS_TOLERANCE = 1e-8
+
+
+class NodeBuffer(Sequence[RawNode]):
+    """Nodes of one entity block held in flat typed arrays.
+
+    ``tags`` holds one value per node and ``coordinates`` holds ``width``
+    values per node, Cartesian coordinates first. Iterating yields the
+    ``(tag, coordinates)`` records consumed by record-based sinks, so array
+    sinks can copy the buffers without creating per-node objects.
+    """
+
+    __slots__ = ("coordinates", "tags", "width")
+
+    def __init__(self, tags: array[int], coordinates: array[float], width: int) -> None:
+        if width < 3 or len(coordinates) != len(tags) * width:
+            raise ValueError("Node coordinates must hold width >= 3 values per tag")
+        self.tags = tags
+        self.coordinates = coordinates
+        self.width = width
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __iter__(self) -> Iterator[RawNode]:
+        return zip(self.tags, batched(self.coordinates, self.width), strict=True)
+
+    @overload
+    def __getitem__(self, index: int) -> RawNode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RawNode]: ...
+
+    def __getitem__(self, index: int | slice) -> RawNode | list[RawNode]:
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        tag = self.tags[index]
+        start = (index % len(self)) * self.width
+        return tag, tuple(self.coordinates[start : start + self.width])
+
+
+class ElementBuffer(Sequence[RawElement]):
+    """Fixed-width elements of one entity block held in one flat typed array.
+
+    Each record in ``values`` is an element tag followed by ``width - 1`` node
+    tags. Records carry no physical tags.
+    """
+
+    __slots__ = ("values", "width")
+
+    def __init__(self, values: array[int], width: int) -> None:
+        if width < 2 or len(values) % width:
+            raise ValueError("Element records must hold a tag and at least one node")
+        self.values = values
+        self.width = width
+
+    @property
+    def tags(self) -> array[int]:
+        """Element tags in record order."""
+        return self.values[:: self.width]
+
+    def __len__(self) -> int:
+        return len(self.values) // self.width
+
+    def __iter__(self) -> Iterator[RawElement]:
+        width = self.width
+        columns = [self.values[offset::width] for offset in range(1, width)]
+        return zip(self.tags, map(list, zip(*columns, strict=True)), repeat(()))
+
+    @overload
+    def __getitem__(self, index: int) -> RawElement: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RawElement]: ...
+
+    def __getitem__(self, index: int | slice) -> RawElement | list[RawElement]:
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        start = self._row(index) * self.width
+        values = self.values
+        return values[start], list(values[start + 1 : start + self.width]), ()
+
+    def _row(self, index: int) -> int:
+        if not -len(self) <= index < len(self):
+            raise IndexError("element buffer index out of range")
+        return index % len(self)
+
+
+class DataBuffer(Sequence[RawDataRecord]):
+    """Records of one post-processing data section held in flat typed arrays.
+
+    ``tags`` holds one node or element tag per record and ``values`` holds
+    ``width`` values per record. For ``$ElementNodeData``, ``node_counts``
+    gives the number of element nodes of each record, which then holds
+    ``node_count * width`` values.
+    """
+
+    __slots__ = ("node_counts", "tags", "values", "width", "_offsets")
+
+    def __init__(
+        self,
+        tags: array[int],
+        values: array[float],
+        width: int,
+        node_counts: array[int] | None = None,
+    ) -> None:
+        rows = len(tags) if node_counts is None else sum(node_counts)
+        if node_counts is not None and len(node_counts) != len(tags):
+            raise ValueError("Data records must have one node count per tag")
+        if width < 1 or len(values) != rows * width:
+            raise ValueError("Data records must hold width >= 1 values per row")
+        self.tags = tags
+        self.values = values
+        self.width = width
+        self.node_counts = node_counts
+        self._offsets: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __iter__(self) -> Iterator[RawDataRecord]:
+        if self.node_counts is None:
+            return zip(self.tags, batched(self.values, self.width), strict=True)
+        return (self[row] for row in range(len(self)))
+
+    @overload
+    def __getitem__(self, index: int) -> RawDataRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RawDataRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> RawDataRecord | list[RawDataRecord]:
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        tag = self.tags[index]
+        row = index % len(self)
+        if self.node_counts is None:
+            start, stop = row * self.width, (row + 1) * self.width
+        else:
+            if self._offsets is None:
+                self._offsets = [0, *accumulate(self.node_counts)]
+            start, stop = (
+                self.width * self._offsets[row + offset] for offset in (0, 1)
+            )
+        return tag, tuple(self.values[start:stop])
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, DataBuffer)
+            and self.width == other.width
+            and self.tags == other.tags
+            and self.values == other.values
+            and self.node_counts == other.node_counts
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class MeshSink(Protocol):
+    """Callbacks through which the built-in section parsers populate a target.
+
+    Node and element blocks are delivered whole. The built-in MSH 4 parsers
+    pass :class:`NodeBuffer` and :class:`ElementBuffer` instances where the
+    block layout allows it and lists of records otherwise, so sinks must accept
+    any sequence of records. The legacy :class:`gmshparser.Mesh`,
+    :class:`gmshparser.modern_builder.ModernMeshBuilder`, and
+    :class:`gmshparser.numpy.NumpyMeshBuilder` implement this protocol.
+
+    The parsers also use ``get_validation`` and ``set_entity_bounding_box``
+    when a target has them; without them, every check runs and no bounding
+    boxes are recorded.
+    """
+
+    def get_name(self) -> str: ...
+
+    def set_version(self, version: float, /) -> None: ...
+
+    def get_version(self) -> float | None: ...
+
+    def get_version_major(self) -> int | None: ...
+
+    def get_version_minor(self) -> int | None: ...
+
+    def set_ascii(self, is_ascii: bool, /) -> None: ...
+
+    def get_ascii(self) -> bool: ...
+
+    def set_precision(self, precision: int, /) -> None: ...
+
+    def set_number_of_node_entities(self, value: int, /) -> None: ...
+
+    def set_number_of_nodes(self, value: int, /) -> None: ...
+
+    def set_min_node_tag(self, value: int, /) -> None: ...
+
+    def set_max_node_tag(self, value: int, /) -> None: ...
+
+    def set_number_of_element_entities(self, value: int, /) -> None: ...
+
+    def set_number_of_elements(self, value: int, /) -> None: ...
+
+    def set_min_element_tag(self, value: int, /) -> None: ...
+
+    def set_max_element_tag(self, value: int, /) -> None: ...
+
+    def add_node_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        parametric_coordinate_count: int,
+        nodes: Sequence[RawNode],
+        /,
+    ) -> None: ...
+
+    def add_element_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        element_type: int,
+        elements: Sequence[RawElement],
+        /,
+    ) -> None: ...
+
+    def set_physical_name(self, dimension: int, tag: int, name: str, /) -> None: ...
+
+    def set_entity_physical_tags(
+        self,
+        dimension: int,
+        tag: int,
+        physical_tags: Iterable[int],
+        /,
+    ) -> None: ...
+
+    def add_entity_physical_tags(
+        self,
+        dimension: int,
+        tag: int,
+        physical_tags: Iterable[int],
+        /,
+    ) -> None: ...
+
+    def set_entity_boundary(
+        self,
+        dimension: int,
+        tag: int,
+        boundary_tags: Iterable[int],
+        /,
+    ) -> None: ...
+
+    def selects_entity_block(
+        self,
+        section: str,
+        dimension: int,
+        entity_tag: int,
+        /,
+    ) -> bool: ...
+
+    def has_periodic_link(self, dimension: int, entity_tag: int, /) -> bool: ...
+
+    def add_periodic_link(
+        self,
+        dimension: int,
+        entity_tag: int,
+        master_entity_tag: int,
+        affine_transform: Iterable[float],
+        node_pairs: Iterable[NodePair],
+        /,
+    ) -> None: ...
+
+    def add_data_step(
+        self,
+        section: str,
+        string_tags: tuple[str, ...],
+        real_tags: tuple[float, ...],
+        integer_tags: tuple[int, ...],
+        data: DataBuffer,
+        /,
+    ) -> None: ...
+
+    def set_number_of_partitions(self, value: int, /) -> None: ...
+
+    def add_ghost_entity(self, tag: int, partition: int, /) -> None: ...
+
+    def set_entity_partitions(
+        self,
+        dimension: int,
+        tag: int,
+        parent_dimension: int,
+        parent_tag: int,
+        partitions: Iterable[int],
+        /,
+    ) -> None: ...
+
+    def add_ghost_element(
+        self,
+        element_tag: int,
+        partition: int,
+        ghost_partitions: Iterable[int],
+        /,
+    ) -> None: ...
+
+
+class MeshSinkBase:
+    """Store everything but node and element blocks for a :class:`MeshSink`.
+
+    Subclasses implement ``add_node_block`` and ``add_element_block``. After
+    :meth:`select_entities`, :meth:`selects_entity_block` tells the MSH 4
+    section parsers which entity blocks to skip.
+    """
+
+    def __init__(self, name: str = "New Mesh") -> None:
+        self._name = name
+        self._version: float | None = None
+        self._version_major: int | None = None
+        self._version_minor: int | None = None
+        self._ascii = True
+        self._precision = 8
+        self._validation: Validation = "full"
+
+        self._number_of_node_entities = 0
+        self._number_of_nodes = 0
+        self._min_node_tag = 0
+        self._max_node_tag = 0
+        self._number_of_element_entities = 0
+        self._number_of_elements = 0
+        self._min_element_tag = 0
+        self._max_element_tag = 0
+
+        self._physical_names: dict[PhysicalGroupKey, str] = {}
+        self._entity_physical_tags: dict[EntityKey, tuple[int, ...]] = {}
+        self._element_physical_tags: dict[int, tuple[int, ...]] = {}
+        self._entity_boundaries: dict[EntityKey, tuple[int, ...]] = {}
+        self._entity_bounds: dict[EntityKey, EntityBounds] = {}
+        self._periodic_links: dict[EntityKey, PeriodicLinkValue] = {}
+        self._data_steps: list[DataStepRecord] = []
+        self._number_of_partitions = 0
+        self._ghost_entities: dict[int, int] = {}
+        self._entity_partitions: dict[EntityKey, EntityPartitionValue] = {}
+        self._ghost_elements: list[GhostElementRecord] = []
+        self._selected_partition: int | None = None
+
+        self._selected_entities: frozenset[EntityKey] | None = None
+        self._selected_groups: tuple[str | PhysicalGroupKey, ...] = ()
+        self._selection: tuple[frozenset[EntityKey], frozenset[EntityKey] | None] | None
+        self._selection = None
+
+    def set_name(self, name: str) -> None:
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+    def set_version(self, version: float) -> None:
+        self._version = version
+        major = int(version)
+        self._version_major = major
+        self._version_minor = int(round((version - major) * 10))
+
+    def get_version(self) -> float | None:
+        return self._version
+
+    def get_version_major(self) -> int | None:
+        return self._version_major
+
+    def get_version_minor(self) -> int | None:
+        return self._version_minor
+
+    def set_ascii(self, is_ascii: bool) -> None:
+        self._ascii = is_ascii
+
+    def get_ascii(self) -> bool:
+        return self._ascii
+
+    def set_precision(self, precision: int) -> None:
+        self._precision = precision
+
+    def get_precision(self) -> int:
+        return self._precision
+
+    def set_validation(self, validation: Validation) -> None:
+        """Choose how thoroughly parsers and builders check the records."""
+        self._validation = validation
+
+    def get_validation(self) -> Validation:
+        return self._validation
+
+    def set_number_of_node_entities(self, value: int) -> None:
+        self._number_of_node_entities = value
+
+    def get_number_of_node_entities(self) -> int:
+        return self._number_of_node_entities
+
+    def set_number_of_nodes(self, value: int) -> None:
+        self._number_of_nodes = value
+
+    def get_number_of_nodes(self) -> int:
+        return self._number_of_nodes
+
+    def set_min_node_tag(self, value: int) -> None:
+        self._min_node_tag = value
+
+    def get_min_node_tag(self) -> int:
+        return self._min_node_tag
+
+    def set_max_node_tag(self, value: int) -> None:
+        self._max_node_tag = value
+
+    def get_max_node_tag(self) -> int:
+        return self._max_node_tag
+
+    def set_number_of_element_entities(self, value: int) -> None:
+        self._number_of_element_entities = value
+
+    def get_number_of_element_entities(self) -> int:
+        return self._number_of_element_entities
+
+    def set_number_of_elements(self, value: int) -> None:
+        self._number_of_elements = value
+
+    def get_number_of_elements(self) -> int:
+        return self._number_of_elements
+
+    def set_min_element_tag(self, value: int) -> None:
+        self._min_element_tag = value
+
+    def get_min_element_tag(self) -> int:
+        return self._min_element_tag
+
+    def set_max_element_tag(self, value: int) -> None:
+        self._max_element_tag = value
+
+    def get_max_element_tag(self) -> int:
+        return self._max_element_tag
+
+    def set_physical_name(self, dimension: int, tag: int, name: str) -> None:
+        self._physical_names[(dimension, tag)] = name
+        self._selection = None
+
+    def get_physical_names(self) -> dict[PhysicalGroupKey, str]:
+        return dict(self._physical_names)
+
+    def set_entity_physical_tags(
+        self,
+        dimension: int,
+        tag: int,
+        physical_tags: Iterable[int],
+    ) -> None:
+        self._entity_physical_tags[(dimension, tag)] = self._normalize_tags(
+            physical_tags
+        )
+        self._selection = None
+
+    def add_entity_physical_tags(
+        self,
+        dimension: int,
+        tag: int,
+        physical_tags: Iterable[int],
+    ) -> None:
+        key = dimension, tag
+        existing = self._entity_physical_tags.get(key, ())
+        self._entity_physical_tags[key] = self._normalize_tags(
+            (*existing, *physical_tags)
+        )
+        self._selection = None
+
+    def get_entity_physical_tags(
+        self,
+        dimension: int,
+        tag: int,
+    ) -> tuple[int, ...]:
+        return self._entity_physical_tags.get((dimension, tag), ())
+
+    def set_element_physical_tags(
+        self,
+        element_tag: int,
+        physical_tags: Iterable[int],
+    ) -> None:
+        self._element_physical_tags[element_tag] = self._normalize_tags(physical_tags)
+
+    def get_element_physical_tags(self, element_tag: int) -> tuple[int, ...]:
+        return self._element_physical_tags.get(element_tag, ())
+
+    def set_entity_boundary(
+        self,
+        dimension: int,
+        tag: int,
+        boundary_tags: Iterable[int],
+    ) -> None:
+        """Record the bounding entities of one MSH 4 entity; signs are dropped."""
+        self._entity_boundaries[(dimension, tag)] = tuple(
+            abs(int(boundary)) for boundary in boundary_tags
+        )
+        self._selection = None
+
+    def set_entity_bounding_box(
+        self,
+        dimension: int,
+        tag: int,
+        geometry: Sequence[float],
+    ) -> None:
+        """Record the bounding box of one MSH 4 entity, or the point of an entity.
+
+        *geometry* holds the minimum and maximum coordinates, or the three
+        coordinates of an MSH 4.1 point entity.
+        """
+        low, high = geometry[:3], geometry[3:] or geometry[:3]
+        self._entity_bounds[(dimension, tag)] = (
+            float(low[0]),
+            float(low[1]),
+            float(low[2]),
+            float(high[0]),
+            float(high[1]),
+            float(high[2]),
+        )
+
+    def select_entities(
+        self,
+        entities: Iterable[EntityKey] = (),
+        physical_groups: Iterable[str | PhysicalGroupKey] = (),
+    ) -> None:
+        """Keep only the elements of the given entities and physical groups.
+
+        Physical groups are given by name or ``(dimension, tag)`` and resolve to
+        the entities that carry them. Nodes are kept for the selected entities
+        and, through the boundaries recorded from ``$Entities``, for the
+        entities bounding them. ``$Entities`` does not list embedded points and
+        curves, so the nodes of a lower-dimensional entity whose bounding box
+        meets that of a selected entity are kept too, as far as selected
+        elements reference them. Without boundary information all nodes are
+        kept.
+        """
+        self._selected_entities = frozenset(
+            (int(dimension), int(tag)) for dimension, tag in entities
+        )
+        self._selected_groups = tuple(physical_groups)
+        self._selected_partition = None
+        self._selection = None
+
+    def select_partition(self, partition: int) -> None:
+        """Keep the entities of one partition and of the partitions next to it.
+
+        Partitions are neighbours when a partitioned entity, such as a shared
+        interface, lists both. Their entity blocks hold the elements that
+        ``$GhostElements`` may declare as ghosts of *partition*. Without
+        ``$PartitionedEntities`` nothing is kept.
+        """
+        self.select_entities()
+        self._selected_partition = int(partition)
+
+    @property
+    def is_selective(self) -> bool:
+        """Whether :meth:`select_entities` limits the entities that are kept."""
+        return self._selected_entities is not None
+
+    def selects_entity_block(
+        self,
+        section: str,
+        dimension: int,
+        entity_tag: int,
+    ) -> bool:
+        """Return whether an entity block of *section* is kept rather than skipped.
+
+        Node blocks outside the boundary closure of the selection are kept when
+        their entity may be embedded in a selected one, since a selected element
+        may use their nodes.
+        """
+        if self._selected_entities is None:
+            return True
+        if self._selection is None:
+            self._selection = self._resolve_selection()
+        elements, nodes = self._selection
+        key = dimension, entity_tag
+        if section in ("$Elements", "$ELM"):
+            return key in elements
+        return nodes is None or key in nodes or self._may_be_embedded(key, elements)
+
+    def _may_be_embedded(self, key: EntityKey, hosts: Iterable[EntityKey]) -> bool:
+        """Return whether entity *key* may be embedded in one of *hosts*.
+
+        An embedded entity has a lower dimension than its host and lies inside
+        the host's bounding box. Entities without a recorded box may be.
+        """
+        bounds = self._entity_bounds.get(key)
+        if bounds is None:
+            return True
+        for host in hosts:
+            if host[0] <= key[0]:
+                continue
+            host_bounds = self._entity_bounds.get(host)
+            if host_bounds is None or _boxes_meet(bounds, host_bounds):
+                return True
+        return False
+
+    def _missing_physical_groups(self) -> tuple[str | PhysicalGroupKey, ...]:
+        """Selected physical groups that no name or entity in the mesh declares."""
+        names = set(self._physical_names.values())
+        declared = set(self._physical_names)
+        for (dimension, _), physical_tags in self._entity_physical_tags.items():
+            declared.update((dimension, tag) for tag in physical_tags)
+        return tuple(
+            group
+            for group in self._selected_groups
+            if (group not in names if isinstance(group, str) else group not in declared)
+        )
+
+    def _resolve_selection(
+        self,
+    ) -> tuple[frozenset[EntityKey], frozenset[EntityKey] | None]:
+        """Return the selected entities and the entities whose nodes they use."""
+        assert self._selected_entities is not None
+        keys: set[PhysicalGroupKey] = set()
+        for group in self._selected_groups:
+            if isinstance(group, str):
+                keys.update(
+                    key for key, name in self._physical_names.items() if name == group
+                )
+            else:
+                keys.add((int(group[0]), int(group[1])))
+
+        selected = set(self._selected_entities)
+        if self._selected_partition is not None:
+            selected.update(self._partition_entities(self._selected_partition))
+        for (dimension, tag), physical_tags in self._entity_physical_tags.items():
+            if any((dimension, physical) in keys for physical in physical_tags):
+                selected.add((dimension, tag))
+        if not self._entity_boundaries:
+            return frozenset(selected), None
+
+        closure: set[EntityKey] = set()
+        pending = list(selected)
+        while pending:
+            key = pending.pop()
+            if key in closure:
+                continue
+            closure.add(key)
+            dimension = key[0] - 1
+            pending.extend(
+                (dimension, tag) for tag in self._entity_boundaries.get(key, ())
+            )
+        return frozenset(selected), frozenset(closure)
+
+    def _partition_entities(self, partition: int) -> list[EntityKey]:
+        """Partitioned entities of *partition* and of its neighbours."""
+        wanted = {partition}
+        for _, partitions in self._entity_partitions.values():
+            if partition in partitions:
+                wanted.update(partitions)
+        return [
+            key
+            for key, (_, partitions) in self._entity_partitions.items()
+            if not wanted.isdisjoint(partitions)
+        ]
+
+    def has_periodic_link(self, dimension: int, entity_tag: int) -> bool:
+        return (dimension, entity_tag) in self._periodic_links
+
+    def add_periodic_link(
+        self,
+        dimension: int,
+        entity_tag: int,
+        master_entity_tag: int,
+        affine_transform: Iterable[float],
+        node_pairs: Iterable[NodePair],
+    ) -> None:
+        key = int(dimension), int(entity_tag)
+        if key in self._periodic_links:
+            raise InvalidMeshError(f"Duplicate periodic link for entity {key}")
+        self._periodic_links[key] = (
+            int(master_entity_tag),
+            tuple(float(value) for value in affine_transform),
+            tuple((int(slave), int(master)) for slave, master in node_pairs),
+        )
+
+    def get_periodic_link(
+        self,
+        dimension: int,
+        entity_tag: int,
+    ) -> PeriodicLinkValue:
+        return self._periodic_links[(dimension, entity_tag)]
+
+    def get_periodic_links(self) -> tuple[PeriodicLinkRecord, ...]:
+        return tuple(
+            (dimension, entity_tag, master_tag, affine_transform, node_pairs)
+            for (dimension, entity_tag), (
+                master_tag,
+                affine_transform,
+                node_pairs,
+            ) in self._periodic_links.items()
+        )
+
+    def add_data_step(
+        self,
+        section: str,
+        string_tags: tuple[str, ...],
+        real_tags: tuple[float, ...],
+        integer_tags: tuple[int, ...],
+        data: DataBuffer,
+    ) -> None:
+        """Store the records of one ``$NodeData``-style section in file order."""
+        self._data_steps.append((section, string_tags, real_tags, integer_tags, data))
+
+    def get_data_steps(self) -> tuple[DataStepRecord, ...]:
+        return tuple(self._data_steps)
+
+    def set_number_of_partitions(self, value: int) -> None:
+        self._number_of_partitions = value
+
+    def get_number_of_partitions(self) -> int:
+        return self._number_of_partitions
+
+    def add_ghost_entity(self, tag: int, partition: int) -> None:
+        self._ghost_entities[int(tag)] = int(partition)
+
+    def get_ghost_entities(self) -> dict[int, int]:
+        """Return the partition of each ghost entity tag."""
+        return dict(self._ghost_entities)
+
+    def set_entity_partitions(
+        self,
+        dimension: int,
+        tag: int,
+        parent_dimension: int,
+        parent_tag: int,
+        partitions: Iterable[int],
+    ) -> None:
+        """Record the model entity and partitions of one partitioned entity."""
+        self._entity_partitions[(int(dimension), int(tag))] = (
+            (int(parent_dimension), int(parent_tag)),
+            tuple(int(partition) for partition in partitions),
+        )
+        self._selection = None
+
+    def get_entity_partitions(
+        self,
+        dimension: int,
+        tag: int,
+    ) -> EntityPartitionValue | None:
+        return self._entity_partitions.get((dimension, tag))
+
+    def add_ghost_element(
+        self,
+        element_tag: int,
+        partition: int,
+        ghost_partitions: Iterable[int],
+    ) -> None:
+        self._ghost_elements.append(
+            (
+                int(element_tag),
+                int(partition),
+                tuple(int(ghost) for ghost in ghost_partitions),
+            )
+        )
+
+    def get_ghost_elements(self) -> tuple[GhostElementRecord, ...]:
+        return tuple(self._ghost_elements)
+
+    @staticmethod
+    def _normalize_tags(tags: Iterable[int]) -> tuple[int, ...]:
+        normalized: list[int] = []
+        for tag in tags:
+            value = int(tag)
+            if value > 0 and value not in normalized:
+                normalized.append(value)
+        return tuple(normalized)
+
+
+def _boxes_meet(first: EntityBounds, second: EntityBounds) -> bool:
+    """Return whether two boxes overlap or touch, up to a relative tolerance."""
+    extent = max(abs(value) for value in (*first, *second))
+    tolerance = _BOUNDS_TOLERANCE * max(extent, 1.0)
+    return all(
+        first[axis] <= second[axis + 3] + tolerance
+        and second[axis] <= first[axis + 3] + tolerance
+        for axis in range(3)
+    )
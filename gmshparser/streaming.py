@@ -0,0 +1,290 @@
+"""Entity-block iterators that stream nodes and elements without a mesh."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import batched
+from typing import TYPE_CHECKING, BinaryIO, TextIO, cast
+
+from . import elements_parser, elements_parser_v2, nodes_parser, nodes_parser_v2
+from .element_types import ElementType
+from .elements_parser import ElementsParser
+from .elements_parser_v1 import ElementsParserV1
+from .elements_parser_v2 import ElementsParserV2
+from .errors import InvalidSectionError
+from .main_parser import (
+    ParserClass,
+    dispatch_table,
+    get_default_parsers,
+    is_section_header,
+    parse_section,
+    skip_section,
+)
+from .mesh_format_parser import MeshFormatParser
+from .modern_builder import ModernMeshBuilder
+from .nodes_parser import NodesParser
+from .nodes_parser_v1 import NodesParserV1
+from .nodes_parser_v2 import NodesParserV2
+from .parsing import SourceTextIO, contextualize_error, open_source, track_source
+from .sink import (
+    ElementBuffer,
+    NodeBuffer,
+    ParsedElementBlock,
+    ParsedNodeBlock,
+    RawElement,
+    RawNode,
+)
+
+if TYPE_CHECKING:
+    from .api import EntityKey
+    from .mesh import Mesh
+
+__all__ = ["ElementBlock", "NodeBlock", "iter_element_blocks", "iter_node_blocks"]
+
+type BlockReader[T] = Callable[[Mesh, TextIO], Iterator[T]]
+
+
+@dataclass(frozen=True, slots=True)
+class NodeBlock:
+    """Nodes of one entity block as parallel tag and coordinate tuples."""
+
+    dimension: int
+    entity_tag: int
+    tags: tuple[int, ...]
+    coordinates: tuple[tuple[float, float, float], ...]
+    parametric_coordinates: tuple[tuple[float, ...], ...] = ()
+
+    @property
+    def entity_key(self) -> EntityKey:
+        """Owning entity as ``(dimension, tag)``."""
+        return self.dimension, self.entity_tag
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+
+@dataclass(frozen=True, slots=True)
+class ElementBlock:
+    """Elements of one entity block as parallel tag and connectivity tuples."""
+
+    dimension: int
+    entity_tag: int
+    element_type: ElementType
+    tags: tuple[int, ...]
+    connectivity: tuple[tuple[int, ...], ...]
+
+    @property
+    def entity_key(self) -> EntityKey:
+        """Owning entity as ``(dimension, tag)``."""
+        return self.dimension, self.entity_tag
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+
+_NODE_PARSERS: dict[ParserClass, BlockReader[ParsedNodeBlock] | None] = {
+    NodesParser: nodes_parser.iter_blocks,
+    NodesParserV2: nodes_parser_v2.iter_blocks,
+    NodesParserV1: None,
+}
+
+_ELEMENT_PARSERS: dict[ParserClass, BlockReader[ParsedElementBlock] | None] = {
+    ElementsParser: elements_parser.iter_blocks,
+    ElementsParserV2: elements_parser_v2.iter_blocks,
+    ElementsParserV1: None,
+}
+
+
+def iter_node_blocks(
+    source: str | os.PathLike[str] | TextIO | BinaryIO,
+    *,
+    name: str | None = None,
+) -> Iterator[NodeBlock]:
+    """Yield the nodes of a path or stream one entity block at a time.
+
+    Only ``$MeshFormat`` and the nodes section are parsed; every other section
+    is skipped by searching for its end marker. Blocks are not accumulated, so
+    memory is bounded by the largest entity block rather than by the mesh. The
+    flat MSH 2 node list is yielded in chunks of up to 65,536 nodes attributed
+    to entity ``(3, 1)``. MSH 1 node sections are parsed whole before they are
+    yielded.
+    """
+    blocks = _iter_section_blocks(source, name, _NODE_PARSERS, _buffered_nodes)
+    for dimension, entity_tag, parametric, records in blocks:
+        yield _node_block(dimension, entity_tag, parametric, records)
+
+
+def iter_element_blocks(
+    source: str | os.PathLike[str] | TextIO | BinaryIO,
+    *,
+    name: str | None = None,
+) -> Iterator[ElementBlock]:
+    """Yield the elements of a path or stream one entity block at a time.
+
+    The nodes section is skipped without being tokenized, and node tags are not
+    resolved. MSH 2 elements are yielded in runs of consecutive records that
+    share an entity and element type, so an entity may appear in several
+    blocks. MSH 1 element sections are parsed whole before they are yielded.
+    """
+    blocks = _iter_section_blocks(source, name, _ELEMENT_PARSERS, _buffered_elements)
+    for dimension, entity_tag, type_id, records in blocks:
+        if isinstance(records, ElementBuffer):
+            tags = tuple(records.tags)
+            connectivity = tuple(
+                row[1:] for row in batched(records.values, records.width)
+            )
+        else:
+            tags = tuple(record[0] for record in records)
+            connectivity = tuple(tuple(record[1]) for record in records)
+        yield ElementBlock(
+            dimension=dimension,
+            entity_tag=entity_tag,
+            element_type=ElementType(type_id),
+            tags=tags,
+            connectivity=connectivity,
+        )
+
+
+class _BlockCollector(ModernMeshBuilder):
+    """Parser target that keeps the blocks of parsers without a block reader."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.node_blocks: list[ParsedNodeBlock] = []
+        self.element_blocks: list[ParsedElementBlock] = []
+
+    def add_node_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        parametric_coordinate_count: int,
+        nodes: Iterable[RawNode],
+    ) -> None:
+        block = dimension, entity_tag, parametric_coordinate_count, list(nodes)
+        self.node_blocks.append(block)
+
+    def add_element_block(
+        self,
+        dimension: int,
+        entity_tag: int,
+        element_type: int,
+        elements: Iterable[RawElement],
+    ) -> None:
+        block = dimension, entity_tag, int(element_type), list(elements)
+        self.element_blocks.append(block)
+
+
+def _buffered_nodes(target: _BlockCollector) -> list[ParsedNodeBlock]:
+    return target.node_blocks
+
+
+def _buffered_elements(target: _BlockCollector) -> list[ParsedElementBlock]:
+    return target.element_blocks
+
+
+def _iter_section_blocks[T](
+    source: str | os.PathLike[str] | TextIO | BinaryIO,
+    name: str | None,
+    parsers: dict[ParserClass, BlockReader[T] | None],
+    buffered: Callable[[_BlockCollector], list[T]],
+) -> Iterator[T]:
+    """Skip to the first section parsed by one of *parsers* and stream it."""
+    with _open_stream(source, name) as stream:
+        target = _BlockCollector(stream.context.filename or "<stream>")
+        section_parsers: dict[str, ParserClass] = {}
+        for raw_line in stream:
+            header = raw_line.strip()
+            if not section_parsers and header in ("$MeshFormat", "$NOD"):
+                if header == "$MeshFormat":
+                    parse_section(MeshFormatParser, target, stream, header)
+                else:
+                    target.set_version(1.0)
+                section_parsers = dispatch_table(get_default_parsers(target))
+                if header == "$MeshFormat":
+                    continue
+
+            parser = section_parsers.get(header)
+            if parser is not None and parser in parsers:
+                reader = parsers[parser]
+                if reader is None:
+                    parse_section(parser, target, stream, header)
+                    yield from buffered(target)
+                else:
+                    blocks = reader(cast("Mesh", target), cast(TextIO, stream))
+                    yield from _contextualized(blocks, stream, header)
+                return
+            if is_section_header(header):
+                skip_section(stream, header)
+
+        if not section_parsers:
+            context = stream.locate()
+            raise InvalidSectionError(
+                "Could not detect a supported MSH format",
+                filename=context.filename,
+                line_number=context.line_number or None,
+                line=context.line,
+            )
+
+
+def _contextualized[T](
+    blocks: Iterator[T],
+    source: SourceTextIO,
+    section: str,
+) -> Iterator[T]:
+    """Re-raise failures of a block reader with the source location attached."""
+    context = source.locate()
+    context.section = section
+    try:
+        yield from blocks
+    except Exception as error:
+        contextual = contextualize_error(error, source.locate())
+        if contextual is error:
+            raise
+        raise contextual from error
+    finally:
+        context.section = None
+
+
+@contextmanager
+def _open_stream(
+    source: str | os.PathLike[str] | TextIO | BinaryIO,
+    name: str | None,
+) -> Iterator[SourceTextIO]:
+    if hasattr(source, "read"):
+        stream = cast(TextIO, source)
+        filename = name or str(getattr(stream, "name", "<stream>"))
+        yield track_source(stream, filename, line_tracking="lazy")
+        return
+
+    path = os.fspath(source)
+    with open_source(path) as stream:
+        yield track_source(stream, name or path, line_tracking="lazy")
+
+
+def _node_block(
+    dimension: int,
+    entity_tag: int,
+    parametric: int,
+    records: Sequence[RawNode],
+) -> NodeBlock:
+    values: list[tuple[float, ...]]
+    if isinstance(records, NodeBuffer):
+        tags = tuple(records.tags)
+        values = list(batched(records.coordinates, records.width))
+    else:
+        tags = tuple(tag for tag, _ in records)
+        values = [coordinates for _, coordinates in records]
+    parametric_coordinates: tuple[tuple[float, ...], ...] = ()
+    if parametric:
+        parametric_coordinates = tuple(value[3:] for value in values)
+        values = [value[:3] for value in values]
+    return NodeBlock(
+        dimension=dimension,
+        entity_tag=entity_tag,
+        tags=tags,
+        coordinates=cast(tuple[tuple[float, float, float], ...], tuple(values)),
+        parametric_coordinates=parametric_coordinates,
+    )
@@ -0,0 +1,113 @@
+import struct
+from io import BytesIO, StringIO
+
+import pytest
+
+import gmshparser
+
+ASCII_MESH = """$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$PhysicalNames
+2
+1 10 "edge"
+2 20 "plate"
+$EndPhysicalNames
+$Nodes
+4
+1 0.0 0.0 0.0
+2 1.0 0.0 0.0
+3 1.0 1.0 0.0
+4 0.0 1.0 0.0
+$EndNodes
+$Elements
+3
+1 1 2 10 1 1 2
+2 2 2 20 1 1 2 3
+3 2 2 20 1 1 3 4
+$EndElements
+$Periodic
+1
+1 2 1
+1
+4 1
+$EndPeriodic
+"""
+
+
+def _binary_mesh(byte_order="<"):
+    def pack(layout, *values):
+        return struct.pack(byte_order + layout, *values)
+
+    return b"".join(
+        [
+            b"$MeshFormat\n2.2 1 8\n",
+            pack("i", 1),
+            b"\n$EndMeshFormat\n",
+            b'$PhysicalNames\n2\n1 10 "edge"\n2 20 "plate"\n$EndPhysicalNames\n',
+            b"$Nodes\n4\n",
+            pack("i3d", 1, 0.0, 0.0, 0.0),
+            pack("i3d", 2, 1.0, 0.0, 0.0),
+            pack("i3d", 3, 1.0, 1.0, 0.0),
+            pack("i3d", 4, 0.0, 1.0, 0.0),
+            b"\n$EndNodes\n$Elements\n3\n",
+            pack("iii", 1, 1, 2),
+            pack("5i", 1, 10, 1, 1, 2),
+            pack("iii", 2, 2, 2),
+            pack("6i", 2, 20, 1, 1, 2, 3),
+            pack("6i", 3, 20, 1, 1, 3, 4),
+            b"\n$EndElements\n",
+            b"$Periodic\n1\n1 2 1\n1\n4 1\n$EndPeriodic\n",
+        ]
+    )
+
+
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+def test_binary_msh22_matches_ascii_model(byte_order):
+    expected = gmshparser.read(StringIO(ASCII_MESH))
+
+    mesh = gmshparser.read(BytesIO(_binary_mesh(byte_order)))
+
+    assert mesh.is_ascii is False
+    assert str(mesh.version) == "2.2"
+    assert mesh.nodes == expected.nodes
+    assert mesh.elements == expected.elements
+    assert mesh.entities == expected.entities
+    assert mesh.physical_groups["plate"].elements.tags == (2, 3)
+    assert mesh.periodic_links == expected.periodic_links
+
+
+def test_binary_msh22_groups_compatibility_blocks(tmp_path):
+    path = tmp_path / "legacy-binary.msh"
+    path.write_bytes(_binary_mesh())
+
+    mesh = gmshparser.parse(str(path))
+
+    assert mesh.get_ascii() is False
+    assert mesh.get_number_of_element_entities() == 2
+    assert mesh.get_min_element_tag() == 1
+    assert mesh.get_max_element_tag() == 3
+    block = mesh.get_element_entity(2, 1, 2)
+    assert [element.get_connectivity() for element in block.get_elements()] == [
+        [1, 2, 3],
+        [1, 3, 4],
+    ]
+    assert mesh.get_entity_physical_tags(2, 1) == (20,)
+
+
+def test_binary_msh22_element_header_cannot_exceed_declared_count():
+    triangles = struct.pack("<6i", 2, 20, 1, 1, 2, 3)
+    data = _binary_mesh().replace(
+        struct.pack("<iii", 2, 2, 2) + triangles,
+        struct.pack("<iii", 2, 5, 2) + triangles,
+    )
+
+    with pytest.raises(gmshparser.InvalidElementError, match="declares 5 elements"):
+        gmshparser.read(BytesIO(data))
+
+
+def test_binary_msh22_requires_eight_byte_doubles():
+    data = _binary_mesh().replace(b"2.2 1 8", b"2.2 1 4")
+
+    with pytest.raises(gmshparser.UnsupportedBinaryFormatError, match="data size"):
+        gmshparser.read(BytesIO(data))
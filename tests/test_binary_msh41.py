@@ -0,0 +1,192 @@
+import struct
+from io import BytesIO, StringIO
+
+import numpy as np
+import pytest
+
+import gmshparser
+import gmshparser.numpy as gnp
+
+ASCII_MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+2
+1 10 "edge"
+2 20 "plate"
+$EndPhysicalNames
+$Entities
+1 1 1 0
+1 0.0 0.0 0.0 0
+1 0.0 0.0 0.0 1.0 0.0 0.0 1 10 2 1 -1
+1 0.0 0.0 0.0 1.0 1.0 0.0 1 20 1 1
+$EndEntities
+$Nodes
+3 4 1 4
+0 1 0 1
+1
+0.0 0.0 0.0
+1 1 1 1
+2
+1.0 0.0 0.0 1.0
+2 1 0 2
+3
+4
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+2 3 1 3
+1 1 1 1
+1 1 2
+2 1 2 2
+2 1 2 3
+3 1 3 4
+$EndElements
+$Periodic
+1
+1 1 1
+16 1.0 0.0 0.0 0.0 0.0 1.0 0.0 0.0 0.0 0.0 1.0 0.0 0.0 0.0 0.0 1.0
+1
+2 1
+$EndPeriodic
+"""
+
+
+def _binary_mesh(byte_order="<", data_size=8):
+    size = "Q" if data_size == 8 else "I"
+
+    def pack(layout, *values):
+        return struct.pack(byte_order + layout.replace("N", size), *values)
+
+    identity = tuple(float(row == column) for row in range(4) for column in range(4))
+    return b"".join(
+        [
+            f"$MeshFormat\n4.1 1 {data_size}\n".encode(),
+            pack("i", 1),
+            b"\n$EndMeshFormat\n",
+            b'$PhysicalNames\n2\n1 10 "edge"\n2 20 "plate"\n$EndPhysicalNames\n',
+            b"$Entities\n",
+            pack("NNNN", 1, 1, 1, 0),
+            pack("i3dN", 1, 0.0, 0.0, 0.0, 0),
+            pack("i6dNiNii", 1, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1, 10, 2, 1, -1),
+            pack("i6dNiNi", 1, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 1, 20, 1, 1),
+            b"\n$EndEntities\n$Nodes\n",
+            pack("NNNN", 3, 4, 1, 4),
+            pack("iiiN", 0, 1, 0, 1),
+            pack("N", 1),
+            pack("3d", 0.0, 0.0, 0.0),
+            pack("iiiN", 1, 1, 1, 1),
+            pack("N", 2),
+            pack("4d", 1.0, 0.0, 0.0, 1.0),
+            pack("iiiN", 2, 1, 0, 2),
+            pack("NN", 3, 4),
+            pack("6d", 1.0, 1.0, 0.0, 0.0, 1.0, 0.0),
+            b"\n$EndNodes\n$Elements\n",
+            pack("NNNN", 2, 3, 1, 3),
+            pack("iiiN", 1, 1, 1, 1),
+            pack("NNN", 1, 1, 2),
+            pack("iiiN", 2, 1, 2, 2),
+            pack("NNNN", 2, 1, 2, 3),
+            pack("NNNN", 3, 1, 3, 4),
+            b"\n$EndElements\n$Periodic\n",
+            pack("N", 1),
+            pack("iii", 1, 1, 1),
+            pack("N16d", 16, *identity),
+            pack("NNN", 1, 2, 1),
+            b"\n$EndPeriodic\n",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ("byte_order", "data_size"), [("<", 8), (">", 8), ("<", 4), (">", 4)]
+)
+def test_binary_msh41_matches_ascii_model(byte_order, data_size):
+    expected = gmshparser.read(StringIO(ASCII_MESH))
+
+    mesh = gmshparser.read(BytesIO(_binary_mesh(byte_order, data_size)))
+
+    assert mesh.is_ascii is False
+    assert mesh.data_size == data_size
+    assert str(mesh.version) == "4.1"
+    assert mesh.nodes == expected.nodes
+    assert mesh.elements == expected.elements
+    assert mesh.entities == expected.entities
+    assert mesh.nodes[2].parametric_coordinates == (1.0,)
+    assert mesh.physical_groups["plate"].elements.tags == (2, 3)
+    assert mesh.periodic_links == expected.periodic_links
+
+
+def test_binary_msh41_paths_are_detected_by_both_entry_points(tmp_path):
+    path = tmp_path / "binary.msh"
+    path.write_bytes(_binary_mesh())
+
+    modern = gmshparser.read(path)
+    legacy = gmshparser.parse(str(path))
+
+    assert modern.name == str(path)
+    assert modern.elements.tags == (1, 2, 3)
+    assert legacy.get_ascii() is False
+    assert legacy.get_number_of_nodes() == 4
+    assert legacy.get_node_entity(2, 1).get_node(4).get_coordinates() == (
+        0.0,
+        1.0,
+        0.0,
+    )
+
+
+def test_binary_msh41_feeds_numpy_arrays():
+    arrays = gnp.to_numpy(gmshparser.read(BytesIO(_binary_mesh(">"))))
+
+    np.testing.assert_array_equal(arrays.node_tags, [1, 2, 3, 4])
+    np.testing.assert_array_equal(
+        arrays.cell_block(2).connectivity, [[0, 1, 2], [0, 2, 3]]
+    )
+
+
+@pytest.mark.parametrize("data_size", [4, 8])
+def test_binary_msh41_blocks_are_copied_into_numpy_arrays(data_size):
+    expected = gnp.to_numpy(gmshparser.read(StringIO(ASCII_MESH)))
+
+    arrays = gnp.read_numpy(BytesIO(_binary_mesh(">", data_size)))
+
+    np.testing.assert_array_equal(arrays.points, expected.points)
+    np.testing.assert_array_equal(arrays.node_entity_keys, expected.node_entity_keys)
+    for element_type, block in expected.cells.items():
+        np.testing.assert_array_equal(
+            arrays.cells[element_type].connectivity, block.connectivity
+        )
+
+
+def test_truncated_binary_payload_reports_section():
+    data = _binary_mesh()
+    truncated = data[: data.index(b"$EndNodes") - 20]
+
+    with pytest.raises(gmshparser.UnexpectedEndOfFileError) as caught:
+        gmshparser.read(BytesIO(truncated), name="truncated.msh")
+
+    assert caught.value.filename == "truncated.msh"
+    assert caught.value.section == "$Nodes"
+    assert "binary node coordinates" in str(caught.value)
+
+
+def test_binary_byte_order_mark_is_validated():
+    data = _binary_mesh().replace(b"\x01\x00\x00\x00", b"\x02\x00\x00\x00", 1)
+
+    with pytest.raises(gmshparser.InvalidSectionError, match="byte-order mark"):
+        gmshparser.read(BytesIO(data))
+
+
+def test_binary_msh40_is_rejected():
+    data = b"$MeshFormat\n4.0 1 8\n\x01\x00\x00\x00\n$EndMeshFormat\n"
+
+    with pytest.raises(gmshparser.UnsupportedBinaryFormatError, match="4.0"):
+        gmshparser.read(BytesIO(data))
+
+
+def test_ascii_mesh_can_be_read_from_binary_stream():
+    mesh = gmshparser.read(BytesIO(ASCII_MESH.encode()))
+
+    assert mesh.is_ascii is True
+    assert mesh.nodes == gmshparser.read(StringIO(ASCII_MESH)).nodes
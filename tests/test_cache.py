@@ -0,0 +1,236 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+2
+1 3 "edge"
+2 1 "domain"
+$EndPhysicalNames
+$Entities
+0 1 1 0
+1 0 0 0 1 0 0 1 3 0
+1 0 0 0 1 1 0 1 1 0
+$EndEntities
+$Nodes
+2 4 1 4
+1 1 0 2
+1
+2
+0 0 0
+1 0 0
+2 1 0 2
+3
+4
+1 1 0
+0 1 0
+$EndNodes
+$Elements
+2 3 1 3
+1 1 1 1
+1 1 2
+2 1 2 2
+2 1 2 3
+3 1 3 4
+$EndElements
+$Periodic
+1
+1 1 1
+16 1 0 0 0 0 1 0 0 0 0 1 0 0 0 0 1
+1
+4 1
+$EndPeriodic
+$NodeData
+1
+"temperature"
+1
+0.5
+3
+0
+1
+2
+1 10.0
+3 30.0
+$EndNodeData
+"""
+
+
+def _assert_same_mesh(actual, expected):
+    assert actual.version == expected.version
+    assert list(actual.nodes) == list(expected.nodes)
+    assert list(actual.elements) == list(expected.elements)
+    assert actual.entities == expected.entities
+    assert actual.physical_groups.keys == expected.physical_groups.keys
+    for group in expected.physical_groups:
+        cached = actual.physical_group(group.tag, dimension=group.dimension)
+        assert cached.name == group.name
+        assert cached.nodes == group.nodes
+        assert cached.elements == group.elements
+    assert actual.periodic_links == expected.periodic_links
+    assert actual.views == expected.views
+    assert [list(view) for view in actual.views] == [
+        list(view) for view in expected.views
+    ]
+
+
+def test_cached_read_does_not_parse_the_unchanged_file(tmp_path, monkeypatch):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    expected = gmshparser.read(StringIO(MESH))
+
+    first = gmshparser.read(path, cache_dir=tmp_path / "cache")
+    os.utime(path, ns=(0, 0))
+    gmshparser.read(path, cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(gmshparser.MainParser, "parse", None)
+    cached = gmshparser.read(path, name="cached", cache_dir=tmp_path / "cache")
+
+    _assert_same_mesh(first, expected)
+    _assert_same_mesh(cached, expected)
+    assert cached.name == "cached"
+    _assert_same_mesh(
+        gmshparser.api.parse(path, cache_dir=tmp_path / "cache"), expected
+    )
+    with pytest.raises(TypeError):
+        gmshparser.read(path, sections={"$Nodes"}, cache_dir=tmp_path / "cache")
+    with pytest.raises(ValueError, match="file path"):
+        gmshparser.read(StringIO(MESH), cache_dir=tmp_path / "cache")
+
+
+def test_changed_source_invalidates_its_snapshot(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    cache = gmshparser.DiskCache(tmp_path / "cache")
+    sections = {"$Nodes", "$NodeData"}
+    gmshparser.read(path, sections=sections, cache_dir=cache)
+    status = path.stat()
+
+    # Same size and modification time: only the content digest differs.
+    path.write_text(MESH.replace("1 10.0", "1 20.0"))
+    os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns))
+    mesh = gmshparser.read(path, sections=sections, cache_dir=cache)
+
+    assert mesh.views["temperature"].step(0).data[0] == (1, (20.0,))
+    path.write_text(MESH.replace("0 1 0\n$EndNodes", "0 2 0\n$EndNodes"))
+    changed = gmshparser.read(path, sections=sections, cache_dir=cache)
+    assert changed.nodes[4].coordinates[1] == 2.0
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_snapshots_are_evicted_least_recently_used_first(tmp_path):
+    paths = [tmp_path / f"mesh_{number}.msh" for number in range(3)]
+    for path in paths:
+        path.write_text(MESH)
+    cache_dir = tmp_path / "cache"
+    gmshparser.read(paths[0], cache_dir=cache_dir)
+    (snapshot,) = cache_dir.iterdir()
+    cache = gmshparser.DiskCache(cache_dir, max_bytes=2 * snapshot.stat().st_size)
+
+    gmshparser.read(paths[1], cache_dir=cache)
+    os.utime(snapshot, ns=(0, 0))
+    gmshparser.read(paths[2], cache_dir=cache)
+
+    assert snapshot not in set(cache_dir.iterdir())
+    assert len(list(cache_dir.iterdir())) == 2
+    cache.clear()
+    assert list(cache_dir.iterdir()) == []
+    with pytest.raises(ValueError, match="negative"):
+        gmshparser.DiskCache(cache_dir, max_bytes=-1)
+
+
+def test_unreadable_snapshot_is_replaced(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    cache_dir = tmp_path / "cache"
+    gmshparser.read(path, cache_dir=cache_dir)
+    (snapshot,) = cache_dir.iterdir()
+    snapshot.write_bytes(snapshot.read_bytes()[:100])
+
+    mesh = gmshparser.read(path, cache_dir=cache_dir)
+
+    _assert_same_mesh(mesh, gmshparser.read(path))
+    assert snapshot.stat().st_size > 100
+
+
+def test_fixture_meshes_survive_a_snapshot_round_trip(tmp_path):
+    testdata = Path(__file__).parents[1] / "testdata"
+    for path in (
+        testdata / "simple" / "testmesh_v1_0.msh",
+        testdata / "simple" / "testmesh_v2_1.msh",
+        testdata / "complex" / "test_from_internet" / "entities_v4_1.msh",
+    ):
+        gmshparser.read(path, cache_dir=tmp_path)
+        cached = gmshparser.read(path, cache_dir=tmp_path)
+
+        _assert_same_mesh(cached, gmshparser.read(path))
+
+
+def test_mesh_cache_shares_the_built_mesh_until_the_file_changes(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    cache = gmshparser.MeshCache()
+
+    first = cache.read(path)
+    second = cache.read(str(path))
+    filtered = cache.read(path, sections={"$Nodes"})
+    path.write_text(MESH.replace("0 1 0\n$EndNodes", "0 2 0\n$EndNodes"))
+    changed = cache.read(path)
+
+    assert second is first
+    assert len(filtered.elements) == 0
+    assert changed is not first
+    assert changed.nodes[4].coordinates[1] == 2.0
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.entries) == (1, 3, 0, 2)
+    assert 0 < info.current_bytes <= info.max_bytes
+    cache.cache_clear()
+    assert cache.cache_info() == gmshparser.CacheInfo(0, 0, 0, 0, 0, 1 << 30)
+    assert cache.read(path) is not changed
+
+
+def test_mesh_cache_evicts_least_recently_used_meshes(tmp_path):
+    paths = [tmp_path / f"mesh_{number}.msh" for number in range(3)]
+    for path in paths:
+        path.write_text(MESH)
+    footprint = gmshparser.MeshCache()
+    footprint.read(paths[0])
+    cache = gmshparser.MeshCache(max_bytes=2 * footprint.cache_info().current_bytes)
+
+    first = cache.read(paths[0])
+    cache.read(paths[1])
+    assert cache.read(paths[0]) is first
+    cache.read(paths[2])
+
+    assert cache.cache_info().evictions == 1
+    assert cache.read(paths[0]) is first
+    assert cache.cache_info().misses == 3
+    tiny = gmshparser.MeshCache(max_bytes=1)
+    tiny.read(paths[0])
+    assert tiny.cache_info().entries == 0
+
+
+def test_concurrent_mesh_cache_misses_parse_once(tmp_path, monkeypatch):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    cache = gmshparser.MeshCache()
+    parse = gmshparser.MainParser.parse
+    calls = []
+
+    def counted_parse(self, mesh, io):
+        calls.append(mesh)
+        return parse(self, mesh, io)
+
+    monkeypatch.setattr(gmshparser.MainParser, "parse", counted_parse)
+    with ThreadPoolExecutor(8) as executor:
+        meshes = list(executor.map(lambda _: cache.read(path), range(16)))
+
+    assert len(calls) == 1
+    assert all(mesh is meshes[0] for mesh in meshes)
+    assert cache.cache_info().hits + cache.cache_info().misses == 16
@@ -0,0 +1,141 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+import gmshparser
+from gmshparser.columnar import NodeTable, RowView
+
+# Unsorted node and element tags, and one node with a parametric coordinate.
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+2
+1 10 "edge"
+2 20 "plate"
+$EndPhysicalNames
+$Entities
+1 1 1 0
+1 0.0 0.0 0.0 0
+1 0.0 0.0 0.0 1.0 0.0 0.0 1 10 2 1 -1
+1 0.0 0.0 0.0 1.0 1.0 0.0 1 20 1 1
+$EndEntities
+$Nodes
+3 4 1 9
+0 1 0 1
+4
+0.0 0.0 0.0
+1 1 1 1
+2
+1.0 0.0 0.0 1.0
+2 1 0 2
+9
+1
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+2 3 2 5
+1 1 1 1
+5 4 2
+2 1 2 2
+3 4 2 9
+2 4 9 1
+$EndElements
+$Periodic
+1
+1 1 1
+16 1.0 0.0 0.0 0.0 0.0 1.0 0.0 0.0 0.0 0.0 1.0 0.0 0.0 0.0 0.0 1.0
+1
+2 4
+$EndPeriodic
+"""
+
+
+def _assert_same_mesh(actual, expected):
+    assert actual.nodes == expected.nodes
+    assert actual.elements == expected.elements
+    assert list(actual.nodes) == list(expected.nodes)
+    assert hash(actual.elements) == hash(expected.elements)
+    assert actual.entities == expected.entities
+    assert actual.physical_groups.keys == expected.physical_groups.keys
+    for group in expected.physical_groups:
+        columnar = actual.physical_group(group.tag, dimension=group.dimension)
+        assert columnar.entities == group.entities
+        assert columnar.nodes == group.nodes
+        assert columnar.elements == group.elements
+    assert actual.periodic_links == expected.periodic_links
+
+
+def test_columnar_mesh_equals_the_object_mesh():
+    expected = gmshparser.read(StringIO(MESH))
+
+    mesh = gmshparser.read(StringIO(MESH), columnar=True)
+
+    _assert_same_mesh(mesh, expected)
+    assert isinstance(mesh.nodes._items, RowView)
+    assert mesh.nodes.tags == (4, 2, 9, 1)
+    assert mesh.nodes[2].parametric_coordinates == (1.0,)
+    assert mesh.nodes[9].parametric_coordinates == ()
+    assert mesh.elements[2].node_tags == (4, 9, 1)
+    assert mesh.physical_groups["plate"].nodes.tags == (4, 2, 9, 1)
+    assert mesh.entities[2, 1].elements.tags == (3, 2)
+    assert 5 not in mesh.entities[2, 1].elements
+    with pytest.raises(KeyError):
+        mesh.nodes[3]
+    with pytest.raises(KeyError):
+        mesh.entities[1, 1].nodes[4]
+    assert mesh.nodes.where(dimension=2) == expected.nodes.where(dimension=2)
+    assert mesh.nodes.where(physical_tag=10).tags == (2,)
+    assert mesh.nodes.where(parametric=True).tags == (2,)
+    assert mesh.elements.where(dimension=2, physical_tag=20).tags == (3, 2)
+    assert mesh.elements.types == expected.elements.types
+
+
+def test_fixture_meshes_build_the_same_columnar_mesh():
+    testdata = Path(__file__).parents[1] / "testdata"
+    for path in (
+        testdata / "simple" / "testmesh_v1_0.msh",
+        testdata / "simple" / "testmesh_v2_1.msh",
+        testdata / "complex" / "test_from_internet" / "entities_v4_1.msh",
+    ):
+        _assert_same_mesh(gmshparser.read(path, columnar=True), gmshparser.read(path))
+
+
+def test_columnar_reads_report_the_object_mesh_errors():
+    duplicate = MESH.replace("9\n1\n1.0 1.0", "9\n4\n1.0 1.0")
+    unknown = MESH.replace("2 4 9 1\n", "2 4 9 7\n")
+
+    with pytest.raises(gmshparser.InvalidMeshError, match="Duplicate node tag 4"):
+        gmshparser.read(StringIO(duplicate), columnar=True)
+    with pytest.raises(
+        gmshparser.InvalidMeshError, match="Element 2 references unknown node 7"
+    ):
+        gmshparser.read(StringIO(unknown), columnar=True)
+
+
+def test_node_table_finds_rows_of_sorted_and_unsorted_tags():
+    table = NodeTable()
+    table.add_block(0, 1, [(10, (0.0, 0.0, 0.0)), (11, (1.0, 0.0, 0.0))])
+    table.add_block(0, 2, [(13, (2.0, 0.0, 0.0))])
+
+    assert [table.row(tag) for tag in (10, 11, 13)] == [0, 1, 2]
+    assert not table.has(12)
+    table.add_block(0, 3, [(1, (3.0, 0.0, 0.0)), (11, (4.0, 0.0, 0.0))])
+    assert table.row(1) == 3
+    assert table.first_repeated() == 11
+
+
+def test_mesh_cache_keeps_columnar_meshes_apart(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    cache = gmshparser.MeshCache()
+
+    objects = cache.read(path)
+    columnar = cache.read(path, columnar=True)
+
+    assert columnar is not objects
+    assert columnar.elements == objects.elements
+    assert cache.read(path, columnar=True) is columnar
+    assert cache.cache_info().misses == 2
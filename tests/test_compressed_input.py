@@ -0,0 +1,85 @@
+import bz2
+import gzip
+import lzma
+import struct
+
+import pytest
+
+import gmshparser
+import gmshparser.parsing
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$Nodes
+1 3 1 3
+2 1 0 3
+1
+2
+3
+0.0 0.0 0.0
+1.0 0.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+1 1 1 1
+2 1 2 1
+1 1 2 3
+$EndElements
+"""
+
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS)
+def test_compressed_paths_are_read_transparently(tmp_path, compression):
+    path = tmp_path / f"mesh.msh.{compression}"
+    path.write_bytes(COMPRESSORS[compression](MESH.encode()))
+
+    mesh = gmshparser.read(path)
+    legacy = gmshparser.parse(str(path))
+
+    assert gmshparser.parsing.detect_compression(path) == compression
+    assert mesh.nodes.tags == (1, 2, 3)
+    assert mesh.elements[1].node_tags == (1, 2, 3)
+    assert legacy.get_number_of_nodes() == 3
+
+
+def test_compressed_binary_files_are_detected_after_decompression(tmp_path):
+    data = b"".join(
+        [
+            b"$MeshFormat\n2.2 1 8\n",
+            struct.pack("<i", 1),
+            b"\n$EndMeshFormat\n$Nodes\n2\n",
+            struct.pack("<i3d", 1, 0.0, 0.0, 0.0),
+            struct.pack("<i3d", 2, 1.0, 0.0, 0.0),
+            b"\n$EndNodes\n",
+        ]
+    )
+    path = tmp_path / "mesh.msh.gz"
+    path.write_bytes(gzip.compress(data))
+
+    mesh = gmshparser.read(path)
+
+    assert mesh.nodes[2].coordinates == (1.0, 0.0, 0.0)
+
+
+def test_errors_in_compressed_files_keep_their_location(tmp_path):
+    path = tmp_path / "broken.msh.xz"
+    path.write_bytes(lzma.compress(MESH.replace("1 1 2 3\n", "1 1 x 3\n").encode()))
+
+    with pytest.raises(gmshparser.InvalidElementError) as caught:
+        gmshparser.read(path)
+
+    assert caught.value.filename == str(path)
+    assert caught.value.line_number == 17
+    assert caught.value.line == "1 1 x 3"
+
+
+def test_compressed_files_cannot_be_indexed(tmp_path):
+    path = tmp_path / "mesh.msh.bz2"
+    path.write_bytes(bz2.compress(MESH.encode()))
+
+    with pytest.raises(gmshparser.InvalidSectionError, match="bz2-compressed"):
+        gmshparser.SectionIndex(path)
+    assert gmshparser.read(path, workers=2).nodes.tags == (1, 2, 3)
@@ -1,5 +1,13 @@
 from io import StringIO
 
+import pytest
+
+from gmshparser import (
+    InvalidElementConnectivityError,
+    InvalidElementError,
+    MainParser,
+    elements_parser,
+)
 from gmshparser.elements_parser import ElementsParser
 from gmshparser.mesh import Mesh
 
@@ -34,3 +42,52 @@ def test_elements_parser():
     assert entity.get_element(1).get_connectivity() == [1, 2, 3, 4]
     assert entity.get_element(2).get_tag() == 2
     assert entity.get_element(2).get_connectivity() == [2, 5, 6, 3]
+
+
+def _read_legacy(content):
+    source = StringIO("$MeshFormat\n4.1 0 8\n$EndMeshFormat\n" + content)
+    mesh = Mesh()
+    MainParser().parse(mesh, source)
+    return mesh
+
+
+@pytest.mark.parametrize("batch_lines", [1, 3, 1 << 16])
+def test_batched_element_blocks_match_across_batch_sizes(monkeypatch, batch_lines):
+    monkeypatch.setattr(elements_parser, "_BATCH_LINES", batch_lines)
+    mesh = Mesh()
+
+    ElementsParser().parse(mesh, StringIO(__content__.strip()))
+
+    entity = mesh.get_element_entity(2, 1)
+    assert [element.get_tag() for element in entity.get_elements()] == [1, 2]
+    assert entity.get_element(2).get_connectivity() == [2, 5, 6, 3]
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "error_type", "message"),
+    [
+        ("2 2 5 6 3", "2 2 5 6", InvalidElementConnectivityError, "requires 4 nodes"),
+        ("2 2 5 6 3", "2 2 5 x 3", InvalidElementError, "invalid literal"),
+        ("2 2 5 6 3", "", InvalidElementError, "cannot be empty"),
+    ],
+)
+def test_bulk_element_errors_report_the_offending_line(
+    monkeypatch, old, new, error_type, message
+):
+    monkeypatch.setattr(elements_parser, "_BATCH_LINES", 2)
+    broken = __content__.strip().replace(old, new)
+
+    with pytest.raises(error_type, match=message) as caught:
+        _read_legacy(broken)
+
+    assert caught.value.line_number == 8
+    assert caught.value.section == "$Elements"
+    assert caught.value.line == new
+
+
+def test_unknown_element_types_keep_variable_width_records():
+    mesh = _read_legacy("$Elements\n1 2 1 2\n2 1 999 2\n1 1 2\n2 2 5 6\n$EndElements\n")
+
+    entity = mesh.get_element_entity(2, 1)
+    assert entity.get_element(1).get_connectivity() == [1, 2]
+    assert entity.get_element(2).get_connectivity() == [2, 5, 6]
@@ -100,3 +100,87 @@ def test_entities_reject_non_positive_physical_tags():
         match="Entity physical-group tags must be positive integers",
     ):
         gmshparser.read(StringIO(source), name="invalid-physical-tag.msh")
+
+
+@pytest.mark.parametrize("validate", ["basic", "none"])
+def test_lower_validation_levels_skip_entity_value_checks(validate):
+    source = _msh41(
+        """2 1 0 0
+1 0 0 0 0
+1 1 0 0 0
+7 1 0 0 0 0 0 0 2 1 2"""
+    )
+
+    mesh = gmshparser.read(StringIO(source), validate=validate)
+
+    assert mesh.entities.keys == ((0, 1), (1, 7))
+
+
+@pytest.mark.parametrize("validate", ["full", "basic", "none"])
+def test_duplicate_element_tags_are_reported_at_every_validation_level(validate):
+    source = (
+        _msh41("0 1 0 0\n1 0 0 0 1 1 0 0 0")
+        + """$Nodes
+1 3 1 3
+1 1 0 3
+1
+2
+3
+0 0 0
+1 0 0
+0 1 0
+$EndNodes
+$Elements
+1 2 1 2
+1 1 1 2
+1 1 2
+1 2 3
+$EndElements
+"""
+    )
+
+    with pytest.raises(gmshparser.InvalidMeshError, match="Duplicate element tag 1"):
+        gmshparser.read(StringIO(source), validate=validate)
+    with pytest.raises(ValueError, match="validate must be one of"):
+        gmshparser.read(StringIO(source), validate="fast")
+    if validate == "none":
+        mesh = gmshparser.read(StringIO(source), validate="none", columnar=True)
+        assert len(mesh.elements) == 2
+    else:
+        with pytest.raises(gmshparser.InvalidMeshError, match="Duplicate element"):
+            gmshparser.read(StringIO(source), validate=validate, columnar=True)
+
+
+class _EntityTarget:
+    """Third-party parser target without ``get_validation``."""
+
+    def __init__(self):
+        self.boundaries = {}
+
+    def get_ascii(self):
+        return True
+
+    def get_version_major(self):
+        return 4
+
+    def get_version_minor(self):
+        return 1
+
+    def set_entity_boundary(self, dimension, tag, boundary_tags):
+        self.boundaries[dimension, tag] = tuple(boundary_tags)
+
+    def set_entity_physical_tags(self, dimension, tag, physical_tags):
+        pass
+
+
+def test_targets_without_a_validation_level_are_fully_checked():
+    target = _EntityTarget()
+    parser = gmshparser.entities_parser.EntitiesParser
+
+    parser.parse(
+        target, StringIO("1 1 0 0\n1 0 0 0 0\n2 0 0 0 1 0 0 0 1 1\n$EndEntities\n")
+    )
+
+    assert target.boundaries == {(1, 2): (1,)}
+    with pytest.raises(gmshparser.InvalidSectionError, match="inverted"):
+        parser.parse(target, StringIO("0 1 0 0\n2 1 0 0 0 0 0 0 0\n$EndEntities\n"))
@@ -0,0 +1,160 @@
+import struct
+from io import StringIO
+
+import pytest
+
+import gmshparser
+
+PHYSICAL_NAMES = {(1, 30): "seam", (2, 10): "left", (2, 20): "right"}
+# (dimension, tag, geometry, physical tags, boundary tags)
+ENTITIES = [
+    (0, 1, (1.0, 0.0, 0.0), (), ()),
+    (0, 2, (1.0, 1.0, 0.0), (), ()),
+    (1, 1, (1.0, 0.0, 0.0, 1.0, 1.0, 0.0), (30,), (1, -2)),
+    (2, 1, (0.0, 0.0, 0.0, 1.0, 1.0, 0.0), (10,), (1,)),
+    (2, 2, (1.0, 0.0, 0.0, 2.0, 1.0, 0.0), (20,), (-1,)),
+]
+NODE_BLOCKS = [
+    (0, 1, [(2, (1.0, 0.0, 0.0))]),
+    (0, 2, [(5, (1.0, 1.0, 0.0))]),
+    (2, 1, [(1, (0.0, 0.0, 0.0)), (4, (0.0, 1.0, 0.0))]),
+    (2, 2, [(3, (2.0, 0.0, 0.0)), (6, (2.0, 1.0, 0.0))]),
+]
+ELEMENT_BLOCKS = [
+    (1, 1, 1, [(1, (2, 5))]),
+    (2, 1, 3, [(2, (1, 2, 5, 4))]),
+    (2, 2, 3, [(3, (2, 3, 6, 5))]),
+]
+
+
+def _text(values):
+    return " ".join(str(value) for value in values) + "\n"
+
+
+def _ascii_mesh():
+    lines = ["$MeshFormat\n4.1 0 8\n$EndMeshFormat\n$PhysicalNames\n3\n"]
+    lines += [f'{key[0]} {key[1]} "{name}"\n' for key, name in PHYSICAL_NAMES.items()]
+    lines.append("$EndPhysicalNames\n$Entities\n2 1 2 0\n")
+    for dimension, tag, geometry, physical, boundary in ENTITIES:
+        bounding = [len(boundary), *boundary] if dimension else []
+        lines.append(_text([tag, *geometry, len(physical), *physical, *bounding]))
+    lines.append("$EndEntities\n$Nodes\n4 6 1 6\n")
+    for dimension, tag, nodes in NODE_BLOCKS:
+        lines.append(_text([dimension, tag, 0, len(nodes)]))
+        lines += [f"{node}\n" for node, _ in nodes]
+        lines += [_text(coordinates) for _, coordinates in nodes]
+    lines.append("$EndNodes\n$Elements\n3 3 1 3\n")
+    for dimension, tag, element_type, elements in ELEMENT_BLOCKS:
+        lines.append(_text([dimension, tag, element_type, len(elements)]))
+        lines += [_text([element, *nodes]) for element, nodes in elements]
+    lines.append("$EndElements\n")
+    return "".join(lines)
+
+
+def _binary_mesh():
+    parts = [b"$MeshFormat\n4.1 1 8\n", struct.pack("<i", 1), b"\n$EndMeshFormat\n"]
+    parts.append(b"$PhysicalNames\n3\n")
+    parts += [
+        f'{key[0]} {key[1]} "{name}"\n'.encode() for key, name in PHYSICAL_NAMES.items()
+    ]
+    parts += [b"$EndPhysicalNames\n$Entities\n", struct.pack("<4Q", 2, 1, 2, 0)]
+    for dimension, tag, geometry, physical, boundary in ENTITIES:
+        parts.append(struct.pack(f"<i{len(geometry)}dQ", tag, *geometry, len(physical)))
+        parts.append(struct.pack(f"<{len(physical)}i", *physical))
+        if dimension:
+            parts.append(struct.pack(f"<Q{len(boundary)}i", len(boundary), *boundary))
+    parts += [b"\n$EndEntities\n$Nodes\n", struct.pack("<4Q", 4, 6, 1, 6)]
+    for dimension, tag, nodes in NODE_BLOCKS:
+        parts.append(struct.pack("<iiiQ", dimension, tag, 0, len(nodes)))
+        parts += [struct.pack("<Q", node) for node, _ in nodes]
+        parts += [struct.pack("<3d", *coordinates) for _, coordinates in nodes]
+    parts += [b"\n$EndNodes\n$Elements\n", struct.pack("<4Q", 3, 3, 1, 3)]
+    for dimension, tag, element_type, elements in ELEMENT_BLOCKS:
+        parts.append(struct.pack("<iiiQ", dimension, tag, element_type, len(elements)))
+        for element, nodes in elements:
+            parts.append(struct.pack(f"<{1 + len(nodes)}Q", element, *nodes))
+    parts.append(b"\n$EndElements\n")
+    return b"".join(parts)
+
+
+@pytest.mark.parametrize(
+    "content", [_ascii_mesh().encode(), _binary_mesh()], ids=["ascii", "binary"]
+)
+def test_physical_group_selection_keeps_bounding_nodes(tmp_path, content):
+    path = tmp_path / "mesh.msh"
+    path.write_bytes(content)
+    full = gmshparser.read(path)
+
+    mesh = gmshparser.read(path, physical_groups=["left"])
+
+    assert mesh.elements.tags == (2,)
+    assert mesh.elements[2] == full.elements[2]
+    assert sorted(mesh.nodes.tags) == [1, 2, 4, 5]
+    assert mesh.physical_group("left").elements.tags == (2,)
+    assert {entity.key for entity in mesh.entities} == {(0, 1), (0, 2), (1, 1), (2, 1)}
+
+
+def test_skipped_blocks_are_not_tokenized():
+    broken = _ascii_mesh().replace("2.0 1.0 0.0\n", "not a coordinate\n")
+    broken = broken.replace("3 2 3 6 5\n", "not an element\n")
+
+    mesh = gmshparser.read(StringIO(broken), entities=[(1, 1)])
+
+    assert mesh.elements.tags == (1,)
+    assert sorted(mesh.nodes.tags) == [2, 5]
+    with pytest.raises(gmshparser.InvalidNodeError):
+        gmshparser.read(StringIO(broken))
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_selection_keeps_the_referenced_nodes_of_embedded_entities(columnar):
+    # Point 4 is embedded in surface 1, which $Entities does not record. Point 6
+    # lies outside the surface, so its malformed node block is skipped.
+    content = (
+        "$MeshFormat\n4.1 0 8\n$EndMeshFormat\n"
+        "$Entities\n2 0 1 0\n4 0.5 0.5 0 0\n6 2 2 0 0\n"
+        "1 0 0 0 1 1 0 0 0\n$EndEntities\n"
+        "$Nodes\n3 6 1 6\n0 4 0 1\n4\n0.5 0.5 0\n0 6 0 1\n6\nnot a coordinate\n"
+        "2 1 0 4\n1\n2\n3\n5\n0 0 0\n1 0 0\n1 1 0\n0 1 0\n$EndNodes\n"
+        "$Elements\n2 3 1 3\n0 4 15 1\n3 4\n2 1 2 2\n1 1 2 4\n2 2 3 4\n"
+        "$EndElements\n"
+    )
+
+    mesh = gmshparser.read(StringIO(content), entities=[(2, 1)], columnar=columnar)
+
+    assert mesh.elements.tags == (1, 2)
+    assert sorted(mesh.nodes.tags) == [1, 2, 3, 4, 5]
+    assert mesh.elements[1].nodes[2] == mesh.nodes[4]
+    assert mesh.entities[0, 4].nodes.tags == (4,)
+    assert mesh.entities[0, 4].elements.tags == ()
+    assert (0, 6) not in mesh.entities.keys
+
+
+def test_entities_and_physical_groups_combine():
+    mesh = gmshparser.read(
+        StringIO(_ascii_mesh()), entities=[(2, 2)], physical_groups=[(1, 30)]
+    )
+
+    assert mesh.elements.tags == (1, 3)
+    assert sorted(mesh.nodes.tags) == [2, 3, 5, 6]
+
+
+def test_msh2_elements_are_filtered_after_parsing():
+    content = (
+        "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n"
+        '$PhysicalNames\n1\n1 7 "edge"\n$EndPhysicalNames\n'
+        "$Nodes\n3\n1 0 0 0\n2 1 0 0\n3 0 1 0\n$EndNodes\n"
+        "$Elements\n2\n1 1 2 7 1 1 2\n2 1 2 0 2 2 3\n$EndElements\n"
+    )
+
+    by_group = gmshparser.read(StringIO(content), physical_groups=["edge"])
+    by_entity = gmshparser.read(StringIO(content), entities=[(1, 2)])
+
+    assert by_group.elements.tags == (1,)
+    assert by_entity.elements.tags == (2,)
+    assert by_entity.nodes.tags == (1, 2, 3)
+
+
+def test_unknown_physical_groups_are_rejected():
+    with pytest.raises(ValueError, match="Unknown physical group 'outlet'"):
+        gmshparser.read(StringIO(_ascii_mesh()), physical_groups=["outlet"])
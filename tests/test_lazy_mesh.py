@@ -0,0 +1,95 @@
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+1
+2 20 "plate"
+$EndPhysicalNames
+$Entities
+0 0 1 0
+1 0.0 0.0 0.0 1.0 1.0 0.0 1 20 0
+$EndEntities
+$Nodes
+1 4 1 4
+2 1 0 4
+1
+2
+3
+4
+0.0 0.0 0.0
+1.0 0.0 0.0
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+1 2 1 2
+2 1 2 2
+1 1 2 3
+2 1 3 4
+$EndElements
+"""
+
+
+@pytest.fixture
+def mesh_path(tmp_path):
+    path = tmp_path / "lazy.msh"
+    path.write_text(MESH)
+    return path
+
+
+def test_physical_names_do_not_parse_geometry(mesh_path):
+    with gmshparser.read_lazy(mesh_path) as mesh:
+        assert mesh.physical_names == {(2, 20): "plate"}
+        assert mesh.loaded_sections == {"$MeshFormat", "$PhysicalNames"}
+
+
+def test_nodes_do_not_parse_elements(mesh_path):
+    with gmshparser.read_lazy(mesh_path) as mesh:
+        nodes = mesh.nodes
+
+        assert nodes.tags == (1, 2, 3, 4)
+        assert nodes[3].physical_tags == (20,)
+        assert "$Elements" not in mesh.loaded_sections
+        assert mesh.elements.tags == (1, 2)
+
+
+def test_read_matches_eager_reader(mesh_path):
+    with gmshparser.read_lazy(mesh_path, name="lazy") as mesh:
+        lazy = mesh.read()
+
+    eager = gmshparser.read(mesh_path)
+    assert lazy.name == "lazy"
+    assert lazy.nodes == eager.nodes
+    assert lazy.elements == eager.elements
+    assert lazy.physical_groups["plate"].elements.tags == (1, 2)
+
+
+def test_legacy_msh1_sections_are_supported(tmp_path):
+    path = tmp_path / "v1.msh"
+    path.write_text(
+        "$NOD\n3\n1 0 0 0\n2 1 0 0\n3 0 1 0\n$ENDNOD\n"
+        "$ELM\n1\n1 2 1 1 3 1 2 3\n$ENDELM\n"
+    )
+
+    with gmshparser.read_lazy(path) as mesh:
+        assert str(mesh.version) == "1.0"
+        assert mesh.elements[1].node_tags == (1, 2, 3)
+
+
+def test_section_errors_keep_file_line_numbers(tmp_path):
+    path = tmp_path / "broken.msh"
+    path.write_text(MESH.replace("1.0 1.0 0.0\n0.0", "1.0 1.0 0.0\n0.0 x"))
+    with pytest.raises(gmshparser.InvalidNodeError) as eager:
+        gmshparser.read(path)
+
+    with gmshparser.read_lazy(path) as mesh:
+        assert mesh.physical_names == {(2, 20): "plate"}
+        with pytest.raises(gmshparser.InvalidNodeError) as caught:
+            _ = mesh.nodes
+
+    assert caught.value.line_number == eager.value.line_number == 22
+    assert caught.value.section == "$Nodes"
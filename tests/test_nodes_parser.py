@@ -1,5 +1,9 @@
 from io import StringIO
 
+import pytest
+
+import gmshparser
+from gmshparser import nodes_parser
 from gmshparser.mesh import Mesh
 from gmshparser.nodes_parser import NodesParser
 
@@ -52,3 +56,40 @@ def test_nodes_parser():
     assert entity.get_node(5).get_coordinates() == (2.0, 0.0, 0.0)
     assert entity.get_node(6).get_tag() == 6
     assert entity.get_node(6).get_coordinates() == (2.0, 1.0, 0.0)
+
+
+def _read_modern(content):
+    return gmshparser.read(StringIO("$MeshFormat\n4.1 0 8\n$EndMeshFormat\n" + content))
+
+
+@pytest.mark.parametrize("batch_lines", [1, 4, 1 << 16])
+def test_batched_node_blocks_match_across_batch_sizes(monkeypatch, batch_lines):
+    monkeypatch.setattr(nodes_parser, "_BATCH_LINES", batch_lines)
+
+    mesh = _read_modern(__content__.strip())
+
+    assert mesh.nodes.tags == (1, 2, 3, 4, 5, 6)
+    assert mesh.nodes[6].coordinates == (2.0, 1.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "message", "line_number"),
+    [
+        ("3\n4\n5", "3\n4 5\n5", "must be on its own line", 10),
+        ("3\n4\n5", "3\nfour\n5", "Node tags must be integers", 10),
+        ("1. 1. 0.\n", "1. 1.\n", "Node 3 requires 3 coordinate values, got 2", 15),
+        ("2. 0. 0.", "2. zero 0.", "could not convert", 17),
+    ],
+)
+def test_bulk_node_errors_report_the_offending_line(
+    monkeypatch, old, new, message, line_number
+):
+    monkeypatch.setattr(nodes_parser, "_BATCH_LINES", 4)
+    broken = __content__.strip().replace(old, new, 1)
+
+    with pytest.raises(gmshparser.InvalidNodeError, match=message) as caught:
+        _read_modern(broken)
+
+    lines = ("$MeshFormat\n4.1 0 8\n$EndMeshFormat\n" + broken).splitlines()
+    assert caught.value.line_number == line_number
+    assert caught.value.line == lines[line_number - 1]
@@ -158,3 +158,86 @@ def test_empty_mesh_produces_stable_empty_shapes():
     assert arrays.element_types == ()
     assert arrays.number_of_nodes == 0
     assert arrays.number_of_elements == 0
+
+
+def _assert_same_arrays(actual, expected):
+    for field in ("points", "node_tags", "node_entity_keys"):
+        assert getattr(actual, field).dtype == getattr(expected, field).dtype
+        np.testing.assert_array_equal(getattr(actual, field), getattr(expected, field))
+    assert actual.element_types == expected.element_types
+    for element_type, block in expected.cells.items():
+        for field in ("connectivity", "element_tags", "entity_keys"):
+            values = getattr(actual.cells[element_type], field)
+            assert values.dtype == getattr(block, field).dtype
+            np.testing.assert_array_equal(values, getattr(block, field))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"element_types": 2, "coordinate_dtype": np.float32, "index_dtype": np.int32}],
+)
+def test_read_numpy_matches_to_numpy(tmp_path, options):
+    path = tmp_path / "mixed.msh"
+    path.write_text(MIXED_MESH)
+
+    arrays = gnp.read_numpy(path, **options)
+
+    _assert_same_arrays(arrays, gnp.to_numpy(gmshparser.read(path), **options))
+
+
+def test_read_numpy_rebuilds_arrays_from_the_cache(tmp_path, monkeypatch):
+    path = tmp_path / "mixed.msh"
+    path.write_text(MIXED_MESH)
+    options = {"element_types": 2, "index_dtype": np.int32}
+    expected = gnp.to_numpy(gmshparser.read(path), **options)
+
+    first = gnp.read_numpy(path, cache_dir=tmp_path / "cache", **options)
+    monkeypatch.setattr(gmshparser.MainParser, "parse", None)
+    cached = gnp.read_numpy(path, cache_dir=tmp_path / "cache", **options)
+
+    _assert_same_arrays(first, expected)
+    _assert_same_arrays(cached, expected)
+
+
+def test_numpy_builder_converts_msh2_records():
+    content = (
+        "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n"
+        "$Nodes\n3\n7 0 0 0\n8 1 0 0\n9 0 1 0\n$EndNodes\n"
+        "$Elements\n2\n1 1 2 0 4 7 8\n2 2 2 0 5 7 8 9\n$EndElements\n"
+    )
+    builder = gnp.NumpyMeshBuilder()
+
+    gmshparser.MainParser().parse(builder, StringIO(content))
+    arrays = builder.build()
+
+    _assert_same_arrays(arrays, gnp.to_numpy(gmshparser.read(StringIO(content))))
+    np.testing.assert_array_equal(arrays.cell_block(2).connectivity, [[0, 1, 2]])
+    np.testing.assert_array_equal(arrays.cell_block(1).entity_keys, [[1, 4]])
+
+
+def test_numpy_builder_reports_unknown_nodes():
+    broken = MIXED_MESH.replace("200 10 20 30", "200 10 20 31")
+
+    with pytest.raises(gmshparser.InvalidMeshError, match="unknown node 31"):
+        gnp.read_numpy(StringIO(broken))
+
+
+def test_views_are_converted_one_step_at_a_time():
+    content = MIXED_MESH + (
+        '$NodeData\n1\n"u"\n1\n0.0\n3\n0\n2\n2\n10 1 2\n20 3 4\n$EndNodeData\n'
+        '$NodeData\n1\n"u"\n1\n1.0\n3\n1\n2\n1\n30 5 6\n$EndNodeData\n'
+    )
+
+    arrays = gnp.read_numpy(StringIO(content))
+    converted = gnp.to_numpy(
+        gmshparser.read(StringIO(content), sections={"$Nodes", "$NodeData"})
+    )
+
+    view = arrays.views["u"]
+    assert len(view) == 2
+    np.testing.assert_array_equal(view.times, [0.0, 1.0])
+    last = view.step(-1)
+    assert last.time_step == 1
+    np.testing.assert_array_equal(last.tags, [30])
+    np.testing.assert_array_equal(last.values, [[5.0, 6.0]])
+    np.testing.assert_array_equal(converted.views["u"].step(0).values, [[1, 2], [3, 4]])
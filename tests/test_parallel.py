@@ -0,0 +1,128 @@
+import struct
+
+import pytest
+
+import gmshparser
+import gmshparser.parallel
+from gmshparser.parallel import read_parallel
+
+# Worker processes may be forked while the test runner has other threads alive.
+pytestmark = pytest.mark.filterwarnings("ignore:.*use of fork:DeprecationWarning")
+
+NODE_BLOCKS = [
+    (2, 1, 0, [(tag, (float(tag), 0.0, 0.0)) for tag in range(1, 6)]),
+    (1, 1, 1, [(tag, (float(tag), 1.0, 0.0, 0.5)) for tag in range(6, 9)]),
+]
+ELEMENT_BLOCKS = [
+    (1, 1, 1, [(1, (6, 7)), (2, (7, 8))]),
+    (2, 1, 2, [(3, (1, 2, 3)), (4, (2, 3, 4)), (5, (3, 4, 5))]),
+]
+
+
+def _text(values):
+    return " ".join(str(value) for value in values) + "\n"
+
+
+def _ascii_mesh(version):
+    legacy = version == "4.0"
+    lines = [f"$MeshFormat\n{version} 0 8\n$EndMeshFormat\n$Nodes\n"]
+    lines.append(_text([2, 8] if legacy else [2, 8, 1, 8]))
+    for dimension, tag, parametric, nodes in NODE_BLOCKS:
+        key = [tag, dimension] if legacy else [dimension, tag]
+        lines.append(_text([*key, parametric, len(nodes)]))
+        if legacy:
+            lines.extend(_text([node_tag, *values]) for node_tag, values in nodes)
+        else:
+            lines.extend(f"{node_tag}\n" for node_tag, _ in nodes)
+            lines.extend(_text(values) for _, values in nodes)
+    lines.append("$EndNodes\n$Elements\n")
+    lines.append(_text([2, 5] if legacy else [2, 5, 1, 5]))
+    for dimension, tag, element_type, elements in ELEMENT_BLOCKS:
+        key = [tag, dimension] if legacy else [dimension, tag]
+        lines.append(_text([*key, element_type, len(elements)]))
+        lines.extend(_text([element, *nodes]) for element, nodes in elements)
+    lines.append("$EndElements\n")
+    return "".join(lines).encode()
+
+
+def _binary_mesh():
+    parts = [b"$MeshFormat\n4.1 1 8\n", struct.pack("<i", 1), b"\n$EndMeshFormat\n"]
+    parts += [b"$Nodes\n", struct.pack("<4Q", 2, 8, 1, 8)]
+    for dimension, tag, parametric, nodes in NODE_BLOCKS:
+        parts.append(struct.pack("<iiiQ", dimension, tag, parametric, len(nodes)))
+        parts += [struct.pack("<Q", node_tag) for node_tag, _ in nodes]
+        parts += [struct.pack(f"<{len(v)}d", *v) for _, v in nodes]
+    parts += [b"\n$EndNodes\n$Elements\n", struct.pack("<4Q", 2, 5, 1, 5)]
+    for dimension, tag, element_type, elements in ELEMENT_BLOCKS:
+        parts.append(struct.pack("<iiiQ", dimension, tag, element_type, len(elements)))
+        for element, nodes in elements:
+            parts.append(struct.pack(f"<{1 + len(nodes)}Q", element, *nodes))
+    parts.append(b"\n$EndElements\n")
+    return b"".join(parts)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(gmshparser.parallel, "_MIN_CHUNK_RECORDS", 2)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [_ascii_mesh("4.1"), _ascii_mesh("4.0"), _binary_mesh()],
+    ids=["ascii-4.1", "ascii-4.0", "binary-4.1"],
+)
+def test_parallel_read_matches_serial_read(tmp_path, content):
+    path = tmp_path / "mesh.msh"
+    path.write_bytes(content)
+    expected = gmshparser.read(path)
+
+    mesh = read_parallel(path, str(path), gmshparser.MainParser(), workers=2)
+
+    assert mesh is not None
+    assert mesh.nodes == expected.nodes
+    assert mesh.elements == expected.elements
+    assert mesh.entities == expected.entities
+    assert mesh.nodes[7].parametric_coordinates == (0.5,)
+    assert gmshparser.read(path, workers=2).elements == expected.elements
+
+
+def test_parallel_errors_match_serial_errors(tmp_path):
+    path = tmp_path / "broken.msh"
+    path.write_bytes(_ascii_mesh("4.1").replace(b"4 2 3 4\n", b"4 2 x 4\n"))
+    with pytest.raises(gmshparser.InvalidElementError) as serial:
+        gmshparser.read(path)
+
+    with pytest.raises(gmshparser.InvalidElementError) as parallel:
+        gmshparser.read(path, workers=2)
+
+    assert str(parallel.value) == str(serial.value)
+    assert parallel.value.line_number == 32
+
+
+def test_parallel_read_honours_section_selection(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_bytes(_ascii_mesh("4.1"))
+
+    mesh = read_parallel(
+        path, "nodes", gmshparser.MainParser(sections={"$Nodes"}), workers=2
+    )
+
+    assert mesh is not None
+    assert mesh.nodes.tags == tuple(range(1, 9))
+    assert len(mesh.elements) == 0
+
+
+def test_other_versions_and_streams_are_read_serially(tmp_path):
+    path = tmp_path / "v2.msh"
+    path.write_text(
+        "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n"
+        "$Nodes\n2\n1 0 0 0\n2 1 0 0\n$EndNodes\n"
+        "$Elements\n1\n1 1 2 0 1 1 2\n$EndElements\n"
+    )
+
+    assert read_parallel(path, "v2", gmshparser.MainParser(), workers=2) is None
+    assert gmshparser.read(path, workers=2).elements.tags == (1,)
+    with path.open() as stream:
+        assert gmshparser.read(stream, workers=2).nodes.tags == (1, 2)
+    with pytest.raises(ValueError, match="workers"):
+        gmshparser.read(path, workers=0)
@@ -1,3 +1,5 @@
+import gzip
+import struct
 from io import StringIO
 
 import pytest
@@ -104,7 +106,7 @@ def test_invalid_connectivity_retains_element_error_type():
 def test_legacy_and_modern_entry_points_share_error_types(tmp_path):
     path = tmp_path / "binary.msh"
     path.write_text(
-        "$MeshFormat\n4.1 1 8\n$EndMeshFormat\n",
+        "$MeshFormat\n4.0 1 8\n$EndMeshFormat\n",
         encoding="utf-8",
     )
 
@@ -132,3 +134,85 @@ def test_empty_input_is_a_structured_value_error():
     assert isinstance(caught.value, ValueError)
     assert caught.value.filename == "empty.msh"
     assert caught.value.line_number is None
+
+
+LAZY_MESH = (
+    "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n"
+    "$Comments\nskipped\r\n$EndComments\n"
+    "$Nodes\n3\n1 0 0 0\n2 1 0 0\n3 0 1 0\n$EndNodes\n"
+    "$Elements\n2\n1 1 2 1 1 1 2\n2 1 2 1 1 2 x\n$EndElements\n"
+)
+
+
+@pytest.mark.parametrize("encoding", [None, "utf-8", "utf-16"])
+@pytest.mark.parametrize(
+    "content",
+    [LAZY_MESH, LAZY_MESH.replace("2 x", "")],
+    ids=["invalid-tag", "short-record"],
+)
+def test_lazy_line_tracking_reports_eager_locations(tmp_path, encoding, content):
+    path = tmp_path / "mesh.msh"
+    path.write_text(content, encoding=encoding or "utf-8", newline="")
+
+    def locate(line_tracking):
+        parser = gmshparser.MainParser(
+            exclude={"$Comments"}, line_tracking=line_tracking
+        )
+        if encoding is None:
+            stream = StringIO(content)
+        else:
+            stream = path.open(encoding=encoding)
+        with stream, pytest.raises(gmshparser.ParseError) as caught:
+            parser.parse(gmshparser.Mesh(), stream)
+        return caught.value.line_number, caught.value.line, caught.value.section
+
+    assert locate("lazy") == locate("eager")
+    assert locate("lazy")[0] in (15, 16)
+
+
+# Node tag 10 packs to a newline byte, which is not a line of the file.
+BINARY_LAZY_MESH = b"".join(
+    [
+        b"$MeshFormat\n2.2 1 8\n",
+        struct.pack("<i", 1),
+        b"\n$EndMeshFormat\n$Comments\nskipped\n$EndComments\n$Nodes\n2\n",
+        struct.pack("<i3d", 10, 0.0, 0.0, 0.0),
+        struct.pack("<i3d", 2, 1.0, 0.0, 0.0),
+        b'\n$EndNodes\n$PhysicalNames\n1\n1 x "edge"\n$EndPhysicalNames\n',
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "content", [LAZY_MESH.encode(), BINARY_LAZY_MESH], ids=["ascii", "binary"]
+)
+def test_lazy_line_tracking_applies_to_paths(tmp_path, content):
+    path = tmp_path / "mesh.msh"
+    path.write_bytes(content)
+
+    def locate(line_tracking):
+        parser = gmshparser.MainParser(line_tracking=line_tracking)
+        with (
+            gmshparser.parsing.open_source(str(path)) as stream,
+            pytest.raises(gmshparser.ParseError) as caught,
+        ):
+            parser.parse(gmshparser.Mesh(), stream)
+        assert stream.line_tracking == line_tracking
+        return caught.value.line_number, caught.value.line, caught.value.section
+
+    assert locate("lazy") == locate("eager")
+    with gzip.open(tmp_path / "mesh.msh.gz", "wb") as compressed:
+        compressed.write(content)
+    with gmshparser.parsing.open_source(str(tmp_path / "mesh.msh.gz")) as stream:
+        stream.set_line_tracking("lazy")
+        assert stream.line_tracking == "eager"
+
+
+def test_lazy_line_tracking_counts_lines_on_demand():
+    source = gmshparser.parsing.SourceTextIO(StringIO("a\nb\nc"), line_tracking="lazy")
+
+    assert source.readline() == "a\n"
+    assert source.read_lines(2) == ["b\n", "c"]
+    assert source.context.line_number == 0
+    assert source.locate().line_number == 3
+    assert source.context.line == "c"
@@ -0,0 +1,282 @@
+import struct
+from io import BytesIO, StringIO
+from operator import attrgetter
+
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+1
+2 1 "domain"
+$EndPhysicalNames
+$Entities
+0 0 1 0
+1 0 0 0 3 1 0 1 1 0
+$EndEntities
+$PartitionedEntities
+3
+0
+0 2 3 0
+10 2 1 2 1 2 1 0 0 1 1 0 0 0
+13 2 1 2 2 3 2 0 0 2 1 0 0 0
+11 2 1 1 1 0 0 0 1 1 0 1 1 1 10
+12 2 1 1 2 1 0 0 2 1 0 1 1 2 10 13
+14 2 1 1 3 2 0 0 3 1 0 1 1 1 13
+$EndPartitionedEntities
+$Nodes
+4 8 1 8
+1 10 0 2
+2
+5
+1 0 0
+1 1 0
+1 13 0 2
+3
+6
+2 0 0
+2 1 0
+2 11 0 2
+1
+4
+0 0 0
+0 1 0
+2 14 0 2
+7
+8
+3 0 0
+3 1 0
+$EndNodes
+$Elements
+3 6 1 6
+2 11 2 2
+1 1 2 5
+2 1 5 4
+2 12 2 2
+3 2 3 6
+4 2 6 5
+2 14 2 2
+5 3 7 8
+6 3 8 6
+$EndElements
+$GhostElements
+4
+1 1 1 2
+4 2 1 1
+3 2 1 3
+5 3 1 2
+$EndGhostElements
+"""
+
+
+def test_partitioned_entities_and_ghost_elements_are_read():
+    mesh = gmshparser.read(StringIO(MESH))
+    legacy = gmshparser.Mesh()
+    gmshparser.MainParser().parse(legacy, StringIO(MESH))
+
+    assert mesh.partitioning is not None
+    assert mesh.partitioning.count == 3
+    assert [ghost.tag for ghost in mesh.partitioning.ghosts(2)] == [1, 5]
+    assert mesh.entity(2, 11).parent == (2, 1)
+    assert mesh.entity(2, 11).partitions == (1,)
+    assert mesh.entity(1, 10).partitions == (1, 2)
+    assert mesh.entity(2, 1).parent is None
+    assert len(mesh.physical_group("domain").elements) == 6
+    assert legacy.get_entity_partitions(1, 13) == ((2, 1), (2, 3))
+    assert gmshparser.ModernMesh.from_legacy(legacy).partitioning == mesh.partitioning
+
+
+def test_partition_is_renumbered_with_its_ghost_layer():
+    mesh = gmshparser.read(StringIO(MESH))
+
+    partition = mesh.partition(1)
+
+    assert partition.node_tags == (2, 5, 1, 4, 6)
+    assert partition.element_tags == (1, 2, 4)
+    assert partition.mesh.nodes.tags == (1, 2, 3, 4)
+    assert partition.mesh.elements[1].node_tags == (3, 1, 2)
+    assert partition.mesh.entities.keys == ((1, 10), (2, 11))
+    assert partition.mesh.entity(2, 11).partitions == (1,)
+    assert len(partition.mesh.physical_group("domain").elements) == 2
+    (ghost,) = partition.ghost_elements
+    assert (ghost.tag, ghost.node_tags) == (3, (1, 5, 2))
+    assert partition.ghost_nodes[5].coordinates == (2.0, 1.0, 0.0)
+    assert partition.global_node_tag(5) == 6
+    assert partition.global_element_tag(3) == 4
+    assert mesh.partition(2).element_tags == (3, 4, 1, 5)
+
+
+def test_read_partition_skips_unrelated_partitions(tmp_path):
+    path = tmp_path / "partitioned.msh"
+    path.write_text(MESH)
+    expected = gmshparser.read(path).partition(1)
+    path.write_text(MESH.replace("5 3 7 8\n", "5 3 x 8\n"))
+
+    partition = gmshparser.read_partition(path, 1)
+
+    assert partition.node_tags == expected.node_tags
+    assert partition.element_tags == expected.element_tags
+    assert partition.mesh.elements == expected.mesh.elements
+    assert partition.mesh.entities == expected.mesh.entities
+    assert partition.ghost_elements == expected.ghost_elements
+    with pytest.raises(gmshparser.InvalidElementError):
+        gmshparser.read(path)
+    with pytest.raises(ValueError, match="outside 1..3"):
+        gmshparser.read_partition(path, 4)
+    with pytest.raises(ValueError, match="not partitioned"):
+        gmshparser.read(StringIO(MESH.split("$PartitionedEntities")[0])).partition(1)
+
+
+def test_binary_partition_metadata_is_decoded():
+    data = b"".join(
+        [
+            b"$MeshFormat\n4.1 1 8\n",
+            struct.pack("<i", 1),
+            b"\n$EndMeshFormat\n$PartitionedEntities\n",
+            struct.pack("<2Q", 2, 1),
+            struct.pack("<ii", 99, 2),
+            struct.pack("<4Q", 0, 0, 1, 0),
+            struct.pack("<iiiQi", 11, 2, 1, 1, 1),
+            struct.pack("<6d", 0.0, 0.0, 0.0, 1.0, 1.0, 0.0),
+            struct.pack("<QQ", 0, 0),
+            b"\n$EndPartitionedEntities\n$GhostElements\n",
+            struct.pack("<QQiQi", 1, 7, 1, 1, 2),
+            b"\n$EndGhostElements\n",
+        ]
+    )
+
+    mesh = gmshparser.read(BytesIO(data))
+
+    assert mesh.partitioning == gmshparser.Partitioning(
+        2, ((99, 2),), (gmshparser.GhostElement(7, 1, (2,)),)
+    )
+    assert mesh.entity(2, 11).parent == (2, 1)
+
+
+def test_invalid_partition_tags_are_rejected():
+    broken = MESH.replace("14 2 1 1 3 2", "14 2 1 1 4 2")
+
+    with pytest.raises(gmshparser.InvalidSectionError) as caught:
+        gmshparser.read(StringIO(broken))
+
+    assert caught.value.section == "$PartitionedEntities"
+    assert caught.value.line_number == 20
+    assert "outside 1..3" in str(caught.value)
+
+
+def _split_file(curves, surfaces, nodes, elements, ghosts):
+    """Return the file Gmsh writes for one partition of ``MESH``."""
+    lines = [MESH.split("$PartitionedEntities")[0], "$PartitionedEntities\n3\n0\n"]
+    lines.append(f"0 {len(curves)} {len(surfaces)} 0\n")
+    lines += [f"{_entity(tag)}\n" for tag in (*curves, *surfaces)]
+    lines.append("$EndPartitionedEntities\n$Nodes\n")
+    tags = [tag for *_, block in nodes for tag, _ in block]
+    lines.append(f"{len(nodes)} {len(tags)} {min(tags)} {max(tags)}\n")
+    for dimension, entity, block in nodes:
+        lines.append(f"{dimension} {entity} 0 {len(block)}\n")
+        lines += [f"{tag}\n" for tag, _ in block]
+        lines += [f"{coordinates}\n" for _, coordinates in block]
+    lines.append("$EndNodes\n$Elements\n")
+    tags = [element.split()[0] for *_, block in elements for element in block]
+    lines.append(f"{len(elements)} {len(tags)} {min(tags)} {max(tags)}\n")
+    for entity, block in elements:
+        lines.append(f"2 {entity} 2 {len(block)}\n")
+        lines += [f"{element}\n" for element in block]
+    lines.append(f"$EndElements\n$GhostElements\n{len(ghosts)}\n")
+    lines += [f"{ghost}\n" for ghost in ghosts]
+    lines.append("$EndGhostElements\n")
+    return "".join(lines)
+
+
+def _entity(tag):
+    return next(line for line in MESH.splitlines() if line.startswith(f"{tag} 2 1 "))
+
+
+INTERFACE_12 = (1, 10, [(2, "1 0 0"), (5, "1 1 0")])
+INTERFACE_23 = (1, 13, [(3, "2 0 0"), (6, "2 1 0")])
+SPLIT_FILES = [
+    _split_file(
+        [10],
+        [11],
+        [INTERFACE_12, (2, 11, [(1, "0 0 0"), (4, "0 1 0")])],
+        [(11, ["1 1 2 5", "2 1 5 4"])],
+        ["4 2 1 1"],
+    ),
+    _split_file(
+        [10, 13],
+        [12],
+        [INTERFACE_12, INTERFACE_23],
+        [(12, ["3 2 3 6", "4 2 6 5"])],
+        ["1 1 1 2", "5 3 1 2"],
+    ),
+    _split_file(
+        [13],
+        [14],
+        [INTERFACE_23, (2, 14, [(7, "3 0 0"), (8, "3 1 0")])],
+        [(14, ["5 3 7 8", "6 3 8 6"])],
+        ["3 2 1 3"],
+    ),
+]
+
+
+def _write_split_files(directory, files=SPLIT_FILES):
+    paths = []
+    for number, content in enumerate(files, 1):
+        paths.append(directory / f"mesh_{number}.msh")
+        paths[-1].write_text(content)
+    return paths
+
+
+@pytest.mark.filterwarnings("ignore:.*use of fork:DeprecationWarning")
+def test_split_partition_files_are_merged(tmp_path):
+    by_tag = attrgetter("tag")
+    paths = _write_split_files(tmp_path)
+    expected = gmshparser.read(StringIO(MESH))
+
+    mesh = gmshparser.read_partitioned(tmp_path / "mesh_*.msh", workers=2)
+
+    assert mesh.name == str(tmp_path / "mesh_*.msh")
+    assert sorted(mesh.nodes, key=by_tag) == sorted(expected.nodes, key=by_tag)
+    assert sorted(mesh.elements, key=by_tag) == list(expected.elements)
+    assert set(mesh.entities.keys) == set(expected.entities.keys)
+    assert mesh.entity(1, 10).partitions == (1, 2)
+    assert len(mesh.physical_group("domain").elements) == 6
+    assert mesh.partitioning is not None
+    assert expected.partitioning is not None
+    for partition in (1, 2, 3):
+        assert set(mesh.partitioning.ghosts(partition)) == set(
+            expected.partitioning.ghosts(partition)
+        )
+    assert mesh.partition(2).element_tags == expected.partition(2).element_tags
+    serial = gmshparser.read_partitioned(paths[::-1], workers=1)
+    assert serial.name == str(paths[-1])
+    assert sorted(serial.nodes.tags) == list(range(1, 9))
+
+
+def test_split_partition_files_feed_numpy_arrays(tmp_path):
+    gnp = pytest.importorskip("gmshparser.numpy")
+    _write_split_files(tmp_path)
+
+    arrays = gnp.read_partitioned_numpy(tmp_path / "mesh_*.msh", workers=1)
+
+    assert sorted(arrays.node_tags.tolist()) == list(range(1, 9))
+    assert arrays.number_of_elements == 6
+
+
+def test_inconsistent_split_partition_files_are_rejected(tmp_path):
+    moved = SPLIT_FILES[1].replace("\n1 1 0\n", "\n1 1 1\n", 1)
+    paths = _write_split_files(tmp_path, [SPLIT_FILES[0], moved])
+
+    with pytest.raises(gmshparser.InvalidMeshError, match="Node 5 differs") as caught:
+        gmshparser.read_partitioned(paths, workers=1)
+
+    assert caught.value.filename == str(paths[1])
+    renumbered = SPLIT_FILES[1].replace("3 2 3 6", "1 2 3 6")
+    _write_split_files(tmp_path, [SPLIT_FILES[0], renumbered])
+    with pytest.raises(gmshparser.InvalidMeshError, match="Element 1 differs"):
+        gmshparser.read_partitioned(tmp_path / "mesh_*.msh", workers=1)
+    with pytest.raises(FileNotFoundError):
+        gmshparser.read_partitioned(tmp_path / "missing_*.msh")
@@ -92,6 +92,25 @@ def test_msh4_entities_resolve_to_named_physical_groups():
     assert domain.nodes.tags == (1, 2, 3, 4)
 
 
+def test_group_nodes_follow_mesh_order_for_unsorted_tags(tmp_path):
+    content = MSH2.replace(
+        "1 0 0 0\n2 1 0 0\n3 1 1 0\n4 0 1 0",
+        "7 0 0 0\n2 1 0 0\n9 1 1 0\n4 0 1 0",
+    )
+    content = content.replace("2 10 2 1 2", "2 10 2 4 2").replace(
+        "2 20 3 1 2 3", "2 20 3 9 7 2"
+    )
+    path = tmp_path / "mesh.msh"
+    path.write_text(content)
+
+    modern = gmshparser.read(StringIO(content))
+    converted = ModernMesh.from_legacy(gmshparser.parse(str(path)))
+
+    for mesh in (modern, converted):
+        assert mesh.physical_group("Surface").nodes.tags == (7, 2, 9)
+        assert mesh.physical_groups["Left Edge"].nodes.tags == (2, 4)
+
+
 def test_entity_helpers_and_element_type_naming_are_pythonic():
     mesh = gmshparser.read(StringIO(MSH4))
 
@@ -0,0 +1,128 @@
+import struct
+
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+1
+2 20 "plate"
+$EndPhysicalNames
+$Entities
+0 0 1 0
+1 0.0 0.0 0.0 1.0 1.0 0.0 1 20 0
+$EndEntities
+$Nodes
+1 4 3 6
+2 1 0 4
+3
+4
+5
+6
+0.0 0.0 0.0
+1.0 0.0 0.0
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+1 2 7 8
+2 1 2 2
+7 3 4 5
+8 3 5 6
+$EndElements
+"""
+
+MSH22 = """$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$Nodes
+3
+1 0 0 0
+2 1 0 0
+3 0 1 0
+$EndNodes
+$Elements
+1
+1 2 2 0 1 1 2 3
+$EndElements
+"""
+
+
+def test_probe_reports_msh41_headers_without_parsing_records(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH.replace("7 3 4 5\n", "not an element\n"))
+
+    info = gmshparser.probe(path)
+
+    assert info.name == str(path)
+    assert str(info.version) == "4.1"
+    assert info.is_ascii
+    assert info.data_size == 8
+    assert (info.node_count, info.min_node_tag, info.max_node_tag) == (4, 3, 6)
+    assert (info.element_count, info.min_element_tag, info.max_element_tag) == (
+        2,
+        7,
+        8,
+    )
+    assert info.entity_counts == (0, 0, 1, 0)
+    assert info.physical_names == {(2, 20): "plate"}
+    assert [span.name for span in info.sections] == [
+        "$MeshFormat",
+        "$PhysicalNames",
+        "$Entities",
+        "$Nodes",
+        "$Elements",
+    ]
+    assert info.sections[3].offset == MESH.index("$Nodes")
+
+
+def test_probe_reads_binary_msh41_headers(tmp_path):
+    path = tmp_path / "binary.msh"
+    path.write_bytes(
+        b"".join(
+            [
+                b"$MeshFormat\n4.1 1 8\n",
+                struct.pack(">i", 1),
+                b"\n$EndMeshFormat\n$Nodes\n",
+                struct.pack(">4Q", 1, 1, 9, 9),
+                struct.pack(">iiiQ", 0, 1, 0, 1),
+                struct.pack(">Q3d", 9, 0.0, 0.0, 0.0),
+                b"\n$EndNodes\n",
+            ]
+        )
+    )
+
+    info = gmshparser.probe(path)
+
+    assert not info.is_ascii
+    assert (info.node_count, info.min_node_tag, info.max_node_tag) == (1, 9, 9)
+    assert info.element_count is None
+    assert info.entity_counts is None
+
+
+def test_probe_reports_counts_of_older_versions(tmp_path):
+    path = tmp_path / "v2.msh"
+    path.write_text(MSH22)
+
+    info = gmshparser.probe(path, name="v2")
+
+    assert info.name == "v2"
+    assert str(info.version) == "2.2"
+    assert (info.node_count, info.element_count) == (3, 1)
+    assert info.min_node_tag is None
+    assert info.entity_counts is None
+    assert info.physical_names == {}
+
+
+def test_probe_rejects_malformed_headers(tmp_path):
+    path = tmp_path / "broken.msh"
+    path.write_text(MESH.replace("1 2 7 8\n", "1 two 7 8\n"))
+
+    with pytest.raises(gmshparser.InvalidElementError) as caught:
+        gmshparser.probe(path)
+
+    assert caught.value.line_number == 25
+    assert caught.value.line == "1 two 7 8"
@@ -1,5 +1,6 @@
 from dataclasses import FrozenInstanceError
 from io import StringIO
+from pathlib import Path
 
 import pytest
 
@@ -193,6 +194,39 @@ def test_filtering_and_unified_entity_access_share_value_objects():
     assert mesh.entities.where(element_type=3).keys == ((2, 1),)
 
 
+@pytest.mark.parametrize("columnar", [False, True])
+def test_indexed_queries_match_a_scan_and_are_reused(columnar):
+    testdata = Path(__file__).parents[1] / "testdata"
+    path = testdata / "complex" / "test_from_internet" / "complex_v1_0.msh"
+    mesh = gmshparser.read(path, columnar=columnar)
+    elements = list(mesh.elements)
+
+    for entity in mesh.entities:
+        for element_type in (None, *mesh.elements.types):
+            for physical_tag in (None, *entity.physical_tags):
+                found = mesh.elements.where(
+                    element_type=element_type,
+                    entity=entity.key,
+                    physical_tag=physical_tag,
+                )
+                assert list(found) == [
+                    element
+                    for element in elements
+                    if element.entity_key == entity.key
+                    and element_type in (None, element.element_type)
+                    and physical_tag in (None, *element.physical_tags)
+                ]
+        assert mesh.nodes.by_entity(*entity.key) == entity.nodes
+
+    assert mesh.elements.by_type(2) is mesh.elements.by_type(ElementType(2))
+    assert mesh.nodes.where(dimension=2) is mesh.nodes.where(dimension=2)
+    assert mesh.nodes.where(entity_tag=1).tags == tuple(
+        node.tag for node in mesh.nodes if node.entity_tag == 1
+    )
+    assert len(mesh.elements.where(dimension=9)) == 0
+    assert mesh.elements.where() is mesh.elements
+
+
 def test_nodes_and_mesh_values_are_immutable():
     mesh = gmshparser.read(StringIO(MESH))
 
@@ -251,3 +285,36 @@ def test_read_path_and_parse_keep_both_apis(tmp_path):
     assert isinstance(legacy, gmshparser.Mesh)
     assert legacy.get_number_of_nodes() == len(modern.nodes)
     assert legacy.get_number_of_elements() == len(modern.elements)
+
+
+@pytest.mark.parametrize("content", [MESH, MESH_40], ids=["4.1", "4.0"])
+def test_bytes_sources_match_text_streams(tmp_path, content):
+    path = tmp_path / "mesh.msh"
+    path.write_text(content)
+    expected = gmshparser.read(StringIO(content))
+
+    meshes = [
+        gmshparser.read(path),
+        gmshparser.read(content.encode()),
+        gmshparser.read(memoryview(bytearray(content.encode()))),
+    ]
+    with path.open("rb") as stream:
+        meshes.append(gmshparser.read(stream))
+
+    for mesh in meshes:
+        assert mesh.nodes == expected.nodes
+        assert mesh.elements == expected.elements
+    assert meshes[1].name == "<bytes>"
+
+
+def test_bytes_sources_report_text_errors():
+    broken = MESH.replace("2.0 1.0 0.0\n", "2.0 1.0 z\n")
+    with pytest.raises(gmshparser.InvalidNodeError) as text:
+        gmshparser.read(StringIO(broken), name="mesh.msh")
+
+    with pytest.raises(gmshparser.InvalidNodeError) as raw:
+        gmshparser.read(broken.encode(), name="mesh.msh")
+
+    assert str(raw.value) == str(text.value)
+    assert raw.value.line_number == text.value.line_number == 18
+    assert raw.value.line == "2.0 1.0 z"
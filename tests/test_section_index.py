@@ -0,0 +1,186 @@
+import struct
+
+import pytest
+
+import gmshparser
+from gmshparser.section_index import SectionIndex
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+1
+2 20 "plate"
+$EndPhysicalNames
+$Comments
+a stray $ and
+$EndNodes lookalike
+$EndComments
+$Nodes
+2 4 1 4
+2 1 0 3
+1
+2
+3
+0.0 0.0 0.0
+1.0 0.0 0.0
+1.0 1.0 0.0
+2 1 0 1
+4
+0.0 1.0 0.0
+$EndNodes
+$Elements
+1 2 1 2
+2 1 2 2
+1 1 2 3
+2 1 3 4
+$EndElements
+$NodeData
+0
+$EndNodeData
+$NodeData
+0
+$EndNodeData
+"""
+
+
+def _write(tmp_path, content, name="mesh.msh"):
+    path = tmp_path / name
+    if isinstance(content, str):
+        path.write_text(content)
+    else:
+        path.write_bytes(content)
+    return path
+
+
+def test_index_records_offsets_and_line_numbers(tmp_path):
+    path = _write(tmp_path, MESH)
+    data = path.read_bytes()
+    lines = MESH.splitlines()
+
+    with SectionIndex(path) as index:
+        nodes = index["$Nodes"]
+
+        assert index.names() == (
+            "$MeshFormat",
+            "$PhysicalNames",
+            "$Comments",
+            "$Nodes",
+            "$Elements",
+            "$NodeData",
+            "$NodeData",
+        )
+        assert lines[nodes.line_number - 1] == "$Nodes"
+        assert lines[nodes.end_line_number - 1] == "$EndNodes"
+        assert data[nodes.offset : nodes.body_offset] == b"$Nodes\n"
+        assert data[nodes.end_offset : nodes.stop] == b"$EndNodes\n"
+        assert index.read(nodes).startswith(b"2 4 1 4\n")
+        assert len(index.find_all("$NodeData")) == 2
+        assert "$Periodic" not in index
+
+
+def test_index_only_scans_as_far_as_requested(tmp_path):
+    path = _write(tmp_path, MESH)
+
+    with SectionIndex(path) as index:
+        assert index.get("$PhysicalNames") is not None
+        assert [span.name for span in index._sections] == [
+            "$MeshFormat",
+            "$PhysicalNames",
+        ]
+
+
+def test_ascii_entity_blocks(tmp_path):
+    path = _write(tmp_path, MESH)
+    lines = MESH.splitlines()
+
+    with SectionIndex(path) as index:
+        node_blocks = index.blocks(index["$Nodes"])
+        element_blocks = index.blocks(index["$Elements"])
+
+    assert [block.entity_key for block in node_blocks] == [(2, 1), (2, 1)]
+    assert [block.count for block in node_blocks] == [3, 1]
+    assert [lines[block.line_number - 1] for block in node_blocks] == [
+        "2 1 0 3",
+        "2 1 0 1",
+    ]
+    assert node_blocks[0].stop == node_blocks[1].offset
+    assert element_blocks[0].element_type == 2
+    assert lines[element_blocks[0].line_number - 1] == "2 1 2 2"
+
+
+def test_binary_entity_blocks_follow_record_widths(tmp_path):
+    def pack(layout, *values):
+        return struct.pack("<" + layout.replace("N", "Q"), *values)
+
+    payload = b"".join(
+        [
+            b"$MeshFormat\n4.1 1 8\n",
+            pack("i", 1),
+            b"\n$EndMeshFormat\n$Nodes\n",
+            pack("NNNN", 2, 3, 1, 3),
+            pack("iiiN", 1, 1, 1, 2),
+            pack("NN", 1, 2),
+            pack("8d", *([0.0] * 8)),
+            pack("iiiN", 0, 1, 0, 1),
+            pack("N", 3),
+            pack("3d", 0.0, 0.0, 0.0),
+            b"\n$EndNodes\n",
+        ]
+    )
+    path = _write(tmp_path, payload)
+
+    with SectionIndex(path) as index:
+        assert index.is_binary is True
+        blocks = index.blocks(index["$Nodes"])
+
+    assert [block.entity_key for block in blocks] == [(1, 1), (0, 1)]
+    assert blocks[0].parametric is True
+    assert blocks[1].stop == payload.index(b"\n$EndNodes")
+    assert blocks[1].line_number is None
+
+
+def test_large_ascii_blocks_are_skipped_in_bulk(tmp_path):
+    count = 20_000
+    tags = "".join(f"{tag}\n" for tag in range(1, count + 1))
+    coordinates = "".join(f"{tag}.0 0.0 0.0\n" for tag in range(1, count + 1))
+    content = (
+        "$MeshFormat\n4.1 0 8\n$EndMeshFormat\n$Nodes\n"
+        f"2 {count + 1} 1 {count + 1}\n"
+        f"3 1 0 {count}\n{tags}{coordinates}"
+        f"0 1 0 1\n{count + 1}\n0.0 0.0 0.0\n$EndNodes\n"
+    )
+    path = _write(tmp_path, content)
+
+    with SectionIndex(path) as index:
+        blocks = index.blocks(index["$Nodes"])
+
+    lines = content.splitlines()
+    assert lines[blocks[1].line_number - 1] == "0 1 0 1"
+    assert content.encode()[blocks[1].offset :].startswith(b"0 1 0 1\n")
+
+
+def test_missing_end_marker_is_reported(tmp_path):
+    path = _write(tmp_path, "$MeshFormat\n4.1 0 8\n$EndMeshFormat\n$Nodes\n0 0 0 0\n")
+
+    with SectionIndex(path) as index:
+        with pytest.raises(gmshparser.UnexpectedEndOfFileError) as caught:
+            index.get("$Nodes")
+
+    assert caught.value.section == "$Nodes"
+    assert caught.value.line_number == 4
+    assert "$EndNodes" in str(caught.value)
+
+
+def test_truncated_entity_block_is_reported(tmp_path):
+    path = _write(tmp_path, MESH.replace("2 1 0 1\n", "2 1 0 9\n"))
+
+    with SectionIndex(path) as index:
+        with pytest.raises(gmshparser.UnexpectedEndOfFileError, match="entity"):
+            index.blocks(index["$Nodes"])
+
+
+def test_empty_file_has_no_sections(tmp_path):
+    with SectionIndex(_write(tmp_path, "")) as index:
+        assert index.sections == ()
+        assert index.version is None
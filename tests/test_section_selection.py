@@ -0,0 +1,178 @@
+import struct
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+
+import gmshparser
+import gmshparser.parsing
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$PhysicalNames
+1
+2 20 "plate"
+$EndPhysicalNames
+$Entities
+0 0 1 0
+1 0.0 0.0 0.0 1.0 1.0 0.0 1 20 0
+$EndEntities
+$Nodes
+1 4 1 4
+2 1 0 4
+1
+2
+3
+4
+0.0 0.0 0.0
+1.0 0.0 0.0
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Comments
+$EndNodes is not a marker here
+$EndComments
+$Elements
+1 2 1 2
+2 1 2 2
+1 1 2 3
+2 1 3 4
+$EndElements
+$Periodic
+1
+2 1 1
+0
+1
+4 1
+$EndPeriodic
+"""
+
+
+def test_sections_limit_reading_to_nodes():
+    full = gmshparser.read(StringIO(MESH))
+
+    mesh = gmshparser.read(StringIO(MESH), sections={"$Nodes"})
+
+    assert [node.coordinates for node in mesh.nodes] == [
+        node.coordinates for node in full.nodes
+    ]
+    assert len(mesh.elements) == 0
+    assert len(mesh.periodic_links) == 0
+    assert mesh.physical_groups.names == ()
+
+
+def test_exclude_skips_named_sections(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+
+    mesh = gmshparser.read(path, exclude=["$Periodic", "$Comments"])
+
+    assert mesh.elements.tags == (1, 2)
+    assert mesh.physical_groups["plate"].elements.tags == (1, 2)
+    assert len(mesh.periodic_links) == 0
+
+
+def test_dependent_sections_require_nodes():
+    with pytest.raises(ValueError, match=r"\$Elements requires \$Nodes"):
+        gmshparser.read(StringIO(MESH), sections={"$Elements"})
+
+
+def test_skipped_sections_keep_line_numbers():
+    broken = MESH.replace("2 1 3 4\n", "2 1 3 x\n")
+    with pytest.raises(gmshparser.InvalidElementError) as eager:
+        gmshparser.read(StringIO(broken))
+
+    with pytest.raises(gmshparser.InvalidElementError) as caught:
+        gmshparser.read(StringIO(broken), exclude={"$Entities", "$Comments"})
+
+    assert caught.value.line_number == eager.value.line_number == 31
+
+
+def test_skip_finds_markers_across_chunk_boundaries(monkeypatch):
+    monkeypatch.setattr(gmshparser.parsing, "_SKIP_CHUNK_SIZE", 5)
+    full = gmshparser.read(StringIO(MESH))
+
+    mesh = gmshparser.read(StringIO(MESH), exclude={"$Entities", "$Periodic"})
+
+    assert mesh.nodes.tags == full.nodes.tags
+    assert [element.node_tags for element in mesh.elements] == [
+        element.node_tags for element in full.elements
+    ]
+    assert len(mesh.periodic_links) == 0
+
+
+def test_missing_end_marker_of_skipped_section_is_reported():
+    truncated = MESH[: MESH.index("$EndEntities")]
+
+    with pytest.raises(gmshparser.UnexpectedEndOfFileError) as caught:
+        gmshparser.read(StringIO(truncated), sections={"$Nodes"})
+
+    assert caught.value.section == "$Entities"
+    assert "$EndEntities" in str(caught.value)
+
+
+def test_binary_sections_are_skipped_by_end_marker():
+    def pack(layout, *values):
+        return struct.pack("<" + layout, *values)
+
+    data = b"".join(
+        [
+            b"$MeshFormat\n2.2 1 8\n",
+            pack("i", 1),
+            b"\n$EndMeshFormat\n$Nodes\n3\n",
+            pack("i3d", 1, 0.0, 0.0, 0.0),
+            pack("i3d", 2, 1.0, 0.0, 0.0),
+            pack("i3d", 3, 1.0, 1.0, 0.0),
+            b"\n$EndNodes\n$Elements\n1\n",
+            pack("iii", 2, 1, 2),
+            pack("6i", 1, 20, 1, 1, 2, 3),
+            b"\n$EndElements\n",
+        ]
+    )
+
+    mesh = gmshparser.read(BytesIO(data), exclude={"$Elements"})
+
+    assert mesh.nodes.tags == (1, 2, 3)
+    assert len(mesh.elements) == 0
+
+
+def test_sections_without_a_parser_are_skipped_whole(tmp_path):
+    path = tmp_path / "results.msh"
+    data = '$NodeData\n1\n"T"\n1\n0.0\n3\n0\n1\n1\n$Periodic\n$EndNodeData\n'
+    path.write_text(MESH.replace("$Elements\n", data + "$Elements\n"))
+
+    mesh = gmshparser.read(path)
+    legacy = gmshparser.parse(str(path))
+
+    assert mesh.elements.tags == (1, 2)
+    assert len(mesh.periodic_links) == 1
+    assert legacy.get_number_of_elements() == 2
+    with pytest.raises(gmshparser.UnexpectedEndOfFileError) as caught:
+        gmshparser.read(StringIO(MESH + "$ElementData\n1\n"))
+    assert caught.value.section == "$ElementData"
+
+
+def test_data_sections_are_parsed_only_when_selected(tmp_path):
+    path = tmp_path / "results.msh"
+    testdata = Path(__file__).parents[1] / "testdata" / "simple"
+    short_record = '$NodeData\n1\n"T"\n1\n0.0\n3\n0\n3\n1\n1 0.5 0.5\n$EndNodeData\n'
+    path.write_text((testdata / "testmesh_v2_0.msh").read_text() + short_record)
+
+    assert len(gmshparser.read(path).views) == 0
+    assert gmshparser.parse(str(path)).get_data_steps() == ()
+    with pytest.raises(gmshparser.InvalidSectionError, match="requires 3 values"):
+        gmshparser.read(path, sections={"$Nodes", "$NodeData"})
+
+
+def test_main_parser_selection_accepts_msh1_aliases():
+    content = (
+        "$NOD\n3\n1 0 0 0\n2 1 0 0\n3 0 1 0\n$ENDNOD\n"
+        "$ELM\n1\n1 2 1 1 3 1 2 3\n$ENDELM\n"
+    )
+    mesh = gmshparser.Mesh()
+
+    gmshparser.MainParser(sections={"$Nodes"}).parse(mesh, StringIO(content))
+
+    assert mesh.get_number_of_nodes() == 3
+    assert mesh.get_number_of_elements() == 0
@@ -0,0 +1,78 @@
+from array import array
+from io import StringIO
+
+import pytest
+
+import gmshparser
+from gmshparser.modern_builder import ModernMeshBuilder
+from gmshparser.sink import ElementBuffer, NodeBuffer
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$Nodes
+1 3 1 3
+2 1 0 3
+1
+2
+3
+0.0 0.0 0.0
+1.0 0.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+2 2 1 2
+1 1 1 1
+1 1 2
+2 1 2 1
+2 1 2 3
+$EndElements
+"""
+
+
+class RecordingBuilder(ModernMeshBuilder):
+    def __init__(self):
+        super().__init__("recording")
+        self.blocks = []
+
+    def add_node_block(self, dimension, entity_tag, parametric, nodes):
+        self.blocks.append(nodes)
+        super().add_node_block(dimension, entity_tag, parametric, nodes)
+
+    def add_element_block(self, dimension, entity_tag, element_type, elements):
+        self.blocks.append(elements)
+        super().add_element_block(dimension, entity_tag, element_type, elements)
+
+
+def test_buffers_are_sequences_of_records():
+    coordinates = array("d", [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 0.5, 0.0])
+    nodes = NodeBuffer(array("q", [4, 5]), coordinates, 4)
+    elements = ElementBuffer(array("q", [1, 4, 5, 2, 5, 4]), 3)
+
+    assert list(nodes) == [(4, (0.0, 1.0, 2.0, 3.0)), (5, (4.0, 5.0, 0.5, 0.0))]
+    assert nodes[-1] == (5, (4.0, 5.0, 0.5, 0.0))
+    assert list(elements) == [(1, [4, 5], ()), (2, [5, 4], ())]
+    assert elements[1:] == [(2, [5, 4], ())]
+    assert list(elements.tags) == [1, 2]
+    with pytest.raises(IndexError):
+        elements[2]
+    with pytest.raises(ValueError, match="width"):
+        NodeBuffer(array("q", [1]), array("d", [0.0, 0.0]), 3)
+
+
+def test_msh4_parsers_pass_typed_buffers_to_sinks():
+    builder = RecordingBuilder()
+
+    gmshparser.MainParser().parse(builder, StringIO(MESH))
+    mesh = builder.build()
+
+    assert [type(block) for block in builder.blocks] == [
+        NodeBuffer,
+        ElementBuffer,
+        ElementBuffer,
+    ]
+    assert builder.blocks[0].tags.typecode == "q"
+    assert mesh.elements[2].node_tags == (1, 2, 3)
+    expected = gmshparser.read(StringIO(MESH))
+    assert mesh.nodes == expected.nodes
+    assert mesh.elements == expected.elements
@@ -0,0 +1,131 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$Entities
+1 1 1 0
+1 0.0 0.0 0.0 0
+1 0.0 0.0 0.0 1.0 0.0 0.0 0 2 1 -1
+1 0.0 0.0 0.0 1.0 1.0 0.0 0 1 1
+$EndEntities
+$Nodes
+3 4 1 4
+0 1 0 1
+1
+0.0 0.0 0.0
+1 1 1 1
+2
+1.0 0.0 0.0 1.0
+2 1 0 2
+3
+4
+1.0 1.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+2 3 1 3
+1 1 1 1
+1 1 2
+2 1 2 2
+2 1 2 3
+3 1 3 4
+$EndElements
+"""
+
+MSH22 = """$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$Nodes
+3
+1 0 0 0
+2 1 0 0
+3 0 1 0
+$EndNodes
+$Elements
+3
+1 1 2 10 1 1 2
+2 1 2 10 2 2 3
+3 1 2 10 1 3 1
+$EndElements
+"""
+
+
+def test_node_blocks_match_the_built_mesh(tmp_path):
+    path = tmp_path / "mesh.msh"
+    path.write_text(MESH)
+    mesh = gmshparser.read(path)
+
+    blocks = list(gmshparser.iter_node_blocks(path))
+
+    assert [block.entity_key for block in blocks] == [(0, 1), (1, 1), (2, 1)]
+    assert [len(block) for block in blocks] == [1, 1, 2]
+    for block in blocks:
+        nodes = mesh.nodes.by_entity(*block.entity_key)
+        assert block.tags == nodes.tags
+        assert block.coordinates == nodes.coordinates
+    assert blocks[1].parametric_coordinates == ((1.0,),)
+    assert blocks[2].parametric_coordinates == ()
+
+
+def test_element_blocks_skip_the_nodes_section():
+    broken_nodes = MESH.replace("1.0 1.0 0.0\n", "not a node\n")
+
+    blocks = list(gmshparser.iter_element_blocks(StringIO(broken_nodes)))
+
+    assert [block.entity_key for block in blocks] == [(1, 1), (2, 1)]
+    assert blocks[1].element_type is gmshparser.ElementType.TRIANGLE
+    assert blocks[1].tags == (2, 3)
+    assert blocks[1].connectivity == ((1, 2, 3), (1, 3, 4))
+
+
+def test_blocks_are_parsed_on_demand():
+    broken = MESH.replace("1.0 1.0 0.0\n", "1.0 x 0.0\n")
+    blocks = gmshparser.iter_node_blocks(StringIO(broken), name="broken.msh")
+
+    assert next(blocks).tags == (1,)
+    assert next(blocks).tags == (2,)
+    with pytest.raises(gmshparser.InvalidNodeError) as caught:
+        next(blocks)
+    with pytest.raises(gmshparser.InvalidNodeError) as eager:
+        gmshparser.read(StringIO(broken), name="broken.msh")
+
+    assert str(caught.value) == str(eager.value)
+    assert caught.value.line_number == 21
+    assert caught.value.line == "1.0 x 0.0"
+
+
+def test_msh2_elements_are_streamed_in_consecutive_runs():
+    nodes = list(gmshparser.iter_node_blocks(StringIO(MSH22)))
+    elements = list(gmshparser.iter_element_blocks(StringIO(MSH22)))
+
+    assert [(block.entity_key, block.tags) for block in nodes] == [((3, 1), (1, 2, 3))]
+    assert [(block.entity_key, block.tags) for block in elements] == [
+        ((1, 1), (1,)),
+        ((1, 2), (2,)),
+        ((1, 1), (3,)),
+    ]
+
+
+def test_msh1_and_binary_sources_are_supported():
+    msh1 = "$NOD\n2\n1 0 0 0\n2 1 0 0\n$ENDNOD\n$ELM\n1\n1 1 1 1 2 1 2\n$ENDELM\n"
+    binary = (
+        b"$MeshFormat\n2.2 1 8\n\x01\x00\x00\x00\n$EndMeshFormat\n$Nodes\n1\n"
+        b"\x07\x00\x00\x00" + bytes(24) + b"\n$EndNodes\n"
+    )
+
+    (element_block,) = gmshparser.iter_element_blocks(StringIO(msh1))
+    (node_block,) = gmshparser.iter_node_blocks(BytesIO(binary))
+
+    assert element_block.connectivity == ((1, 2),)
+    assert node_block.tags == (7,)
+    assert node_block.coordinates == ((0.0, 0.0, 0.0),)
+
+
+def test_missing_format_header_is_reported():
+    with pytest.raises(gmshparser.InvalidSectionError, match="supported MSH format"):
+        list(gmshparser.iter_node_blocks(StringIO("$Comments\n$EndComments\n")))
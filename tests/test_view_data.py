@@ -0,0 +1,165 @@
+import struct
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+
+import gmshparser
+
+MESH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$Nodes
+1 3 1 3
+2 1 0 3
+1
+2
+3
+0.0 0.0 0.0
+1.0 0.0 0.0
+0.0 1.0 0.0
+$EndNodes
+$Elements
+1 1 1 1
+2 1 2 1
+1 1 2 3
+$EndElements
+"""
+
+
+def _data(section, name, time, step, components, records):
+    lines = [section, "1", f'"{name}"', "1", str(time), "3", str(step)]
+    lines += [str(components), str(len(records))]
+    lines += [" ".join(str(value) for value in record) for record in records]
+    return "\n".join([*lines, "$End" + section[1:], ""])
+
+
+# Data sections are parsed only when selected.
+SECTIONS = ("$Nodes", "$Elements", "$NodeData", "$ElementData", "$ElementNodeData")
+
+RESULTS = MESH + "".join(
+    [
+        _data("$NodeData", "pressure", 0.0, 0, 1, [(1, 0.5), (2, 1.5), (3, 2.5)]),
+        _data("$ElementData", "flux", 0.0, 0, 3, [(1, 1.0, 2.0, 3.0)]),
+        _data("$NodeData", "pressure", 0.25, 1, 1, [(1, 4.0), (3, 6.0)]),
+        _data("$ElementNodeData", "strain", 0.0, 0, 2, [(1, 3, 1, 2, 3, 4, 5, 6)]),
+    ]
+)
+
+
+def test_data_sections_are_read_as_views_of_time_steps():
+    mesh = gmshparser.read(StringIO(RESULTS), sections=SECTIONS)
+
+    assert mesh.views.names == ("pressure", "flux", "strain")
+    pressure = mesh.views["pressure"]
+    assert pressure.section == "$NodeData"
+    assert pressure.time_steps == (0, 1)
+    assert pressure.times == (0.0, 0.25)
+    last = pressure.step(-1)
+    assert (last.time_step, last.components, last.partition) == (1, 1, None)
+    assert last.tags.tolist() == [1, 3]
+    assert list(last) == [(1, (4.0,)), (3, (6.0,))]
+    assert mesh.views["flux"].step(0).values.tolist() == [1.0, 2.0, 3.0]
+    strain = mesh.views["strain"].step(0)
+    assert strain.node_counts is not None and strain.node_counts.tolist() == [3]
+    assert list(strain) == [(1, (1.0, 2.0, 3.0, 4.0, 5.0, 6.0))]
+
+
+def test_compatibility_mesh_keeps_data_steps():
+    path = Path(__file__).parents[1] / "testdata" / "simple" / "testmesh.msh"
+
+    legacy = gmshparser.Mesh()
+    with open(path) as stream:
+        gmshparser.MainParser(sections=SECTIONS).parse(legacy, stream)
+    mesh = gmshparser.read(path, sections=SECTIONS)
+
+    ((section, string_tags, _, integer_tags, data),) = legacy.get_data_steps()
+    assert (section, string_tags, integer_tags) == (
+        "$NodeData",
+        ("A scalar view",),
+        (0, 1, 6),
+    )
+    assert data.values.tolist() == [0.0, 0.1, 0.2, 0.0, 0.2, 0.4]
+    assert gmshparser.ModernMesh.from_legacy(legacy).views == mesh.views
+
+
+def test_binary_data_records_are_decoded():
+    def header(name, count):
+        return f'1\n"{name}"\n1\n0.5\n3\n2\n2\n{count}\n'.encode()
+
+    data = b"".join(
+        [
+            b"$MeshFormat\n4.1 1 8\n",
+            struct.pack("<i", 1),
+            b"\n$EndMeshFormat\n$NodeData\n",
+            header("u", 2),
+            struct.pack("<i2d", 4, 1.0, 2.0),
+            struct.pack("<i2d", 5, 3.0, 4.0),
+            b"\n$EndNodeData\n$ElementNodeData\n",
+            header("v", 1),
+            struct.pack("<ii4d", 7, 2, 1.0, 2.0, 3.0, 4.0),
+            b"\n$EndElementNodeData\n",
+        ]
+    )
+
+    mesh = gmshparser.read(BytesIO(data), sections=SECTIONS)
+
+    step = mesh.views["u"].step(0)
+    assert (step.time, step.time_step, step.components) == (0.5, 2, 2)
+    assert list(step) == [(4, (1.0, 2.0)), (5, (3.0, 4.0))]
+    assert list(mesh.views["v"].step(0)) == [(7, (1.0, 2.0, 3.0, 4.0))]
+
+
+def test_malformed_data_records_report_their_line():
+    broken = RESULTS.replace("2 1.5\n", "2 x\n")
+
+    with pytest.raises(gmshparser.InvalidSectionError) as caught:
+        gmshparser.read(StringIO(broken), sections=SECTIONS)
+
+    assert caught.value.section == "$NodeData"
+    assert caught.value.line_number == 29
+    assert caught.value.line == "2 x"
+    with pytest.raises(gmshparser.InvalidSectionError, match="three integer tags"):
+        gmshparser.read(
+            StringIO(MESH + "$NodeData\n0\n0\n1\n0\n$EndNodeData\n"),
+            sections=SECTIONS,
+        )
+
+
+def test_misaligned_records_are_rejected():
+    shifted = RESULTS.replace("1 0.5\n2 1.5\n", "1 0.5 2\n1.5\n")
+
+    with pytest.raises(gmshparser.InvalidSectionError, match="requires 1 values"):
+        gmshparser.read(StringIO(shifted), sections=SECTIONS)
+    assert len(gmshparser.read(StringIO(shifted)).views) == 0
+
+
+def test_lazy_views_parse_only_the_requested_step(tmp_path):
+    path = tmp_path / "results.msh"
+    path.write_text(RESULTS.replace("2 1.5\n", "2 x\n"))
+
+    with gmshparser.LazyMesh(path) as lazy:
+        pressure = lazy.views["pressure"]
+        assert pressure.times == (0.0, 0.25)
+        assert pressure.step_info(0).count == 3
+        last = pressure.step(-1)
+        assert list(last) == [(1, (4.0,)), (3, (6.0,))]
+        assert pressure.step(1) is last
+        assert lazy.loaded_sections == {"$MeshFormat"}
+        with pytest.raises(gmshparser.InvalidSectionError) as caught:
+            pressure.step(0)
+
+    assert caught.value.filename == str(path)
+    assert caught.value.line_number == 29
+
+
+def test_lazy_read_keeps_every_data_step(tmp_path):
+    path = tmp_path / "results.msh"
+    path.write_text(RESULTS)
+
+    with gmshparser.LazyMesh(path, step_cache=0) as lazy:
+        assert lazy.views["strain"].step(0) is not lazy.views["strain"].step(0)
+        expected = gmshparser.read(path, sections=SECTIONS).views
+        assert lazy.views == lazy.read().views == expected
+    with pytest.raises(ValueError, match="step_cache"):
+        gmshparser.LazyMesh(path, step_cache=-1)
@@ -10,21 +10,49 @@ from gmshparser.api import (
     Mesh,
     Node,
     NodeCollection,
+    Partition,
+    Partitioning,
     PeriodicLink,
     PeriodicLinkCollection,
     PhysicalGroup,
     PhysicalGroupCollection,
+    View,
+    ViewCollection,
+    ViewStep,
+    ViewStepInfo,
 )
+from gmshparser.modern_builder import ModernMeshBuilder
+from gmshparser.numpy import MeshArrays, NumpyMeshBuilder
+from gmshparser.sink import MeshSink
 
 
 def verify_public_api(path: Path) -> None:
     modern = gmshparser.read(path)
     assert_type(modern, Mesh)
+    assert_type(gmshparser.read(path.read_bytes()), Mesh)
+    assert_type(gmshparser.read(memoryview(b"")), Mesh)
+    assert_type(
+        gmshparser.read(path, entities=[(2, 1)], physical_groups=["inlet", (1, 2)]),
+        Mesh,
+    )
     assert_type(modern.nodes, NodeCollection)
     assert_type(modern.elements, ElementCollection)
     assert_type(modern.entities, EntityCollection)
     assert_type(modern.physical_groups, PhysicalGroupCollection)
     assert_type(modern.periodic_links, PeriodicLinkCollection)
+    assert_type(modern.views, ViewCollection)
+    assert_type(modern.views["pressure"], View)
+    assert_type(modern.views["pressure"].step(-1), ViewStep)
+    assert_type(modern.views["pressure"].step_info(0), ViewStepInfo)
+    assert_type(modern.partitioning, Partitioning | None)
+    assert_type(modern.partition(1), Partition)
+    assert_type(gmshparser.read_partition(path, 1), Partition)
+    assert_type(gmshparser.read_partitioned("mesh_*.msh", workers=2), Mesh)
+    cache = gmshparser.DiskCache("cache", max_bytes=1 << 20)
+    assert_type(gmshparser.read("mesh.msh", cache_dir=cache), Mesh)
+    meshes = gmshparser.MeshCache(max_bytes=1 << 28)
+    assert_type(meshes.read("mesh.msh", workers=2), Mesh)
+    assert_type(meshes.cache_info().hits, int)
 
     assert_type(modern.nodes[1], Node)
     assert_type(modern.nodes.get(1), Node | None)
@@ -49,3 +77,18 @@ def verify_public_api(path: Path) -> None:
 
     compatibility = gmshparser.parse(str(path))
     assert_type(compatibility, gmshparser.Mesh)
+
+    info = gmshparser.probe(path)
+    assert_type(info, gmshparser.MeshProbe)
+    assert_type(info.node_count, int | None)
+    assert_type(info.entity_counts, tuple[int, int, int, int] | None)
+
+
+def verify_sinks() -> None:
+    sinks: list[MeshSink] = [
+        gmshparser.Mesh(),
+        ModernMeshBuilder(),
+        NumpyMeshBuilder(),
+    ]
+    assert_type(sinks[0].get_ascii(), bool)
+    assert_type(NumpyMeshBuilder().build(), MeshArrays)